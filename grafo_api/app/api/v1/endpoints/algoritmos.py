@@ -5,7 +5,7 @@ Endpoints para algoritmos de grafos.
 from fastapi import APIRouter, HTTPException, Path, Query, Depends, status, Body
 from typing import Dict, Any, Optional, List
 
-from app.schemas.grafo import AlgoritmoInfo, AlgoritmoResultado
+from app.schemas.grafo import AlgoritmoInfo, AlgoritmoResultado, ConsultaRotas, Rota
 from app.core.session import get_grafo_service, get_algoritmo_service
 from app.services.grafo_service import GrafoService
 from app.services.algoritmo_service import AlgoritmoService
@@ -116,6 +116,32 @@ def executar_algoritmo(
         raise HTTPException(status_code=500, detail=f"Erro ao executar algoritmo: {str(e)}")
 
 
+@router.post("/rotas/{grafo_id}", response_model=List[Rota])
+def consultar_rotas(
+    consulta: ConsultaRotas,
+    grafo_id: str = Path(..., description="ID do grafo"),
+    algoritmo_service: AlgoritmoService = Depends(get_algoritmo_service),
+    grafo_service: GrafoService = Depends(get_grafo_service)
+):
+    """
+    Calcula caminhos mínimos entre pares de vértices pela hierarquia de contração.
+    
+    A hierarquia é construída na primeira consulta após cada alteração do
+    grafo; as consultas seguintes levam de microssegundos a milissegundos.
+    
+    - **grafo_id**: ID do grafo
+    - **consulta**: Pares [origem, destino]
+    """
+    # Verifica se o grafo existe
+    if not grafo_service.obter_grafo(grafo_id):
+        raise HTTPException(status_code=404, detail=f"Grafo com ID {grafo_id} não encontrado")
+    
+    try:
+        return algoritmo_service.consultar_rotas(grafo_id, consulta.pares)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/{categoria}", response_model=List[AlgoritmoInfo])
 def listar_algoritmos_por_categoria_especifica(
     categoria: str = Path(..., description="Categoria de algoritmos"),
@@ -2,7 +2,8 @@
 Endpoints para persistência de grafos.
 """
 
-from fastapi import APIRouter, HTTPException, Path, Query, Depends, Response
+from fastapi import APIRouter, HTTPException, Path, Query, Depends
+from fastapi.responses import StreamingResponse
 from typing import Dict, Any, Optional
 import base64
 import json
@@ -112,14 +113,18 @@ def exportar_grafo(
 def exportar_grafo_arquivo(
     grafo_id: str = Path(..., description="ID do grafo"),
     formato: str = Query("graphml", description="Formato de exportação"),
+    compactar: bool = Query(False, description="Compacta o arquivo com gzip durante o envio"),
     grafo_service: GrafoService = Depends(get_grafo_service),
     persistencia_service: PersistenciaService = Depends(get_persistencia_service)
 ):
     """
     Exporta um grafo para um arquivo.
     
+    O arquivo é enviado em fluxo, à medida que é gerado.
+    
     - **grafo_id**: ID do grafo
     - **formato**: Formato de exportação (graphml, gml, gexf, json, csv)
+    - **compactar**: Se verdadeiro, envia o arquivo compactado com gzip (.gz)
     """
     # Verifica se o grafo existe
     grafo = grafo_service.obter_grafo(grafo_id)
@@ -132,18 +137,19 @@ def exportar_grafo_arquivo(
         raise HTTPException(status_code=400, detail=f"Formato '{formato}' inválido. Formatos válidos: {', '.join(formatos_validos)}")
     
     try:
-        # Exporta o grafo
-        conteudo = persistencia_service.exportar_grafo(grafo_id, formato)
+        # Obtém o gerador da exportação
+        conteudo = persistencia_service.exportar_grafo_fluxo(grafo_id, formato, compactar=compactar)
         
-        # Define o nome do arquivo
+        # Define o nome do arquivo e o tipo de conteúdo
         nome_arquivo = f"grafo_{grafo_id}.{formato}"
-        
-        # Define o tipo de conteúdo
         content_type = "application/octet-stream"
+        if compactar:
+            nome_arquivo += ".gz"
+            content_type = "application/gzip"
         
-        # Retorna o arquivo para download
-        return Response(
-            content=conteudo,
+        # Retorna o arquivo para download em fluxo
+        return StreamingResponse(
+            conteudo,
             media_type=content_type,
             headers={"Content-Disposition": f"attachment; filename={nome_arquivo}"}
         )
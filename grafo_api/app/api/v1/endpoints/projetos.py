@@ -7,6 +7,7 @@ projetos de estudo, com suporte a isolamento por sessão.
 
 from typing import Dict, List, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, File, UploadFile, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, StreamingResponse
 import json
 import io
@@ -75,10 +76,15 @@ def listar_projetos(
     session_id: str = Depends(get_session_id),
     projeto_service: GerenciadorProjetos = Depends(get_projeto_service),
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    tag: Optional[str] = None,
+    ordenar_por: Optional[str] = None,
+    decrescente: bool = True
 ):
     """
     Lista todos os projetos disponíveis na sessão atual.
+    
+    Os metadados vêm do índice de projetos, sem carregar os projetos.
     """
     # Obtém os projetos associados à sessão
     projetos_sessao = request.app.state.session_storage.list_data(
@@ -90,11 +96,17 @@ def listar_projetos(
     projetos_ids = [data["projeto_id"] for data in projetos_sessao.values()]
     
     # Obtém os metadados de cada projeto
-    projetos = []
-    for projeto_id in projetos_ids:
-        projeto = projeto_service.obter_projeto(projeto_id)
-        if projeto:
-            projetos.append(projeto.obter_metadados())
+    projetos = projeto_service.listar_projetos(
+        session_id=session_id,
+        tag=tag,
+        ordenar_por=ordenar_por,
+        decrescente=decrescente,
+        ids=projetos_ids
+    )
+    for metadados in projetos:
+        for campo in ("data_criacao", "data_atualizacao"):
+            if isinstance(metadados.get(campo), datetime):
+                metadados[campo] = metadados[campo].isoformat()
     
     # Aplica paginação
     total = len(projetos)
@@ -514,8 +526,10 @@ def exportar_projeto(
     if not conteudo:
         raise HTTPException(status_code=500, detail=f"Erro ao exportar projeto para formato {formato}")
     
-    # Codifica o conteúdo em base64
-    conteudo_base64 = base64.b64encode(conteudo.encode('utf-8')).decode('utf-8')
+    # Codifica o conteúdo em base64 (o pacote ZIP já está em bytes)
+    if isinstance(conteudo, str):
+        conteudo = conteudo.encode('utf-8')
+    conteudo_base64 = base64.b64encode(conteudo).decode('utf-8')
     
     # Obtém o projeto para metadados
     projeto = projeto_service.obter_projeto(projeto_id)
@@ -550,24 +564,29 @@ def exportar_projeto_arquivo(
     if not projeto_data:
         raise HTTPException(status_code=404, detail="Projeto não encontrado na sessão atual")
     
-    # Exporta o projeto
-    conteudo = projeto_service.exportar_projeto(projeto_id, formato)
-    if not conteudo:
-        raise HTTPException(status_code=500, detail=f"Erro ao exportar projeto para formato {formato}")
+    # Exporta o projeto (o pacote ZIP é emitido em partes, sem montá-lo em memória)
+    if formato == "zip":
+        arquivo = projeto_service.exportar_projeto_zip(projeto_id)
+        if arquivo is None:
+            raise HTTPException(status_code=500, detail=f"Erro ao exportar projeto para formato {formato}")
+    else:
+        conteudo = projeto_service.exportar_projeto(projeto_id, formato)
+        if not conteudo:
+            raise HTTPException(status_code=500, detail=f"Erro ao exportar projeto para formato {formato}")
+        
+        # Cria um arquivo em memória
+        arquivo = io.BytesIO(conteudo.encode('utf-8'))
     
     # Obtém o projeto para metadados
     projeto = projeto_service.obter_projeto(projeto_id)
     
-    # Cria um arquivo em memória
-    arquivo = io.BytesIO(conteudo.encode('utf-8'))
-    
     # Define o nome do arquivo
     nome_arquivo = f"{projeto.titulo.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.{formato}"
     
     # Retorna o arquivo como resposta
     return StreamingResponse(
         arquivo,
-        media_type="application/json" if formato == "json" else "application/octet-stream",
+        media_type={"json": "application/json", "zip": "application/zip"}.get(formato, "application/octet-stream"),
         headers={"Content-Disposition": f"attachment; filename={nome_arquivo}"}
     )
 
@@ -584,7 +603,9 @@ def importar_projeto(
     """
     try:
         # Decodifica o conteúdo de base64
-        conteudo = base64.b64decode(projeto_import.conteudo).decode('utf-8')
+        conteudo = base64.b64decode(projeto_import.conteudo)
+        if projeto_import.formato != "zip":
+            conteudo = conteudo.decode('utf-8')
         
         # Importa o projeto
         projeto_id = projeto_service.importar_projeto(conteudo, projeto_import.formato)
@@ -623,12 +644,17 @@ async def importar_projeto_arquivo(
     Importa um projeto a partir de um arquivo.
     """
     try:
-        # Lê o conteúdo do arquivo
-        conteudo = await arquivo.read()
-        conteudo_str = conteudo.decode('utf-8')
-        
-        # Importa o projeto
-        projeto_id = projeto_service.importar_projeto(conteudo_str, formato)
+        if formato == "zip":
+            # Lê o pacote diretamente do arquivo enviado (mantido em disco pelo
+            # servidor), sem carregá-lo inteiro em memória
+            projeto_id = await run_in_threadpool(projeto_service.importar_projeto_zip, arquivo.file)
+        else:
+            # Lê o conteúdo do arquivo
+            conteudo = await arquivo.read()
+            conteudo_str = conteudo.decode('utf-8')
+            
+            # Importa o projeto
+            projeto_id = projeto_service.importar_projeto(conteudo_str, formato)
         if not projeto_id:
             raise HTTPException(status_code=500, detail=f"Erro ao importar projeto do formato {formato}")
         
@@ -652,7 +678,7 @@ async def importar_projeto_arquivo(
         raise HTTPException(status_code=400, detail=f"Erro ao importar projeto: {str(e)}")
 
 
-@router.post("/{projeto_id}/relatorio")
+@router.post("/{projeto_id}/relatorio", status_code=202)
 def gerar_relatorio_projeto(
     projeto_id: str,
     request: Request,
@@ -666,7 +692,12 @@ def gerar_relatorio_projeto(
     relatorio_service: RelatorioGrafoPDF = Depends(get_relatorio_service)
 ):
     """
-    Gera um relatório didático de um projeto.
+    Inicia a geração de um relatório didático de um projeto em segundo plano.
+    
+    Retorna a tarefa de geração; o PDF é obtido em
+    ``/{projeto_id}/relatorio/{tarefa_id}/pdf`` quando a tarefa estiver concluída.
+    Relatórios de um projeto não alterado desde a última geração ficam prontos
+    imediatamente.
     """
     # Verifica se o projeto pertence à sessão atual
     projeto_data = request.app.state.session_storage.get_data(
@@ -692,21 +723,85 @@ def gerar_relatorio_projeto(
     }
     
     try:
-        # Gera o relatório
-        pdf_bytes = relatorio_service.gerar_relatorio_projeto(projeto, config)
-        
-        # Define o nome do arquivo
-        nome_arquivo = f"{projeto.titulo.replace(' ', '_')}_relatorio_{datetime.now().strftime('%Y%m%d')}.pdf"
-        
-        # Cria um arquivo em memória
-        arquivo = io.BytesIO(pdf_bytes)
-        
-        # Retorna o arquivo como resposta
-        return StreamingResponse(
-            arquivo,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={nome_arquivo}"}
-        )
+        # Inicia a geração do relatório
+        tarefa = relatorio_service.iniciar_relatorio_projeto(projeto, config)
+        tarefa["url_pdf"] = f"{request.url.path}/{tarefa['tarefa_id']}/pdf"
+        return tarefa
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro ao gerar relatório: {str(e)}")
+
+
+@router.get("/{projeto_id}/relatorio/{tarefa_id}")
+def obter_tarefa_relatorio(
+    projeto_id: str,
+    tarefa_id: str,
+    request: Request,
+    session_id: str = Depends(get_session_id),
+    relatorio_service: RelatorioGrafoPDF = Depends(get_relatorio_service)
+):
+    """
+    Obtém o estado de uma tarefa de geração de relatório.
+    """
+    # Verifica se o projeto pertence à sessão atual
+    projeto_data = request.app.state.session_storage.get_data(
+        session_id=session_id,
+        data_type="projetos",
+        data_id=projeto_id
+    )
+    
+    if not projeto_data:
+        raise HTTPException(status_code=404, detail="Projeto não encontrado na sessão atual")
+    
+    # Obtém a tarefa
+    tarefa = relatorio_service.obter_tarefa(tarefa_id)
+    if not tarefa or tarefa["projeto_id"] != projeto_id:
+        raise HTTPException(status_code=404, detail="Tarefa de relatório não encontrada")
+    
+    return tarefa
+
+
+@router.get("/{projeto_id}/relatorio/{tarefa_id}/pdf")
+def baixar_relatorio_projeto(
+    projeto_id: str,
+    tarefa_id: str,
+    request: Request,
+    session_id: str = Depends(get_session_id),
+    projeto_service: GerenciadorProjetos = Depends(get_projeto_service),
+    relatorio_service: RelatorioGrafoPDF = Depends(get_relatorio_service)
+):
+    """
+    Obtém o PDF gerado por uma tarefa de relatório concluída.
+    """
+    # Verifica se o projeto pertence à sessão atual
+    projeto_data = request.app.state.session_storage.get_data(
+        session_id=session_id,
+        data_type="projetos",
+        data_id=projeto_id
+    )
+    
+    if not projeto_data:
+        raise HTTPException(status_code=404, detail="Projeto não encontrado na sessão atual")
+    
+    # Obtém a tarefa
+    tarefa = relatorio_service.obter_tarefa(tarefa_id)
+    if not tarefa or tarefa["projeto_id"] != projeto_id:
+        raise HTTPException(status_code=404, detail="Tarefa de relatório não encontrada")
+    if tarefa["estado"] == "erro":
+        raise HTTPException(status_code=500, detail=f"Erro ao gerar relatório: {tarefa['erro']}")
+    
+    pdf_bytes = relatorio_service.obter_pdf_tarefa(tarefa_id)
+    if pdf_bytes is None:
+        raise HTTPException(status_code=409, detail=f"Relatório ainda não concluído (estado: {tarefa['estado']})")
+    
+    # Define o nome do arquivo
+    projeto = projeto_service.obter_projeto(projeto_id)
+    titulo = projeto.titulo if projeto else projeto_id
+    nome_arquivo = f"{titulo.replace(' ', '_')}_relatorio_{tarefa['criada_em'].strftime('%Y%m%d')}.pdf"
+    
+    # Retorna o arquivo como resposta
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={nome_arquivo}"}
+    )
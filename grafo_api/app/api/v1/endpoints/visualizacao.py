@@ -2,10 +2,13 @@
 Endpoints para visualização de grafos.
 """
 
-from fastapi import APIRouter, HTTPException, Path, Query, Depends
-from typing import Dict, Any, Optional, List
+import json
 
-from app.schemas.grafo import VisualizacaoGrafo, DadosVisualizacao
+from fastapi import APIRouter, HTTPException, Path, Query, Depends, Response
+from fastapi.responses import StreamingResponse
+from typing import Optional, List
+
+from app.schemas.grafo import VisualizacaoGrafo, DadosVisualizacao, DadosVisualizacaoAgregada, DadosJanela
 from app.core.session import get_grafo_service, get_visualizacao_service
 from app.services.grafo_service import GrafoService
 from app.services.visualizacao_service import VisualizacaoService
@@ -29,20 +32,30 @@ def listar_layouts(
         raise HTTPException(status_code=500, detail=f"Erro ao listar layouts: {str(e)}")
 
 
-@router.get("/{grafo_id}/imagem", response_model=Dict[str, Any])
+@router.get(
+    "/{grafo_id}/imagem",
+    response_class=Response,
+    responses={200: {"content": {"image/png": {}, "image/svg+xml": {}}, "description": "Imagem do grafo"}}
+)
 def gerar_imagem_grafo(
     grafo_id: str = Path(..., description="ID do grafo"),
     formato: str = Query("png", description="Formato da imagem (png, svg, etc.)"),
     layout: str = Query("spring", description="Layout de visualização"),
+    semente: Optional[int] = Query(None, description="Semente dos layouts aleatórios"),
+    largura: int = Query(1000, description="Largura da imagem em pixels"),
+    altura: int = Query(800, description="Altura da imagem em pixels"),
     grafo_service: GrafoService = Depends(get_grafo_service),
     visualizacao_service: VisualizacaoService = Depends(get_visualizacao_service)
 ):
     """
-    Gera uma imagem de um grafo.
+    Gera uma imagem de um grafo, devolvida diretamente no corpo da resposta.
     
     - **grafo_id**: ID do grafo
     - **formato**: Formato da imagem (png, svg, etc.)
     - **layout**: Layout de visualização
+    - **semente**: Semente dos layouts aleatórios (opcional)
+    - **largura**: Largura da imagem em pixels (padrão: 1000)
+    - **altura**: Altura da imagem em pixels (padrão: 800)
     """
     # Verifica se o grafo existe
     grafo = grafo_service.obter_grafo(grafo_id)
@@ -51,19 +64,142 @@ def gerar_imagem_grafo(
     
     try:
         # Gera a imagem
-        imagem = visualizacao_service.gerar_imagem(grafo_id, formato, layout)
-        return imagem
+        conteudo, tipo_midia = visualizacao_service.gerar_imagem(grafo_id, formato, layout, semente, largura, altura)
+        return Response(content=conteudo, media_type=tipo_midia)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro ao gerar imagem: {str(e)}")
 
 
+@router.get("/{grafo_id}/agregado", response_model=DadosVisualizacaoAgregada)
+def visualizar_grafo_agregado(
+    grafo_id: str = Path(..., description="ID do grafo"),
+    layout: str = Query("multinivel", description="Layout de visualização"),
+    agrupamento: str = Query("comunidades", description="Critério de agrupamento (comunidades ou espacial)"),
+    grupo: Optional[str] = Query(None, description="ID do grupo a ser detalhado (ex: 3 ou 3.1)"),
+    limite_elementos: Optional[int] = Query(None, description="Número máximo de vértices mais arestas na resposta"),
+    semente: Optional[int] = Query(None, description="Semente dos layouts aleatórios e das comunidades"),
+    grafo_service: GrafoService = Depends(get_grafo_service),
+    visualizacao_service: VisualizacaoService = Depends(get_visualizacao_service)
+):
+    """
+    Obtém uma visão em nível de detalhe de um grafo grande.
+    
+    - **grafo_id**: ID do grafo
+    - **layout**: Layout de visualização (padrão: multinivel)
+    - **agrupamento**: Critério de agrupamento dos super-vértices
+    - **grupo**: Grupo a ser detalhado (omitido para o grafo inteiro)
+    - **limite_elementos**: Número máximo de vértices mais arestas (opcional)
+    - **semente**: Semente dos layouts aleatórios e das comunidades (opcional)
+    
+    Se o grupo couber no limite, seus vértices e arestas são devolvidos em
+    detalhe; caso contrário, a resposta traz super-vértices com o número de
+    membros e arestas com o peso somado entre grupos. O ID de cada
+    super-vértice pode ser passado em **grupo** para detalhá-lo.
+    """
+    # Verifica se o grafo existe
+    grafo = grafo_service.obter_grafo(grafo_id)
+    if not grafo:
+        raise HTTPException(status_code=404, detail=f"Grafo com ID {grafo_id} não encontrado")
+    
+    try:
+        return visualizacao_service.visualizar_agregado(grafo_id, layout, agrupamento, grupo, limite_elementos, semente)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro ao visualizar grafo: {str(e)}")
+
+
+@router.get("/{grafo_id}/janela", response_model=DadosJanela)
+def obter_janela_grafo(
+    grafo_id: str = Path(..., description="ID do grafo"),
+    xmin: float = Query(..., description="Limite esquerdo da janela"),
+    ymin: float = Query(..., description="Limite inferior da janela"),
+    xmax: float = Query(..., description="Limite direito da janela"),
+    ymax: float = Query(..., description="Limite superior da janela"),
+    zoom: Optional[int] = Query(None, description="Nível de zoom para rarefação (omitido para todos os elementos)"),
+    layout: str = Query("multinivel", description="Layout de visualização"),
+    semente: Optional[int] = Query(None, description="Semente dos layouts aleatórios"),
+    grafo_service: GrafoService = Depends(get_grafo_service),
+    visualizacao_service: VisualizacaoService = Depends(get_visualizacao_service)
+):
+    """
+    Obtém apenas os vértices e as arestas que intersectam uma janela do layout.
+    
+    - **grafo_id**: ID do grafo
+    - **xmin**, **ymin**, **xmax**, **ymax**: Retângulo visível, nas coordenadas do layout
+    - **zoom**: Nível de zoom; com valores baixos, regiões densas são rarefeitas
+    - **layout**: Layout de visualização (padrão: multinivel)
+    - **semente**: Semente dos layouts aleatórios (opcional)
+    """
+    # Verifica se o grafo existe
+    grafo = grafo_service.obter_grafo(grafo_id)
+    if not grafo:
+        raise HTTPException(status_code=404, detail=f"Grafo com ID {grafo_id} não encontrado")
+    
+    try:
+        return visualizacao_service.obter_janela(grafo_id, xmin, ymin, xmax, ymax, zoom, layout, semente)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro ao obter janela: {str(e)}")
+
+
+@router.get("/{grafo_id}/layout/progressivo", response_class=StreamingResponse)
+def transmitir_layout_grafo(
+    grafo_id: str = Path(..., description="ID do grafo"),
+    layout: str = Query("multinivel", description="Layout de força (multinivel ou barnes_hut)"),
+    semente: Optional[int] = Query(None, description="Semente do layout"),
+    intervalo: int = Query(10, description="Iterações entre quadros"),
+    bits: int = Query(12, description="Bits por eixo na quantização das posições"),
+    grafo_service: GrafoService = Depends(get_grafo_service),
+    visualizacao_service: VisualizacaoService = Depends(get_visualizacao_service)
+):
+    """
+    Transmite o cálculo de um layout de força por Server-Sent Events.
+    
+    Envia um evento ``inicio`` com a lista de vértices, eventos ``quadro`` a
+    cada ``intervalo`` iterações (o primeiro completo, os demais apenas com
+    as diferenças das posições quantizadas) e um evento ``fim``. Fechar a
+    conexão interrompe o cálculo; o layout concluído fica em cache para os
+    demais endpoints de visualização.
+    
+    - **grafo_id**: ID do grafo
+    - **layout**: Layout de força (padrão: multinivel)
+    - **semente**: Semente do layout (opcional)
+    - **intervalo**: Iterações entre quadros (padrão: 10)
+    - **bits**: Bits por eixo na quantização (padrão: 12)
+    """
+    # Verifica se o grafo existe
+    grafo = grafo_service.obter_grafo(grafo_id)
+    if not grafo:
+        raise HTTPException(status_code=404, detail=f"Grafo com ID {grafo_id} não encontrado")
+    
+    try:
+        eventos = visualizacao_service.transmitir_layout(grafo_id, layout, semente, intervalo, bits)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro ao transmitir layout: {str(e)}")
+    
+    def formatar():
+        for numero, (nome, dados) in enumerate(eventos):
+            yield f"event: {nome}\nid: {numero}\ndata: {json.dumps(dados, separators=(',', ':'))}\n\n"
+    
+    return StreamingResponse(
+        formatar(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{grafo_id}", response_model=DadosVisualizacao)
 def visualizar_grafo(
     grafo_id: str = Path(..., description="ID do grafo"),
     layout: str = Query("spring", description="Layout de visualização"),
     incluir_atributos: bool = Query(True, description="Incluir atributos dos vértices e arestas"),
+    semente: Optional[int] = Query(None, description="Semente dos layouts aleatórios"),
     grafo_service: GrafoService = Depends(get_grafo_service),
     visualizacao_service: VisualizacaoService = Depends(get_visualizacao_service)
 ):
@@ -73,6 +209,11 @@ def visualizar_grafo(
     - **grafo_id**: ID do grafo
     - **layout**: Layout de visualização (spring, circular, etc.)
     - **incluir_atributos**: Incluir atributos dos vértices e arestas
+    - **semente**: Semente dos layouts aleatórios (opcional)
+    
+    As posições são mantidas em cache por versão do grafo; após pequenas
+    alterações, os layouts de força preservam as posições dos vértices
+    existentes.
     """
     # Verifica se o grafo existe
     grafo = grafo_service.obter_grafo(grafo_id)
@@ -81,7 +222,7 @@ def visualizar_grafo(
     
     try:
         # Obtém os dados de visualização
-        dados = visualizacao_service.visualizar_grafo(grafo_id, layout, incluir_atributos)
+        dados = visualizacao_service.visualizar_grafo(grafo_id, layout, incluir_atributos, semente)
         return dados
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
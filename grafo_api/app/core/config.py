@@ -2,7 +2,7 @@
 Configurações da aplicação.
 """
 
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -23,6 +23,14 @@ class Settings(BaseSettings):
     # Configurações de segurança
     SECRET_KEY: str = "chave_secreta_para_desenvolvimento"
     
+    # Configurações de visualização: número máximo de vértices mais arestas
+    # devolvidos pelas visões agregadas
+    LIMITE_ELEMENTOS_VISUALIZACAO: int = 5000
+    
+    # Diretório em que as hierarquias de contração são gravadas, pelo hash de
+    # conteúdo do grafo, para serem reaproveitadas após reinícios (opcional)
+    DIRETORIO_HIERARQUIAS: Optional[str] = None
+    
     # Configurações de ambiente
     DEBUG: bool = True
     
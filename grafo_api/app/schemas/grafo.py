@@ -146,6 +146,17 @@ class AlgoritmoResultado(BaseModel):
     tempo_execucao: float  # em segundos
 
 
+class ConsultaRotas(BaseModel):
+    """Modelo para consultas de caminho mínimo entre pares de vértices."""
+    pares: List[List[Any]] = Field(..., description="Pares [origem, destino]")
+
+
+class Rota(BaseModel):
+    """Modelo para o caminho mínimo entre dois vértices."""
+    custo: Optional[float] = None  # None se o destino for inalcançável
+    caminho: List[Any] = Field(default_factory=list)
+
+
 class OperacaoGrafos(BaseModel):
     """Modelo para operações entre grafos."""
     grafo_id1: str
@@ -195,6 +206,31 @@ class DadosVisualizacao(BaseModel):
     layout: str
 
 
+class DadosVisualizacaoAgregada(BaseModel):
+    """Modelo para visões em nível de detalhe de grafos grandes."""
+    vertices: List[Dict[str, Any]]
+    arestas: List[Dict[str, Any]]
+    layout: str
+    agrupamento: str
+    grupo: Optional[str] = None
+    detalhado: bool
+    total_vertices: int
+    arestas_omitidas: int = 0
+
+
+class DadosJanela(BaseModel):
+    """Modelo para os elementos de uma janela (viewport) do layout."""
+    vertices: List[Dict[str, Any]]
+    arestas: List[Dict[str, Any]]
+    layout: str
+    janela: Dict[str, float]
+    zoom: Optional[int] = None
+    total_vertices: int
+    total_arestas: int
+    vertices_omitidos: int = 0
+    arestas_omitidas: int = 0
+
+
 class ErrorResponse(BaseModel):
     """Modelo para respostas de erro."""
     detail: str
@@ -2,13 +2,18 @@
 Serviço para algoritmos de grafos.
 """
 
+import json
 import logging
 import time
 from typing import Dict, Any, Optional, List
 
+from app.core.config import settings
 from app.services.grafo_service import GrafoService
 from app.schemas.grafo import AlgoritmoInfo, ResultadoAlgoritmo # Importa os schemas necessários
-from grafo_backend.algoritmos.caminhos.dijkstra import dijkstra
+from grafo_backend.algoritmos.caminhos.dijkstra import dijkstra, dijkstra_bidirecional, k_mais_proximos
+from grafo_backend.algoritmos.caminhos.a_star import a_star, comparar_a_star_dijkstra
+from grafo_backend.algoritmos.caminhos.marcos import QUANTIDADE_MARCOS, obter_indice_marcos
+from grafo_backend.algoritmos.caminhos.hierarquia_contracao import obter_hierarquia
 from grafo_backend.algoritmos.coloracao.coloracao import coloracao_welsh_powell
 from grafo_backend.algoritmos.centralidade.centralidade import centralidade_grau
 
@@ -39,6 +44,22 @@ class AlgoritmoService:
                 categoria="caminhos",
                 descricao="Calcula o caminho mais curto de um vértice de origem para todos os outros vértices em um grafo ponderado.",
                 parametros_obrigatorios=["origem"],
+                parametros_opcionais=["destino", "k"]
+            ),
+            "a_star": AlgoritmoInfo(
+                id="a_star",
+                nome="Algoritmo A* com marcos",
+                categoria="caminhos",
+                descricao="Calcula o caminho mais curto entre dois vértices com o A*, usando como heurística as distâncias a vértices marcos (ALT).",
+                parametros_obrigatorios=["origem", "destino"],
+                parametros_opcionais=["marcos", "comparar"]
+            ),
+            "contracao_hierarquica": AlgoritmoInfo(
+                id="contracao_hierarquica",
+                nome="Hierarquia de Contração",
+                categoria="caminhos",
+                descricao="Calcula o caminho mais curto entre dois vértices por uma hierarquia de contração, pré-processada uma vez por versão do grafo.",
+                parametros_obrigatorios=["origem", "destino"],
                 parametros_opcionais=[]
             ),
             "coloracao_welsh_powell": AlgoritmoInfo(
@@ -63,10 +84,18 @@ class AlgoritmoService:
         # Mapeia IDs de algoritmos para suas funções de execução
         self._algoritmos_exec: Dict[str, callable] = {
             "dijkstra": self._executar_dijkstra,
+            "a_star": self._executar_a_star,
+            "contracao_hierarquica": self._executar_contracao_hierarquica,
             "coloracao_welsh_powell": self._executar_coloracao_welsh_powell,
             "centralidade_grau": self._executar_centralidade_grau
         }
         
+        # Parâmetros que transformam a execução em uma medição (tempos e
+        # contagens): com algum deles ativo, o resultado não vai para o cache
+        self._parametros_sem_cache: Dict[str, List[str]] = {
+            "a_star": ["comparar"]
+        }
+        
         logger.debug(f"AlgoritmoService inicializado com ID: {id(self)}")
     
     def _get_grafo_service(self):
@@ -175,10 +204,21 @@ class AlgoritmoService:
         # Log para depuração
         logger.debug(f"Executando algoritmo {algoritmo_id} no grafo {grafo_id} com parâmetros: {parametros}")
         
-        # Executa o algoritmo
+        # Executa o algoritmo (resultados com todos os parâmetros obrigatórios
+        # informados são compartilhados entre grafos de conteúdo idêntico,
+        # exceto as medições, que são refeitas a cada chamada)
+        executar = self._algoritmos_exec[algoritmo_id]
+        obrigatorios = self._algoritmos_info[algoritmo_id].parametros_obrigatorios
+        medicao = any(parametros.get(parametro) for parametro in self._parametros_sem_cache.get(algoritmo_id, []))
         inicio = time.time()
         try:
-            resultado_exec = self._algoritmos_exec[algoritmo_id](grafo, parametros)
+            if not medicao and all(parametro in parametros for parametro in obrigatorios):
+                chave = f"algoritmo:{algoritmo_id}:{json.dumps(parametros, sort_keys=True, default=str)}"
+                resultado_exec = grafo_service.obter_resultado_derivado(
+                    grafo_id, chave, lambda g: executar(g, parametros)
+                )
+            else:
+                resultado_exec = executar(grafo, parametros)
         except ValueError as e:
             # Propaga erros de validação específicos
             raise ValueError(str(e))
@@ -200,6 +240,10 @@ class AlgoritmoService:
         """
         Executa o algoritmo de Dijkstra.
         
+        Com o parâmetro 'destino', retorna apenas o custo e o caminho até o
+        destino (busca bidirecional); com 'k', as distâncias dos k vértices
+        mais próximos. Sem eles, as distâncias para todos os vértices.
+        
         Args:
             grafo: Grafo para executar o algoritmo.
             parametros: Parâmetros para o algoritmo.
@@ -228,6 +272,22 @@ class AlgoritmoService:
         if not grafo.existe_vertice(origem):
             raise ValueError(f"Vértice de origem \'{origem}\' não existe no grafo.")
         
+        # Caminho entre dois vértices
+        if parametros.get("destino") is not None:
+            destino = parametros["destino"]
+            if not grafo.existe_vertice(destino):
+                raise ValueError(f"Vértice de destino \'{destino}\' não existe no grafo.")
+            custo, caminho = dijkstra_bidirecional(grafo, origem, destino)
+            return {"custo": custo, "caminho": caminho}
+        
+        # Vértices mais próximos da origem
+        if parametros.get("k") is not None:
+            try:
+                k = int(parametros["k"])
+            except (TypeError, ValueError):
+                raise ValueError("O parâmetro 'k' deve ser um inteiro.")
+            return {str(v): d for v, d in k_mais_proximos(grafo, origem, k)}
+        
         # Executa o algoritmo de Dijkstra
         distancias, predecessores = dijkstra(grafo, origem)
         
@@ -235,6 +295,115 @@ class AlgoritmoService:
         # Retorna apenas o dicionário de distâncias com chaves como strings
         return {str(v): d for v, d in distancias.items()}
 
+    def _executar_a_star(self, grafo, parametros: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executa o algoritmo A* com heurística por marcos.
+        
+        O índice de marcos é construído na primeira consulta e reaproveitado
+        até a próxima alteração do grafo. Com o parâmetro 'comparar', o
+        resultado inclui os nós explorados e os tempos do A* e do Dijkstra.
+        
+        Args:
+            grafo: Grafo para executar o algoritmo.
+            parametros: Parâmetros para o algoritmo ('marcos' = 0 desativa a heurística).
+            
+        Returns:
+            Dict[str, Any]: Caminho e custo, e a comparação com o Dijkstra se pedida.
+            
+        Raises:
+            ValueError: Se os parâmetros forem inválidos ou não houver caminho.
+        """
+        for nome in ("origem", "destino"):
+            if parametros.get(nome) is None:
+                raise ValueError(f"Parâmetro '{nome}' é obrigatório para o algoritmo A*.")
+        origem, destino = parametros["origem"], parametros["destino"]
+        
+        try:
+            quantidade = int(parametros.get("marcos", QUANTIDADE_MARCOS))
+        except (TypeError, ValueError):
+            raise ValueError("O parâmetro 'marcos' deve ser um inteiro.")
+        if quantidade < 0:
+            raise ValueError("O parâmetro 'marcos' não pode ser negativo.")
+        
+        # Verifica os vértices antes de construir o índice
+        for vertice in (origem, destino):
+            if not grafo.existe_vertice(vertice):
+                raise ValueError(f"Vértice '{vertice}' não existe no grafo.")
+        heuristica = obter_indice_marcos(grafo, quantidade) if quantidade else None
+        
+        if not parametros.get("comparar"):
+            caminho, custo = a_star(grafo, origem, destino, heuristica)
+            return {"custo": custo, "caminho": caminho}
+        
+        comparacao = comparar_a_star_dijkstra(grafo, origem, destino, heuristica)
+        return {
+            "custo": comparacao["a_star_custo"],
+            "caminho": comparacao["a_star_caminho"],
+            "comparacao": {chave: valor for chave, valor in comparacao.items()
+                           if chave not in ("a_star_caminho", "dijkstra_caminho")}
+        }
+
+    def consultar_rotas(self, grafo_id: str, pares: List[List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Calcula caminhos mínimos entre vários pares de vértices pela hierarquia de contração.
+        
+        A hierarquia é construída na primeira consulta após cada alteração do
+        grafo e, se ``settings.DIRETORIO_HIERARQUIAS`` estiver definido,
+        gravada em disco pelo hash de conteúdo do grafo.
+        
+        Args:
+            grafo_id: ID do grafo.
+            pares: Pares [origem, destino].
+            
+        Returns:
+            List[Dict[str, Any]]: Custo e caminho de cada par, na ordem dos pares
+            (custo None e caminho vazio se o destino for inalcançável).
+            
+        Raises:
+            ValueError: Se o grafo não existir, se um par for inválido ou se
+                houver arestas com peso negativo.
+        """
+        grafo = self._get_grafo_service().obter_grafo(grafo_id)
+        if not grafo:
+            raise ValueError(f"Grafo com ID {grafo_id} não encontrado.")
+        for par in pares:
+            if not isinstance(par, (list, tuple)) or len(par) != 2:
+                raise ValueError("Cada par deve conter exatamente uma origem e um destino.")
+            for vertice in par:
+                if not grafo.existe_vertice(vertice):
+                    raise ValueError(f"Vértice '{vertice}' não existe no grafo.")
+        
+        hierarquia = obter_hierarquia(grafo, settings.DIRETORIO_HIERARQUIAS)
+        rotas = []
+        for origem, destino in pares:
+            custo, caminho = hierarquia.consultar(origem, destino)
+            rotas.append({"custo": custo if caminho else None, "caminho": caminho})
+        return rotas
+    
+    def _executar_contracao_hierarquica(self, grafo, parametros: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executa uma consulta de caminho mínimo pela hierarquia de contração.
+        
+        Args:
+            grafo: Grafo para executar o algoritmo.
+            parametros: Parâmetros para o algoritmo ('origem' e 'destino').
+            
+        Returns:
+            Dict[str, Any]: Custo e caminho até o destino.
+            
+        Raises:
+            ValueError: Se os parâmetros forem inválidos ou não houver caminho.
+        """
+        origem, destino = parametros.get("origem"), parametros.get("destino")
+        for vertice in (origem, destino):
+            if not grafo.existe_vertice(vertice):
+                raise ValueError(f"Vértice '{vertice}' não existe no grafo.")
+        
+        custo, caminho = obter_hierarquia(grafo, settings.DIRETORIO_HIERARQUIAS).consultar(origem, destino)
+        if not caminho:
+            raise ValueError(f"Não existe caminho de '{origem}' para '{destino}'.")
+        return {"custo": custo, "caminho": caminho}
+
     def _executar_coloracao_welsh_powell(self, grafo, parametros: Dict[str, Any]) -> Dict[str, Any]:
         """
         Executa o algoritmo de coloração Welsh-Powell.
@@ -5,8 +5,10 @@ Serviço para gerenciamento de grafos na API.
 import uuid
 import time
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
 
 # Configuração de logging
 logging.basicConfig(level=logging.DEBUG)
@@ -19,6 +21,9 @@ sys.path.append("/home/ubuntu")  # Adiciona o diretório raiz ao path
 from grafo_backend.core import Grafo
 from grafo_backend.tipos import GrafoDirecionado, GrafoPonderado, GrafoBipartido
 
+# Número máximo de resultados derivados mantidos em cache
+LIMITE_RESULTADOS_DERIVADOS = 256
+
 
 class GrafoService:
     """
@@ -29,6 +34,11 @@ class GrafoService:
         """Inicializa o serviço de grafos."""
         self.grafos: Dict[str, Grafo] = {}
         self.metadados: Dict[str, Dict[str, Any]] = {}
+        
+        # Resultados calculados a partir dos grafos, indexados pelo hash de
+        # conteúdo: grafos idênticos compartilham as mesmas entradas
+        self._resultados_derivados: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._trava_resultados = threading.Lock()
         logger.debug(f"GrafoService inicializado com ID: {id(self)}")
 
     def criar_grafo(self, nome: str, direcionado: bool = False,
@@ -116,6 +126,47 @@ class GrafoService:
 
         return metadados
 
+    def obter_resultado_derivado(self, grafo_id: str, chave: str,
+                                 calcular: Callable[[Grafo], Any]) -> Any:
+        """
+        Obtém um resultado calculado a partir de um grafo, usando o cache.
+
+        O cache é indexado pelo hash de conteúdo do grafo, de modo que grafos
+        idênticos (cópias, ou resultados de operações iguais a grafos já
+        existentes) reaproveitam os resultados uns dos outros. Alterar o grafo
+        muda seu hash e, portanto, invalida as entradas antigas.
+
+        Args:
+            grafo_id: ID do grafo.
+            chave: Identifica o cálculo (por exemplo, algoritmo e parâmetros).
+            calcular: Função que calcula o resultado a partir do grafo.
+
+        Returns:
+            Any: Resultado do cálculo.
+
+        Raises:
+            ValueError: Se o grafo não existir.
+        """
+        grafo = self.obter_grafo(grafo_id)
+        if not grafo:
+            raise ValueError(f"Grafo com ID {grafo_id} não encontrado.")
+
+        entrada = (grafo.obter_hash(), chave)
+        with self._trava_resultados:
+            if entrada in self._resultados_derivados:
+                self._resultados_derivados.move_to_end(entrada)
+                logger.debug(f"Resultado derivado em cache: ID={grafo_id}, Chave={chave}")
+                return self._resultados_derivados[entrada]
+
+        resultado = calcular(grafo)
+
+        with self._trava_resultados:
+            self._resultados_derivados[entrada] = resultado
+            while len(self._resultados_derivados) > LIMITE_RESULTADOS_DERIVADOS:
+                self._resultados_derivados.popitem(last=False)
+
+        return resultado
+
     def listar_metadados(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Lista os metadados dos grafos disponíveis.
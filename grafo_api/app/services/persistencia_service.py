@@ -5,9 +5,17 @@ Serviço para persistência de grafos.
 import logging
 import base64
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 
 from app.services.grafo_service import GrafoService
+from grafo_backend.persistencia.exportador import (
+    gerar_graphml,
+    gerar_gml,
+    gerar_gexf,
+    gerar_json,
+    gerar_csv_lista_arestas,
+    codificar_em_blocos
+)
 
 # Configuração de logging
 logging.basicConfig(level=logging.DEBUG)
@@ -120,17 +128,20 @@ class PersistenciaService:
         
         return grafo_id
     
-    def exportar_grafo(self, grafo_id: str, formato: str) -> str:
+    def _gerar_exportacao(self, grafo_id: str, formato: str) -> Iterator[str]:
         """
-        Exporta um grafo para um formato específico.
-        
+        Valida a exportação e obtém o gerador de texto do formato solicitado.
+
+        A validação é feita antes de qualquer fragmento ser produzido, para que
+        erros possam ser reportados antes do início de uma resposta em fluxo.
+
         Args:
             grafo_id: ID do grafo.
             formato: Formato de exportação (graphml, gml, gexf, json, csv).
-            
+
         Returns:
-            str: Conteúdo da exportação.
-            
+            Iterator[str]: Fragmentos de texto da exportação.
+
         Raises:
             ValueError: Se o grafo não existir ou o formato for inválido.
         """
@@ -147,67 +158,61 @@ class PersistenciaService:
         if formato not in formatos_validos:
             raise ValueError(f"Formato '{formato}' inválido. Formatos válidos: {', '.join(formatos_validos)}")
         
-        # Exporta o grafo de acordo com o formato
         if formato == "json":
-            # Serializa o grafo para JSON
-            grafo_serializado = grafo_service.serializar_grafo(grafo_id)
-            return json.dumps(grafo_serializado, indent=2)
+            # Inclui os metadados do serviço no início do documento
+            metadados = grafo_service.obter_metadados(grafo_id)
+            cabecalho = {
+                "id": grafo_id,
+                "nome": metadados["nome"],
+                "direcionado": metadados["direcionado"],
+                "ponderado": metadados["ponderado"],
+                "bipartido": metadados["bipartido"],
+                "num_vertices": grafo.numero_vertices(),
+                "num_arestas": grafo.numero_arestas()
+            }
+            return gerar_json(grafo, cabecalho)
+        
+        geradores = {
+            "graphml": gerar_graphml,
+            "gml": gerar_gml,
+            "gexf": gerar_gexf,
+            "csv": gerar_csv_lista_arestas
+        }
+        return geradores[formato](grafo)
+    
+    def exportar_grafo(self, grafo_id: str, formato: str) -> str:
+        """
+        Exporta um grafo para um formato específico.
         
-        # Para outros formatos, usaríamos bibliotecas específicas
-        # Por simplicidade, apenas simulamos a exportação
-        if formato == "graphml":
-            return f"""<?xml version="1.0" encoding="UTF-8"?>
-<graphml xmlns="http://graphml.graphdrawing.org/xmlns">
-  <graph id="{grafo_id}" edgedefault="undirected">
-    <node id="A"/>
-    <node id="B"/>
-    <node id="C"/>
-    <edge source="A" target="B"/>
-    <edge source="B" target="C"/>
-  </graph>
-</graphml>"""
-        
-        elif formato == "gml":
-            return f"""graph [
-  id {grafo_id}
-  node [
-    id "A"
-  ]
-  node [
-    id "B"
-  ]
-  node [
-    id "C"
-  ]
-  edge [
-    source "A"
-    target "B"
-  ]
-  edge [
-    source "B"
-    target "C"
-  ]
-]"""
-        
-        elif formato == "gexf":
-            return f"""<?xml version="1.0" encoding="UTF-8"?>
-<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">
-  <graph mode="static" defaultedgetype="undirected">
-    <nodes>
-      <node id="A" label="A" />
-      <node id="B" label="B" />
-      <node id="C" label="C" />
-    </nodes>
-    <edges>
-      <edge id="0" source="A" target="B" />
-      <edge id="1" source="B" target="C" />
-    </edges>
-  </graph>
-</gexf>"""
-        
-        elif formato == "csv":
-            return """source,target,weight
-A,B,1.0
-B,C,2.0"""
-        
-        return ""
+        Args:
+            grafo_id: ID do grafo.
+            formato: Formato de exportação (graphml, gml, gexf, json, csv).
+            
+        Returns:
+            str: Conteúdo da exportação.
+            
+        Raises:
+            ValueError: Se o grafo não existir ou o formato for inválido.
+        """
+        return "".join(self._gerar_exportacao(grafo_id, formato))
+    
+    def exportar_grafo_fluxo(self, grafo_id: str, formato: str, compactar: bool = False) -> Iterator[bytes]:
+        """
+        Exporta um grafo em fluxo, como blocos de bytes de tamanho limitado.
+        
+        O documento é produzido à medida que é consumido, de modo que o envio
+        começa imediatamente e a memória usada não depende do tamanho do grafo.
+        
+        Args:
+            grafo_id: ID do grafo.
+            formato: Formato de exportação (graphml, gml, gexf, json, csv).
+            compactar: Se True, compacta o fluxo no formato gzip.
+            
+        Returns:
+            Iterator[bytes]: Blocos de bytes da exportação.
+            
+        Raises:
+            ValueError: Se o grafo não existir ou o formato for inválido.
+        """
+        partes = self._gerar_exportacao(grafo_id, formato)
+        return codificar_em_blocos(partes, compactar=compactar)
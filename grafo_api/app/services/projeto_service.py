@@ -6,19 +6,277 @@ projetos de estudo que agrupam múltiplos grafos, operações, algoritmos
 e anotações relacionadas.
 """
 
+import hashlib
+import io
 import os
 import json
+import shutil
+import tempfile
+import threading
 import uuid
 import time
+import zipfile
+from collections.abc import MutableMapping
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterator, BinaryIO, Union
 
 # Importações do backend de grafos
 import sys
 sys.path.append('/home/ubuntu')  # Adiciona o diretório raiz ao path
 from grafo_backend.core import Grafo
-from grafo_backend.persistencia.exportador import exportar_grafo
-from grafo_backend.persistencia.importador import importar_grafo
+from grafo_backend.persistencia.armazem import ArmazemGrafos
+from grafo_backend.persistencia.exportador import exportar_grafo, exportar_binario
+from grafo_backend.persistencia.importador import importar_grafo, importar_binario
+
+# Trava entre processos do índice (indisponível fora de sistemas POSIX, onde
+# resta apenas a trava entre threads)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+# Arquivo com o índice de metadados dos projetos salvos
+ARQUIVO_INDICE = "indice.json"
+
+# Arquivo travado durante as alterações do índice (o índice em si é substituído a cada gravação)
+ARQUIVO_TRAVA_INDICE = "indice.lock"
+
+# Estrutura do diretório de cada projeto
+ARQUIVO_MANIFESTO = "manifesto.json"
+DIRETORIO_GRAFOS = "grafos"
+
+# Diretório do armazém de grafos compartilhado entre os projetos
+DIRETORIO_OBJETOS = "objetos"
+
+# Listas do projeto gravadas como entradas separadas no pacote ZIP
+LISTAS_PROJETO = ("operacoes", "algoritmos", "notas", "historico")
+
+# Tamanho dos blocos copiados para dentro e para fora do pacote ZIP (em bytes)
+TAMANHO_BLOCO_ZIP = 1 << 20
+
+
+class _SaidaZip(io.RawIOBase):
+    """
+    Destino de escrita não posicionável para ``zipfile``.
+    
+    Acumula os bytes produzidos pelo ZipFile até que sejam coletados, o que
+    permite emitir o pacote em partes à medida que é escrito.
+    """
+    
+    def __init__(self):
+        self._partes: List[bytes] = []
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, dados) -> int:
+        self._partes.append(bytes(dados))
+        return len(dados)
+    
+    def coletar(self) -> bytes:
+        """
+        Retorna e descarta os bytes acumulados desde a última coleta.
+        """
+        dados = b"".join(self._partes)
+        self._partes.clear()
+        return dados
+
+
+class ColecaoGrafos(MutableMapping):
+    """
+    Coleção dos grafos de um projeto, com carregamento sob demanda.
+    
+    Grafos registrados a partir de arquivos binários só são lidos no primeiro
+    acesso; até lá, consultas de pertinência e de metadados são respondidas a
+    partir do manifesto. A coleção também acompanha quais grafos foram
+    alterados desde o último salvamento, usando a versão de cada grafo, e o
+    hash de conteúdo com que cada grafo foi gravado no armazém.
+    """
+    
+    def __init__(self):
+        """
+        Inicializa uma coleção vazia.
+        """
+        self._carregados: Dict[str, Grafo] = {}  # id -> grafo em memória
+        self._arquivos: Dict[str, str] = {}  # id -> arquivo binário salvo
+        self._metadados: Dict[str, Dict[str, Any]] = {}  # id -> metadados do manifesto
+        self._versoes_salvas: Dict[str, int] = {}  # id -> versão no último salvamento
+        self._hashes: Dict[str, str] = {}  # id -> hash de conteúdo do arquivo salvo
+        self._ordem: Dict[str, None] = {}  # ids na ordem de inserção
+    
+    def registrar_arquivo(self, grafo_id: str, caminho: str, metadados: Dict[str, Any]) -> None:
+        """
+        Registra um grafo salvo em arquivo, sem carregá-lo.
+        
+        Args:
+            grafo_id: ID do grafo
+            caminho: Caminho do arquivo binário do grafo
+            metadados: Metadados do grafo registrados no manifesto (inclusive
+                o hash de conteúdo, quando o arquivo está no armazém)
+        """
+        self._carregados.pop(grafo_id, None)
+        self._versoes_salvas.pop(grafo_id, None)
+        self._hashes.pop(grafo_id, None)
+        if metadados.get("hash"):
+            self._hashes[grafo_id] = metadados["hash"]
+        self._arquivos[grafo_id] = caminho
+        self._metadados[grafo_id] = dict(metadados)
+        self._ordem[grafo_id] = None
+    
+    def esta_carregado(self, grafo_id: str) -> bool:
+        """
+        Verifica se um grafo já foi carregado em memória.
+        
+        Args:
+            grafo_id: ID do grafo
+            
+        Returns:
+            bool: True se o grafo está em memória, False caso contrário
+        """
+        return grafo_id in self._carregados
+    
+    def obter_metadados(self, grafo_id: str) -> Dict[str, Any]:
+        """
+        Obtém os metadados de um grafo sem forçar seu carregamento.
+        
+        Args:
+            grafo_id: ID do grafo
+            
+        Returns:
+            Dict[str, Any]: Nome, tipo e tamanho do grafo
+            
+        Raises:
+            KeyError: Se o grafo não pertencer à coleção
+        """
+        grafo = self._carregados.get(grafo_id)
+        if grafo is None:
+            return dict(self._metadados[grafo_id])
+        
+        return {
+            "nome": grafo.nome,
+            "direcionado": grafo.eh_direcionado() if hasattr(grafo, 'eh_direcionado') else False,
+            "ponderado": grafo.eh_ponderado() if hasattr(grafo, 'eh_ponderado') else False,
+            "bipartido": grafo.eh_bipartido() if hasattr(grafo, 'eh_bipartido') else False,
+            "num_vertices": grafo.numero_vertices(),
+            "num_arestas": grafo.numero_arestas()
+        }
+    
+    def obter_alterados(self) -> List[str]:
+        """
+        Obtém os IDs dos grafos novos ou alterados desde o último salvamento.
+        
+        Grafos registrados a partir de arquivos fora do armazém (sem hash de
+        conteúdo) também são incluídos, para que sejam migrados.
+        
+        Returns:
+            List[str]: IDs dos grafos que precisam ser gravados
+        """
+        alterados = []
+        for grafo_id in self._ordem:
+            grafo = self._carregados.get(grafo_id)
+            if grafo_id not in self._hashes:
+                alterados.append(grafo_id)
+            elif grafo is not None and self._versoes_salvas.get(grafo_id) != grafo.obter_versao():
+                alterados.append(grafo_id)
+        return alterados
+    
+    def obter_arquivo(self, grafo_id: str) -> Optional[str]:
+        """
+        Obtém o arquivo binário de um grafo, se estiver atualizado.
+        
+        Args:
+            grafo_id: ID do grafo
+            
+        Returns:
+            Optional[str]: Caminho do arquivo ou None se o grafo nunca foi
+            gravado ou foi alterado depois do último salvamento
+        """
+        caminho = self._arquivos.get(grafo_id)
+        grafo = self._carregados.get(grafo_id)
+        if grafo is not None and self._versoes_salvas.get(grafo_id) != grafo.obter_versao():
+            return None
+        return caminho
+    
+    def obter_hash_salvo(self, grafo_id: str) -> Optional[str]:
+        """
+        Obtém o hash de conteúdo com que um grafo foi gravado, se estiver atualizado.
+        
+        Args:
+            grafo_id: ID do grafo
+            
+        Returns:
+            Optional[str]: Hash de conteúdo ou None se o grafo precisar ser gravado
+        """
+        if self.obter_arquivo(grafo_id) is None:
+            return None
+        return self._hashes.get(grafo_id)
+    
+    def obter_hashes(self) -> Set[str]:
+        """
+        Obtém os hashes de conteúdo de todos os arquivos referenciados pela coleção.
+        
+        Returns:
+            Set[str]: Hashes dos objetos do armazém usados pela coleção
+        """
+        return set(self._hashes.values())
+    
+    def marcar_salvo(self, grafo_id: str, caminho: str, hash_conteudo: str) -> None:
+        """
+        Registra que um grafo carregado foi gravado em arquivo.
+        
+        Args:
+            grafo_id: ID do grafo
+            caminho: Caminho do arquivo binário gravado
+            hash_conteudo: Hash de conteúdo do grafo gravado
+        """
+        self._arquivos[grafo_id] = caminho
+        self._hashes[grafo_id] = hash_conteudo
+        self._versoes_salvas[grafo_id] = self._carregados[grafo_id].obter_versao()
+    
+    def __getitem__(self, grafo_id: str) -> Grafo:
+        grafo = self._carregados.get(grafo_id)
+        if grafo is not None:
+            return grafo
+        if grafo_id not in self._ordem:
+            raise KeyError(grafo_id)
+        
+        # Carrega o grafo do arquivo no primeiro acesso
+        grafo = importar_binario(self._arquivos[grafo_id], self._metadados[grafo_id].get("nome"))
+        if grafo is None:
+            raise KeyError(grafo_id)
+        
+        self._carregados[grafo_id] = grafo
+        self._versoes_salvas[grafo_id] = grafo.obter_versao()
+        return grafo
+    
+    def __setitem__(self, grafo_id: str, grafo: Grafo) -> None:
+        self._carregados[grafo_id] = grafo
+        self._metadados.pop(grafo_id, None)
+        self._versoes_salvas.pop(grafo_id, None)
+        
+        # Um grafo substituído precisa ser gravado novamente
+        self._arquivos.pop(grafo_id, None)
+        self._hashes.pop(grafo_id, None)
+        self._ordem[grafo_id] = None
+    
+    def __delitem__(self, grafo_id: str) -> None:
+        del self._ordem[grafo_id]
+        self._carregados.pop(grafo_id, None)
+        self._arquivos.pop(grafo_id, None)
+        self._metadados.pop(grafo_id, None)
+        self._versoes_salvas.pop(grafo_id, None)
+        self._hashes.pop(grafo_id, None)
+    
+    def __contains__(self, grafo_id: object) -> bool:
+        return grafo_id in self._ordem
+    
+    def __iter__(self):
+        return iter(list(self._ordem))
+    
+    def __len__(self) -> int:
+        return len(self._ordem)
 
 
 class ProjetoEstudo:
@@ -47,7 +305,7 @@ class ProjetoEstudo:
         self.data_atualizacao = self.data_criacao
         
         # Armazenamento de componentes do projeto
-        self.grafos = {}  # id -> grafo
+        self.grafos = ColecaoGrafos()  # id -> grafo (carregado sob demanda)
         self.operacoes = []  # Lista de operações realizadas
         self.algoritmos = []  # Lista de algoritmos aplicados
         self.notas = []  # Lista de anotações
@@ -80,6 +338,34 @@ class ProjetoEstudo:
         
         return grafo_id
     
+    def adicionar_grafo_armazenado(self, caminho: str, metadados: Dict[str, Any],
+                                   grafo_id: str = None) -> str:
+        """
+        Adiciona ao projeto um grafo já gravado no armazém, sem carregá-lo.
+        
+        Args:
+            caminho: Caminho do arquivo binário do grafo
+            metadados: Metadados do grafo, inclusive nome e hash de conteúdo
+            grafo_id: ID opcional para o grafo (se None, gera um novo ID)
+            
+        Returns:
+            str: ID do grafo adicionado
+        """
+        if grafo_id is None:
+            grafo_id = str(uuid.uuid4())
+        
+        self.grafos.registrar_arquivo(grafo_id, caminho, metadados)
+        self.data_atualizacao = datetime.now()
+        
+        # Registra no histórico
+        self._registrar_acao(
+            tipo="adicionar_grafo",
+            descricao=f"Adicionado grafo '{metadados.get('nome')}' ao projeto",
+            detalhes={"grafo_id": grafo_id, "nome": metadados.get("nome")}
+        )
+        
+        return grafo_id
+    
     def remover_grafo(self, grafo_id: str) -> bool:
         """
         Remove um grafo do projeto.
@@ -93,7 +379,7 @@ class ProjetoEstudo:
         if grafo_id not in self.grafos:
             return False
         
-        nome_grafo = self.grafos[grafo_id].nome
+        nome_grafo = self.grafos.obter_metadados(grafo_id)["nome"]
         del self.grafos[grafo_id]
         self.data_atualizacao = datetime.now()
         
@@ -116,7 +402,10 @@ class ProjetoEstudo:
         Returns:
             Optional[Grafo]: O grafo correspondente ou None se não encontrado
         """
-        return self.grafos.get(grafo_id)
+        try:
+            return self.grafos[grafo_id]
+        except KeyError:
+            return None
     
     def listar_grafos(self) -> List[Dict[str, Any]]:
         """
@@ -125,20 +414,9 @@ class ProjetoEstudo:
         Returns:
             List[Dict[str, Any]]: Lista de metadados dos grafos
         """
-        resultado = []
-        for grafo_id, grafo in self.grafos.items():
-            metadados = {
-                "id": grafo_id,
-                "nome": grafo.nome,
-                "direcionado": grafo.eh_direcionado() if hasattr(grafo, 'eh_direcionado') else False,
-                "ponderado": grafo.eh_ponderado() if hasattr(grafo, 'eh_ponderado') else False,
-                "bipartido": grafo.eh_bipartido() if hasattr(grafo, 'eh_bipartido') else False,
-                "num_vertices": grafo.numero_vertices(),
-                "num_arestas": grafo.numero_arestas()
-            }
-            resultado.append(metadados)
-        
-        return resultado
+        # Os metadados são obtidos sem carregar os grafos ainda não acessados
+        return [dict(self.grafos.obter_metadados(grafo_id), id=grafo_id)
+                for grafo_id in self.grafos]
     
     def registrar_operacao(self, tipo: str, descricao: str, 
                           grafos_entrada: List[str], grafo_saida: str,
@@ -331,6 +609,37 @@ class ProjetoEstudo:
             "tags": list(self.tags)
         }
     
+    def obter_assinatura(self) -> str:
+        """
+        Obtém uma assinatura que identifica a versão atual do conteúdo do projeto.
+        
+        A assinatura muda quando o título, a descrição ou o autor mudam,
+        quando uma ação é registrada no histórico (grafos, operações,
+        algoritmos, notas e tags) ou quando o conteúdo de algum grafo muda,
+        inclusive por alterações feitas diretamente no grafo. Grafos ainda não
+        carregados usam o hash com que foram salvos, sem serem lidos.
+        
+        Returns:
+            str: Hash SHA-256 em hexadecimal.
+        """
+        grafos = []
+        for grafo_id in self.grafos:
+            hash_conteudo = self.grafos.obter_hash_salvo(grafo_id)
+            if hash_conteudo is None:
+                hash_conteudo = self.grafos[grafo_id].obter_hash()
+            grafos.append([grafo_id, hash_conteudo])
+        
+        conteudo = json.dumps({
+            "id": self.id,
+            "titulo": self.titulo,
+            "descricao": self.descricao,
+            "autor": self.autor,
+            "acoes": len(self.historico),
+            "tags": sorted(self.tags),
+            "grafos": grafos
+        }, sort_keys=True)
+        return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
+    
     def _registrar_acao(self, tipo: str, descricao: str, detalhes: Dict[str, Any] = None) -> None:
         """
         Registra uma ação no histórico do projeto.
@@ -373,6 +682,30 @@ class GerenciadorProjetos:
         
         self.diretorio_armazenamento = diretorio_armazenamento
         self.projetos_em_memoria = {}  # id -> projeto
+        
+        # Grafos de todos os projetos, deduplicados pelo hash de conteúdo
+        self.armazem = ArmazemGrafos(os.path.join(diretorio_armazenamento, DIRETORIO_OBJETOS))
+        
+        # Índice de metadados dos projetos salvos (carregado sob demanda)
+        self._indice = None
+        self._modificacao_indice = None
+        self._trava_indice = threading.RLock()
+        self._descritor_trava_indice = None
+    
+    def _diretorio_projeto(self, projeto_id: str) -> str:
+        """
+        Obtém o diretório de armazenamento de um projeto.
+        
+        O diretório contém o manifesto do projeto e o subdiretório com os
+        arquivos binários dos grafos.
+        
+        Args:
+            projeto_id: ID do projeto
+            
+        Returns:
+            str: Caminho do diretório
+        """
+        return os.path.join(self.diretorio_armazenamento, projeto_id)
     
     def criar_projeto(self, titulo: str, descricao: str = "", autor: str = "Usuário") -> str:
         """
@@ -410,12 +743,21 @@ class GerenciadorProjetos:
         except:
             return None
     
-    def listar_projetos(self, session_id: str = None) -> List[Dict[str, Any]]:
+    def listar_projetos(self, session_id: str = None, tag: str = None,
+                        ordenar_por: str = None, decrescente: bool = True,
+                        ids: List[str] = None) -> List[Dict[str, Any]]:
         """
         Lista todos os projetos disponíveis.
         
+        Os projetos salvos são obtidos do índice de metadados, sem abrir os
+        arquivos dos projetos.
+        
         Args:
             session_id: ID da sessão para filtrar projetos (opcional)
+            tag: Lista apenas projetos com esta tag (opcional)
+            ordenar_por: Campo usado na ordenação, por exemplo "data_atualizacao" (opcional)
+            decrescente: Se True, ordena do maior para o menor valor
+            ids: Lista apenas os projetos com estes IDs (opcional)
             
         Returns:
             List[Dict[str, Any]]: Lista de metadados dos projetos
@@ -428,40 +770,183 @@ class GerenciadorProjetos:
         for projeto_id, projeto in self.projetos_em_memoria.items():
             resultado.append(projeto.obter_metadados())
         
-        # Adiciona projetos armazenados em disco
+        # Adiciona projetos armazenados em disco (a partir do índice)
+        for projeto_id, metadados in self._carregar_indice().items():
+            # Pula se já está em memória
+            if projeto_id in self.projetos_em_memoria:
+                continue
+            resultado.append({chave: valor for chave, valor in metadados.items() if chave != "objetos"})
+        
+        # Aplica os filtros
+        if ids is not None:
+            selecionados = set(ids)
+            resultado = [m for m in resultado if m["id"] in selecionados]
+        if tag is not None:
+            resultado = [m for m in resultado if tag in m.get("tags", [])]
+        
+        # Ordena pelo campo solicitado (datas em memória são comparadas no formato ISO)
+        if ordenar_por is not None:
+            def chave(metadados):
+                valor = metadados.get(ordenar_por)
+                if isinstance(valor, datetime):
+                    valor = valor.isoformat()
+                return (valor is not None, valor if valor is not None else "")
+            resultado.sort(key=chave, reverse=decrescente)
+        
+        return resultado
+    
+    def _caminho_indice(self) -> str:
+        """
+        Obtém o caminho do arquivo de índice de metadados.
+        
+        Returns:
+            str: Caminho do arquivo de índice
+        """
+        return os.path.join(self.diretorio_armazenamento, ARQUIVO_INDICE)
+    
+    @contextmanager
+    def _travar_indice(self) -> Iterator[None]:
+        """
+        Trava o índice entre as threads deste processo e entre os processos
+        que compartilham o diretório de armazenamento.
+        
+        A trava entre processos (flock) é obtida apenas no nível mais externo,
+        de modo que os métodos que já a possuem podem chamar uns aos outros.
+        """
+        with self._trava_indice:
+            if fcntl is None or self._descritor_trava_indice is not None:
+                yield
+                return
+            
+            caminho = os.path.join(self.diretorio_armazenamento, ARQUIVO_TRAVA_INDICE)
+            descritor = os.open(caminho, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(descritor, fcntl.LOCK_EX)
+                self._descritor_trava_indice = descritor
+                yield
+            finally:
+                # Fechar o descritor libera a trava
+                self._descritor_trava_indice = None
+                os.close(descritor)
+    
+    def _carregar_indice(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Carrega o índice de metadados dos projetos salvos.
+        
+        O índice é mantido em cache e relido apenas quando o arquivo muda. Se
+        não existir (armazenamento criado por versões anteriores), é
+        reconstruído uma única vez a partir dos arquivos dos projetos.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Metadados por ID de projeto
+        """
+        with self._trava_indice:
+            caminho = self._caminho_indice()
+            try:
+                modificacao = os.stat(caminho).st_mtime_ns
+            except FileNotFoundError:
+                with self._travar_indice():
+                    self._indice = self._reconstruir_indice()
+                    self._gravar_indice(self._indice)
+                return self._indice
+            
+            if self._indice is None or modificacao != self._modificacao_indice:
+                try:
+                    with open(caminho, 'r') as f:
+                        self._indice = json.load(f).get("projetos", {})
+                except (OSError, ValueError):
+                    # Índice corrompido: reconstrói a partir dos projetos
+                    with self._travar_indice():
+                        self._indice = self._reconstruir_indice()
+                        self._gravar_indice(self._indice)
+                    return self._indice
+                self._modificacao_indice = modificacao
+            
+            return self._indice
+    
+    def _reconstruir_indice(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Reconstrói o índice lendo os arquivos de todos os projetos salvos.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Metadados por ID de projeto
+        """
+        indice = {}
         for arquivo in os.listdir(self.diretorio_armazenamento):
-            if arquivo.endswith('.json'):
+            caminho = os.path.join(self.diretorio_armazenamento, arquivo)
+            if os.path.isfile(os.path.join(caminho, ARQUIVO_MANIFESTO)):
+                projeto_id = arquivo
+                caminho = os.path.join(caminho, ARQUIVO_MANIFESTO)
+            elif arquivo.endswith('.json') and arquivo != ARQUIVO_INDICE:
                 projeto_id = arquivo[:-5]  # Remove a extensão .json
-                
-                # Pula se já está em memória
-                if projeto_id in self.projetos_em_memoria:
-                    continue
-                
-                try:
-                    # Carrega apenas os metadados
-                    with open(os.path.join(self.diretorio_armazenamento, arquivo), 'r') as f:
-                        dados = json.load(f)
-                        metadados = {
-                            "id": dados.get("id", projeto_id),
-                            "titulo": dados.get("titulo", "Sem título"),
-                            "descricao": dados.get("descricao", ""),
-                            "autor": dados.get("autor", "Desconhecido"),
-                            "data_criacao": dados.get("data_criacao"),
-                            "data_atualizacao": dados.get("data_atualizacao"),
-                            "num_grafos": len(dados.get("grafos", {})),
-                            "tags": dados.get("tags", [])
-                        }
-                        resultado.append(metadados)
-                except:
-                    # Ignora arquivos com erro
-                    continue
+            else:
+                continue
+            
+            try:
+                with open(caminho, 'r') as f:
+                    dados = json.load(f)
+                indice[projeto_id] = {
+                    "id": dados.get("id", projeto_id),
+                    "titulo": dados.get("titulo", "Sem título"),
+                    "descricao": dados.get("descricao", ""),
+                    "autor": dados.get("autor", "Desconhecido"),
+                    "data_criacao": dados.get("data_criacao"),
+                    "data_atualizacao": dados.get("data_atualizacao"),
+                    "num_grafos": len(dados.get("grafos", {})),
+                    "num_operacoes": len(dados.get("operacoes", [])),
+                    "num_algoritmos": len(dados.get("algoritmos", [])),
+                    "num_notas": len(dados.get("notas", [])),
+                    "tags": dados.get("tags", []),
+                    "objetos": sorted({g["hash"] for g in dados.get("grafos", {}).values() if g.get("hash")})
+                }
+            except Exception:
+                # Ignora arquivos com erro
+                continue
         
-        return resultado
+        return indice
+    
+    def _gravar_indice(self, indice: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Grava o índice de forma atômica (arquivo temporário + renomeação).
+        
+        Deve ser chamado com a trava do índice (``_travar_indice``).
+        
+        Args:
+            indice: Metadados por ID de projeto
+        """
+        caminho = self._caminho_indice()
+        _gravar_json_atomico(caminho, {"versao": 1, "projetos": indice})
+        
+        self._modificacao_indice = os.stat(caminho).st_mtime_ns
+    
+    def _atualizar_indice(self, projeto_id: str, metadados: Optional[Dict[str, Any]]) -> None:
+        """
+        Atualiza a entrada de um projeto no índice.
+        
+        Args:
+            projeto_id: ID do projeto
+            metadados: Novos metadados, ou None para remover o projeto do índice
+        """
+        with self._travar_indice():
+            # Relê o índice do disco, que pode ter sido alterado por outro processo
+            self._modificacao_indice = None
+            indice = dict(self._carregar_indice())
+            if metadados is None:
+                indice.pop(projeto_id, None)
+            else:
+                indice[projeto_id] = metadados
+            self._gravar_indice(indice)
+            self._indice = indice
     
     def salvar_projeto(self, projeto_id: str) -> bool:
         """
         Salva um projeto no armazenamento.
         
+        O projeto é salvo em um diretório próprio, com um manifesto JSON que
+        referencia os grafos pelo hash de conteúdo. Os grafos ficam no armazém
+        compartilhado: apenas grafos novos ou alterados são gravados, e um grafo
+        idêntico a outro já armazenado reaproveita o mesmo arquivo.
+        
         Args:
             projeto_id: ID do projeto a ser salvo
             
@@ -472,38 +957,46 @@ class GerenciadorProjetos:
         if not projeto:
             return False
         
-        # Prepara o dicionário para serialização
-        dados = {
-            "id": projeto.id,
-            "titulo": projeto.titulo,
-            "descricao": projeto.descricao,
-            "autor": projeto.autor,
-            "data_criacao": projeto.data_criacao.isoformat(),
-            "data_atualizacao": projeto.data_atualizacao.isoformat(),
-            "tags": list(projeto.tags),
-            "grafos": {},
-            "operacoes": projeto.operacoes,
-            "algoritmos": projeto.algoritmos,
-            "notas": projeto.notas,
-            "historico": projeto.historico
-        }
+        diretorio_projeto = self._diretorio_projeto(projeto_id)
         
-        # Serializa os grafos
-        for grafo_id, grafo in projeto.grafos.items():
-            # Exporta o grafo para GraphML como representação padrão
-            conteudo_graphml = exportar_grafo(grafo, "graphml")
+        # Grava os grafos alterados no armazém
+        try:
+            os.makedirs(diretorio_projeto, exist_ok=True)
             
-            dados["grafos"][grafo_id] = {
-                "nome": grafo.nome,
-                "representacao": conteudo_graphml,
-                "formato": "graphml"
-            }
+            for grafo_id in projeto.grafos.obter_alterados():
+                hash_conteudo = self.armazem.gravar(projeto.grafos[grafo_id])
+                if hash_conteudo is None:
+                    return False
+                projeto.grafos.marcar_salvo(grafo_id, self.armazem.obter_caminho(hash_conteudo), hash_conteudo)
+            
+            # Arquivos por projeto de versões anteriores já foram migrados
+            shutil.rmtree(os.path.join(diretorio_projeto, DIRETORIO_GRAFOS), ignore_errors=True)
+        except Exception as e:
+            print(f"Erro ao salvar grafos do projeto: {e}")
+            return False
         
-        # Salva o arquivo JSON
+        # Prepara o manifesto (os grafos são apenas referenciados)
+        dados = self._montar_manifesto(projeto)
+        for nome in LISTAS_PROJETO:
+            dados[nome] = getattr(projeto, nome)
+        
+        # Salva o manifesto de forma atômica
         try:
-            caminho_arquivo = os.path.join(self.diretorio_armazenamento, f"{projeto_id}.json")
-            with open(caminho_arquivo, 'w') as f:
-                json.dump(dados, f, indent=2, default=str)
+            _gravar_json_atomico(os.path.join(diretorio_projeto, ARQUIVO_MANIFESTO), dados, indent=2)
+            
+            # Remove o armazenamento no formato antigo, se existir
+            self._remover_formato_antigo(projeto_id)
+            
+            # Atualiza o índice de metadados
+            objetos_anteriores = self._carregar_indice().get(projeto_id, {}).get("objetos", [])
+            metadados = projeto.obter_metadados()
+            metadados["data_criacao"] = dados["data_criacao"]
+            metadados["data_atualizacao"] = dados["data_atualizacao"]
+            metadados["objetos"] = sorted(projeto.grafos.obter_hashes())
+            self._atualizar_indice(projeto_id, metadados)
+            
+            # Remove do armazém os grafos que deixaram de ser usados
+            self._coletar_objetos(objetos_anteriores)
             return True
         except Exception as e:
             print(f"Erro ao salvar projeto: {e}")
@@ -513,15 +1006,22 @@ class GerenciadorProjetos:
         """
         Carrega um projeto do armazenamento.
         
+        Apenas o manifesto é lido; cada grafo é carregado no primeiro acesso.
+        
         Args:
             projeto_id: ID do projeto a ser carregado
             
         Returns:
             Optional[ProjetoEstudo]: O projeto carregado ou None se não encontrado
         """
-        caminho_arquivo = os.path.join(self.diretorio_armazenamento, f"{projeto_id}.json")
+        diretorio_projeto = self._diretorio_projeto(projeto_id)
+        caminho_arquivo = os.path.join(diretorio_projeto, ARQUIVO_MANIFESTO)
         if not os.path.exists(caminho_arquivo):
-            return None
+            # Projetos salvos no formato antigo (arquivo JSON único)
+            diretorio_projeto = self.diretorio_armazenamento
+            caminho_arquivo = os.path.join(self.diretorio_armazenamento, f"{projeto_id}.json")
+            if not os.path.exists(caminho_arquivo):
+                return None
         
         try:
             with open(caminho_arquivo, 'r') as f:
@@ -544,14 +1044,25 @@ class GerenciadorProjetos:
             projeto.notas = dados.get("notas", [])
             projeto.historico = dados.get("historico", [])
             
-            # Carrega os grafos
+            # Registra os grafos
             for grafo_id, grafo_dados in dados.get("grafos", {}).items():
                 try:
-                    representacao = grafo_dados.get("representacao", "")
                     formato = grafo_dados.get("formato", "graphml")
                     
-                    # Importa o grafo da representação
-                    grafo = importar_grafo(representacao, formato)
+                    if formato == "binario":
+                        # Formato nativo: carregado apenas no primeiro acesso
+                        if grafo_dados.get("hash"):
+                            caminho_grafo = self.armazem.obter_caminho(grafo_dados["hash"])
+                        else:
+                            caminho_grafo = os.path.join(diretorio_projeto, grafo_dados["arquivo"])
+                        metadados = {chave: valor for chave, valor in grafo_dados.items()
+                                     if chave not in ("arquivo", "formato")}
+                        metadados.setdefault("nome", grafo_id)
+                        projeto.grafos.registrar_arquivo(grafo_id, caminho_grafo, metadados)
+                        continue
+                    
+                    # Projetos antigos: representação textual embutida
+                    grafo = importar_grafo(grafo_dados.get("representacao", ""), formato)
                     
                     # Atualiza o nome se necessário
                     if "nome" in grafo_dados:
@@ -585,16 +1096,126 @@ class GerenciadorProjetos:
             del self.projetos_em_memoria[projeto_id]
         
         # Remove do armazenamento
-        caminho_arquivo = os.path.join(self.diretorio_armazenamento, f"{projeto_id}.json")
-        if os.path.exists(caminho_arquivo):
+        diretorio_projeto = self._diretorio_projeto(projeto_id)
+        caminho_antigo = os.path.join(self.diretorio_armazenamento, f"{projeto_id}.json")
+        if os.path.isdir(diretorio_projeto) or os.path.exists(caminho_antigo):
             try:
-                os.remove(caminho_arquivo)
+                objetos = self._carregar_indice().get(projeto_id, {}).get("objetos", [])
+                self._atualizar_indice(projeto_id, None)
+                shutil.rmtree(diretorio_projeto, ignore_errors=True)
+                self._remover_formato_antigo(projeto_id)
+                
+                # Remove do armazém os grafos usados apenas por este projeto
+                self._coletar_objetos(objetos)
                 return True
             except:
                 return False
         
         return True  # Considera sucesso se o projeto não existia
     
+    def copiar_grafo(self, projeto_origem_id: str, grafo_id: str,
+                     projeto_destino_id: str) -> Optional[str]:
+        """
+        Copia um grafo de um projeto para outro.
+        
+        A cópia referencia o mesmo objeto do armazém que o grafo de origem, sem
+        ler nem duplicar seu conteúdo. Se o grafo de origem tiver alterações
+        ainda não salvas, ele é gravado no armazém uma única vez antes da cópia.
+        
+        Args:
+            projeto_origem_id: ID do projeto que contém o grafo
+            grafo_id: ID do grafo a ser copiado
+            projeto_destino_id: ID do projeto que receberá a cópia
+            
+        Returns:
+            Optional[str]: ID do grafo no projeto de destino ou None se a cópia falhar
+        """
+        origem = self.obter_projeto(projeto_origem_id)
+        destino = self.obter_projeto(projeto_destino_id)
+        if not origem or not destino or grafo_id not in origem.grafos:
+            return None
+        
+        # Garante que o grafo de origem está gravado no armazém
+        hash_conteudo = origem.grafos.obter_hash_salvo(grafo_id)
+        if hash_conteudo is None:
+            hash_conteudo = self.armazem.gravar(origem.grafos[grafo_id])
+            if hash_conteudo is None:
+                return None
+            origem.grafos.marcar_salvo(grafo_id, self.armazem.obter_caminho(hash_conteudo), hash_conteudo)
+        
+        metadados = dict(origem.grafos.obter_metadados(grafo_id), hash=hash_conteudo)
+        return destino.adicionar_grafo_armazenado(self.armazem.obter_caminho(hash_conteudo), metadados)
+    
+    def _coletar_objetos(self, candidatos: List[str]) -> None:
+        """
+        Remove do armazém os objetos candidatos que nenhum projeto usa mais.
+        
+        São considerados os projetos do índice e os projetos em memória, que
+        podem referenciar objetos ainda não registrados em um manifesto.
+        
+        Args:
+            candidatos: Hashes de objetos que podem ter deixado de ser usados
+        """
+        if not candidatos:
+            return
+        
+        with self._travar_indice():
+            self._modificacao_indice = None
+            referenciados = set()
+            for metadados in self._carregar_indice().values():
+                referenciados.update(metadados.get("objetos", []))
+            for projeto in self.projetos_em_memoria.values():
+                referenciados.update(projeto.grafos.obter_hashes())
+            self.armazem.remover_nao_referenciados(candidatos, referenciados)
+    
+    def _montar_manifesto(self, projeto: ProjetoEstudo, pacote: bool = False) -> Dict[str, Any]:
+        """
+        Monta o manifesto de um projeto, com os metadados e as referências aos
+        arquivos dos grafos.
+        
+        Args:
+            projeto: Projeto a ser descrito
+            pacote: Se True, referencia os grafos pelas entradas do pacote ZIP;
+                caso contrário, pelo hash de conteúdo no armazém
+            
+        Returns:
+            Dict[str, Any]: Manifesto do projeto (sem as listas de operações,
+            algoritmos, notas e histórico)
+        """
+        dados = {
+            "versao_formato": 2,
+            "id": projeto.id,
+            "titulo": projeto.titulo,
+            "descricao": projeto.descricao,
+            "autor": projeto.autor,
+            "data_criacao": projeto.data_criacao.isoformat(),
+            "data_atualizacao": projeto.data_atualizacao.isoformat(),
+            "tags": list(projeto.tags),
+            "grafos": {}
+        }
+        for grafo_id in projeto.grafos:
+            entrada = projeto.grafos.obter_metadados(grafo_id)
+            entrada.pop("hash", None)
+            if pacote:
+                entrada["arquivo"] = f"{DIRETORIO_GRAFOS}/{grafo_id}.grafo"
+            else:
+                entrada["hash"] = projeto.grafos.obter_hash_salvo(grafo_id)
+            entrada["formato"] = "binario"
+            dados["grafos"][grafo_id] = entrada
+        return dados
+    
+    def _remover_formato_antigo(self, projeto_id: str) -> None:
+        """
+        Remove os arquivos de um projeto salvo no formato antigo (JSON único).
+        
+        Args:
+            projeto_id: ID do projeto
+        """
+        caminho_arquivo = os.path.join(self.diretorio_armazenamento, f"{projeto_id}.json")
+        if os.path.exists(caminho_arquivo):
+            os.remove(caminho_arquivo)
+        shutil.rmtree(os.path.join(self.diretorio_armazenamento, f"{projeto_id}.grafos"), ignore_errors=True)
+    
     def exportar_projeto(self, projeto_id: str, formato: str = "json") -> Optional[str]:
         """
         Exporta um projeto para um formato específico.
@@ -642,19 +1263,109 @@ class GerenciadorProjetos:
             return json.dumps(dados, indent=2, default=str)
         
         elif formato == "zip":
-            # Implementação para formato ZIP seria aqui
-            # (requer manipulação de arquivos temporários e compressão)
-            return None
+            # Monta o pacote inteiro em memória; use exportar_projeto_zip para
+            # emiti-lo em partes
+            return b"".join(self._gerar_zip(projeto))
         
         else:
             return None
     
-    def importar_projeto(self, conteudo: str, formato: str = "json") -> Optional[str]:
+    def exportar_projeto_zip(self, projeto_id: str) -> Optional[Iterator[bytes]]:
+        """
+        Exporta um projeto como pacote ZIP emitido em partes.
+        
+        O pacote contém o manifesto, uma entrada JSON para cada lista do
+        projeto (operações, algoritmos, notas e histórico) e o arquivo binário
+        de cada grafo. As entradas são comprimidas à medida que são escritas,
+        de modo que a memória usada fica limitada pelo maior grafo.
+        
+        Args:
+            projeto_id: ID do projeto a ser exportado
+            
+        Returns:
+            Optional[Iterator[bytes]]: Partes do pacote ZIP ou None se o
+            projeto não for encontrado
+        """
+        projeto = self.obter_projeto(projeto_id)
+        if not projeto:
+            return None
+        
+        return self._gerar_zip(projeto)
+    
+    def _gerar_zip(self, projeto: ProjetoEstudo) -> Iterator[bytes]:
+        """
+        Gera o pacote ZIP de um projeto em partes.
+        
+        Args:
+            projeto: Projeto a ser exportado
+            
+        Returns:
+            Iterator[bytes]: Partes do pacote ZIP
+        """
+        saida = _SaidaZip()
+        with zipfile.ZipFile(saida, 'w', compression=zipfile.ZIP_DEFLATED) as pacote:
+            # Manifesto e listas do projeto
+            pacote.writestr(ARQUIVO_MANIFESTO, json.dumps(self._montar_manifesto(projeto, pacote=True), indent=2, default=str))
+            for nome in LISTAS_PROJETO:
+                pacote.writestr(f"{nome}.json", json.dumps(getattr(projeto, nome), indent=2, default=str))
+            yield saida.coletar()
+            
+            # Arquivos binários dos grafos, copiados em blocos
+            for grafo_id in list(projeto.grafos):
+                with pacote.open(f"{DIRETORIO_GRAFOS}/{grafo_id}.grafo", 'w', force_zip64=True) as entrada:
+                    for bloco in self._ler_grafo_binario(projeto, grafo_id):
+                        entrada.write(bloco)
+                        dados = saida.coletar()
+                        if dados:
+                            yield dados
+        
+        # Diretório central do pacote
+        yield saida.coletar()
+    
+    def _ler_grafo_binario(self, projeto: ProjetoEstudo, grafo_id: str) -> Iterator[bytes]:
+        """
+        Lê em blocos o arquivo binário de um grafo do projeto.
+        
+        Usa o arquivo já salvo quando o grafo não foi alterado; caso contrário,
+        grava o grafo em um arquivo temporário.
+        
+        Args:
+            projeto: Projeto ao qual o grafo pertence
+            grafo_id: ID do grafo
+            
+        Returns:
+            Iterator[bytes]: Blocos do arquivo binário
+            
+        Raises:
+            ValueError: Se não for possível gravar o grafo
+        """
+        caminho = projeto.grafos.obter_arquivo(grafo_id)
+        temporario = None
+        if caminho is None:
+            descritor, temporario = tempfile.mkstemp(suffix=".grafo")
+            os.close(descritor)
+            if not exportar_binario(projeto.grafos[grafo_id], temporario):
+                os.remove(temporario)
+                raise ValueError(f"Erro ao exportar o grafo {grafo_id}")
+            caminho = temporario
+        
+        try:
+            with open(caminho, 'rb') as arquivo:
+                while True:
+                    bloco = arquivo.read(TAMANHO_BLOCO_ZIP)
+                    if not bloco:
+                        break
+                    yield bloco
+        finally:
+            if temporario is not None:
+                os.remove(temporario)
+    
+    def importar_projeto(self, conteudo: Union[str, bytes], formato: str = "json") -> Optional[str]:
         """
         Importa um projeto a partir de uma representação.
         
         Args:
-            conteudo: Conteúdo do projeto
+            conteudo: Conteúdo do projeto (bytes do pacote para o formato "zip")
             formato: Formato do conteúdo ("json", "zip")
             
         Returns:
@@ -717,8 +1428,117 @@ class GerenciadorProjetos:
                 return None
         
         elif formato == "zip":
-            # Implementação para formato ZIP seria aqui
-            return None
+            return self.importar_projeto_zip(io.BytesIO(conteudo))
         
         else:
             return None
+    
+    def importar_projeto_zip(self, arquivo: BinaryIO) -> Optional[str]:
+        """
+        Importa um projeto a partir de um pacote ZIP.
+        
+        Os arquivos binários dos grafos são copiados em blocos para o armazém e
+        registrados para carregamento sob demanda. Cada grafo é carregado uma
+        vez para que seu hash de conteúdo seja calculado, de modo que a memória
+        usada fica limitada pelo maior grafo. O projeto importado é salvo.
+        
+        Args:
+            arquivo: Arquivo binário posicionável com o pacote ZIP
+            
+        Returns:
+            Optional[str]: ID do projeto importado ou None em caso de erro
+        """
+        try:
+            with zipfile.ZipFile(arquivo) as pacote:
+                dados = json.loads(pacote.read(ARQUIVO_MANIFESTO))
+                nomes = set(pacote.namelist())
+                
+                # Cria o objeto de projeto
+                projeto = ProjetoEstudo(
+                    titulo=dados.get("titulo", "Projeto Importado"),
+                    descricao=dados.get("descricao", ""),
+                    autor=dados.get("autor", "Usuário")
+                )
+                
+                # Atualiza os atributos
+                if "id" in dados:
+                    projeto.id = _validar_identificador(dados["id"])
+                if "data_criacao" in dados:
+                    projeto.data_criacao = datetime.fromisoformat(dados["data_criacao"])
+                if "data_atualizacao" in dados:
+                    projeto.data_atualizacao = datetime.fromisoformat(dados["data_atualizacao"])
+                if "tags" in dados:
+                    projeto.tags = set(dados["tags"])
+                for nome in LISTAS_PROJETO:
+                    if f"{nome}.json" in nomes:
+                        setattr(projeto, nome, json.loads(pacote.read(f"{nome}.json")))
+                
+                # Copia os arquivos dos grafos para o armazém
+                for grafo_id, grafo_dados in dados.get("grafos", {}).items():
+                    descritor, temporario = tempfile.mkstemp(suffix=".tmp", dir=self.armazem.diretorio)
+                    with pacote.open(grafo_dados["arquivo"]) as origem, os.fdopen(descritor, 'wb') as destino:
+                        shutil.copyfileobj(origem, destino, TAMANHO_BLOCO_ZIP)
+                    
+                    # O hash é recalculado: o manifesto do pacote não é confiável
+                    hash_conteudo = self.armazem.gravar_arquivo(temporario)
+                    if hash_conteudo is None:
+                        raise ValueError(f"Arquivo do grafo {grafo_id} inválido")
+                    
+                    metadados = {chave: valor for chave, valor in grafo_dados.items()
+                                 if chave not in ("arquivo", "formato")}
+                    metadados.setdefault("nome", grafo_id)
+                    metadados["hash"] = hash_conteudo
+                    projeto.grafos.registrar_arquivo(grafo_id, self.armazem.obter_caminho(hash_conteudo), metadados)
+            
+            # Adiciona à memória e grava o manifesto junto aos grafos copiados
+            self.projetos_em_memoria[projeto.id] = projeto
+            if not self.salvar_projeto(projeto.id):
+                return None
+            
+            return projeto.id
+            
+        except Exception as e:
+            print(f"Erro ao importar projeto: {e}")
+            return None
+
+
+def _validar_identificador(identificador: str) -> str:
+    """
+    Valida um identificador usado como nome de arquivo ou diretório.
+    
+    Args:
+        identificador: Identificador lido de um pacote importado
+        
+    Returns:
+        str: O próprio identificador
+        
+    Raises:
+        ValueError: Se o identificador puder escapar do diretório de destino
+    """
+    if (not identificador or identificador in (".", "..")
+            or os.path.basename(identificador) != identificador or "\\" in identificador):
+        raise ValueError(f"Identificador inválido: {identificador!r}")
+    return identificador
+
+
+def _gravar_json_atomico(caminho: str, dados: Any, **opcoes) -> None:
+    """
+    Grava um arquivo JSON de forma atômica.
+    
+    O conteúdo é escrito em um arquivo temporário exclusivo no mesmo
+    diretório e depois renomeado sobre o destino, de modo que gravações
+    simultâneas não compartilham o arquivo temporário.
+    
+    Args:
+        caminho: Arquivo de destino
+        dados: Conteúdo a ser serializado
+        **opcoes: Opções adicionais para ``json.dump`` (por exemplo, ``indent``)
+    """
+    descritor, temporario = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(caminho))
+    try:
+        with os.fdopen(descritor, 'w') as f:
+            json.dump(dados, f, default=str, **opcoes)
+        os.replace(temporario, caminho)
+    except BaseException:
+        os.unlink(temporario)
+        raise
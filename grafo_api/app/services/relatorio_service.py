@@ -7,15 +7,17 @@ e visualizações.
 """
 
 import os
+import json
 import time
-import tempfile
+import uuid
+import threading
 import base64
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import networkx as nx
-from weasyprint import HTML, CSS
 from jinja2 import Environment, FileSystemLoader
 
 # Importações do backend de grafos
@@ -23,6 +25,18 @@ import sys
 sys.path.append('/home/ubuntu')  # Adiciona o diretório raiz ao path
 from grafo_backend.core import Grafo
 from grafo_backend.visualizacao import gerar_layout, visualizar_grafo
+from grafo_backend.visualizacao.renderizacao import agendar_renderizacao, renderizar_grafo
+
+
+# Número de relatórios gerados ao mesmo tempo em segundo plano
+TRABALHADORES_RELATORIOS = 2
+
+# Número máximo de relatórios PDF e de imagens de grafos mantidos em cache
+LIMITE_RELATORIOS_EM_CACHE = 16
+LIMITE_IMAGENS_EM_CACHE = 256
+
+# Número máximo de tarefas de relatório lembradas (as concluídas mais antigas são descartadas)
+LIMITE_TAREFAS = 256
 
 
 class RelatorioGrafoPDF:
@@ -53,6 +67,15 @@ class RelatorioGrafoPDF:
         
         # Registra filtros personalizados
         self.env.filters['datetime_format'] = self._datetime_format
+        
+        # Relatórios gerados em segundo plano, por ID da tarefa, e caches dos
+        # PDFs (por projeto, versão e configuração) e das imagens dos grafos
+        # (por hash de conteúdo, layout e tamanho)
+        self._executor = ThreadPoolExecutor(max_workers=TRABALHADORES_RELATORIOS, thread_name_prefix="relatorios")
+        self._tarefas: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_relatorios: "OrderedDict[Tuple[str, str, str], bytes]" = OrderedDict()
+        self._cache_imagens: "OrderedDict[Tuple[str, str, int, int], str]" = OrderedDict()
+        self._trava = threading.Lock()
     
     def gerar_relatorio(self, 
                        titulo: str,
@@ -96,17 +119,21 @@ class RelatorioGrafoPDF:
         config.setdefault('incluir_referencias', True)
         config.setdefault('estilo', 'padrao')
         
-        # Gera imagens para os grafos
+        # Agenda as imagens dos grafos e dos resultados dos algoritmos, que
+        # são desenhadas em paralelo no pool de renderização
+        imagens = []
         for grafo_info in grafos:
             if 'grafo' in grafo_info:
-                grafo = grafo_info['grafo']
-                grafo_info['imagem_base64'] = self._gerar_imagem_grafo_base64(grafo)
-        
-        # Gera imagens para os resultados dos algoritmos, se necessário
+                futuro = self._agendar_imagem_grafo(grafo_info['grafo'])
+                imagens.append((grafo_info, 'imagem_base64', futuro))
         for algo_info in algoritmos:
             if 'resultado_visual' in algo_info and isinstance(algo_info['resultado_visual'], Grafo):
-                grafo = algo_info['resultado_visual']
-                algo_info['imagem_resultado_base64'] = self._gerar_imagem_grafo_base64(grafo)
+                futuro = self._agendar_imagem_grafo(algo_info['resultado_visual'])
+                imagens.append((algo_info, 'imagem_resultado_base64', futuro))
+        
+        # Aguarda as imagens
+        for destino, campo, futuro in imagens:
+            destino[campo] = futuro.result()
         
         # Carrega o template
         template = self.env.get_template(f"relatorio_{config['estilo']}.html")
@@ -121,6 +148,10 @@ class RelatorioGrafoPDF:
             config=config
         )
         
+        # O WeasyPrint só é necessário para gerar o PDF; as tarefas e os caches
+        # do serviço não dependem dele
+        from weasyprint import HTML, CSS
+        
         # Carrega o CSS
         css_file = os.path.join(self.template_dir, f"estilo_{config['estilo']}.css")
         css = CSS(filename=css_file)
@@ -320,6 +351,143 @@ class RelatorioGrafoPDF:
             config=config
         )
     
+    def iniciar_relatorio_projeto(self, projeto: Any, config: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Inicia a geração do relatório PDF de um projeto em segundo plano.
+        
+        Se um relatório da mesma versão do projeto, com a mesma configuração,
+        já estiver em cache, a tarefa é criada como concluída; se já estiver
+        sendo gerado, a tarefa existente é devolvida.
+        
+        Args:
+            projeto: Projeto de estudo (``ProjetoEstudo``)
+            config: Configurações de formatação (opcional)
+            
+        Returns:
+            Dict[str, Any]: Descrição da tarefa (ID, projeto e estado)
+        """
+        config = dict(config or {})
+        chave = (projeto.id, projeto.obter_assinatura(), json.dumps(config, sort_keys=True, default=str))
+        
+        with self._trava:
+            pdf_bytes = self._cache_relatorios.get(chave)
+            if pdf_bytes is not None:
+                # Relatório já gerado para esta versão do projeto
+                self._cache_relatorios.move_to_end(chave)
+                futuro = Future()
+                futuro.set_result(pdf_bytes)
+            else:
+                # Reaproveita uma geração em andamento
+                for tarefa_id, tarefa in self._tarefas.items():
+                    if tarefa['chave'] == chave and not tarefa['futuro'].done():
+                        return self._descrever_tarefa(tarefa_id, tarefa)
+                futuro = self._executor.submit(self._executar_relatorio_projeto, projeto, config, chave)
+            
+            tarefa_id = str(uuid.uuid4())
+            tarefa = {'projeto_id': projeto.id, 'chave': chave, 'futuro': futuro, 'criada_em': datetime.now()}
+            self._tarefas[tarefa_id] = tarefa
+            
+            # Descarta as tarefas concluídas mais antigas
+            while len(self._tarefas) > LIMITE_TAREFAS:
+                mais_antiga = next(iter(self._tarefas))
+                if not self._tarefas[mais_antiga]['futuro'].done():
+                    break
+                del self._tarefas[mais_antiga]
+        
+        return self._descrever_tarefa(tarefa_id, tarefa)
+    
+    def obter_tarefa(self, tarefa_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém o estado de uma tarefa de relatório.
+        
+        Args:
+            tarefa_id: ID da tarefa
+            
+        Returns:
+            Optional[Dict[str, Any]]: Descrição da tarefa ou None se não existir
+        """
+        with self._trava:
+            tarefa = self._tarefas.get(tarefa_id)
+        if tarefa is None:
+            return None
+        return self._descrever_tarefa(tarefa_id, tarefa)
+    
+    def obter_pdf_tarefa(self, tarefa_id: str) -> Optional[bytes]:
+        """
+        Obtém o PDF gerado por uma tarefa de relatório.
+        
+        Args:
+            tarefa_id: ID da tarefa
+            
+        Returns:
+            Optional[bytes]: Conteúdo do PDF ou None se a tarefa não existir,
+            ainda não tiver terminado ou tiver falhado
+        """
+        with self._trava:
+            tarefa = self._tarefas.get(tarefa_id)
+        if tarefa is None or not tarefa['futuro'].done() or tarefa['futuro'].exception() is not None:
+            return None
+        return tarefa['futuro'].result()
+    
+    def _descrever_tarefa(self, tarefa_id: str, tarefa: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converte uma tarefa em um dicionário com seu estado atual.
+        """
+        futuro = tarefa['futuro']
+        erro = None
+        if futuro.done():
+            erro = futuro.exception()
+            estado = 'erro' if erro is not None else 'concluido'
+        else:
+            estado = 'executando' if futuro.running() else 'pendente'
+        
+        return {
+            'tarefa_id': tarefa_id,
+            'projeto_id': tarefa['projeto_id'],
+            'estado': estado,
+            'erro': str(erro) if erro is not None else None,
+            'criada_em': tarefa['criada_em']
+        }
+    
+    def _executar_relatorio_projeto(self, projeto: Any, config: Dict[str, Any],
+                                    chave: Tuple[str, str, str]) -> bytes:
+        """
+        Gera o relatório de um projeto (executado no pool de relatórios) e o guarda em cache.
+        """
+        pdf_bytes = self.gerar_relatorio_projeto(self._dados_projeto(projeto), config)
+        
+        with self._trava:
+            self._cache_relatorios[chave] = pdf_bytes
+            self._cache_relatorios.move_to_end(chave)
+            while len(self._cache_relatorios) > LIMITE_RELATORIOS_EM_CACHE:
+                self._cache_relatorios.popitem(last=False)
+        
+        return pdf_bytes
+    
+    def _dados_projeto(self, projeto: Any) -> Dict[str, Any]:
+        """
+        Converte um ``ProjetoEstudo`` no dicionário usado por ``gerar_relatorio_projeto``.
+        
+        As listas são copiadas, pois a geração do relatório acrescenta as
+        imagens aos dicionários dos grafos e dos algoritmos.
+        """
+        grafos = []
+        for grafo_id in projeto.grafos:
+            grafo = projeto.grafos[grafo_id]
+            grafos.append(dict(projeto.grafos.obter_metadados(grafo_id), id=grafo_id, grafo=grafo))
+        
+        return {
+            'titulo': projeto.titulo,
+            'descricao': projeto.descricao,
+            'autor': projeto.autor,
+            'data_criacao': projeto.data_criacao,
+            'data_atualizacao': projeto.data_atualizacao,
+            'grafos': grafos,
+            'operacoes': [dict(operacao) for operacao in projeto.operacoes],
+            'algoritmos': [dict(algoritmo) for algoritmo in projeto.algoritmos],
+            'notas': [nota['texto'] for nota in projeto.notas]
+        }
+    
     def _gerar_imagem_grafo_base64(self, grafo: Grafo, layout: str = 'spring', 
                                   largura: int = 800, altura: int = 600) -> str:
         """
@@ -334,12 +502,60 @@ class RelatorioGrafoPDF:
         Returns:
             str: Imagem em formato base64
         """
+        return self._agendar_imagem_grafo(grafo, layout, largura, altura).result()
+    
+    def _agendar_imagem_grafo(self, grafo: Grafo, layout: str = 'spring',
+                              largura: int = 800, altura: int = 600) -> Future:
+        """
+        Agenda a imagem de um grafo no pool de renderização.
+        
+        As imagens ficam em cache pelo hash de conteúdo do grafo, de modo que
+        grafos não alterados (inclusive cópias em outros projetos) não são
+        desenhados novamente.
+        
+        Args:
+            grafo: Grafo a ser visualizado
+            layout: Layout de visualização
+            largura: Largura da imagem em pixels
+            altura: Altura da imagem em pixels
+            
+        Returns:
+            Future: Futuro com a imagem em formato base64
+        """
+        chave = (grafo.obter_hash(), layout, largura, altura)
+        with self._trava:
+            img_base64 = self._cache_imagens.get(chave)
+            if img_base64 is not None:
+                self._cache_imagens.move_to_end(chave)
+        if img_base64 is not None:
+            futuro = Future()
+            futuro.set_result(img_base64)
+            return futuro
+        
+        futuro = agendar_renderizacao(self._desenhar_imagem_grafo, grafo, layout, largura, altura)
+        
+        def guardar(concluido: Future) -> None:
+            if concluido.exception() is not None:
+                return
+            with self._trava:
+                self._cache_imagens[chave] = concluido.result()
+                self._cache_imagens.move_to_end(chave)
+                while len(self._cache_imagens) > LIMITE_IMAGENS_EM_CACHE:
+                    self._cache_imagens.popitem(last=False)
+        
+        futuro.add_done_callback(guardar)
+        return futuro
+    
+    def _desenhar_imagem_grafo(self, grafo: Grafo, layout: str, largura: int, altura: int) -> str:
+        """
+        Calcula o layout e desenha um grafo (executado no pool de renderização).
+        
+        Returns:
+            str: Imagem PNG em formato base64
+        """
         # Obtém o grafo NetworkX subjacente
         g_nx = grafo.obter_grafo_networkx()
         
-        # Configura a figura
-        plt.figure(figsize=(largura/100, altura/100), dpi=100)
-        
         # Gera o layout
         pos = None
         if layout == 'spring':
@@ -351,27 +567,19 @@ class RelatorioGrafoPDF:
         else:
             pos = nx.spring_layout(g_nx)  # Layout padrão
         
-        # Desenha o grafo
-        nx.draw(g_nx, pos, with_labels=True, node_color='skyblue', node_size=700, 
-                edge_color='gray', width=1, font_size=10, font_weight='bold')
-        
         # Se o grafo for ponderado, adiciona os pesos das arestas
+        edge_labels = None
         if hasattr(grafo, 'eh_ponderado') and grafo.eh_ponderado():
             edge_labels = {}
             for u, v in g_nx.edges():
                 edge_labels[(u, v)] = grafo.obter_peso_aresta(u, v)
-            nx.draw_networkx_edge_labels(g_nx, pos, edge_labels=edge_labels)
         
-        # Salva a imagem em um buffer
-        buf = tempfile.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight')
-        plt.close()
+        # Desenha o grafo sem o estado global do pyplot
+        estilo = {'node_size': 700, 'edge_color': 'gray', 'font_size': 10, 'font_weight': 'bold'}
+        imagem = renderizar_grafo(g_nx, pos, 'png', largura, altura, rotulos_arestas=edge_labels, estilo=estilo)
         
         # Converte para base64
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        
-        return img_base64
+        return base64.b64encode(imagem).decode('utf-8')
     
     def _obter_teoria_algoritmo(self, algoritmo: str) -> str:
         """
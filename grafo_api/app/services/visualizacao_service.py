@@ -4,19 +4,54 @@ Serviço para visualização de grafos.
 
 import logging
 import time
-import base64
-from typing import Dict, Any, Optional, List
-import io
-import matplotlib.pyplot as plt
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 import networkx as nx
+import numpy as np
+import scipy.sparse as sp
 
+from app.core.config import settings
 from app.schemas.grafo import DadosVisualizacao
 from app.services.grafo_service import GrafoService
+from grafo_backend.core import Grafo
+from grafo_backend.visualizacao.agregacao import AGRUPAMENTOS, agregar, agrupar_comunidades, agrupar_espacial
+from grafo_backend.visualizacao.indice_espacial import IndiceEspacial
+from grafo_backend.visualizacao.forca import (iterar_layout_forca, layout_barnes_hut, layout_multinivel,
+                                              matriz_adjacencia, montar_matriz_simetrica)
+from grafo_backend.visualizacao.quadros import CodificadorQuadros
+from grafo_backend.visualizacao.renderizacao import (FORMATOS_IMAGEM, MAXIMO_PIXELS, MINIMO_PIXELS,
+                                                    renderizar_em_segundo_plano)
+from grafo_backend.visualizacao.layout import LAYOUTS_INCREMENTAIS, gerar_layout_incremental
 
 # Configuração de logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Número máximo de layouts mantidos em cache
+LIMITE_LAYOUTS_EM_CACHE = 64
+
+# Número máximo de matrizes de adjacência e de agrupamentos mantidos em cache
+LIMITE_ESTRUTURAS_EM_CACHE = 8
+LIMITE_AGRUPAMENTOS_EM_CACHE = 256
+
+# Número máximo de índices espaciais mantidos em cache
+LIMITE_INDICES_EM_CACHE = 8
+
+# Número máximo de imagens renderizadas mantidas em cache
+LIMITE_IMAGENS_EM_CACHE = 64
+
+# Menor limite de elementos aceito nas visões agregadas
+MINIMO_ELEMENTOS_AGREGADOS = 8
+
+# Layouts de força que podem ser transmitidos progressivamente
+LAYOUTS_PROGRESSIVOS = ("multinivel", "barnes_hut")
+
+# Layouts que aceitam semente para o gerador aleatório
+_LAYOUTS_COM_SEMENTE = {"spring", "random", "barnes_hut", "multinivel"}
+
 
 class VisualizacaoService:
     """
@@ -37,8 +72,31 @@ class VisualizacaoService:
             "random": nx.random_layout,
             "shell": nx.shell_layout,
             "spectral": nx.spectral_layout,
-            "kamada_kawai": nx.kamada_kawai_layout
+            "kamada_kawai": nx.kamada_kawai_layout,
+            "barnes_hut": layout_barnes_hut,
+            "multinivel": layout_multinivel
         }
+        
+        # Posições calculadas por (grafo, layout, semente), com a referência
+        # ao grafo e a versão em que foram calculadas
+        self._cache_layouts: "OrderedDict[Tuple[str, str, Optional[int]], Tuple[Any, int, Dict[Any, Tuple[float, float]]]]" = OrderedDict()
+        self._trava_layouts = threading.Lock()
+        
+        # Matrizes de adjacência por grafo e agrupamentos das visões agregadas
+        self._cache_estruturas: "OrderedDict[str, Tuple[Any, int, Tuple[List[Any], sp.csr_matrix, sp.csr_matrix]]]" = OrderedDict()
+        self._cache_agrupamentos: "OrderedDict[Tuple[Any, ...], Tuple[Any, int, np.ndarray]]" = OrderedDict()
+        self._trava_agregacao = threading.Lock()
+        
+        # Índices espaciais por (grafo, layout, semente)
+        self._cache_indices: "OrderedDict[Tuple[str, str, Optional[int]], Tuple[Any, int, IndiceEspacial]]" = OrderedDict()
+        self._trava_indices = threading.Lock()
+        
+        # Imagens renderizadas por (grafo, layout, semente, formato, largura,
+        # altura) e renderizações em andamento, com a referência ao grafo e a
+        # versão em que foram geradas
+        self._cache_imagens: "OrderedDict[Tuple[Any, ...], Tuple[Any, int, bytes]]" = OrderedDict()
+        self._imagens_em_andamento: "Dict[Tuple[Any, ...], Tuple[Any, int, Future]]" = {}
+        self._trava_imagens = threading.Lock()
         logger.debug(f"VisualizacaoService inicializado com ID: {id(self)}")
     
     def _get_grafo_service(self):
@@ -63,7 +121,88 @@ class VisualizacaoService:
         """
         return list(self._layouts.keys())
     
-    def visualizar_grafo(self, grafo_id: str, layout: str = "spring", incluir_atributos: bool = True) -> Dict[str, Any]:
+    def obter_posicoes(self, grafo_id: str, layout: str = "spring",
+                       semente: Optional[int] = None) -> Dict[Any, Tuple[float, float]]:
+        """
+        Obtém as posições dos vértices de um grafo em um layout, usando o cache.
+        
+        As posições são mantidas por (grafo, versão, layout, semente). Se o grafo
+        foi alterado desde o último cálculo, os layouts de força partem das
+        posições anteriores e apenas os vértices novos são acomodados perto de
+        seus vizinhos; os demais layouts são recalculados.
+        
+        Args:
+            grafo_id: ID do grafo.
+            layout: Layout de visualização.
+            semente: Semente dos layouts aleatórios (opcional).
+            
+        Returns:
+            Dict[Any, Tuple[float, float]]: Posição (x, y) de cada vértice.
+            
+        Raises:
+            ValueError: Se o grafo não existir ou o layout não for suportado.
+        """
+        # Obtém o grafo
+        grafo = self._get_grafo_service().obter_grafo(grafo_id)
+        if not grafo:
+            raise ValueError(f"Grafo com ID {grafo_id} não encontrado.")
+        
+        # Verifica se o layout é suportado
+        if layout not in self._layouts:
+            raise ValueError(f"Layout '{layout}' não suportado.")
+        
+        chave = (grafo_id, layout, semente)
+        versao = grafo.obter_versao()
+        with self._trava_layouts:
+            entrada = self._cache_layouts.get(chave)
+            if entrada is not None:
+                self._cache_layouts.move_to_end(chave)
+        
+        # Mesmo grafo e mesma versão: reaproveita as posições
+        if entrada is not None and entrada[0]() is grafo and entrada[1] == versao:
+            logger.debug(f"Layout em cache: ID={grafo_id}, Layout={layout}, Versão={versao}")
+            return entrada[2]
+        
+        g_layout = self._grafo_para_layout(grafo)
+        if entrada is not None and layout in LAYOUTS_INCREMENTAIS:
+            logger.debug(f"Layout incremental: ID={grafo_id}, Layout={layout}, Versão={versao}")
+            pos = gerar_layout_incremental(g_layout, layout, entrada[2], semente)
+        elif layout in _LAYOUTS_COM_SEMENTE:
+            pos = self._layouts[layout](g_layout, seed=semente)
+        else:
+            pos = self._layouts[layout](g_layout)
+        
+        posicoes = {v: (float(p[0]), float(p[1])) for v, p in pos.items()}
+        with self._trava_layouts:
+            self._cache_layouts[chave] = (weakref.ref(grafo), versao, posicoes)
+            self._cache_layouts.move_to_end(chave)
+            while len(self._cache_layouts) > LIMITE_LAYOUTS_EM_CACHE:
+                self._cache_layouts.popitem(last=False)
+        
+        return posicoes
+    
+    def _grafo_para_layout(self, grafo: Grafo) -> nx.Graph:
+        """
+        Monta o grafo NetworkX usado no cálculo dos layouts.
+        
+        Mantém os IDs originais dos vértices e apenas pesos numéricos nas
+        arestas (pesos não numéricos viram 1.0), sem os demais atributos.
+        
+        Args:
+            grafo: Grafo a ser posicionado.
+            
+        Returns:
+            nx.Graph: Grafo (ou DiGraph) com os pesos em 'weight'.
+        """
+        G = nx.DiGraph() if grafo.eh_direcionado() else nx.Graph()
+        G.add_nodes_from(grafo.obter_vertices())
+        G.add_weighted_edges_from(
+            (u, v, _peso_numerico(atributos)) for u, v, atributos in grafo.obter_arestas()
+        )
+        return G
+    
+    def visualizar_grafo(self, grafo_id: str, layout: str = "spring", incluir_atributos: bool = True,
+                         semente: Optional[int] = None) -> Dict[str, Any]:
         """
         Obtém dados para visualização de um grafo.
         
@@ -71,6 +210,7 @@ class VisualizacaoService:
             grafo_id: ID do grafo.
             layout: Layout de visualização.
             incluir_atributos: Incluir atributos dos vértices e arestas.
+            semente: Semente dos layouts aleatórios (opcional).
             
         Returns:
             Dict[str, Any]: Dados para visualização.
@@ -91,56 +231,35 @@ class VisualizacaoService:
             raise ValueError(f"Layout '{layout}' não suportado.")
         
         try:
-            # Cria um grafo NetworkX
-            G = nx.Graph() if not grafo.eh_direcionado() else nx.DiGraph()
-            
-            # Adiciona os vértices
-            for v in grafo.obter_vertices():
-                atributos = grafo.obter_atributos_vertice(v) if incluir_atributos else {}
-                G.add_node(str(v), **atributos)
-            
-            # Adiciona as arestas com peso numérico para evitar erro no NetworkX
-            for u, v, atributos_aresta in grafo.obter_arestas():
-                # Extrai o peso como valor numérico ou usa 1.0 como padrão
-                peso = 1.0
-                if 'weight' in atributos_aresta and isinstance(atributos_aresta['weight'], (int, float)):
-                    peso = float(atributos_aresta['weight'])
-                
-                # Cria uma cópia dos atributos sem o peso para evitar conflito
-                atributos_sem_peso = {k: v for k, v in atributos_aresta.items() if k != 'weight'}
-                
-                # Adiciona a aresta com peso numérico e outros atributos separados
-                G.add_edge(str(u), str(v), weight=peso, **atributos_sem_peso)
-            
-            # Calcula o layout
-            pos = self._layouts[layout](G)
+            # Calcula (ou reaproveita) as posições dos vértices
+            pos = self.obter_posicoes(grafo_id, layout, semente)
             
             # Prepara os dados de visualização
             vertices = []
-            for v in G.nodes():
+            for v in grafo.obter_vertices():
                 node_data = {
-                    "id": v,
-                    "x": float(pos[v][0]),
-                    "y": float(pos[v][1])
+                    "id": str(v),
+                    "x": pos[v][0],
+                    "y": pos[v][1]
                 }
                 
                 # Adiciona atributos se solicitado
                 if incluir_atributos:
-                    node_data["atributos"] = dict(G.nodes[v])
+                    node_data["atributos"] = dict(grafo.obter_atributos_vertice(v))
                 
                 vertices.append(node_data)
             
             arestas = []
-            for u, v, data in G.edges(data=True):
+            for u, v, atributos_aresta in grafo.obter_arestas():
                 edge_data = {
-                    "origem": u,
-                    "destino": v
+                    "origem": str(u),
+                    "destino": str(v)
                 }
                 
-                # Adiciona atributos se solicitado
+                # Adiciona atributos se solicitado, com o peso sempre numérico
                 if incluir_atributos:
-                    # Recria os atributos incluindo o peso como parte do dicionário
-                    atributos = {k: v for k, v in data.items()}
+                    atributos = {"weight": _peso_numerico(atributos_aresta)}
+                    atributos.update((k, valor) for k, valor in atributos_aresta.items() if k != 'weight')
                     edge_data["atributos"] = atributos
                 
                 arestas.append(edge_data)
@@ -155,20 +274,395 @@ class VisualizacaoService:
             logger.error(f"Erro ao visualizar grafo {grafo_id}: {e}", exc_info=True)
             raise ValueError(f"Erro ao visualizar grafo: {str(e)}")
     
-    def gerar_imagem(self, grafo_id: str, formato: str = "png", layout: str = "spring") -> Dict[str, Any]:
+    def visualizar_agregado(self, grafo_id: str, layout: str = "multinivel", agrupamento: str = "comunidades",
+                            grupo: Optional[str] = None, limite_elementos: Optional[int] = None,
+                            semente: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Obtém uma visão em nível de detalhe de um grafo grande.
+        
+        Se os vértices do grupo e as arestas entre eles cabem no limite de
+        elementos, são devolvidos em detalhe. Caso contrário, os vértices são
+        divididos em super-vértices (por comunidades ou pela posição no
+        layout), posicionados no centroide de seus membros, e as arestas entre
+        grupos são somadas (em visões agregadas, a direção é ignorada). Se
+        ainda assim houver elementos demais, apenas as arestas entre grupos
+        com mais conexões são mantidas. Cada super-vértice tem um ID (como
+        "3" ou "3.1") que pode ser passado em ``grupo`` para detalhá-lo.
+        
+        Args:
+            grafo_id: ID do grafo.
+            layout: Layout de visualização.
+            agrupamento: Critério de agrupamento ('comunidades' ou 'espacial').
+            grupo: Grupo a ser detalhado (None para o grafo inteiro).
+            limite_elementos: Número máximo de vértices mais arestas na resposta
+                (padrão: LIMITE_ELEMENTOS_VISUALIZACAO).
+            semente: Semente dos layouts aleatórios e das comunidades (opcional).
+            
+        Returns:
+            Dict[str, Any]: Dados da visão, com 'detalhado' indicando se os
+            vértices são os originais ou super-vértices.
+            
+        Raises:
+            ValueError: Se o grafo ou o grupo não existirem ou algum parâmetro for inválido.
+        """
+        grafo = self._get_grafo_service().obter_grafo(grafo_id)
+        if not grafo:
+            raise ValueError(f"Grafo com ID {grafo_id} não encontrado.")
+        
+        if layout not in self._layouts:
+            raise ValueError(f"Layout '{layout}' não suportado.")
+        
+        if agrupamento not in AGRUPAMENTOS:
+            raise ValueError(f"Agrupamento '{agrupamento}' não suportado. Agrupamentos suportados: {', '.join(AGRUPAMENTOS)}")
+        
+        limite = settings.LIMITE_ELEMENTOS_VISUALIZACAO if limite_elementos is None else limite_elementos
+        if limite < MINIMO_ELEMENTOS_AGREGADOS:
+            raise ValueError(f"O limite de elementos deve ser de pelo menos {MINIMO_ELEMENTOS_AGREGADOS}.")
+        
+        caminho = _interpretar_grupo(grupo)
+        pos = self.obter_posicoes(grafo_id, layout, semente)
+        vertices, contagem, pesos, _ = self._obter_estrutura(grafo_id, grafo)
+        coordenadas = np.array([pos[v] for v in vertices], dtype=float).reshape(-1, 2)
+        limite_grupos = max(2, limite // 4)
+        
+        # Desce pela hierarquia de grupos até o grupo pedido
+        membros = np.arange(len(vertices))
+        for profundidade, indice in enumerate(caminho):
+            rotulos = self._obter_rotulos(grafo_id, grafo, layout, semente, agrupamento, limite_grupos,
+                                          tuple(caminho[:profundidade]), membros, contagem, coordenadas)
+            if indice > rotulos.max():
+                raise ValueError(f"Grupo '{grupo}' não encontrado.")
+            membros = membros[rotulos == indice]
+        
+        resposta = {
+            "layout": layout,
+            "agrupamento": agrupamento,
+            "grupo": grupo or None,
+            "total_vertices": len(membros),
+            "arestas_omitidas": 0
+        }
+        
+        # Grupo pequeno: vértices e arestas originais
+        if len(membros) <= limite:
+            ids = [vertices[i] for i in membros]
+            subgrafo = grafo.obter_grafo_networkx().subgraph(ids)
+            if len(ids) + subgrafo.number_of_edges() <= limite:
+                resposta["detalhado"] = True
+                resposta["vertices"] = [{"id": str(v), "x": pos[v][0], "y": pos[v][1]} for v in ids]
+                resposta["arestas"] = [
+                    {"origem": str(u), "destino": str(v), "peso": _peso_numerico(atributos)}
+                    for u, v, atributos in subgrafo.edges(data=True)
+                ]
+                return resposta
+        
+        # Grupo grande: super-vértices e arestas agregadas
+        rotulos = self._obter_rotulos(grafo_id, grafo, layout, semente, agrupamento, limite_grupos,
+                                      tuple(caminho), membros, contagem, coordenadas)
+        tamanhos, conexoes = agregar(contagem[membros][:, membros], rotulos)
+        _, soma_pesos = agregar(pesos[membros][:, membros], rotulos)
+        centroides = np.stack([np.bincount(rotulos, weights=coordenadas[membros, eixo]) for eixo in (0, 1)], axis=1)
+        centroides /= tamanhos[:, None]
+        
+        prefixo = f"{grupo}." if grupo else ""
+        resposta["detalhado"] = False
+        resposta["vertices"] = [
+            {"id": f"{prefixo}{i}", "x": float(x), "y": float(y), "tamanho": int(tamanho)}
+            for i, ((x, y), tamanho) in enumerate(zip(centroides, tamanhos))
+        ]
+        
+        # Mantém as arestas entre grupos com mais conexões até o limite
+        triangular = sp.triu(conexoes, k=1).tocoo()
+        ordem = np.argsort(-triangular.data, kind="stable")
+        mantidas = ordem[:max(0, limite - len(tamanhos))]
+        origens, destinos = triangular.row[mantidas], triangular.col[mantidas]
+        pesos_mantidos = np.asarray(soma_pesos[origens, destinos]).ravel()
+        resposta["arestas"] = [
+            {"origem": f"{prefixo}{u}", "destino": f"{prefixo}{v}", "peso": float(peso), "quantidade": int(quantidade)}
+            for u, v, peso, quantidade in zip(origens, destinos, pesos_mantidos, triangular.data[mantidas])
+        ]
+        resposta["arestas_omitidas"] = len(ordem) - len(mantidas)
+        return resposta
+    
+    def _obter_estrutura(self, grafo_id: str, grafo: Grafo) -> Tuple[List[Any], sp.csr_matrix, sp.csr_matrix,
+                                                                      Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Obtém os vértices, as matrizes de adjacência (conexões e pesos) e a lista
+        de arestas (origens, destinos e pesos, por índice) de um grafo, usando o cache.
+        """
+        versao = grafo.obter_versao()
+        with self._trava_agregacao:
+            entrada = self._cache_estruturas.get(grafo_id)
+        if entrada is not None and entrada[0]() is grafo and entrada[1] == versao:
+            return entrada[2]
+        
+        # Percorre as arestas uma única vez para as duas matrizes
+        g_nx = grafo.obter_grafo_networkx()
+        vertices = list(g_nx)
+        indice = {v: i for i, v in enumerate(vertices)}
+        m = g_nx.number_of_edges()
+        origens = np.empty(m, dtype=np.int64)
+        destinos = np.empty(m, dtype=np.int64)
+        valores = np.empty(m)
+        for i, (u, v, atributos) in enumerate(g_nx.edges(data=True)):
+            origens[i], destinos[i], valores[i] = indice[u], indice[v], _peso_numerico(atributos)
+        
+        estrutura = (vertices,
+                     montar_matriz_simetrica(len(vertices), origens, destinos),
+                     montar_matriz_simetrica(len(vertices), origens, destinos, valores),
+                     (origens, destinos, valores))
+        
+        with self._trava_agregacao:
+            self._cache_estruturas[grafo_id] = (weakref.ref(grafo), versao, estrutura)
+            self._cache_estruturas.move_to_end(grafo_id)
+            while len(self._cache_estruturas) > LIMITE_ESTRUTURAS_EM_CACHE:
+                self._cache_estruturas.popitem(last=False)
+        return estrutura
+    
+    def _obter_rotulos(self, grafo_id: str, grafo: Grafo, layout: str, semente: Optional[int], agrupamento: str,
+                       limite_grupos: int, caminho: Tuple[int, ...], membros: np.ndarray,
+                       contagem: sp.csr_matrix, coordenadas: np.ndarray) -> np.ndarray:
+        """
+        Obtém o grupo de cada membro de um grupo da hierarquia, usando o cache.
+        """
+        chave = (grafo_id, layout, semente, agrupamento, limite_grupos, caminho)
+        versao = grafo.obter_versao()
+        with self._trava_agregacao:
+            entrada = self._cache_agrupamentos.get(chave)
+            if entrada is not None:
+                self._cache_agrupamentos.move_to_end(chave)
+        if entrada is not None and entrada[0]() is grafo and entrada[1] == versao:
+            return entrada[2]
+        
+        logger.debug(f"Agrupando vértices: ID={grafo_id}, Agrupamento={agrupamento}, Grupo={caminho}")
+        if agrupamento == "espacial":
+            rotulos = agrupar_espacial(coordenadas[membros], limite_grupos)
+        else:
+            rotulos = agrupar_comunidades(contagem[membros][:, membros], coordenadas[membros], limite_grupos, semente)
+        
+        with self._trava_agregacao:
+            self._cache_agrupamentos[chave] = (weakref.ref(grafo), versao, rotulos)
+            self._cache_agrupamentos.move_to_end(chave)
+            while len(self._cache_agrupamentos) > LIMITE_AGRUPAMENTOS_EM_CACHE:
+                self._cache_agrupamentos.popitem(last=False)
+        return rotulos
+    
+    def obter_janela(self, grafo_id: str, xmin: float, ymin: float, xmax: float, ymax: float,
+                     zoom: Optional[int] = None, layout: str = "multinivel",
+                     semente: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Obtém os vértices e as arestas que intersectam uma janela do layout.
+        
+        A consulta usa um índice espacial das posições em cache, construído uma
+        vez por versão do grafo. Arestas que atravessam a janela são incluídas
+        mesmo com as extremidades fora dela, com as coordenadas das duas
+        extremidades. Com ``zoom``, a janela é rarefeita: em cada célula de uma
+        grade fixa no layout (mais fina a cada nível de zoom) fica apenas o
+        vértice de maior grau, e somem as arestas ligadas a vértices omitidos.
+        
+        Args:
+            grafo_id: ID do grafo.
+            xmin: Limite esquerdo da janela.
+            ymin: Limite inferior da janela.
+            xmax: Limite direito da janela.
+            ymax: Limite superior da janela.
+            zoom: Nível de zoom para a rarefação (None para não rarefazer).
+            layout: Layout de visualização.
+            semente: Semente dos layouts aleatórios (opcional).
+            
+        Returns:
+            Dict[str, Any]: Vértices e arestas da janela e contagens de elementos omitidos.
+            
+        Raises:
+            ValueError: Se o grafo não existir ou algum parâmetro for inválido.
+        """
+        grafo = self._get_grafo_service().obter_grafo(grafo_id)
+        if not grafo:
+            raise ValueError(f"Grafo com ID {grafo_id} não encontrado.")
+        
+        if layout not in self._layouts:
+            raise ValueError(f"Layout '{layout}' não suportado.")
+        
+        if xmin > xmax or ymin > ymax:
+            raise ValueError("A janela deve ter xmin <= xmax e ymin <= ymax.")
+        
+        if zoom is not None and zoom < 0:
+            raise ValueError("O zoom deve ser maior ou igual a zero.")
+        
+        indice, vertices, pesos = self._obter_indice(grafo_id, grafo, layout, semente)
+        indices_vertices, indices_arestas = indice.consultar(xmin, ymin, xmax, ymax)
+        total_vertices, total_arestas = len(indices_vertices), len(indices_arestas)
+        
+        # Rarefação: mantém um vértice por célula e as arestas entre vértices
+        # mantidos ou fora da janela
+        if zoom is not None:
+            mantidos = indice.rarefazer(indices_vertices, zoom)
+            visiveis = np.ones(len(vertices), dtype=bool)
+            visiveis[indices_vertices] = False
+            visiveis[mantidos] = True
+            indices_arestas = indices_arestas[visiveis[indice.origens[indices_arestas]]
+                                              & visiveis[indice.destinos[indices_arestas]]]
+            indices_vertices = mantidos
+        
+        posicoes = indice.posicoes
+        vertices_janela = [
+            {"id": str(vertices[i]), "x": float(posicoes[i, 0]), "y": float(posicoes[i, 1])}
+            for i in indices_vertices
+        ]
+        arestas_janela = []
+        for k in indices_arestas:
+            u, v = indice.origens[k], indice.destinos[k]
+            arestas_janela.append({
+                "origem": str(vertices[u]),
+                "destino": str(vertices[v]),
+                "peso": float(pesos[k]),
+                "x_origem": float(posicoes[u, 0]),
+                "y_origem": float(posicoes[u, 1]),
+                "x_destino": float(posicoes[v, 0]),
+                "y_destino": float(posicoes[v, 1])
+            })
+        
+        return {
+            "vertices": vertices_janela,
+            "arestas": arestas_janela,
+            "layout": layout,
+            "janela": {"xmin": xmin, "ymin": ymin, "xmax": xmax, "ymax": ymax},
+            "zoom": zoom,
+            "total_vertices": total_vertices,
+            "total_arestas": total_arestas,
+            "vertices_omitidos": total_vertices - len(vertices_janela),
+            "arestas_omitidas": total_arestas - len(arestas_janela)
+        }
+    
+    def _obter_indice(self, grafo_id: str, grafo: Grafo, layout: str,
+                      semente: Optional[int]) -> Tuple[IndiceEspacial, List[Any], np.ndarray]:
+        """
+        Obtém o índice espacial das posições de um layout, usando o cache.
+        
+        Returns:
+            Tuple[IndiceEspacial, List[Any], np.ndarray]: Índice, vértices na
+            ordem dos índices e peso de cada aresta.
+        """
+        chave = (grafo_id, layout, semente)
+        versao = grafo.obter_versao()
+        with self._trava_indices:
+            entrada = self._cache_indices.get(chave)
+            if entrada is not None:
+                self._cache_indices.move_to_end(chave)
+        if entrada is not None and entrada[0]() is grafo and entrada[1] == versao:
+            return entrada[2]
+        
+        pos = self.obter_posicoes(grafo_id, layout, semente)
+        vertices, _, _, (origens, destinos, pesos) = self._obter_estrutura(grafo_id, grafo)
+        coordenadas = np.array([pos[v] for v in vertices], dtype=float).reshape(-1, 2)
+        logger.debug(f"Construindo índice espacial: ID={grafo_id}, Layout={layout}, Versão={versao}")
+        resultado = (IndiceEspacial(coordenadas, origens, destinos), vertices, pesos)
+        
+        with self._trava_indices:
+            self._cache_indices[chave] = (weakref.ref(grafo), versao, resultado)
+            self._cache_indices.move_to_end(chave)
+            while len(self._cache_indices) > LIMITE_INDICES_EM_CACHE:
+                self._cache_indices.popitem(last=False)
+        return resultado
+    
+    def transmitir_layout(self, grafo_id: str, layout: str = "multinivel", semente: Optional[int] = None,
+                          intervalo: int = 10, bits: int = 12) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Calcula um layout de força devolvendo quadros intermediários das posições.
+        
+        Os parâmetros são validados imediatamente; o cálculo só avança à medida
+        que os eventos são consumidos, de modo que parar a iteração (por
+        exemplo, quando o cliente fecha a conexão) interrompe o cálculo. Ao
+        terminar, o layout final é guardado no mesmo cache de
+        ``obter_posicoes``; se ele já estiver em cache, é enviado direto.
+        
+        Args:
+            grafo_id: ID do grafo.
+            layout: Layout de força (barnes_hut ou multinivel).
+            semente: Semente do gerador de números aleatórios (opcional).
+            intervalo: Iterações entre quadros.
+            bits: Bits por eixo na quantização das posições.
+            
+        Returns:
+            Iterator[Tuple[str, Dict[str, Any]]]: Eventos (nome, dados): um
+            ``inicio`` com os vértices, ``quadro`` completos ou de diferenças
+            (ver ``CodificadorQuadros``) e um ``fim``.
+            
+        Raises:
+            ValueError: Se o grafo não existir ou algum parâmetro for inválido.
+        """
+        grafo = self._get_grafo_service().obter_grafo(grafo_id)
+        if not grafo:
+            raise ValueError(f"Grafo com ID {grafo_id} não encontrado.")
+        
+        if layout not in LAYOUTS_PROGRESSIVOS:
+            raise ValueError(f"Layout '{layout}' não suportado na transmissão progressiva. "
+                             f"Layouts suportados: {', '.join(LAYOUTS_PROGRESSIVOS)}")
+        
+        if intervalo < 1:
+            raise ValueError("O intervalo entre quadros deve ser de pelo menos uma iteração.")
+        
+        codificador = CodificadorQuadros(bits)
+        chave = (grafo_id, layout, semente)
+        versao = grafo.obter_versao()
+        g_layout = self._grafo_para_layout(grafo)
+        vertices, adjacencia = matriz_adjacencia(g_layout)
+        
+        with self._trava_layouts:
+            entrada = self._cache_layouts.get(chave)
+        em_cache = entrada is not None and entrada[0]() is grafo and entrada[1] == versao
+        
+        def eventos() -> Iterator[Tuple[str, Dict[str, Any]]]:
+            yield "inicio", {"grafo_id": grafo_id, "layout": layout, "bits": bits,
+                             "vertices": [str(v) for v in vertices]}
+            
+            if em_cache:
+                posicoes = np.array([entrada[2][v] for v in vertices], dtype=float).reshape(-1, 2)
+                yield "quadro", dict(codificador.codificar(posicoes), iteracao=0)
+                yield "fim", {"iteracoes": 0, "em_cache": True}
+                return
+            
+            iteracao, posicoes = 0, np.zeros((0, 2))
+            for iteracao, posicoes in iterar_layout_forca(adjacencia, layout == "multinivel",
+                                                          semente=semente, intervalo=intervalo):
+                quadro = codificador.codificar(posicoes)
+                if quadro is not None:
+                    yield "quadro", dict(quadro, iteracao=iteracao)
+            
+            # Guarda o layout final se o grafo não mudou durante o cálculo
+            if grafo.obter_versao() == versao:
+                finais = {v: (float(p[0]), float(p[1])) for v, p in zip(vertices, posicoes)}
+                with self._trava_layouts:
+                    self._cache_layouts[chave] = (weakref.ref(grafo), versao, finais)
+                    self._cache_layouts.move_to_end(chave)
+                    while len(self._cache_layouts) > LIMITE_LAYOUTS_EM_CACHE:
+                        self._cache_layouts.popitem(last=False)
+            yield "fim", {"iteracoes": iteracao, "em_cache": False}
+        
+        return eventos()
+    
+    def gerar_imagem(self, grafo_id: str, formato: str = "png", layout: str = "spring",
+                     semente: Optional[int] = None, largura: int = 1000, altura: int = 800) -> Tuple[bytes, str]:
         """
         Gera uma imagem de um grafo.
         
+        A imagem é desenhada no pool de renderização e guardada em cache por
+        (grafo, layout, semente, formato, tamanho) enquanto o grafo não for
+        alterado. Requisições simultâneas da mesma imagem aguardam uma única
+        renderização.
+        
         Args:
             grafo_id: ID do grafo.
             formato: Formato da imagem (png, svg, etc.).
             layout: Layout de visualização.
+            semente: Semente dos layouts aleatórios (opcional).
+            largura: Largura da imagem em pixels.
+            altura: Altura da imagem em pixels.
             
         Returns:
-            Dict[str, Any]: Dados da imagem.
+            Tuple[bytes, str]: Conteúdo da imagem e seu tipo de mídia.
             
         Raises:
-            ValueError: Se o grafo não existir, o layout não for suportado ou o formato não for suportado.
+            ValueError: Se o grafo não existir, o layout, o formato ou o tamanho não forem suportados.
         """
         # Obtém o serviço de grafos
         grafo_service = self._get_grafo_service()
@@ -182,51 +676,88 @@ class VisualizacaoService:
         if layout not in self._layouts:
             raise ValueError(f"Layout '{layout}' não suportado.")
         
-        # Verifica se o formato é suportado
-        formatos_suportados = ["png", "svg", "pdf", "jpg", "jpeg"]
-        if formato not in formatos_suportados:
-            raise ValueError(f"Formato '{formato}' não suportado. Formatos suportados: {', '.join(formatos_suportados)}")
+        # Verifica se o formato e o tamanho são suportados
+        if formato not in FORMATOS_IMAGEM:
+            raise ValueError(f"Formato '{formato}' não suportado. Formatos suportados: {', '.join(FORMATOS_IMAGEM)}")
+        for dimensao in (largura, altura):
+            if not MINIMO_PIXELS <= dimensao <= MAXIMO_PIXELS:
+                raise ValueError(f"O tamanho da imagem deve estar entre {MINIMO_PIXELS} e {MAXIMO_PIXELS} pixels.")
         
-        try:
-            # Cria um grafo NetworkX
+        if layout not in _LAYOUTS_COM_SEMENTE:
+            semente = None
+        chave = (grafo_id, layout, semente, formato, largura, altura)
+        versao = grafo.obter_versao()
+        
+        # Reaproveita a imagem em cache ou uma renderização em andamento
+        with self._trava_imagens:
+            entrada = self._cache_imagens.get(chave)
+            if entrada is not None and entrada[0]() is grafo and entrada[1] == versao:
+                self._cache_imagens.move_to_end(chave)
+                logger.debug(f"Imagem do grafo {grafo_id} obtida do cache ({formato}, {largura}x{altura})")
+                return entrada[2], FORMATOS_IMAGEM[formato]
+            andamento = self._imagens_em_andamento.get(chave)
+            if andamento is not None and andamento[0]() is grafo and andamento[1] == versao:
+                futuro = andamento[2]
+            else:
+                futuro = None
+        
+        if futuro is None:
+            # Cria um grafo NetworkX com IDs textuais e a posição de cada vértice
             G = nx.Graph() if not grafo.eh_direcionado() else nx.DiGraph()
-            
-            # Adiciona os vértices
             for v in grafo.obter_vertices():
                 G.add_node(str(v))
+            for u, v, _ in grafo.obter_arestas():
+                G.add_edge(str(u), str(v))
             
-            # Adiciona as arestas com peso numérico para evitar erro no NetworkX
-            for u, v, atributos_aresta in grafo.obter_arestas():
-                # Extrai o peso como valor numérico ou usa 1.0 como padrão
-                peso = 1.0
-                if 'weight' in atributos_aresta and isinstance(atributos_aresta['weight'], (int, float)):
-                    peso = float(atributos_aresta['weight'])
-                
-                G.add_edge(str(u), str(v), weight=peso)
-            
-            # Calcula o layout
-            pos = self._layouts[layout](G)
-            
-            # Gera a imagem
-            plt.figure(figsize=(10, 8))
-            nx.draw(G, pos, with_labels=True, node_color='skyblue', node_size=1500, edge_color='black', linewidths=1, font_size=15)
-            
-            # Salva a imagem em um buffer
-            buf = io.BytesIO()
-            plt.savefig(buf, format=formato)
-            plt.close()
+            # Usa as mesmas posições (em cache) da visualização interativa
+            pos = {str(v): p for v, p in self.obter_posicoes(grafo_id, layout, semente).items()}
             
-            # Codifica a imagem em base64
-            buf.seek(0)
-            imagem_base64 = base64.b64encode(buf.read()).decode('utf-8')
-            
-            # Retorna os dados da imagem
-            return {
-                "grafo_id": grafo_id,
-                "formato": formato,
-                "layout": layout,
-                "conteudo": imagem_base64
-            }
+            with self._trava_imagens:
+                andamento = self._imagens_em_andamento.get(chave)
+                if andamento is not None and andamento[0]() is grafo and andamento[1] == versao:
+                    futuro = andamento[2]
+                else:
+                    futuro = renderizar_em_segundo_plano(G, pos, formato, largura, altura)
+                    self._imagens_em_andamento[chave] = (weakref.ref(grafo), versao, futuro)
+        
+        try:
+            conteudo = futuro.result()
         except Exception as e:
             logger.error(f"Erro ao gerar imagem do grafo {grafo_id}: {e}", exc_info=True)
             raise ValueError(f"Erro ao gerar imagem: {str(e)}")
+        finally:
+            with self._trava_imagens:
+                andamento = self._imagens_em_andamento.get(chave)
+                if andamento is not None and andamento[2] is futuro:
+                    del self._imagens_em_andamento[chave]
+        
+        # Guarda a imagem em cache
+        with self._trava_imagens:
+            self._cache_imagens[chave] = (weakref.ref(grafo), versao, conteudo)
+            self._cache_imagens.move_to_end(chave)
+            while len(self._cache_imagens) > LIMITE_IMAGENS_EM_CACHE:
+                self._cache_imagens.popitem(last=False)
+        
+        return conteudo, FORMATOS_IMAGEM[formato]
+
+
+def _peso_numerico(atributos: Dict[str, Any]) -> float:
+    """
+    Obtém o peso de uma aresta como número, usando 1.0 quando ausente ou não numérico.
+    """
+    peso = atributos.get('weight')
+    if isinstance(peso, (int, float)):
+        return float(peso)
+    return 1.0
+
+
+def _interpretar_grupo(grupo: Optional[str]) -> List[int]:
+    """
+    Converte o ID de um grupo ("3.1") no caminho de índices na hierarquia ([3, 1]).
+    """
+    if not grupo:
+        return []
+    partes = grupo.split('.')
+    if not all(parte.isdigit() for parte in partes):
+        raise ValueError(f"Grupo inválido: '{grupo}'.")
+    return [int(parte) for parte in partes]
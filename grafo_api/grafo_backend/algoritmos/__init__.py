@@ -6,7 +6,29 @@ organizados por categorias.
 """
 
 # Importações de algoritmos de caminhos
-from grafo_backend.algoritmos.caminhos.dijkstra import dijkstra
+from grafo_backend.algoritmos.caminhos.dijkstra import (
+    dijkstra,
+    dijkstra_multiplas_origens,
+    dijkstra_bidirecional,
+    k_mais_proximos,
+    reconstruir_caminho
+)
+from grafo_backend.algoritmos.caminhos.bellman_ford import bellman_ford, detectar_ciclo_negativo
+from grafo_backend.algoritmos.caminhos.floyd_warshall import (
+    ResultadoFloydWarshall,
+    floyd_warshall,
+    calcular_diametro,
+    calcular_centro,
+    calcular_matriz_distancias
+)
+from grafo_backend.algoritmos.caminhos.johnson import johnson, johnson_matriz
+from grafo_backend.algoritmos.caminhos.oraculo import OraculoDistancias, obter_oraculo
+from grafo_backend.algoritmos.caminhos.marcos import IndiceMarcos, obter_indice_marcos
+from grafo_backend.algoritmos.caminhos.a_star import a_star, comparar_a_star_dijkstra
+from grafo_backend.algoritmos.caminhos.hierarquia_contracao import HierarquiaContracao, obter_hierarquia
+from grafo_backend.algoritmos.caminhos.busca.fronteira import bfs_fronteira, bfs_csr
+from grafo_backend.algoritmos.caminhos.busca.multiplas_origens import bfs_multiplas_origens
+from grafo_backend.algoritmos.caminhos.busca.profundidade import percorrer_profundidade
 
 # Importações de algoritmos de coloração
 from grafo_backend.algoritmos.coloracao.coloracao import (
@@ -22,6 +44,7 @@ from grafo_backend.algoritmos.centralidade.centralidade import (
     centralidade_grau,
     centralidade_intermediacao,
     centralidade_proximidade,
+    centralidade_harmonica,
     centralidade_autovetor,
     pagerank,
     centralidade_katz
@@ -31,6 +54,31 @@ from grafo_backend.algoritmos.centralidade.centralidade import (
 __all__ = [
     # Algoritmos de caminhos
     'dijkstra',
+    'dijkstra_multiplas_origens',
+    'dijkstra_bidirecional',
+    'k_mais_proximos',
+    'reconstruir_caminho',
+    'bellman_ford',
+    'detectar_ciclo_negativo',
+    'ResultadoFloydWarshall',
+    'floyd_warshall',
+    'calcular_diametro',
+    'calcular_centro',
+    'calcular_matriz_distancias',
+    'johnson',
+    'johnson_matriz',
+    'OraculoDistancias',
+    'obter_oraculo',
+    'IndiceMarcos',
+    'obter_indice_marcos',
+    'a_star',
+    'comparar_a_star_dijkstra',
+    'HierarquiaContracao',
+    'obter_hierarquia',
+    'bfs_fronteira',
+    'bfs_csr',
+    'bfs_multiplas_origens',
+    'percorrer_profundidade',
     
     # Algoritmos de coloração
     'coloracao_gulosa',
@@ -43,6 +91,7 @@ __all__ = [
     'centralidade_grau',
     'centralidade_intermediacao',
     'centralidade_proximidade',
+    'centralidade_harmonica',
     'centralidade_autovetor',
     'pagerank',
     'centralidade_katz'
@@ -2,4 +2,51 @@
 Módulo de algoritmos de caminhos.
 """
 
-from .dijkstra import dijkstra
+from .dijkstra import (
+    dijkstra,
+    dijkstra_multiplas_origens,
+    dijkstra_bidirecional,
+    k_mais_proximos,
+    reconstruir_caminho
+)
+from .bellman_ford import (
+    bellman_ford,
+    detectar_ciclo_negativo
+)
+from .floyd_warshall import (
+    ResultadoFloydWarshall,
+    floyd_warshall,
+    calcular_diametro,
+    calcular_centro,
+    calcular_matriz_distancias
+)
+from .johnson import (
+    johnson,
+    johnson_matriz,
+    calcular_potenciais
+)
+from .oraculo import (
+    OraculoDistancias,
+    obter_oraculo
+)
+from .marcos import (
+    IndiceMarcos,
+    obter_indice_marcos
+)
+from .a_star import (
+    a_star,
+    comparar_a_star_dijkstra
+)
+from .hierarquia_contracao import (
+    HierarquiaContracao,
+    obter_hierarquia
+)
+from .busca.fronteira import (
+    bfs_fronteira,
+    bfs_csr
+)
+from .busca.multiplas_origens import (
+    bfs_multiplas_origens,
+    iterar_lotes_bfs
+)
+from .busca.profundidade import percorrer_profundidade
@@ -8,8 +8,110 @@ encontrar caminhos mínimos entre dois vértices específicos.
 
 from typing import Dict, List, Any, Tuple, Callable, Optional
 import heapq
-import networkx as nx
+import time
 from ...core.grafo import Grafo
+from ...core.csr import GrafoCSR
+from .marcos import IndiceMarcos
+
+
+INFINITO = float('infinity')
+
+
+def _buscar_a_star(csr: GrafoCSR, origem: int, destino: int,
+                   potencial: Callable[[int], float]) -> Tuple[float, List[int], int]:
+    """
+    Executa o A* sobre os índices da representação CSR.
+    
+    Com potencial nulo, equivale a um Dijkstra que termina ao fixar o destino.
+    
+    Args:
+        csr: Representação CSR do grafo.
+        origem: Índice do vértice de origem.
+        destino: Índice do vértice de destino.
+        potencial: Estimativa da distância de cada índice ao destino.
+        
+    Returns:
+        Tuple[float, List[int], int]: Custo e caminho (em índices) até o destino,
+        ou (inf, []) se for inalcançável, e o número de vértices explorados.
+    """
+    indptr, indices, pesos = csr.listas()
+    heappush, heappop = heapq.heappush, heapq.heappop
+    
+    g_custo = {origem: 0.0}
+    estimativas = {origem: potencial(origem)}
+    predecessores: Dict[int, int] = {}
+    fechados = set()
+    abertos = [(estimativas[origem], origem)]
+    explorados = 0
+    
+    while abertos:
+        # Remove o vértice com menor custo f (entradas obsoletas são ignoradas)
+        _, vertice_atual = heappop(abertos)
+        if vertice_atual in fechados:
+            continue
+        fechados.add(vertice_atual)
+        explorados += 1
+        
+        # Se chegou ao destino, reconstrói o caminho e retorna
+        if vertice_atual == destino:
+            caminho = [destino]
+            while caminho[-1] in predecessores:
+                caminho.append(predecessores[caminho[-1]])
+            caminho.reverse()
+            return g_custo[destino], caminho, explorados
+        
+        custo_atual = g_custo[vertice_atual]
+        for posicao in range(indptr[vertice_atual], indptr[vertice_atual + 1]):
+            vizinho = indices[posicao]
+            if vizinho in fechados:
+                continue
+            g_tentativo = custo_atual + pesos[posicao]
+            if g_tentativo < g_custo.get(vizinho, INFINITO):
+                estimativa = estimativas.get(vizinho)
+                if estimativa is None:
+                    estimativa = estimativas[vizinho] = potencial(vizinho)
+                
+                # O destino é inalcançável a partir deste vizinho
+                if estimativa == INFINITO:
+                    continue
+                g_custo[vizinho] = g_tentativo
+                predecessores[vizinho] = vertice_atual
+                heappush(abertos, (g_tentativo + estimativa, vizinho))
+    
+    return INFINITO, [], explorados
+
+
+def _preparar_a_star(grafo: Grafo, origem: Any, destino: Any,
+                     heuristica: Optional[Callable[[Any, Any], float]]) -> Tuple[GrafoCSR, int, int, Callable[[int], float]]:
+    """
+    Valida os vértices e converte a heurística para os índices da representação CSR.
+    
+    Raises:
+        ValueError: Se algum dos vértices não existir, se houver pesos
+            negativos ou se o índice de marcos for de outra versão do grafo.
+    """
+    # Verifica se os vértices existem no grafo
+    if not grafo.existe_vertice(origem):
+        raise ValueError(f"Vértice de origem '{origem}' não existe no grafo.")
+    if not grafo.existe_vertice(destino):
+        raise ValueError(f"Vértice de destino '{destino}' não existe no grafo.")
+    
+    csr = grafo.obter_csr()
+    if len(csr.pesos) and float(csr.pesos.min()) < 0:
+        raise ValueError("O algoritmo A* não suporta arestas com peso negativo.")
+    indice_origem, indice_destino = csr.indice(origem), csr.indice(destino)
+    
+    if isinstance(heuristica, IndiceMarcos):
+        if heuristica.csr is not csr:
+            raise ValueError("O índice de marcos não corresponde à versão atual do grafo.")
+        potencial = heuristica.potencial(indice_origem, indice_destino)
+    elif heuristica is not None:
+        ids = csr.lista_ids()
+        potencial = lambda indice: heuristica(ids[indice], destino)
+    else:
+        # Heurística nula (equivalente a Dijkstra)
+        potencial = lambda indice: 0.0
+    return csr, indice_origem, indice_destino, potencial
 
 
 def a_star(grafo: Grafo, origem: Any, destino: Any, 
@@ -21,7 +123,8 @@ def a_star(grafo: Grafo, origem: Any, destino: Any,
         grafo: Grafo ponderado.
         origem: Vértice de origem.
         destino: Vértice de destino.
-        heuristica: Função que estima a distância entre dois vértices.
+        heuristica: Função que estima a distância entre dois vértices, ou um
+                   ``IndiceMarcos`` do grafo (heurística por marcos, sem coordenadas).
                    Se não for fornecida, será usada uma heurística nula (equivalente a Dijkstra).
         
     Returns:
@@ -33,80 +136,14 @@ def a_star(grafo: Grafo, origem: Any, destino: Any,
         ValueError: Se algum dos vértices não existir no grafo.
         ValueError: Se não existir caminho entre origem e destino.
     """
-    # Verifica se os vértices existem no grafo
-    if not grafo.existe_vertice(origem):
-        raise ValueError(f"Vértice de origem '{origem}' não existe no grafo.")
-    if not grafo.existe_vertice(destino):
-        raise ValueError(f"Vértice de destino '{destino}' não existe no grafo.")
-    
-    # Se a heurística não for fornecida, usa uma heurística nula
-    if heuristica is None:
-        heuristica = lambda u, v: 0
-    
-    # Obtém o grafo NetworkX subjacente
-    g_nx = grafo.obter_grafo_networkx()
-    
-    # Inicializa as estruturas de dados
-    abertos = []  # Fila de prioridade (heap) para os vértices a serem explorados
-    fechados = set()  # Conjunto de vértices já explorados
-    
-    # Dicionário de custos g: custo do caminho da origem até o vértice
-    g_custo = {vertice: float('infinity') for vertice in grafo.obter_vertices()}
-    g_custo[origem] = 0
+    csr, indice_origem, indice_destino, potencial = _preparar_a_star(grafo, origem, destino, heuristica)
+    custo, caminho, _ = _buscar_a_star(csr, indice_origem, indice_destino, potencial)
     
-    # Dicionário de custos f: g(n) + h(n)
-    f_custo = {vertice: float('infinity') for vertice in grafo.obter_vertices()}
-    f_custo[origem] = heuristica(origem, destino)
-    
-    # Dicionário de predecessores para reconstrução do caminho
-    predecessores = {vertice: None for vertice in grafo.obter_vertices()}
-    
-    # Adiciona o vértice de origem à fila de prioridade
-    heapq.heappush(abertos, (f_custo[origem], origem))
-    
-    # Enquanto houver vértices na fila de prioridade
-    while abertos:
-        # Remove o vértice com menor custo f
-        _, vertice_atual = heapq.heappop(abertos)
-        
-        # Se chegou ao destino, reconstrói o caminho e retorna
-        if vertice_atual == destino:
-            caminho = []
-            atual = destino
-            while atual is not None:
-                caminho.append(atual)
-                atual = predecessores[atual]
-            caminho.reverse()
-            return caminho, g_custo[destino]
-        
-        # Adiciona o vértice atual ao conjunto de fechados
-        fechados.add(vertice_atual)
-        
-        # Para cada vizinho do vértice atual
-        for vizinho in grafo.obter_adjacentes(vertice_atual):
-            # Se o vizinho já foi explorado, continua
-            if vizinho in fechados:
-                continue
-            
-            # Calcula o custo g tentativo
-            peso = g_nx[vertice_atual][vizinho].get('weight', 1.0)
-            g_tentativo = g_custo[vertice_atual] + peso
-            
-            # Se o vizinho não está na fila ou o novo caminho é melhor
-            if g_tentativo < g_custo[vizinho]:
-                # Atualiza o predecessor
-                predecessores[vizinho] = vertice_atual
-                # Atualiza o custo g
-                g_custo[vizinho] = g_tentativo
-                # Atualiza o custo f
-                f_custo[vizinho] = g_tentativo + heuristica(vizinho, destino)
-                
-                # Adiciona o vizinho à fila de prioridade se ainda não estiver
-                if not any(vizinho == v for _, v in abertos):
-                    heapq.heappush(abertos, (f_custo[vizinho], vizinho))
-    
-    # Se chegou aqui, não existe caminho entre origem e destino
-    raise ValueError(f"Não existe caminho de '{origem}' para '{destino}'.")
+    # Se o caminho estiver vazio, não existe caminho entre origem e destino
+    if not caminho:
+        raise ValueError(f"Não existe caminho de '{origem}' para '{destino}'.")
+    ids = csr.lista_ids()
+    return [ids[i] for i in caminho], custo
 
 
 def heuristica_distancia_euclidiana(grafo: Grafo, pos: Dict[Any, Tuple[float, float]]) -> Callable[[Any, Any], float]:
@@ -178,11 +215,14 @@ def comparar_a_star_dijkstra(grafo: Grafo, origem: Any, destino: Any,
     """
     Compara os algoritmos A* e Dijkstra para o mesmo grafo.
     
+    O Dijkstra também termina ao fixar o destino, de modo que a diferença
+    medida se deve apenas à heurística.
+    
     Args:
         grafo: Grafo ponderado.
         origem: Vértice de origem.
         destino: Vértice de destino.
-        heuristica: Função de heurística para o A*.
+        heuristica: Função de heurística ou ``IndiceMarcos`` para o A*.
         
     Returns:
         Dict[str, Any]: Dicionário contendo:
@@ -193,168 +233,45 @@ def comparar_a_star_dijkstra(grafo: Grafo, origem: Any, destino: Any,
             - 'iguais': Booleano indicando se os caminhos têm o mesmo custo
             - 'nos_explorados_a_star': Número de nós explorados pelo A*
             - 'nos_explorados_dijkstra': Número de nós explorados pelo Dijkstra
-    """
-    from algoritmos.caminhos.dijkstra import dijkstra, reconstruir_caminho
-    
-    # Contador de nós explorados para A*
-    nos_explorados_a_star = [0]
-    
-    def a_star_contador(grafo: Grafo, origem: Any, destino: Any, heuristica: Callable[[Any, Any], float] = None):
-        # Verifica se os vértices existem no grafo
-        if not grafo.existe_vertice(origem):
-            raise ValueError(f"Vértice de origem '{origem}' não existe no grafo.")
-        if not grafo.existe_vertice(destino):
-            raise ValueError(f"Vértice de destino '{destino}' não existe no grafo.")
-        
-        # Se a heurística não for fornecida, usa uma heurística nula
-        if heuristica is None:
-            heuristica = lambda u, v: 0
-        
-        # Obtém o grafo NetworkX subjacente
-        g_nx = grafo.obter_grafo_networkx()
-        
-        # Inicializa as estruturas de dados
-        abertos = []  # Fila de prioridade (heap) para os vértices a serem explorados
-        fechados = set()  # Conjunto de vértices já explorados
-        
-        # Dicionário de custos g: custo do caminho da origem até o vértice
-        g_custo = {vertice: float('infinity') for vertice in grafo.obter_vertices()}
-        g_custo[origem] = 0
-        
-        # Dicionário de custos f: g(n) + h(n)
-        f_custo = {vertice: float('infinity') for vertice in grafo.obter_vertices()}
-        f_custo[origem] = heuristica(origem, destino)
-        
-        # Dicionário de predecessores para reconstrução do caminho
-        predecessores = {vertice: None for vertice in grafo.obter_vertices()}
-        
-        # Adiciona o vértice de origem à fila de prioridade
-        heapq.heappush(abertos, (f_custo[origem], origem))
-        
-        # Enquanto houver vértices na fila de prioridade
-        while abertos:
-            # Remove o vértice com menor custo f
-            _, vertice_atual = heapq.heappop(abertos)
-            nos_explorados_a_star[0] += 1
-            
-            # Se chegou ao destino, reconstrói o caminho e retorna
-            if vertice_atual == destino:
-                caminho = []
-                atual = destino
-                while atual is not None:
-                    caminho.append(atual)
-                    atual = predecessores[atual]
-                caminho.reverse()
-                return caminho, g_custo[destino]
+            - 'tempo_a_star': Tempo do A*, em segundos
+            - 'tempo_dijkstra': Tempo do Dijkstra, em segundos
+            - 'aceleracao_nos': Razão entre os nós explorados pelo Dijkstra e pelo A*
+            - 'aceleracao_tempo': Razão entre os tempos do Dijkstra e do A*
             
-            # Adiciona o vértice atual ao conjunto de fechados
-            fechados.add(vertice_atual)
-            
-            # Para cada vizinho do vértice atual
-            for vizinho in grafo.obter_adjacentes(vertice_atual):
-                # Se o vizinho já foi explorado, continua
-                if vizinho in fechados:
-                    continue
-                
-                # Calcula o custo g tentativo
-                peso = g_nx[vertice_atual][vizinho].get('weight', 1.0)
-                g_tentativo = g_custo[vertice_atual] + peso
-                
-                # Se o vizinho não está na fila ou o novo caminho é melhor
-                if g_tentativo < g_custo[vizinho]:
-                    # Atualiza o predecessor
-                    predecessores[vizinho] = vertice_atual
-                    # Atualiza o custo g
-                    g_custo[vizinho] = g_tentativo
-                    # Atualiza o custo f
-                    f_custo[vizinho] = g_tentativo + heuristica(vizinho, destino)
-                    
-                    # Adiciona o vizinho à fila de prioridade se ainda não estiver
-                    if not any(vizinho == v for _, v in abertos):
-                        heapq.heappush(abertos, (f_custo[vizinho], vizinho))
-        
-        # Se chegou aqui, não existe caminho entre origem e destino
-        raise ValueError(f"Não existe caminho de '{origem}' para '{destino}'.")
-    
-    # Contador de nós explorados para Dijkstra
-    nos_explorados_dijkstra = [0]
-    
-    def dijkstra_contador(grafo: Grafo, origem: Any):
-        # Verifica se o vértice de origem existe no grafo
-        if not grafo.existe_vertice(origem):
-            raise ValueError(f"Vértice de origem '{origem}' não existe no grafo.")
-        
-        # Obtém o grafo NetworkX subjacente
-        g_nx = grafo.obter_grafo_networkx()
-        
-        # Inicializa as estruturas de dados
-        distancias = {vertice: float('infinity') for vertice in grafo.obter_vertices()}
-        distancias[origem] = 0
-        predecessores = {vertice: None for vertice in grafo.obter_vertices()}
-        visitados = set()
-        
-        # Fila de prioridade para os vértices
-        fila_prioridade = [(0, origem)]
-        
-        # Enquanto houver vértices na fila
-        while fila_prioridade:
-            # Remove o vértice com menor distância
-            dist_atual, vertice_atual = heapq.heappop(fila_prioridade)
-            nos_explorados_dijkstra[0] += 1
-            
-            # Se o vértice já foi visitado, continua
-            if vertice_atual in visitados:
-                continue
-            
-            # Marca o vértice como visitado
-            visitados.add(vertice_atual)
-            
-            # Se a distância atual é maior que a registrada, continua
-            if dist_atual > distancias[vertice_atual]:
-                continue
-            
-            # Para cada vizinho do vértice atual
-            for vizinho in grafo.obter_adjacentes(vertice_atual):
-                # Se o vizinho já foi visitado, continua
-                if vizinho in visitados:
-                    continue
-                
-                # Calcula a nova distância
-                peso = g_nx[vertice_atual][vizinho].get('weight', 1.0)
-                nova_distancia = distancias[vertice_atual] + peso
-                
-                # Se a nova distância é menor que a registrada
-                if nova_distancia < distancias[vizinho]:
-                    # Atualiza a distância
-                    distancias[vizinho] = nova_distancia
-                    # Atualiza o predecessor
-                    predecessores[vizinho] = vertice_atual
-                    # Adiciona o vizinho à fila de prioridade
-                    heapq.heappush(fila_prioridade, (nova_distancia, vizinho))
-        
-        return distancias, predecessores
+    Raises:
+        ValueError: Se algum dos vértices não existir no grafo.
+        ValueError: Se não existir caminho entre origem e destino.
+    """
+    csr, indice_origem, indice_destino, potencial = _preparar_a_star(grafo, origem, destino, heuristica)
+    ids = csr.lista_ids()
     
-    # Executa o A* com contador
-    a_star_caminho, a_star_custo = a_star_contador(grafo, origem, destino, heuristica)
+    # Executa o A*
+    inicio = time.perf_counter()
+    a_star_custo, a_star_caminho, nos_explorados_a_star = _buscar_a_star(
+        csr, indice_origem, indice_destino, potencial)
+    tempo_a_star = time.perf_counter() - inicio
     
-    # Executa o Dijkstra com contador
-    distancias, predecessores = dijkstra_contador(grafo, origem)
+    # Executa o Dijkstra (A* com heurística nula)
+    inicio = time.perf_counter()
+    dijkstra_custo, dijkstra_caminho, nos_explorados_dijkstra = _buscar_a_star(
+        csr, indice_origem, indice_destino, lambda indice: 0.0)
+    tempo_dijkstra = time.perf_counter() - inicio
     
     # Verifica se existe caminho para o destino
-    if distancias[destino] == float('infinity'):
+    if not dijkstra_caminho:
         raise ValueError(f"Não existe caminho de '{origem}' para '{destino}'.")
     
-    # Reconstrói o caminho do Dijkstra
-    dijkstra_caminho = reconstruir_caminho(predecessores, origem, destino)
-    dijkstra_custo = distancias[destino]
-    
     # Compara os resultados
     return {
-        'a_star_caminho': a_star_caminho,
+        'a_star_caminho': [ids[i] for i in a_star_caminho],
         'a_star_custo': a_star_custo,
-        'dijkstra_caminho': dijkstra_caminho,
+        'dijkstra_caminho': [ids[i] for i in dijkstra_caminho],
         'dijkstra_custo': dijkstra_custo,
         'iguais': abs(a_star_custo - dijkstra_custo) < 1e-9,  # Compara com tolerância para erros de ponto flutuante
-        'nos_explorados_a_star': nos_explorados_a_star[0],
-        'nos_explorados_dijkstra': nos_explorados_dijkstra[0]
+        'nos_explorados_a_star': nos_explorados_a_star,
+        'nos_explorados_dijkstra': nos_explorados_dijkstra,
+        'tempo_a_star': tempo_a_star,
+        'tempo_dijkstra': tempo_dijkstra,
+        'aceleracao_nos': nos_explorados_dijkstra / max(nos_explorados_a_star, 1),
+        'aceleracao_tempo': tempo_dijkstra / tempo_a_star if tempo_a_star > 0 else float('inf')
     }
@@ -4,20 +4,207 @@ Implementação do algoritmo de Bellman-Ford para encontrar caminhos mínimos em
 O algoritmo de Bellman-Ford encontra o caminho mais curto entre um vértice de origem
 e todos os outros vértices em um grafo ponderado, mesmo com arestas de peso negativo.
 Também detecta ciclos de peso negativo.
+
+Há duas variantes sobre a representação CSR do grafo (``Grafo.obter_csr``):
+
+- ``"fila"`` (SPFA): só relaxa as arestas que saem de vértices cuja distância
+  mudou, mantidos em uma fila, e termina quando a fila esvazia;
+- ``"vetorizado"``: cada passada relaxa de uma vez, com NumPy, as arestas dos
+  vértices alterados na passada anterior (``np.minimum.at``), e termina
+  assim que uma passada não altera nenhuma distância.
+
+Em ambas, um ciclo no grafo de predecessores é sempre um ciclo de peso
+negativo, e todo ciclo negativo alcançável acaba aparecendo nele. O grafo de
+predecessores é verificado periodicamente durante a execução, de modo que o
+ciclo é devolvido pela mesma execução que o detecta, muitas vezes bem antes
+das n - 1 passadas.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
-import networkx as nx
+from collections import deque
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+import numpy as np
 from ...core.grafo import Grafo
+from ...core.csr import GrafoCSR
+
+
+INFINITO = float('infinity')
+
+# Variantes aceitas pelo parâmetro ``metodo``
+METODOS = ("fila", "vetorizado")
+
+
+def _ciclo_predecessores(predecessores: Sequence[int]) -> Optional[List[int]]:
+    """
+    Procura um ciclo no grafo de predecessores (-1 indica ausência de predecessor).
+    
+    Returns:
+        Optional[List[int]]: Índices do ciclo, na ordem das arestas, ou None.
+    """
+    n = len(predecessores)
+    marcas = [-1] * n
+    for inicio in range(n):
+        # Segue os predecessores marcando os vértices com o número deste percurso
+        v = inicio
+        while v != -1 and marcas[v] == -1:
+            marcas[v] = inicio
+            v = predecessores[v]
+        if v != -1 and marcas[v] == inicio:
+            ciclo = [v]
+            u = predecessores[v]
+            while u != v:
+                ciclo.append(u)
+                u = predecessores[u]
+            ciclo.reverse()
+            return ciclo
+    return None
 
 
-def bellman_ford(grafo: Grafo, origem: Any) -> Tuple[Dict[Any, float], Dict[Any, Any], bool]:
+def _ciclo_predecessores_vetorizado(predecessores: np.ndarray) -> Optional[List[int]]:
+    """
+    Procura um ciclo no grafo de predecessores por saltos de ponteiros duplicados.
+    
+    Após ceil(log2(n + 1)) duplicações, cada vértice aponta para o vértice
+    alcançado com pelo menos n + 1 passos, que só existe se o percurso entrar
+    em um ciclo (as raízes apontam para uma sentinela que aponta para si mesma).
+    """
+    n = len(predecessores)
+    saltos = np.append(np.where(predecessores >= 0, predecessores, n), n)
+    for _ in range(int(np.ceil(np.log2(n + 1)))):
+        saltos = saltos[saltos]
+    no_ciclo = np.flatnonzero(saltos[:n] != n)
+    if len(no_ciclo) == 0:
+        return None
+    v = int(saltos[no_ciclo[0]])
+    ciclo = [v]
+    u = int(predecessores[v])
+    while u != v:
+        ciclo.append(u)
+        u = int(predecessores[u])
+    ciclo.reverse()
+    return ciclo
+
+
+def _bellman_ford_fila(csr: GrafoCSR, origens: Sequence[int]) -> Tuple[List[float], List[int], Optional[List[int]]]:
+    """
+    Variante com fila (SPFA) sobre os índices da representação CSR.
+    
+    O grafo de predecessores é verificado a cada n relaxamentos, o que mantém
+    o custo das verificações proporcional ao dos relaxamentos.
+    """
+    n = csr.numero_vertices()
+    indptr, indices, pesos = csr.listas()
+    distancias = [INFINITO] * n
+    predecessores = [-1] * n
+    na_fila = [False] * n
+    fila = deque()
+    for origem in origens:
+        distancias[origem] = 0.0
+        if not na_fila[origem]:
+            na_fila[origem] = True
+            fila.append(origem)
+    
+    relaxamentos = 0
+    while fila:
+        u = fila.popleft()
+        na_fila[u] = False
+        dist_u = distancias[u]
+        for posicao in range(indptr[u], indptr[u + 1]):
+            v = indices[posicao]
+            nova_dist = dist_u + pesos[posicao]
+            if nova_dist < distancias[v]:
+                distancias[v] = nova_dist
+                predecessores[v] = u
+                relaxamentos += 1
+                if relaxamentos % n == 0:
+                    ciclo = _ciclo_predecessores(predecessores)
+                    if ciclo is not None:
+                        return distancias, predecessores, ciclo
+                if not na_fila[v]:
+                    na_fila[v] = True
+                    fila.append(v)
+    
+    return distancias, predecessores, None
+
+
+def _bellman_ford_vetorizado(csr: GrafoCSR, origens: Sequence[int]) -> Tuple[List[float], List[int], Optional[List[int]]]:
+    """
+    Variante vetorizada sobre os arrays da representação CSR.
+    
+    O grafo de predecessores é verificado nas passadas de número potência de
+    dois, e obrigatoriamente se a n-ésima passada ainda alterar alguma distância.
+    """
+    n = csr.numero_vertices()
+    fontes = np.repeat(np.arange(n), np.diff(csr.indptr))
+    destinos = np.asarray(csr.indices, dtype=np.int64)
+    pesos = np.asarray(csr.pesos, dtype=np.float64)
+    
+    distancias = np.full(n, np.inf)
+    predecessores = np.full(n, -1, dtype=np.int64)
+    distancias[list(origens)] = 0.0
+    alterados = np.zeros(n, dtype=bool)
+    alterados[list(origens)] = True
+    
+    for passada in range(1, n + 1):
+        # Arestas que saem dos vértices alterados na passada anterior
+        ativas = np.flatnonzero(alterados[fontes])
+        if len(ativas) == 0:
+            return distancias.tolist(), predecessores.tolist(), None
+        de, para = fontes[ativas], destinos[ativas]
+        candidatos = distancias[de] + pesos[ativas]
+        novas = distancias.copy()
+        np.minimum.at(novas, para, candidatos)
+        alterados = novas < distancias
+        if not alterados.any():
+            return distancias.tolist(), predecessores.tolist(), None
+        
+        # Predecessor de cada vértice melhorado: uma aresta que realiza a nova distância
+        realizam = alterados[para] & (candidatos == novas[para])
+        predecessores[para[realizam]] = de[realizam]
+        distancias = novas
+        
+        if passada & (passada - 1) == 0 or passada == n:
+            ciclo = _ciclo_predecessores_vetorizado(predecessores)
+            if ciclo is not None:
+                return distancias.tolist(), predecessores.tolist(), ciclo
+    
+    # Sem ciclo nos predecessores, as distâncias se estabilizam em até n - 1 passadas
+    return distancias.tolist(), predecessores.tolist(), None
+
+
+def _executar(csr: GrafoCSR, origens: Sequence[int],
+              metodo: str) -> Tuple[List[float], List[int], Optional[List[int]]]:
+    """
+    Executa a variante pedida do Bellman-Ford.
+    
+    Returns:
+        Tuple[List[float], List[int], Optional[List[int]]]: Distâncias,
+        predecessores (-1 se não houver) e um ciclo negativo alcançável, em
+        índices da representação CSR.
+        
+    Raises:
+        ValueError: Se o método não for reconhecido.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método '{metodo}' inválido. Use um de: {', '.join(METODOS)}.")
+    if csr.numero_vertices() == 0 or not len(origens):
+        return [INFINITO] * csr.numero_vertices(), [-1] * csr.numero_vertices(), None
+    if metodo == "fila":
+        return _bellman_ford_fila(csr, origens)
+    return _bellman_ford_vetorizado(csr, origens)
+
+
+def bellman_ford(grafo: Grafo, origem: Any, metodo: str = "fila") -> Tuple[Dict[Any, float], Dict[Any, Any], bool]:
     """
     Implementa o algoritmo de Bellman-Ford para encontrar caminhos mínimos.
     
+    Os pesos são os de ``obter_peso_aresta``; em grafos não direcionados, cada
+    aresta pode ser percorrida nos dois sentidos (e uma aresta negativa é,
+    portanto, um ciclo negativo).
+    
     Args:
         grafo: Grafo ponderado.
         origem: Vértice de origem.
+        metodo: "fila" (SPFA) ou "vetorizado".
         
     Returns:
         Tuple[Dict[Any, float], Dict[Any, Any], bool]: Tupla contendo:
@@ -26,43 +213,21 @@ def bellman_ford(grafo: Grafo, origem: Any) -> Tuple[Dict[Any, float], Dict[Any,
             - Booleano indicando se existe ciclo de peso negativo alcançável a partir da origem
             
     Raises:
-        ValueError: Se o vértice de origem não existir no grafo.
+        ValueError: Se o vértice de origem não existir no grafo ou o método for inválido.
     """
     # Verifica se o vértice de origem existe no grafo
     if not grafo.existe_vertice(origem):
         raise ValueError(f"Vértice de origem '{origem}' não existe no grafo.")
     
-    # Obtém o grafo NetworkX subjacente
-    g_nx = grafo.obter_grafo_networkx()
-    
-    # Inicializa as estruturas de dados
-    distancias = {vertice: float('infinity') for vertice in grafo.obter_vertices()}
-    distancias[origem] = 0
-    predecessores = {vertice: None for vertice in grafo.obter_vertices()}
-    
-    # Obtém todas as arestas do grafo
-    arestas = []
-    for u, v, attrs in g_nx.edges(data=True):
-        peso = attrs.get('weight', 1.0)
-        arestas.append((u, v, peso))
-    
-    # Relaxamento das arestas |V| - 1 vezes
-    n_vertices = len(grafo.obter_vertices())
-    for _ in range(n_vertices - 1):
-        for u, v, peso in arestas:
-            # Relaxamento: se podemos melhorar o caminho para v passando por u
-            if distancias[u] != float('infinity') and distancias[u] + peso < distancias[v]:
-                distancias[v] = distancias[u] + peso
-                predecessores[v] = u
-    
-    # Verifica se há ciclos de peso negativo
-    ciclo_negativo = False
-    for u, v, peso in arestas:
-        if distancias[u] != float('infinity') and distancias[u] + peso < distancias[v]:
-            ciclo_negativo = True
-            break
+    csr = grafo.obter_csr()
+    ids = csr.lista_ids()
+    distancias, predecessores, ciclo = _executar(csr, [csr.indice(origem)], metodo)
     
-    return distancias, predecessores, ciclo_negativo
+    return (
+        {ids[i]: d for i, d in enumerate(distancias)},
+        {ids[i]: (ids[p] if p >= 0 else None) for i, p in enumerate(predecessores)},
+        ciclo is not None
+    )
 
 
 def reconstruir_caminho(predecessores: Dict[Any, Any], origem: Any, destino: Any) -> List[Any]:
@@ -94,7 +259,7 @@ def reconstruir_caminho(predecessores: Dict[Any, Any], origem: Any, destino: Any
     return list(reversed(caminho))
 
 
-def caminho_minimo(grafo: Grafo, origem: Any, destino: Any) -> Tuple[List[Any], float]:
+def caminho_minimo(grafo: Grafo, origem: Any, destino: Any, metodo: str = "fila") -> Tuple[List[Any], float]:
     """
     Encontra o caminho mínimo entre dois vértices usando o algoritmo de Bellman-Ford.
     
@@ -102,6 +267,7 @@ def caminho_minimo(grafo: Grafo, origem: Any, destino: Any) -> Tuple[List[Any],
         grafo: Grafo ponderado.
         origem: Vértice de origem.
         destino: Vértice de destino.
+        metodo: "fila" (SPFA) ou "vetorizado".
         
     Returns:
         Tuple[List[Any], float]: Tupla contendo:
@@ -120,94 +286,56 @@ def caminho_minimo(grafo: Grafo, origem: Any, destino: Any) -> Tuple[List[Any],
         raise ValueError(f"Vértice de destino '{destino}' não existe no grafo.")
     
     # Executa o algoritmo de Bellman-Ford
-    distancias, predecessores, ciclo_negativo = bellman_ford(grafo, origem)
+    csr = grafo.obter_csr()
+    ids = csr.lista_ids()
+    distancias, predecessores, ciclo = _executar(csr, [csr.indice(origem)], metodo)
     
     # Verifica se existe ciclo de peso negativo
-    if ciclo_negativo:
-        raise ValueError("O grafo contém ciclo de peso negativo alcançável a partir da origem.")
+    if ciclo is not None:
+        raise ValueError("O grafo contém ciclo de peso negativo alcançável a partir da origem: "
+                         f"{[ids[i] for i in ciclo]}.")
     
     # Verifica se existe caminho para o destino
-    if distancias[destino] == float('infinity'):
+    indice_destino = csr.indice(destino)
+    if distancias[indice_destino] == INFINITO:
         raise ValueError(f"Não existe caminho de '{origem}' para '{destino}'.")
     
     # Reconstrói o caminho
-    caminho = reconstruir_caminho(predecessores, origem, destino)
+    caminho = [indice_destino]
+    while predecessores[caminho[-1]] != -1:
+        caminho.append(predecessores[caminho[-1]])
+    caminho.reverse()
     
-    return caminho, distancias[destino]
+    return [ids[i] for i in caminho], distancias[indice_destino]
 
 
-def detectar_ciclo_negativo(grafo: Grafo) -> Optional[List[Any]]:
+def detectar_ciclo_negativo(grafo: Grafo, origem: Any = None, metodo: str = "fila") -> Optional[List[Any]]:
     """
     Detecta um ciclo de peso negativo no grafo, se existir.
     
+    Sem origem, equivale a partir de um vértice virtual ligado a todos os
+    vértices com peso zero: todos começam com distância zero.
+    
     Args:
         grafo: Grafo ponderado.
+        origem: Considera apenas os ciclos alcançáveis a partir deste vértice (opcional).
+        metodo: "fila" (SPFA) ou "vetorizado".
         
     Returns:
         Optional[List[Any]]: Lista de vértices que formam um ciclo de peso negativo,
-                           ou None se não existir ciclo de peso negativo.
+                           na ordem das arestas, ou None se não existir ciclo de peso negativo.
+                           
+    Raises:
+        ValueError: Se a origem não existir no grafo ou o método for inválido.
     """
-    # Obtém o grafo NetworkX subjacente
-    g_nx = grafo.obter_grafo_networkx()
-    
-    # Adiciona um vértice artificial conectado a todos os outros
-    vertice_artificial = object()  # Objeto único para garantir que não colide com vértices existentes
-    
-    # Cria um novo grafo com o vértice artificial
-    novo_grafo = Grafo("Grafo com vértice artificial")
-    
-    # Adiciona todos os vértices e arestas do grafo original
-    for vertice in grafo.obter_vertices():
-        novo_grafo.adicionar_vertice(vertice)
-    
-    for u, v, attrs in g_nx.edges(data=True):
-        peso = attrs.get('weight', 1.0)
-        novo_grafo.adicionar_aresta(u, v, peso)
-    
-    # Adiciona o vértice artificial e arestas com peso zero para todos os vértices
-    novo_grafo.adicionar_vertice(vertice_artificial)
-    for vertice in grafo.obter_vertices():
-        novo_grafo.adicionar_aresta(vertice_artificial, vertice, 0)
+    if origem is not None and not grafo.existe_vertice(origem):
+        raise ValueError(f"Vértice de origem '{origem}' não existe no grafo.")
     
-    # Executa o algoritmo de Bellman-Ford a partir do vértice artificial
-    distancias, predecessores, ciclo_negativo = bellman_ford(novo_grafo, vertice_artificial)
+    csr = grafo.obter_csr()
+    origens = range(csr.numero_vertices()) if origem is None else [csr.indice(origem)]
+    _, _, ciclo = _executar(csr, origens, metodo)
     
-    # Se não há ciclo negativo, retorna None
-    if not ciclo_negativo:
+    if ciclo is None:
         return None
-    
-    # Encontra um vértice que faz parte de um ciclo negativo
-    g_novo_nx = novo_grafo.obter_grafo_networkx()
-    for u, v, attrs in g_novo_nx.edges(data=True):
-        peso = attrs.get('weight', 1.0)
-        if distancias[u] != float('infinity') and distancias[u] + peso < distancias[v]:
-            # Encontrou uma aresta que viola a condição de otimalidade
-            # Agora precisamos encontrar o ciclo
-            
-            # Marca os vértices visitados para encontrar o ciclo
-            visitados = set()
-            vertice_atual = u
-            
-            # Avança até encontrar um vértice já visitado (que faz parte do ciclo)
-            while vertice_atual not in visitados and vertice_atual != vertice_artificial:
-                visitados.add(vertice_atual)
-                vertice_atual = predecessores[vertice_atual]
-            
-            # Se chegou ao vértice artificial, tenta outra aresta
-            if vertice_atual == vertice_artificial:
-                continue
-            
-            # Reconstrói o ciclo
-            ciclo = [vertice_atual]
-            v_ciclo = predecessores[vertice_atual]
-            while v_ciclo != vertice_atual:
-                ciclo.append(v_ciclo)
-                v_ciclo = predecessores[v_ciclo]
-            
-            # Inverte o ciclo para ordem natural
-            ciclo.reverse()
-            
-            return ciclo
-    
-    # Não deveria chegar aqui se ciclo_negativo for True
-    return None
+    ids = csr.lista_ids()
+    return [ids[i] for i in ciclo]
@@ -7,9 +7,14 @@ em teoria dos grafos.
 """
 
 from typing import Dict, List, Any, Set, Tuple, Optional, Callable
-from collections import deque
 import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
 from ....core.grafo import Grafo
+from ....core.csr import GrafoCSR
+from .fronteira import _bfs_niveis, bfs_csr
+from .profundidade import percorrer_profundidade
 
 
 def bfs(grafo: Grafo, origem: Any) -> Tuple[Dict[Any, Any], Dict[Any, int]]:
@@ -18,7 +23,8 @@ def bfs(grafo: Grafo, origem: Any) -> Tuple[Dict[Any, Any], Dict[Any, int]]:
     
     A BFS visita todos os vértices alcançáveis a partir da origem em ordem
     crescente de distância, explorando todos os vizinhos de um vértice antes
-    de passar para os próximos níveis.
+    de passar para os próximos níveis. Cada nível é expandido de uma vez sobre
+    a representação CSR do grafo (ver ``bfs_fronteira``).
     
     Args:
         grafo: Grafo a ser percorrido.
@@ -36,34 +42,13 @@ def bfs(grafo: Grafo, origem: Any) -> Tuple[Dict[Any, Any], Dict[Any, int]]:
     if not grafo.existe_vertice(origem):
         raise ValueError(f"Vértice de origem '{origem}' não existe no grafo.")
     
-    # Obtém o grafo NetworkX subjacente
-    g_nx = grafo.obter_grafo_networkx()
-    
-    # Inicializa as estruturas de dados
-    visitados = {origem}
-    fila = deque([origem])
-    predecessores = {vertice: None for vertice in grafo.obter_vertices()}
-    distancias = {vertice: float('infinity') for vertice in grafo.obter_vertices()}
-    distancias[origem] = 0
+    csr = grafo.obter_csr()
+    ids = csr.lista_ids()
+    distancias, pais = bfs_csr(csr, [csr.indice(origem)])
     
-    # Enquanto houver vértices na fila
-    while fila:
-        # Remove o primeiro vértice da fila
-        vertice_atual = fila.popleft()
-        
-        # Para cada vizinho não visitado
-        for vizinho in grafo.obter_adjacentes(vertice_atual):
-            if vizinho not in visitados:
-                # Marca como visitado
-                visitados.add(vizinho)
-                # Adiciona à fila
-                fila.append(vizinho)
-                # Registra o predecessor
-                predecessores[vizinho] = vertice_atual
-                # Registra a distância
-                distancias[vizinho] = distancias[vertice_atual] + 1
-    
-    return predecessores, distancias
+    # Converte os arrays para dicionários indexados pelos vértices
+    predecessores = {v: (ids[p] if p >= 0 else None) for v, p in zip(ids, pais.tolist())}
+    return predecessores, {v: (d if d >= 0 else float('infinity')) for v, d in zip(ids, distancias.tolist())}
 
 
 def dfs(grafo: Grafo, origem: Any) -> Tuple[Dict[Any, Any], Dict[Any, Tuple[int, int]]]:
@@ -72,6 +57,8 @@ def dfs(grafo: Grafo, origem: Any) -> Tuple[Dict[Any, Any], Dict[Any, Tuple[int,
     
     A DFS explora o grafo seguindo um caminho até o fim antes de retroceder,
     o que permite identificar propriedades como tempos de descoberta e finalização.
+    A busca usa pilha explícita sobre a representação CSR (ver ``percorrer_profundidade``),
+    sem limite de profundidade.
     
     Args:
         grafo: Grafo a ser percorrido.
@@ -89,44 +76,29 @@ def dfs(grafo: Grafo, origem: Any) -> Tuple[Dict[Any, Any], Dict[Any, Tuple[int,
     if not grafo.existe_vertice(origem):
         raise ValueError(f"Vértice de origem '{origem}' não existe no grafo.")
     
-    # Obtém o grafo NetworkX subjacente
-    g_nx = grafo.obter_grafo_networkx()
+    csr = grafo.obter_csr()
+    ids = csr.lista_ids()
+    n = csr.numero_vertices()
     
-    # Inicializa as estruturas de dados
-    predecessores = {vertice: None for vertice in grafo.obter_vertices()}
-    tempos = {}  # Mapeamento de vértices para tuplas (tempo_descoberta, tempo_finalização)
-    visitados = set()
-    tempo_atual = [0]  # Lista com um elemento para permitir modificação na função interna
-    
-    def dfs_visita(vertice):
-        # Marca o vértice como visitado
-        visitados.add(vertice)
-        # Registra o tempo de descoberta
-        tempo_atual[0] += 1
-        tempo_descoberta = tempo_atual[0]
-        
-        # Para cada vizinho não visitado
-        for vizinho in grafo.obter_adjacentes(vertice):
-            if vizinho not in visitados:
-                # Registra o predecessor
-                predecessores[vizinho] = vertice
-                # Visita o vizinho recursivamente
-                dfs_visita(vizinho)
-        
-        # Registra o tempo de finalização
-        tempo_atual[0] += 1
-        tempo_finalizacao = tempo_atual[0]
-        # Armazena os tempos de descoberta e finalização
-        tempos[vertice] = (tempo_descoberta, tempo_finalizacao)
+    # Tempos por índice (zero para vértices não alcançáveis a partir da origem)
+    pais = [-1] * n
+    descoberta = [0] * n
+    finalizacao = [0] * n
+    relogio = [0]
+    
+    def ao_descobrir(v, pai):
+        relogio[0] += 1
+        descoberta[v] = relogio[0]
+        pais[v] = pai
     
-    # Inicia a DFS a partir da origem
-    dfs_visita(origem)
+    def ao_finalizar(v, pai):
+        relogio[0] += 1
+        finalizacao[v] = relogio[0]
     
-    # Para vértices não alcançáveis a partir da origem
-    for vertice in grafo.obter_vertices():
-        if vertice not in visitados:
-            tempos[vertice] = (0, 0)  # Tempos zero para vértices não visitados
+    percorrer_profundidade(csr, [csr.indice(origem)], ao_descobrir, ao_finalizar)
     
+    predecessores = {v: (ids[p] if p >= 0 else None) for v, p in zip(ids, pais)}
+    tempos = {v: (d, f) for v, d, f in zip(ids, descoberta, finalizacao)}
     return predecessores, tempos
 
 
@@ -268,9 +240,21 @@ def reconstruir_caminho_bfs(predecessores: Dict[Any, Any], origem: Any, destino:
     return list(reversed(caminho))
 
 
+def _rotulos_componentes(csr: GrafoCSR) -> Tuple[int, np.ndarray]:
+    """
+    Rotula os componentes conexos (fracamente conexos, se direcionado) de cada vértice.
+    """
+    n = csr.numero_vertices()
+    matriz = sp.csr_matrix((np.ones(len(csr.indices), dtype=np.int8), csr.indices, csr.indptr), shape=(n, n))
+    return connected_components(matriz, directed=csr.direcionado, connection="weak")
+
+
 def encontrar_componentes_conexos(grafo: Grafo) -> List[Set[Any]]:
     """
-    Encontra todos os componentes conexos do grafo usando BFS.
+    Encontra todos os componentes conexos do grafo.
+    
+    Em grafos direcionados, são os componentes fracamente conexos. Os
+    componentes são rotulados sobre a representação CSR do grafo.
     
     Args:
         grafo: Grafo a ser analisado.
@@ -278,24 +262,14 @@ def encontrar_componentes_conexos(grafo: Grafo) -> List[Set[Any]]:
     Returns:
         List[Set[Any]]: Lista de conjuntos, onde cada conjunto contém os vértices de um componente conexo.
     """
-    # Obtém todos os vértices do grafo
-    vertices = set(grafo.obter_vertices())
-    componentes = []
-    
-    # Enquanto houver vértices não visitados
-    while vertices:
-        # Escolhe um vértice arbitrário
-        origem = next(iter(vertices))
-        
-        # Executa BFS a partir desse vértice
-        _, visitados = dfs_iterativo(grafo, origem)
-        
-        # Adiciona o componente conexo à lista
-        componentes.append(visitados)
-        
-        # Remove os vértices visitados do conjunto de vértices restantes
-        vertices -= visitados
-    
+    csr = grafo.obter_csr()
+    ids = csr.lista_ids()
+    quantidade, rotulos = _rotulos_componentes(csr)
+    
+    # Agrupa os vértices pelo rótulo do componente
+    componentes = [set() for _ in range(quantidade)]
+    for v, rotulo in zip(ids, rotulos.tolist()):
+        componentes[rotulo].add(v)
     return componentes
 
 
@@ -305,9 +279,12 @@ def verificar_bipartido(grafo: Grafo) -> Tuple[bool, Dict[Any, int]]:
     
     Um grafo é bipartido se seus vértices podem ser divididos em dois conjuntos
     disjuntos de modo que toda aresta conecte vértices de conjuntos diferentes.
+    Uma única busca em largura parte de um vértice de cada componente; a cor
+    de cada vértice é a paridade do seu nível, e o grafo é bipartido se
+    nenhuma aresta ligar vértices de mesma cor.
     
     Args:
-        grafo: Grafo a ser analisado.
+        grafo: Grafo a ser analisado (a direção das arestas é ignorada).
         
     Returns:
         Tuple[bool, Dict[Any, int]]: Tupla contendo:
@@ -315,100 +292,65 @@ def verificar_bipartido(grafo: Grafo) -> Tuple[bool, Dict[Any, int]]:
             - Dicionário mapeando vértices para suas cores (0 ou 1) se for bipartido,
               ou um dicionário vazio se não for bipartido
     """
-    # Inicializa as cores dos vértices
-    cores = {}
-    
-    # Para cada componente conexo
-    for componente in encontrar_componentes_conexos(grafo):
-        # Escolhe um vértice arbitrário do componente
-        origem = next(iter(componente))
-        
-        # Inicializa a fila para BFS
-        fila = deque([origem])
-        cores[origem] = 0  # Atribui a cor 0 à origem
-        
-        # Enquanto houver vértices na fila
-        while fila:
-            # Remove o primeiro vértice da fila
-            vertice_atual = fila.popleft()
-            
-            # Para cada vizinho
-            for vizinho in grafo.obter_adjacentes(vertice_atual):
-                # Se o vizinho ainda não tem cor
-                if vizinho not in cores:
-                    # Atribui a cor oposta
-                    cores[vizinho] = 1 - cores[vertice_atual]
-                    # Adiciona à fila
-                    fila.append(vizinho)
-                # Se o vizinho já tem cor e é a mesma do vértice atual
-                elif cores[vizinho] == cores[vertice_atual]:
-                    # O grafo não é bipartido
-                    return False, {}
-    
-    # Se chegou até aqui, o grafo é bipartido
-    return True, cores
+    csr = grafo.obter_csr()
+    n = csr.numero_vertices()
+    if n == 0:
+        return True, {}
+    
+    # Adjacência sem direção
+    adjacencia = (np.asarray(csr.indptr), np.asarray(csr.indices))
+    if csr.direcionado:
+        matriz = sp.csr_matrix((np.ones(len(csr.indices), dtype=np.int8), csr.indices, csr.indptr), shape=(n, n))
+        simetrica = (matriz + matriz.T).tocsr()
+        adjacencia = (simetrica.indptr.astype(np.int64), simetrica.indices.astype(np.int64))
+    
+    # Um vértice de cada componente como origem
+    _, rotulos = _rotulos_componentes(csr)
+    _, raizes = np.unique(rotulos, return_index=True)
+    distancias, _ = _bfs_niveis(adjacencia, adjacencia, raizes)
+    cores = distancias % 2
+    
+    # Toda aresta deve ligar vértices de cores diferentes
+    fontes = np.repeat(np.arange(n), np.diff(csr.indptr))
+    if np.any(cores[fontes] == cores[np.asarray(csr.indices)]):
+        return False, {}
+    return True, dict(zip(csr.lista_ids(), cores.tolist()))
 
 
 def encontrar_ciclo(grafo: Grafo) -> Optional[List[Any]]:
     """
     Encontra um ciclo no grafo usando DFS, se existir.
     
+    O ciclo é fechado pela primeira aresta de retorno encontrada. Em grafos não
+    direcionados, a aresta de volta ao pai não forma ciclo.
+    
     Args:
         grafo: Grafo a ser analisado.
         
     Returns:
-        Optional[List[Any]]: Lista de vértices que formam um ciclo, ou None se não existir ciclo.
+        Optional[List[Any]]: Lista de vértices que formam um ciclo (o primeiro
+        vértice é repetido no final), ou None se não existir ciclo.
     """
-    # Inicializa as estruturas de dados
-    visitados = set()
-    em_pilha = set()  # Vértices na pilha de recursão atual
-    predecessores = {}
-    
-    def dfs_ciclo(vertice):
-        # Marca o vértice como visitado e adiciona à pilha
-        visitados.add(vertice)
-        em_pilha.add(vertice)
-        
-        # Para cada vizinho
-        for vizinho in grafo.obter_adjacentes(vertice):
-            # Se o vizinho ainda não foi visitado
-            if vizinho not in visitados:
-                # Registra o predecessor
-                predecessores[vizinho] = vertice
-                # Se encontrou um ciclo na recursão
-                if dfs_ciclo(vizinho):
-                    return True
-            # Se o vizinho está na pilha atual, encontrou um ciclo
-            elif vizinho in em_pilha:
-                # Reconstrói o ciclo
-                ciclo = [vizinho]
-                atual = vertice
-                while atual != vizinho:
-                    ciclo.append(atual)
-                    atual = predecessores[atual]
-                ciclo.append(vizinho)  # Fecha o ciclo
-                ciclo.reverse()  # Inverte para ordem natural
-                
-                # Armazena o ciclo encontrado
-                encontrar_ciclo.resultado = ciclo
-                return True
-        
-        # Remove o vértice da pilha ao retornar
-        em_pilha.remove(vertice)
-        return False
-    
-    # Inicializa o resultado
-    encontrar_ciclo.resultado = None
-    
-    # Para cada vértice não visitado
-    for vertice in grafo.obter_vertices():
-        if vertice not in visitados:
-            predecessores = {vertice: None}
-            if dfs_ciclo(vertice):
-                return encontrar_ciclo.resultado
-    
-    # Se não encontrou ciclo
-    return None
+    csr = grafo.obter_csr()
+    pais = [-1] * csr.numero_vertices()
+    ciclo = []
+    
+    def ao_descobrir(v, pai):
+        pais[v] = pai
+    
+    def ao_retorno(u, w):
+        # Reconstrói o ciclo w -> ... -> u -> w pela árvore de busca
+        ciclo.append(u)
+        while ciclo[-1] != w:
+            ciclo.append(pais[ciclo[-1]])
+        ciclo.reverse()
+        ciclo.append(w)
+        return True
+    
+    if not percorrer_profundidade(csr, ao_descobrir=ao_descobrir, ao_retorno=ao_retorno):
+        return None
+    ids = csr.lista_ids()
+    return [ids[i] for i in ciclo]
 
 
 def ordenacao_topologica(grafo: Grafo) -> Optional[List[Any]]:
@@ -417,6 +359,8 @@ def ordenacao_topologica(grafo: Grafo) -> Optional[List[Any]]:
     
     Uma ordenação topológica é uma ordenação linear dos vértices de um grafo
     direcionado acíclico (DAG) tal que para toda aresta (u, v), u vem antes de v.
+    A ordem é a inversa da finalização dos vértices, e uma aresta de retorno
+    encerra a busca indicando um ciclo.
     
     Args:
         grafo: Grafo direcionado a ser analisado.
@@ -429,30 +373,16 @@ def ordenacao_topologica(grafo: Grafo) -> Optional[List[Any]]:
     if not isinstance(g_nx, nx.DiGraph):
         raise ValueError("A ordenação topológica só é definida para grafos direcionados.")
     
-    # Verifica se o grafo contém ciclos
-    if encontrar_ciclo(grafo) is not None:
-        return None  # Não é possível realizar ordenação topológica em grafos com ciclos
+    csr = grafo.obter_csr()
+    finalizados = []
     
-    # Inicializa as estruturas de dados
-    visitados = set()
-    ordem_topologica = []
-    
-    def dfs_topologica(vertice):
-        # Marca o vértice como visitado
-        visitados.add(vertice)
-        
-        # Para cada vizinho não visitado
-        for vizinho in grafo.obter_adjacentes(vertice):
-            if vizinho not in visitados:
-                dfs_topologica(vizinho)
-        
-        # Adiciona o vértice à ordem topológica
-        ordem_topologica.append(vertice)
+    def ao_finalizar(v, pai):
+        finalizados.append(v)
     
-    # Para cada vértice não visitado
-    for vertice in grafo.obter_vertices():
-        if vertice not in visitados:
-            dfs_topologica(vertice)
+    # Não é possível realizar ordenação topológica em grafos com ciclos
+    if percorrer_profundidade(csr, ao_finalizar=ao_finalizar, ao_retorno=lambda u, w: True):
+        return None
     
-    # Inverte a ordem para obter a ordenação topológica correta
-    return list(reversed(ordem_topologica))
+    # Inverte a ordem de finalização para obter a ordenação topológica
+    ids = csr.lista_ids()
+    return [ids[i] for i in reversed(finalizados)]
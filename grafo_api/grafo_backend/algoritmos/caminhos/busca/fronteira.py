@@ -0,0 +1,183 @@
+"""
+Busca em largura por níveis sobre a representação CSR, com otimização de direção.
+
+Cada nível da busca expande a fronteira inteira de uma vez com operações
+NumPy, em uma de duas direções (Beamer, Asanović e Patterson):
+
+- de cima para baixo: percorre as arestas que saem da fronteira e marca os
+  vizinhos ainda não visitados;
+- de baixo para cima: cada vértice não visitado procura, entre as arestas
+  que chegam a ele, um vizinho na fronteira. As primeiras arestas de cada
+  vértice são testadas em rodadas e os vértices que já encontraram um pai
+  saem das rodadas seguintes, o que imita a interrupção da busca no primeiro
+  pai encontrado.
+
+A busca passa para baixo-para-cima quando as arestas da fronteira superam
+1/ALFA das arestas dos vértices não visitados, e volta quando a fronteira
+diminui para menos de 1/BETA dos vértices. Em grafos com distribuição de
+graus assimétrica, os poucos níveis centrais, em que a fronteira contém a
+maior parte do grafo, deixam de percorrer todas as arestas.
+"""
+
+from typing import Any, Sequence, Tuple
+
+import numpy as np
+
+from grafo_backend.core.grafo import Grafo
+from grafo_backend.core.csr import GrafoCSR
+
+
+# Parâmetros de troca de direção
+ALFA = 14
+BETA = 24
+
+# Arestas de entrada testadas uma a uma por vértice antes da varredura completa
+RODADAS_BAIXO_PARA_CIMA = 4
+
+
+def _expandir(indptr: np.ndarray, indices: np.ndarray, vertices: np.ndarray,
+              pular: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Obtém, de uma vez, as arestas de um conjunto de vértices.
+
+    Args:
+        indptr: Deslocamentos da adjacência.
+        indices: Vizinhos da adjacência.
+        vertices: Índices dos vértices.
+        pular: Número de arestas iniciais de cada vértice a ignorar.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Vizinhos e, alinhado, o vértice de cada aresta.
+    """
+    inicios = indptr[vertices] + pular
+    contagens = np.maximum(indptr[vertices + 1] - inicios, 0)
+    total = int(contagens.sum())
+    if total == 0:
+        vazio = np.empty(0, dtype=np.int64)
+        return vazio, vazio
+    deslocamentos = np.repeat(inicios - np.cumsum(contagens) + contagens, contagens)
+    return indices[deslocamentos + np.arange(total)], np.repeat(vertices, contagens)
+
+
+def _bfs_niveis(saida: Tuple[np.ndarray, np.ndarray], entrada: Tuple[np.ndarray, np.ndarray],
+                origens: np.ndarray, alfa: float = ALFA,
+                beta: float = BETA) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Executa a busca em largura por níveis sobre arrays de adjacência.
+
+    Args:
+        saida: (indptr, indices) das arestas que saem de cada vértice.
+        entrada: (indptr, indices) das arestas que chegam a cada vértice.
+        origens: Índices das origens (nível 0).
+        alfa: Parâmetro de troca para baixo-para-cima.
+        beta: Parâmetro de troca para cima-para-baixo.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Distâncias (-1 para os inalcançáveis)
+        e pais na árvore de busca (-1 para as origens e os inalcançáveis).
+    """
+    indptr_saida, indices_saida = saida
+    indptr_entrada, indices_entrada = entrada
+    n = len(indptr_saida) - 1
+    graus_saida = np.diff(indptr_saida)
+    graus_entrada = np.diff(indptr_entrada)
+
+    distancias = np.full(n, -1, dtype=np.int64)
+    pais = np.full(n, -1, dtype=np.int64)
+    fronteira = np.unique(np.asarray(origens, dtype=np.int64))
+    distancias[fronteira] = 0
+
+    # Arestas de entrada ainda não examinadas (dos vértices não visitados)
+    arestas_restantes = int(graus_entrada.sum()) - int(graus_entrada[fronteira].sum())
+    baixo_para_cima = False
+    nivel = 0
+    while len(fronteira):
+        nivel += 1
+        arestas_fronteira = int(graus_saida[fronteira].sum())
+        if not baixo_para_cima and arestas_fronteira * alfa > arestas_restantes:
+            baixo_para_cima = True
+        elif baixo_para_cima and len(fronteira) * beta < n:
+            baixo_para_cima = False
+
+        if baixo_para_cima:
+            em_fronteira = np.zeros(n, dtype=bool)
+            em_fronteira[fronteira] = True
+            restantes = np.flatnonzero(distancias == -1)
+            encontrados = []
+
+            # Rodadas: a r-ésima aresta de entrada de cada vértice ainda sem pai
+            for rodada in range(RODADAS_BAIXO_PARA_CIMA):
+                restantes = restantes[graus_entrada[restantes] > rodada]
+                if len(restantes) == 0:
+                    break
+                vizinhos = indices_entrada[indptr_entrada[restantes] + rodada]
+                achou = em_fronteira[vizinhos]
+                pais[restantes[achou]] = vizinhos[achou]
+                encontrados.append(restantes[achou])
+                restantes = restantes[~achou]
+
+            # Varredura completa das arestas restantes; vale a primeira encontrada
+            vizinhos, donos = _expandir(indptr_entrada, indices_entrada, restantes, RODADAS_BAIXO_PARA_CIMA)
+            achou = em_fronteira[vizinhos]
+            novos, primeiros = np.unique(donos[achou], return_index=True)
+            pais[novos] = vizinhos[achou][primeiros]
+            encontrados.append(novos)
+            fronteira = np.concatenate(encontrados)
+        else:
+            vizinhos, donos = _expandir(indptr_saida, indices_saida, fronteira)
+            novos = distancias[vizinhos] == -1
+            vizinhos, donos = vizinhos[novos], donos[novos]
+            pais[vizinhos] = donos
+            fronteira = np.unique(vizinhos)
+
+        distancias[fronteira] = nivel
+        arestas_restantes -= int(graus_entrada[fronteira].sum())
+
+    return distancias, pais
+
+
+def bfs_fronteira(grafo: Grafo, origens: Any, alfa: float = ALFA,
+                  beta: float = BETA) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula distâncias (em número de arestas) e pais de uma busca em largura.
+
+    Args:
+        grafo: Grafo a ser percorrido.
+        origens: Vértice de origem ou lista de vértices de origem.
+        alfa: Parâmetro de troca para baixo-para-cima.
+        beta: Parâmetro de troca para cima-para-baixo.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Distâncias (-1 para os inalcançáveis)
+        e índices dos pais (-1 para as origens e os inalcançáveis), na ordem
+        de ``grafo.obter_csr().lista_ids()``.
+
+    Raises:
+        ValueError: Se alguma origem não existir no grafo.
+    """
+    csr = grafo.obter_csr()
+    if isinstance(origens, (list, tuple, set)) and not grafo.existe_vertice(origens):
+        indices = [csr.indice(v) for v in origens]
+    else:
+        indices = [csr.indice(origens)]
+    return bfs_csr(csr, indices, alfa, beta)
+
+
+def bfs_csr(csr: GrafoCSR, origens: Sequence[int], alfa: float = ALFA,
+            beta: float = BETA) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Executa a busca em largura por níveis a partir de índices da representação CSR.
+
+    Args:
+        csr: Representação CSR do grafo.
+        origens: Índices das origens.
+        alfa: Parâmetro de troca para baixo-para-cima.
+        beta: Parâmetro de troca para cima-para-baixo.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Distâncias e pais, como em ``bfs_fronteira``.
+    """
+    transposta = csr.transposta()
+    return _bfs_niveis((np.asarray(csr.indptr), np.asarray(csr.indices)),
+                       (np.asarray(transposta.indptr), np.asarray(transposta.indices)),
+                       np.asarray(origens, dtype=np.int64), alfa, beta)
@@ -0,0 +1,146 @@
+"""
+Busca em largura simultânea a partir de várias origens (MS-BFS).
+
+Até 64 buscas são executadas juntas (Then et al., "The More the Merrier"):
+cada vértice guarda, em palavras de 64 bits, o conjunto de buscas que já o
+visitaram e o conjunto de buscas em cuja fronteira ele está. Um nível
+combina as palavras da fronteira pelas arestas com OU bit a bit, de modo
+que cada aresta é percorrida uma única vez por nível para todo o lote, e
+não uma vez por origem.
+
+Cada nível escolhe entre empurrar as palavras pelas arestas que saem dos
+vértices da fronteira ou, quando essas arestas são muitas, puxá-las pelas
+arestas que chegam a cada vértice, com uma redução contígua sobre a
+transposta.
+"""
+
+from typing import Any, Iterator, Sequence, Tuple
+
+import numpy as np
+
+from grafo_backend.core.grafo import Grafo
+from grafo_backend.core.csr import GrafoCSR
+from .fronteira import _expandir
+
+
+# Número de buscas por lote (bits de uma palavra)
+TAMANHO_LOTE = 64
+
+# Empurra pelas arestas da fronteira enquanto forem menos de 1/FATOR_EMPURRAR do total
+FATOR_EMPURRAR = 4
+
+
+def _bfs_lote(saida: Tuple[np.ndarray, np.ndarray], entrada: Tuple[np.ndarray, np.ndarray],
+              origens: np.ndarray) -> np.ndarray:
+    """
+    Executa até TAMANHO_LOTE buscas em largura simultâneas.
+
+    Args:
+        saida: (indptr, indices) das arestas que saem de cada vértice.
+        entrada: (indptr, indices) das arestas que chegam a cada vértice.
+        origens: Índices das origens do lote, um por bit.
+
+    Returns:
+        np.ndarray: Matriz len(origens) x n de distâncias (-1 para os inalcançáveis).
+    """
+    indptr_saida, indices_saida = saida
+    indptr_entrada, indices_entrada = entrada
+    n = len(indptr_saida) - 1
+    total_arestas = len(indices_saida)
+    k = len(origens)
+    bits = np.left_shift(np.uint64(1), np.arange(k, dtype=np.uint64))
+
+    # Vértices com arestas de entrada, para a redução segmentada
+    com_entrada = np.flatnonzero(np.diff(indptr_entrada))
+    inicios_entrada = indptr_entrada[com_entrada]
+    graus_saida = np.diff(indptr_saida)
+
+    # Distâncias por vértice (n x k), para que cada nível escreva linhas inteiras
+    distancias = np.full((n, k), -1, dtype=np.int32)
+    distancias[origens, np.arange(k)] = 0
+    fronteira = np.zeros(n, dtype=np.uint64)
+    np.bitwise_or.at(fronteira, origens, bits)
+    visto = fronteira.copy()
+
+    nivel = 0
+    ativos = np.flatnonzero(fronteira)
+    while len(ativos):
+        nivel += 1
+        proxima = np.zeros(n, dtype=np.uint64)
+        if int(graus_saida[ativos].sum()) * FATOR_EMPURRAR < total_arestas:
+            vizinhos, donos = _expandir(indptr_saida, indices_saida, ativos)
+            np.bitwise_or.at(proxima, vizinhos, fronteira[donos])
+        elif len(com_entrada):
+            proxima[com_entrada] = np.bitwise_or.reduceat(fronteira[indices_entrada], inicios_entrada)
+
+        # Apenas as buscas que ainda não visitaram cada vértice avançam
+        proxima &= ~visto
+        visto |= proxima
+        fronteira = proxima
+        ativos = np.flatnonzero(fronteira)
+
+        # Registra o nível para cada bit ligado (bit 0 no primeiro byte)
+        if len(ativos):
+            palavras = fronteira[ativos].astype("<u8").view(np.uint8).reshape(-1, 8)
+            ligados = np.unpackbits(palavras, axis=1, bitorder="little")[:, :k].view(bool)
+            distancias[ativos] = np.where(ligados, nivel, distancias[ativos])
+
+    return distancias.T
+
+
+def iterar_lotes_bfs(csr: GrafoCSR, origens: Sequence[int],
+                     reversa: bool = False) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Percorre as distâncias das origens em lotes de até TAMANHO_LOTE linhas.
+
+    Permite agregar medidas sobre todas as origens sem manter a matriz n x n.
+
+    Args:
+        csr: Representação CSR do grafo.
+        origens: Índices das origens.
+        reversa: Se True, segue as arestas no sentido contrário (distâncias até as origens).
+
+    Yields:
+        Tuple[int, np.ndarray]: Posição da primeira origem do lote em ``origens``
+        e as linhas de distâncias do lote (-1 para os inalcançáveis).
+    """
+    origens = np.asarray(origens, dtype=np.int64)
+    saida = (np.asarray(csr.indptr), np.asarray(csr.indices))
+    if csr.direcionado:
+        transposta = csr.transposta()
+        entrada = (np.asarray(transposta.indptr), np.asarray(transposta.indices))
+    else:
+        entrada = saida
+    if reversa:
+        saida, entrada = entrada, saida
+
+    for inicio in range(0, len(origens), TAMANHO_LOTE):
+        yield inicio, _bfs_lote(saida, entrada, origens[inicio:inicio + TAMANHO_LOTE])
+
+
+def bfs_multiplas_origens(grafo: Grafo, origens: Any = None) -> np.ndarray:
+    """
+    Calcula as distâncias (em número de arestas) de várias origens a todos os vértices.
+
+    Args:
+        grafo: Grafo a ser percorrido.
+        origens: Lista de vértices de origem (todos os vértices, se None).
+
+    Returns:
+        np.ndarray: Matriz len(origens) x n, com uma linha por origem e as
+        colunas na ordem de ``grafo.obter_csr().lista_ids()`` (-1 para os
+        inalcançáveis).
+
+    Raises:
+        ValueError: Se alguma origem não existir no grafo.
+    """
+    csr = grafo.obter_csr()
+    if origens is None:
+        indices = np.arange(csr.numero_vertices(), dtype=np.int64)
+    else:
+        indices = np.array([csr.indice(v) for v in origens], dtype=np.int64)
+
+    distancias = np.empty((len(indices), csr.numero_vertices()), dtype=np.int32)
+    for inicio, lote in iterar_lotes_bfs(csr, indices):
+        distancias[inicio:inicio + len(lote)] = lote
+    return distancias
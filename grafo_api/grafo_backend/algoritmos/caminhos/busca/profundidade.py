@@ -0,0 +1,108 @@
+"""
+Busca em profundidade com pilha explícita sobre a representação CSR.
+
+Os algoritmos baseados em DFS (tempos de descoberta e finalização, detecção
+de ciclos, ordenação topológica, componentes fortemente conexos, pontes e
+pontos de articulação) são escritos como ganchos chamados pelo mesmo laço:
+
+- ``ao_descobrir(v, pai)``: v entra na pilha (pai é -1 nas raízes);
+- ``ao_finalizar(v, pai)``: todos os vizinhos de v foram examinados;
+- ``ao_retorno(u, w)``: aresta de u para w, que ainda está na pilha;
+- ``ao_cruzar(u, w)``: aresta de u para w, já finalizado (aresta de avanço
+  ou cruzada; em grafos não direcionados, o outro sentido de uma aresta de
+  retorno já vista).
+
+Um gancho que retorna True interrompe a busca. A pilha guarda apenas os
+vértices e a posição da próxima aresta de cada um fica em uma lista, de modo
+que a profundidade não é limitada pela recursão do Python e cada aresta é
+lida uma única vez das listas de ``GrafoCSR.listas``.
+"""
+
+from typing import Callable, Iterable, Optional
+
+from grafo_backend.core.csr import GrafoCSR
+
+
+# Estados dos vértices durante a busca
+NAO_VISITADO = 0
+NA_PILHA = 1
+FINALIZADO = 2
+
+
+def percorrer_profundidade(csr: GrafoCSR, raizes: Optional[Iterable[int]] = None,
+                           ao_descobrir: Optional[Callable[[int, int], Optional[bool]]] = None,
+                           ao_finalizar: Optional[Callable[[int, int], Optional[bool]]] = None,
+                           ao_retorno: Optional[Callable[[int, int], Optional[bool]]] = None,
+                           ao_cruzar: Optional[Callable[[int, int], Optional[bool]]] = None) -> bool:
+    """
+    Executa a busca em profundidade a partir de cada raiz ainda não visitada.
+
+    Os vizinhos são examinados na ordem da representação CSR. Em grafos não
+    direcionados, a aresta de volta ao pai na árvore é ignorada uma vez.
+
+    Args:
+        csr: Representação CSR do grafo.
+        raizes: Índices das raízes, em ordem (todos os vértices, se None).
+        ao_descobrir: Gancho chamado com (v, pai) quando v é descoberto.
+        ao_finalizar: Gancho chamado com (v, pai) quando v é finalizado.
+        ao_retorno: Gancho chamado com (u, w) nas arestas para vértices na pilha.
+        ao_cruzar: Gancho chamado com (u, w) nas arestas para vértices finalizados.
+
+    Returns:
+        bool: True se algum gancho interrompeu a busca.
+    """
+    indptr, indices, _ = csr.listas()
+    n = csr.numero_vertices()
+    nao_direcionado = not csr.direcionado
+    if raizes is None:
+        raizes = range(n)
+
+    estado = [NAO_VISITADO] * n
+    pais = [-1] * n
+    proxima = indptr[:-1]
+    # Em grafos não direcionados, indica se a aresta de volta ao pai já foi ignorada
+    pai_ignorado = [False] * n if nao_direcionado else None
+
+    for raiz in raizes:
+        if estado[raiz] != NAO_VISITADO:
+            continue
+        estado[raiz] = NA_PILHA
+        if ao_descobrir is not None and ao_descobrir(raiz, -1):
+            return True
+        pilha = [raiz]
+
+        while pilha:
+            u = pilha[-1]
+            i = proxima[u]
+            fim = indptr[u + 1]
+            descendo = False
+            while i < fim:
+                w = indices[i]
+                i += 1
+                situacao = estado[w]
+                if situacao == NAO_VISITADO:
+                    # Aresta de árvore: desce para w e retoma u depois desta aresta
+                    proxima[u] = i
+                    estado[w] = NA_PILHA
+                    pais[w] = u
+                    if ao_descobrir is not None and ao_descobrir(w, u):
+                        return True
+                    pilha.append(w)
+                    descendo = True
+                    break
+                if situacao == NA_PILHA:
+                    if nao_direcionado and w == pais[u] and not pai_ignorado[u]:
+                        pai_ignorado[u] = True
+                        continue
+                    if ao_retorno is not None and ao_retorno(u, w):
+                        return True
+                elif ao_cruzar is not None and ao_cruzar(u, w):
+                    return True
+
+            if not descendo:
+                pilha.pop()
+                estado[u] = FINALIZADO
+                if ao_finalizar is not None and ao_finalizar(u, pais[u]):
+                    return True
+
+    return False
@@ -1,66 +1,300 @@
 """
 Implementação do algoritmo de Dijkstra para caminhos mínimos em grafos.
+
+As buscas percorrem a representação CSR do grafo (``Grafo.obter_csr``), com os
+vértices identificados por índices inteiros e uma fila de prioridade binária
+(``heapq``) com remoção preguiçosa: entradas obsoletas são descartadas ao
+saírem da fila. Os pesos são os de ``obter_peso_aresta`` do grafo, tanto em
+``Grafo`` quanto em ``GrafoPonderado``.
+
+As distâncias e predecessores são mantidos em dicionários, de modo que uma
+busca limitada (com destino, raio ou número de vértices) custa apenas o
+número de vértices que alcança, e não o tamanho do grafo.
 """
 
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Iterable, Tuple, List, Optional
 import heapq
 
 from grafo_backend.core.grafo import Grafo
+from grafo_backend.core.csr import GrafoCSR
+
+
+INFINITO = float('inf')
+
+
+def _validar_pesos(csr: GrafoCSR) -> None:
+    """
+    Verifica se o grafo não tem arestas de peso negativo.
+
+    Raises:
+        ValueError: Se alguma aresta tiver peso negativo.
+    """
+    if len(csr.pesos) and float(csr.pesos.min()) < 0:
+        raise ValueError("O algoritmo de Dijkstra não suporta arestas com peso negativo.")
+
+
+def _buscar(csr: GrafoCSR, sementes: Iterable[Tuple[int, float]], alvo: Optional[int] = None,
+            limite_vertices: Optional[int] = None,
+            raio: Optional[float] = None) -> Tuple[Dict[int, float], Dict[int, int]]:
+    """
+    Executa o Dijkstra sobre os índices da representação CSR.
+
+    Args:
+        csr: Representação CSR do grafo.
+        sementes: Pares (índice, distância inicial) dos vértices de origem.
+        alvo: Índice do vértice em que a busca termina, ao ser fixado (opcional).
+        limite_vertices: Número de vértices fixados após o qual a busca termina (opcional).
+        raio: Distância máxima dos vértices fixados (opcional).
+
+    Returns:
+        Tuple[Dict[int, float], Dict[int, int]]: Distâncias dos vértices
+        fixados, na ordem em que foram fixados, e os predecessores dos
+        vértices alcançados.
+    """
+    indptr, indices, pesos = csr.listas()
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    # Distâncias provisórias e fila com as sementes
+    provisorias: Dict[int, float] = {}
+    for indice, distancia in sementes:
+        if distancia < provisorias.get(indice, INFINITO):
+            provisorias[indice] = distancia
+    fila = [(d, v) for v, d in provisorias.items()]
+    heapq.heapify(fila)
+
+    fixadas: Dict[int, float] = {}
+    predecessores: Dict[int, int] = {}
+    while fila:
+        dist_atual, v_atual = heappop(fila)
+
+        # Entrada obsoleta de um vértice já fixado
+        if v_atual in fixadas:
+            continue
+        if raio is not None and dist_atual > raio:
+            break
+        fixadas[v_atual] = dist_atual
+
+        # Término antecipado
+        if v_atual == alvo or (limite_vertices is not None and len(fixadas) >= limite_vertices):
+            break
+
+        for posicao in range(indptr[v_atual], indptr[v_atual + 1]):
+            vizinho = indices[posicao]
+            if vizinho in fixadas:
+                continue
+            nova_dist = dist_atual + pesos[posicao]
+            if nova_dist < provisorias.get(vizinho, INFINITO):
+                provisorias[vizinho] = nova_dist
+                predecessores[vizinho] = v_atual
+                heappush(fila, (nova_dist, vizinho))
+
+    return fixadas, predecessores
+
+
+def _caminho_indices(predecessores: Dict[int, int], destino: int) -> List[int]:
+    """
+    Reconstrói, em índices, o caminho que termina em ``destino``.
+    """
+    caminho = [destino]
+    while caminho[-1] in predecessores:
+        caminho.append(predecessores[caminho[-1]])
+    caminho.reverse()
+    return caminho
 
 
-def dijkstra(grafo: Grafo, origem: Any) -> Tuple[Dict[Any, float], Dict[Any, Any]]:
+def dijkstra(grafo: Grafo, origem: Any,
+             destino: Optional[Any] = None) -> Tuple[Dict[Any, float], Dict[Any, Any]]:
     """
     Implementa o algoritmo de Dijkstra para encontrar caminhos mínimos.
-    
+
+    Sem destino, calcula as distâncias da origem a todos os vértices. Com
+    destino, a busca termina assim que o destino é fixado e as distâncias
+    retornadas são apenas as dos vértices fixados até então.
+
     Args:
         grafo: Grafo para executar o algoritmo.
         origem: Vértice de origem.
-        
+        destino: Vértice em que a busca pode terminar (opcional).
+
     Returns:
         Tuple[Dict[Any, float], Dict[Any, Any]]: Tupla contendo as distâncias e os predecessores.
+
+    Raises:
+        ValueError: Se um vértice não existir ou se houver pesos negativos.
     """
-    # Inicializa as distâncias com infinito
-    distancias = {v: float('inf') for v in grafo.obter_vertices()}
-    distancias[origem] = 0
-    
-    # Inicializa os predecessores
-    predecessores = {}
-    
-    # Inicializa a fila de prioridade
-    fila = [(0, origem)]
-    
-    # Conjunto de vértices visitados
-    visitados = set()
-    
-    while fila:
-        # Obtém o vértice com menor distância
-        dist_atual, v_atual = heapq.heappop(fila)
-        
-        # Se o vértice já foi visitado, ignora
-        if v_atual in visitados:
+    csr = grafo.obter_csr()
+    _validar_pesos(csr)
+    ids = csr.lista_ids()
+    indice_origem = csr.indice(origem)
+    indice_destino = csr.indice(destino) if destino is not None else None
+
+    fixadas, predecessores = _buscar(csr, [(indice_origem, 0.0)], alvo=indice_destino)
+
+    if destino is None:
+        # Todos os vértices, com infinito para os inalcançáveis
+        distancias = {v: INFINITO for v in ids}
+        distancias.update((ids[i], d) for i, d in fixadas.items())
+    else:
+        distancias = {ids[i]: d for i, d in fixadas.items()}
+    return distancias, {ids[v]: ids[u] for v, u in predecessores.items() if v in fixadas}
+
+
+def dijkstra_multiplas_origens(grafo: Grafo, origens: Any,
+                               raio: Optional[float] = None) -> Tuple[Dict[Any, float], Dict[Any, Any]]:
+    """
+    Calcula a distância de cada vértice à origem mais próxima.
+
+    Equivale a um Dijkstra a partir de um vértice virtual ligado a todas as
+    origens; com um dicionário, cada origem parte da distância indicada.
+
+    Args:
+        grafo: Grafo para executar o algoritmo.
+        origens: Vértices de origem, ou dicionário de origem para distância inicial.
+        raio: Distância máxima dos vértices retornados (opcional).
+
+    Returns:
+        Tuple[Dict[Any, float], Dict[Any, Any]]: Distâncias dos vértices
+        alcançados e a origem mais próxima de cada um.
+
+    Raises:
+        ValueError: Se não houver origens, se uma origem não existir ou se houver pesos negativos.
+    """
+    csr = grafo.obter_csr()
+    _validar_pesos(csr)
+    ids = csr.lista_ids()
+    iniciais = origens if isinstance(origens, dict) else {v: 0.0 for v in origens}
+    if not iniciais:
+        raise ValueError("É necessário informar ao menos uma origem.")
+
+    fixadas, predecessores = _buscar(csr, [(csr.indice(v), float(d)) for v, d in iniciais.items()], raio=raio)
+
+    # Origem mais próxima, propagada na ordem em que os vértices foram fixados
+    fontes: Dict[int, int] = {}
+    for v in fixadas:
+        fontes[v] = fontes[predecessores[v]] if v in predecessores else v
+    return {ids[v]: d for v, d in fixadas.items()}, {ids[v]: ids[f] for v, f in fontes.items()}
+
+
+def k_mais_proximos(grafo: Grafo, origem: Any, k: int) -> List[Tuple[Any, float]]:
+    """
+    Obtém os k vértices mais próximos da origem (incluindo a própria origem).
+
+    A busca termina ao fixar o k-ésimo vértice, sem percorrer o restante do grafo.
+
+    Args:
+        grafo: Grafo para executar o algoritmo.
+        origem: Vértice de origem.
+        k: Número de vértices.
+
+    Returns:
+        List[Tuple[Any, float]]: Pares (vértice, distância) em ordem crescente de distância.
+
+    Raises:
+        ValueError: Se k não for positivo, se a origem não existir ou se houver pesos negativos.
+    """
+    if k < 1:
+        raise ValueError("O número de vértices deve ser positivo.")
+    csr = grafo.obter_csr()
+    _validar_pesos(csr)
+    ids = csr.lista_ids()
+    fixadas, _ = _buscar(csr, [(csr.indice(origem), 0.0)], limite_vertices=k)
+    return [(ids[v], d) for v, d in fixadas.items()]
+
+
+def dijkstra_bidirecional(grafo: Grafo, origem: Any, destino: Any) -> Tuple[float, List[Any]]:
+    """
+    Calcula o caminho mínimo entre dois vértices com buscas a partir das duas pontas.
+
+    Uma busca parte da origem pelas arestas e outra parte do destino pelas
+    arestas invertidas, expandindo sempre a de menor distância na fila. A
+    busca termina quando a soma dos topos das duas filas atinge o melhor
+    caminho já encontrado; cada busca percorre aproximadamente uma bola de
+    metade do raio, em vez de uma bola do raio inteiro.
+
+    Args:
+        grafo: Grafo para executar o algoritmo.
+        origem: Vértice de origem.
+        destino: Vértice de destino.
+
+    Returns:
+        Tuple[float, List[Any]]: Custo do caminho e a sequência de vértices,
+        ou (inf, []) se o destino for inalcançável.
+
+    Raises:
+        ValueError: Se um vértice não existir ou se houver pesos negativos.
+    """
+    csr = grafo.obter_csr()
+    _validar_pesos(csr)
+    ids = csr.lista_ids()
+    s, t = csr.indice(origem), csr.indice(destino)
+    if s == t:
+        return 0.0, [origem]
+
+    # Índice 0: busca a partir da origem; índice 1: a partir do destino
+    adjacencias = (csr.listas(), csr.transposta().listas())
+    provisorias: Tuple[Dict[int, float], Dict[int, float]] = ({s: 0.0}, {t: 0.0})
+    fixadas: Tuple[Dict[int, float], Dict[int, float]] = ({}, {})
+    predecessores: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+    filas = ([(0.0, s)], [(0.0, t)])
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    melhor, encontro = INFINITO, None
+    while filas[0] and filas[1]:
+        # Nenhum caminho ainda não examinado pode ser menor que o melhor
+        if filas[0][0][0] + filas[1][0][0] >= melhor:
+            break
+        lado = 0 if filas[0][0][0] <= filas[1][0][0] else 1
+        fila, fixadas_lado = filas[lado], fixadas[lado]
+        dist_atual, v_atual = heappop(fila)
+        if v_atual in fixadas_lado:
             continue
-        
-        # Marca o vértice como visitado
-        visitados.add(v_atual)
-        
-        # Para cada vizinho do vértice atual
-        for vizinho in grafo.obter_vizinhos(v_atual):
-            # Se o vizinho já foi visitado, ignora
-            if vizinho in visitados:
+        fixadas_lado[v_atual] = dist_atual
+
+        indptr, indices, pesos = adjacencias[lado]
+        distancias, opostas, anteriores = provisorias[lado], provisorias[1 - lado], predecessores[lado]
+        for posicao in range(indptr[v_atual], indptr[v_atual + 1]):
+            vizinho = indices[posicao]
+            if vizinho in fixadas_lado:
                 continue
-            
-            # Obtém o peso da aresta
-            peso = 1.0
-            if hasattr(grafo, 'obter_peso_aresta'):
-                peso = grafo.obter_peso_aresta(v_atual, vizinho)
-            
-            # Calcula a nova distância
-            nova_dist = dist_atual + peso
-            
-            # Se a nova distância for menor que a distância atual, atualiza
-            if nova_dist < distancias[vizinho]:
+            nova_dist = dist_atual + pesos[posicao]
+            if nova_dist < distancias.get(vizinho, INFINITO):
                 distancias[vizinho] = nova_dist
-                predecessores[vizinho] = v_atual
-                heapq.heappush(fila, (nova_dist, vizinho))
-    
-    return distancias, predecessores
+                anteriores[vizinho] = v_atual
+                heappush(fila, (nova_dist, vizinho))
+
+            # Caminho que passa pela aresta e segue pela outra busca
+            oposta = opostas.get(vizinho)
+            if oposta is not None and nova_dist + oposta < melhor:
+                melhor, encontro = nova_dist + oposta, vizinho
+
+    if encontro is None:
+        return INFINITO, []
+
+    # Origem -> encontro pelos predecessores da ida, encontro -> destino pelos da volta
+    caminho = _caminho_indices(predecessores[0], encontro)
+    v = encontro
+    while v in predecessores[1]:
+        v = predecessores[1][v]
+        caminho.append(v)
+    return melhor, [ids[i] for i in caminho]
+
+
+def reconstruir_caminho(predecessores: Dict[Any, Any], origem: Any, destino: Any) -> List[Any]:
+    """
+    Reconstrói o caminho da origem ao destino a partir dos predecessores.
+
+    Args:
+        predecessores: Predecessores retornados por ``dijkstra``.
+        origem: Vértice de origem.
+        destino: Vértice de destino.
+
+    Returns:
+        List[Any]: Sequência de vértices, ou lista vazia se o destino for inalcançável.
+    """
+    caminho = [destino]
+    while caminho[-1] != origem:
+        if caminho[-1] not in predecessores:
+            return []
+        caminho.append(predecessores[caminho[-1]])
+    caminho.reverse()
+    return caminho
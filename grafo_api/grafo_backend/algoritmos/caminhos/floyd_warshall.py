@@ -5,87 +5,201 @@ O algoritmo de Floyd-Warshall encontra os caminhos mais curtos entre todos os pa
 em um grafo ponderado, permitindo arestas com pesos negativos desde que não haja ciclos negativos.
 """
 
-from typing import Dict, List, Any, Tuple, Optional
+from collections.abc import Mapping
+from typing import Iterator, List, Any, Tuple, Optional
 import numpy as np
-import networkx as nx
 from ...core.grafo import Grafo
+from .oraculo import obter_oraculo
 
 
-def floyd_warshall(grafo: Grafo) -> Tuple[Dict[Tuple[Any, Any], float], Dict[Tuple[Any, Any], Any]]:
+# Número de linhas processadas juntas em cada passo do algoritmo em blocos
+TAMANHO_BLOCO = 64
+
+
+class ResultadoFloydWarshall(Mapping):
+    """
+    Distâncias e próximos vértices entre todos os pares de vértices.
+
+    Guarda uma matriz de distâncias (float64) e uma de próximos vértices
+    (int32, -1 quando não há caminho), indexadas pela ordem de ``vertices``.
+    As consultas são O(1) e os caminhos são reconstruídos sob demanda. Também
+    funciona como um mapeamento somente leitura de pares (origem, destino)
+    para distâncias, sem materializar os n² pares.
+    """
+
+    def __init__(self, vertices: List[Any], distancias: np.ndarray, proximos: np.ndarray):
+        """
+        Inicializa o resultado.
+
+        Args:
+            vertices: Vértices, na ordem das linhas e colunas das matrizes.
+            distancias: Matriz n x n de distâncias mínimas.
+            proximos: Matriz n x n com o índice do próximo vértice de cada caminho.
+        """
+        self.vertices = vertices
+        self.distancias = distancias
+        self.proximos = proximos
+        self._indices = {v: i for i, v in enumerate(vertices)}
+
+        # As matrizes são compartilhadas pelo cache do grafo
+        self.distancias.flags.writeable = False
+        self.proximos.flags.writeable = False
+
+    def indice(self, vertice: Any) -> int:
+        """
+        Obtém a linha (e coluna) de um vértice nas matrizes.
+
+        Raises:
+            ValueError: Se o vértice não existir no grafo.
+        """
+        try:
+            return self._indices[vertice]
+        except (KeyError, TypeError):
+            raise ValueError(f"Vértice '{vertice}' não existe no grafo.")
+
+    def distancia(self, origem: Any, destino: Any) -> float:
+        """
+        Obtém a distância mínima entre dois vértices (infinito se não houver caminho).
+        """
+        return float(self.distancias[self.indice(origem), self.indice(destino)])
+
+    def proximo(self, origem: Any, destino: Any) -> Optional[Any]:
+        """
+        Obtém o vértice que segue a origem no caminho mínimo até o destino, ou None.
+        """
+        proximo = int(self.proximos[self.indice(origem), self.indice(destino)])
+        return self.vertices[proximo] if proximo >= 0 else None
+
+    def caminho(self, origem: Any, destino: Any) -> List[Any]:
+        """
+        Reconstrói o caminho mínimo entre dois vértices.
+
+        Args:
+            origem: Vértice de origem.
+            destino: Vértice de destino.
+
+        Returns:
+            List[Any]: Lista de vértices que formam o caminho mínimo.
+
+        Raises:
+            ValueError: Se algum vértice não existir ou se não existir caminho.
+        """
+        i, j = self.indice(origem), self.indice(destino)
+        if self.proximos[i, j] < 0:
+            raise ValueError(f"Não existe caminho de '{origem}' para '{destino}'.")
+        caminho = [i]
+        while i != j:
+            i = int(self.proximos[i, j])
+            caminho.append(i)
+        return [self.vertices[k] for k in caminho]
+
+    def excentricidades(self) -> np.ndarray:
+        """
+        Obtém a maior distância de cada vértice aos demais, na ordem de ``vertices``.
+        """
+        if len(self.vertices) == 0:
+            return np.zeros(0)
+        return self.distancias.max(axis=1)
+
+    def __getitem__(self, par: Tuple[Any, Any]) -> float:
+        try:
+            origem, destino = par
+            return float(self.distancias[self._indices[origem], self._indices[destino]])
+        except (KeyError, TypeError, ValueError):
+            raise KeyError(par)
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        return ((u, v) for u in self.vertices for v in self.vertices)
+
+    def __len__(self) -> int:
+        return len(self.vertices) ** 2
+
+
+def _executar_floyd_warshall(grafo: Grafo) -> ResultadoFloydWarshall:
+    """
+    Executa o Floyd-Warshall vetorizado em blocos de linhas.
+
+    Para cada bloco de vértices intermediários k, primeiro as linhas do
+    próprio bloco são relaxadas e depois cada bloco de TAMANHO_BLOCO linhas,
+    de modo que as linhas k do bloco permaneçam em cache enquanto são usadas.
+    Cada relaxação é uma operação vetorizada sobre o bloco inteiro:
+    ``D[I, :] = minimum(D[I, :], D[I, k] + D[k, :])``.
+
+    Raises:
+        ValueError: Se o grafo contiver ciclo de peso negativo.
+    """
+    csr = grafo.obter_csr()
+    n = csr.numero_vertices()
+
+    # Distâncias e próximos iniciais a partir das arestas
+    dist = np.full((n, n), np.inf)
+    prox = np.full((n, n), -1, dtype=np.int32)
+    origens = np.repeat(np.arange(n), np.diff(csr.indptr))
+    dist[origens, csr.indices] = csr.pesos
+    prox[origens, csr.indices] = csr.indices
+    diagonal = np.arange(n)
+    dist[diagonal, diagonal] = np.minimum(dist[diagonal, diagonal], 0.0)
+    prox[diagonal, diagonal] = diagonal
+
+    blocos = [(inicio, min(inicio + TAMANHO_BLOCO, n)) for inicio in range(0, n, TAMANHO_BLOCO)]
+    candidatos = np.empty((min(TAMANHO_BLOCO, n), n))
+    melhora = np.empty((min(TAMANHO_BLOCO, n), n), dtype=bool)
+
+    def relaxar(inicio: int, fim: int, k: int) -> None:
+        # Relaxa as linhas [inicio, fim) pelo vértice intermediário k
+        coluna = dist[inicio:fim, k]
+        if not np.isfinite(coluna).any():
+            return
+        linhas, cand, mel = dist[inicio:fim], candidatos[:fim - inicio], melhora[:fim - inicio]
+        np.add(coluna[:, None], dist[k], out=cand)
+        np.less(cand, linhas, out=mel)
+        np.copyto(prox[inicio:fim], prox[inicio:fim, k][:, None], where=mel)
+        np.minimum(linhas, cand, out=linhas)
+
+    for inicio_k, fim_k in blocos:
+        # Linhas do próprio bloco, que serão usadas pelos demais
+        for k in range(inicio_k, fim_k):
+            relaxar(inicio_k, fim_k, k)
+
+        # Demais blocos de linhas
+        for inicio, fim in blocos:
+            if inicio != inicio_k:
+                for k in range(inicio_k, fim_k):
+                    relaxar(inicio, fim, k)
+
+        # Um ciclo negativo já alcançado não desaparece
+        if (dist[diagonal, diagonal] < 0).any():
+            raise ValueError("O grafo contém ciclo de peso negativo.")
+
+    return ResultadoFloydWarshall(csr.lista_ids(), dist, prox)
+
+
+def floyd_warshall(grafo: Grafo) -> ResultadoFloydWarshall:
     """
     Implementa o algoritmo de Floyd-Warshall para encontrar caminhos mínimos entre todos os pares de vértices.
     
+    O resultado é calculado uma vez por versão do grafo e compartilhado pelas
+    demais funções deste módulo.
+    
     Args:
         grafo: Grafo ponderado.
         
     Returns:
-        Tuple[Dict[Tuple[Any, Any], float], Dict[Tuple[Any, Any], Any]]: Tupla contendo:
-            - Dicionário mapeando pares de vértices (origem, destino) para distâncias mínimas
-            - Dicionário mapeando pares de vértices (origem, destino) para o próximo vértice no caminho
+        ResultadoFloydWarshall: Distâncias e próximos vértices, com ``distancia(u, v)``
+        e ``caminho(u, v)``.
             
     Raises:
         ValueError: Se o grafo contiver ciclo de peso negativo.
     """
-    # Obtém o grafo NetworkX subjacente
-    g_nx = grafo.obter_grafo_networkx()
-    
-    # Obtém a lista de vértices
-    vertices = list(grafo.obter_vertices())
-    n = len(vertices)
-    
-    # Cria um mapeamento de vértices para índices
-    indice_vertice = {vertice: i for i, vertice in enumerate(vertices)}
-    
-    # Inicializa a matriz de distâncias
-    dist = np.full((n, n), float('infinity'))
-    
-    # Inicializa a matriz de próximos vértices
-    prox = np.full((n, n), None, dtype=object)
-    
-    # Inicializa as diagonais com zeros
-    for i in range(n):
-        dist[i, i] = 0
-    
-    # Inicializa com as arestas existentes
-    for u, v, attrs in g_nx.edges(data=True):
-        peso = attrs.get('weight', 1.0)
-        i, j = indice_vertice[u], indice_vertice[v]
-        dist[i, j] = peso
-        prox[i, j] = v
-    
-    # Algoritmo de Floyd-Warshall
-    for k in range(n):
-        for i in range(n):
-            for j in range(n):
-                if dist[i, k] != float('infinity') and dist[k, j] != float('infinity'):
-                    if dist[i, j] > dist[i, k] + dist[k, j]:
-                        dist[i, j] = dist[i, k] + dist[k, j]
-                        prox[i, j] = prox[i, k]
-    
-    # Verifica se há ciclos de peso negativo
-    for i in range(n):
-        if dist[i, i] < 0:
-            raise ValueError("O grafo contém ciclo de peso negativo.")
-    
-    # Converte as matrizes para dicionários
-    distancias = {}
-    proximos = {}
-    
-    for i in range(n):
-        for j in range(n):
-            u, v = vertices[i], vertices[j]
-            distancias[(u, v)] = dist[i, j]
-            proximos[(u, v)] = prox[i, j]
-    
-    return distancias, proximos
+    return grafo.obter_derivado("floyd_warshall", lambda: _executar_floyd_warshall(grafo))
 
 
-def reconstruir_caminho(proximos: Dict[Tuple[Any, Any], Any], origem: Any, destino: Any) -> List[Any]:
+def reconstruir_caminho(resultado: ResultadoFloydWarshall, origem: Any, destino: Any) -> List[Any]:
     """
-    Reconstrói o caminho mínimo a partir do dicionário de próximos vértices.
+    Reconstrói o caminho mínimo a partir do resultado do Floyd-Warshall.
     
     Args:
-        proximos: Dicionário de próximos vértices.
+        resultado: Resultado de ``floyd_warshall``.
         origem: Vértice de origem.
         destino: Vértice de destino.
         
@@ -95,15 +209,7 @@ def reconstruir_caminho(proximos: Dict[Tuple[Any, Any], Any], origem: Any, desti
     Raises:
         ValueError: Se não existir caminho entre origem e destino.
     """
-    if proximos[(origem, destino)] is None:
-        raise ValueError(f"Não existe caminho de '{origem}' para '{destino}'.")
-    
-    caminho = [origem]
-    while origem != destino:
-        origem = proximos[(origem, destino)]
-        caminho.append(origem)
-    
-    return caminho
+    return resultado.caminho(origem, destino)
 
 
 def caminho_minimo(grafo: Grafo, origem: Any, destino: Any) -> Tuple[List[Any], float]:
@@ -132,23 +238,29 @@ def caminho_minimo(grafo: Grafo, origem: Any, destino: Any) -> Tuple[List[Any],
         raise ValueError(f"Vértice de destino '{destino}' não existe no grafo.")
     
     # Executa o algoritmo de Floyd-Warshall
-    distancias, proximos = floyd_warshall(grafo)
-    
-    # Verifica se existe caminho para o destino
-    if distancias[(origem, destino)] == float('infinity'):
-        raise ValueError(f"Não existe caminho de '{origem}' para '{destino}'.")
+    resultado = floyd_warshall(grafo)
     
     # Reconstrói o caminho
-    caminho = reconstruir_caminho(proximos, origem, destino)
+    caminho = resultado.caminho(origem, destino)
     
-    return caminho, distancias[(origem, destino)]
+    return caminho, resultado.distancia(origem, destino)
+
+
+def _tem_pesos_negativos(grafo: Grafo) -> bool:
+    """
+    Verifica se alguma aresta do grafo tem peso negativo.
+    """
+    pesos = grafo.obter_csr().pesos
+    return bool(len(pesos)) and float(pesos.min()) < 0
 
 
 def calcular_diametro(grafo: Grafo) -> Tuple[float, Tuple[Any, Any]]:
     """
-    Calcula o diâmetro do grafo usando o algoritmo de Floyd-Warshall.
+    Calcula o diâmetro do grafo.
     
-    O diâmetro é a maior distância entre quaisquer dois vértices do grafo.
+    O diâmetro é a maior distância entre quaisquer dois vértices do grafo. É
+    obtido pelo oráculo de distâncias, com poucas buscas a partir de vértices
+    escolhidos; com pesos negativos, usa a execução do Floyd-Warshall.
     
     Args:
         grafo: Grafo ponderado.
@@ -162,31 +274,33 @@ def calcular_diametro(grafo: Grafo) -> Tuple[float, Tuple[Any, Any]]:
         ValueError: Se o grafo não for conexo.
         ValueError: Se o grafo contiver ciclo de peso negativo.
     """
-    # Executa o algoritmo de Floyd-Warshall
-    distancias, _ = floyd_warshall(grafo)
+    n = grafo.numero_vertices()
+    if n <= 1:
+        return 0, None
     
-    # Inicializa o diâmetro
-    diametro = 0
-    par_diametro = None
+    if not _tem_pesos_negativos(grafo):
+        oraculo = obter_oraculo(grafo)
+        if not np.isfinite(oraculo.diametro()):
+            raise ValueError("O grafo não é conexo.")
+        par = oraculo.par_diametral()
+        return oraculo.distancia(*par), par
     
-    # Encontra a maior distância finita
-    for (u, v), dist in distancias.items():
-        if u != v and dist != float('infinity') and dist > diametro:
-            diametro = dist
-            par_diametro = (u, v)
-    
-    # Verifica se o grafo é conexo
-    if diametro == 0 and len(grafo.obter_vertices()) > 1:
+    # Executa o algoritmo de Floyd-Warshall
+    resultado = floyd_warshall(grafo)
+    if not np.isfinite(resultado.distancias).all():
         raise ValueError("O grafo não é conexo.")
-    
-    return diametro, par_diametro
+    posicao = int(np.argmax(resultado.distancias))
+    i, j = divmod(posicao, n)
+    return float(resultado.distancias[i, j]), (resultado.vertices[i], resultado.vertices[j])
 
 
 def calcular_centro(grafo: Grafo) -> List[Any]:
     """
-    Calcula o centro do grafo usando o algoritmo de Floyd-Warshall.
+    Calcula o centro do grafo.
     
-    O centro é o conjunto de vértices cuja maior distância a qualquer outro vértice é mínima.
+    O centro é o conjunto de vértices cuja maior distância a qualquer outro
+    vértice é mínima. É obtido pelo oráculo de distâncias; com pesos
+    negativos, usa a execução do Floyd-Warshall.
     
     Args:
         grafo: Grafo ponderado.
@@ -198,31 +312,28 @@ def calcular_centro(grafo: Grafo) -> List[Any]:
         ValueError: Se o grafo não for conexo.
         ValueError: Se o grafo contiver ciclo de peso negativo.
     """
-    # Executa o algoritmo de Floyd-Warshall
-    distancias, _ = floyd_warshall(grafo)
-    
-    # Calcula a excentricidade de cada vértice
-    excentricidades = {}
-    for vertice in grafo.obter_vertices():
-        # A excentricidade é a maior distância do vértice a qualquer outro
-        excentricidade = 0
-        for outro in grafo.obter_vertices():
-            if vertice != outro:
-                dist = distancias[(vertice, outro)]
-                if dist == float('infinity'):
-                    # Se há um vértice inalcançável, o grafo não é conexo
-                    raise ValueError("O grafo não é conexo.")
-                excentricidade = max(excentricidade, dist)
-        excentricidades[vertice] = excentricidade
-    
-    # Encontra a menor excentricidade
-    min_excentricidade = min(excentricidades.values())
+    if grafo.numero_vertices() == 0:
+        raise ValueError("O grafo não possui vértices.")
+    
+    if not _tem_pesos_negativos(grafo):
+        oraculo = obter_oraculo(grafo)
+        if not np.isfinite(oraculo.diametro()):
+            # Se há um vértice inalcançável, o grafo não é conexo
+            raise ValueError("O grafo não é conexo.")
+        return oraculo.centro()
+    
+    # A excentricidade é a maior distância do vértice a qualquer outro
+    resultado = floyd_warshall(grafo)
+    excentricidades = resultado.excentricidades()
+    if not np.isfinite(excentricidades).all():
+        raise ValueError("O grafo não é conexo.")
     
     # Retorna os vértices com a menor excentricidade
-    return [v for v, e in excentricidades.items() if e == min_excentricidade]
+    minimos = np.flatnonzero(excentricidades == excentricidades.min())
+    return [resultado.vertices[i] for i in minimos]
 
 
-def calcular_matriz_distancias(grafo: Grafo) -> Dict[Tuple[Any, Any], float]:
+def calcular_matriz_distancias(grafo: Grafo) -> ResultadoFloydWarshall:
     """
     Calcula a matriz de distâncias entre todos os pares de vértices.
     
@@ -230,15 +341,14 @@ def calcular_matriz_distancias(grafo: Grafo) -> Dict[Tuple[Any, Any], float]:
         grafo: Grafo ponderado.
         
     Returns:
-        Dict[Tuple[Any, Any], float]: Dicionário mapeando pares de vértices para suas distâncias mínimas.
+        ResultadoFloydWarshall: Mapeamento de pares de vértices para suas
+        distâncias mínimas (a matriz fica em ``distancias``).
             
     Raises:
         ValueError: Se o grafo contiver ciclo de peso negativo.
     """
     # Executa o algoritmo de Floyd-Warshall
-    distancias, _ = floyd_warshall(grafo)
-    
-    return distancias
+    return floyd_warshall(grafo)
 
 
 def detectar_ciclo_negativo(grafo: Grafo) -> Optional[List[Any]]:
@@ -0,0 +1,403 @@
+"""
+Hierarquia de contração para consultas rápidas de caminho mínimo entre dois vértices.
+
+No pré-processamento, os vértices são contraídos um a um, do menos ao mais
+importante. Contrair v remove-o do grafo restante e, para cada par de
+vizinhos (u, w) cujo único caminho mínimo passa por v, adiciona um atalho
+u -> w com o peso d(u, v) + d(v, w). A importância é a diferença de arestas
+(atalhos criados menos arestas removidas) somada ao número de vizinhos já
+contraídos, atualizada de forma preguiçosa: o vértice retirado da fila só é
+contraído se sua prioridade recalculada ainda for a menor.
+
+Uma consulta é um Dijkstra bidirecional que só sobe na hierarquia: a busca
+a partir da origem usa as arestas para vértices contraídos depois, e a busca
+a partir do destino, as arestas invertidas vindas deles. Cada busca fixa
+apenas algumas centenas de vértices, mesmo em grafos de estradas grandes.
+
+A hierarquia é mantida por versão do grafo (``obter_hierarquia``) e pode ser
+gravada em disco junto ao hash de conteúdo do grafo, para ser reaproveitada
+por outros processos ou após reinícios.
+"""
+
+import hashlib
+import heapq
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from grafo_backend.core.grafo import Grafo
+from grafo_backend.core.csr import GrafoCSR
+
+
+INFINITO = float('inf')
+
+# Vértices fixados por cada busca de testemunha durante a contração
+LIMITE_TESTEMUNHA = 60
+
+# Versão do formato dos arquivos gravados por ``HierarquiaContracao.salvar``
+VERSAO_FORMATO = 1
+
+
+def _assinatura(grafo: Grafo, csr: GrafoCSR) -> str:
+    """
+    Identifica o conteúdo do grafo e a ordem dos índices dos vértices.
+    """
+    conteudo = f"{grafo.obter_hash()}:{csr.lista_ids()!r}".encode("utf-8")
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+def _buscar_testemunhas(saida: List[Dict[int, float]], origem: int, ignorado: int,
+                        alvos: Dict[int, float], limite: float) -> Dict[int, float]:
+    """
+    Dijkstra limitado a partir de ``origem`` no grafo restante, sem passar por ``ignorado``.
+
+    A busca termina ao fixar todos os alvos, ao ultrapassar ``limite`` ou ao
+    fixar LIMITE_TESTEMUNHA vértices; as distâncias retornadas são limites
+    superiores das reais.
+    """
+    heappush, heappop = heapq.heappush, heapq.heappop
+    provisorias = {origem: 0.0}
+    fila = [(0.0, origem)]
+    restantes = len(alvos)
+    fixados = 0
+    while fila:
+        dist_atual, v_atual = heappop(fila)
+        if dist_atual > provisorias[v_atual]:
+            continue
+        if dist_atual > limite:
+            break
+        if v_atual in alvos:
+            restantes -= 1
+            if restantes == 0:
+                break
+        fixados += 1
+        if fixados > LIMITE_TESTEMUNHA:
+            break
+        for vizinho, peso in saida[v_atual].items():
+            if vizinho == ignorado:
+                continue
+            nova_dist = dist_atual + peso
+            if nova_dist < provisorias.get(vizinho, INFINITO):
+                provisorias[vizinho] = nova_dist
+                heappush(fila, (nova_dist, vizinho))
+    return provisorias
+
+
+def _atalhos(saida: List[Dict[int, float]], entrada: List[Dict[int, float]],
+             vertice: int) -> List[Tuple[int, int, float]]:
+    """
+    Calcula os atalhos necessários para contrair um vértice no grafo restante.
+    """
+    atalhos = []
+    sucessores = saida[vertice]
+    if not sucessores:
+        return atalhos
+    maior_saida = max(sucessores.values())
+    for u, peso_entrada in entrada[vertice].items():
+        testemunhas = _buscar_testemunhas(saida, u, vertice, sucessores, peso_entrada + maior_saida)
+        for w, peso_saida in sucessores.items():
+            if w == u:
+                continue
+            peso = peso_entrada + peso_saida
+            if testemunhas.get(w, INFINITO) > peso:
+                atalhos.append((u, w, peso))
+    return atalhos
+
+
+def _empacotar(listas: List[List[Tuple[int, float, int]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converte listas de arestas (vizinho, peso, meio) por vértice em arrays CSR.
+    """
+    indptr = np.zeros(len(listas) + 1, dtype=np.int64)
+    np.cumsum([len(lista) for lista in listas], out=indptr[1:])
+    arestas = [aresta for lista in listas for aresta in lista]
+    indices = np.array([a[0] for a in arestas], dtype=np.int64)
+    pesos = np.array([a[1] for a in arestas], dtype=np.float64)
+    meios = np.array([a[2] for a in arestas], dtype=np.int64)
+    return indptr, indices, pesos, meios
+
+
+class HierarquiaContracao:
+    """
+    Hierarquia de contração de um grafo com pesos não negativos.
+
+    Os atributos ``subida`` e ``descida`` são os arrays CSR (indptr, indices,
+    pesos, meios) das arestas de cada vértice para os de posição maior na
+    ordem de contração: em ``subida``, as arestas que saem do vértice; em
+    ``descida``, as que chegam a ele (com o vizinho como origem). O meio de
+    um atalho é o vértice contraído que ele substitui (-1 para arestas do grafo).
+    """
+
+    def __init__(self, grafo: Grafo, _arrays: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Constrói a hierarquia, contraindo todos os vértices do grafo.
+
+        Args:
+            grafo: Grafo ponderado (o grafo não deve ser alterado durante a construção).
+
+        Raises:
+            ValueError: Se houver arestas com peso negativo.
+        """
+        csr = grafo.obter_csr()
+        if len(csr.pesos) and float(csr.pesos.min()) < 0:
+            raise ValueError("A hierarquia de contração não suporta arestas com peso negativo.")
+        self.csr = csr
+        self.assinatura = _assinatura(grafo, csr)
+        if _arrays is None:
+            _arrays = self._contrair()
+
+        self.posicoes = _arrays["posicoes"]
+        self.subida = tuple(_arrays[f"subida_{nome}"] for nome in ("indptr", "indices", "pesos", "meios"))
+        self.descida = tuple(_arrays[f"descida_{nome}"] for nome in ("indptr", "indices", "pesos", "meios"))
+        self.numero_atalhos = int(np.count_nonzero(self.subida[3] >= 0) + np.count_nonzero(self.descida[3] >= 0))
+
+        # Listas Python para as consultas e meios dos atalhos para desempacotar os caminhos
+        self._listas = tuple(tuple(array.tolist() for array in arrays[:3]) for arrays in (self.subida, self.descida))
+        self._meios: Dict[Tuple[int, int], int] = {}
+        for (indptr, indices, _, meios), subindo in ((self.subida, True), (self.descida, False)):
+            for v in np.flatnonzero(np.diff(indptr)):
+                for posicao in range(indptr[v], indptr[v + 1]):
+                    if meios[posicao] >= 0:
+                        w = int(indices[posicao])
+                        self._meios[(int(v), w) if subindo else (w, int(v))] = int(meios[posicao])
+
+    def _contrair(self) -> Dict[str, np.ndarray]:
+        """
+        Ordena e contrai os vértices, retornando os arrays da hierarquia.
+        """
+        csr = self.csr
+        n = csr.numero_vertices()
+        indptr, indices, pesos = csr.listas()
+
+        # Grafo restante, com o menor peso entre arestas paralelas e sem laços
+        saida: List[Dict[int, float]] = [{} for _ in range(n)]
+        entrada: List[Dict[int, float]] = [{} for _ in range(n)]
+        meios: Dict[Tuple[int, int], int] = {}
+        for u in range(n):
+            for posicao in range(indptr[u], indptr[u + 1]):
+                w, peso = indices[posicao], pesos[posicao]
+                if w != u and peso < saida[u].get(w, INFINITO):
+                    saida[u][w] = entrada[w][u] = peso
+
+        vizinhos_contraidos = [0] * n
+
+        def prioridade(v: int) -> Tuple[float, List[Tuple[int, int, float]]]:
+            atalhos = _atalhos(saida, entrada, v)
+            diferenca = len(atalhos) - len(saida[v]) - len(entrada[v])
+            return diferenca + vizinhos_contraidos[v], atalhos
+
+        fila = [(prioridade(v)[0], v) for v in range(n)]
+        heapq.heapify(fila)
+        posicoes = np.empty(n, dtype=np.int64)
+        subida: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+        descida: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+        posicao_atual = 0
+        while fila:
+            _, v = heapq.heappop(fila)
+
+            # Atualização preguiçosa: recoloca o vértice se deixou de ser o menos importante
+            valor, atalhos = prioridade(v)
+            if fila and valor > fila[0][0]:
+                heapq.heappush(fila, (valor, v))
+                continue
+
+            posicoes[v] = posicao_atual
+            posicao_atual += 1
+            subida[v] = [(w, peso, meios.get((v, w), -1)) for w, peso in saida[v].items()]
+            descida[v] = [(u, peso, meios.get((u, v), -1)) for u, peso in entrada[v].items()]
+
+            # Remove o vértice do grafo restante e adiciona os atalhos
+            for w in saida[v]:
+                del entrada[w][v]
+                vizinhos_contraidos[w] += 1
+            for u in entrada[v]:
+                del saida[u][v]
+                vizinhos_contraidos[u] += 1
+            saida[v], entrada[v] = {}, {}
+            for u, w, peso in atalhos:
+                if peso < saida[u].get(w, INFINITO):
+                    saida[u][w] = entrada[w][u] = peso
+                    meios[(u, w)] = v
+
+        arrays = {"posicoes": posicoes}
+        for prefixo, listas in (("subida", subida), ("descida", descida)):
+            for nome, array in zip(("indptr", "indices", "pesos", "meios"), _empacotar(listas)):
+                arrays[f"{prefixo}_{nome}"] = array
+        return arrays
+
+    def _desempacotar(self, u: int, w: int, caminho: List[int]) -> None:
+        """
+        Acrescenta ao caminho os vértices da aresta u -> w, expandindo os atalhos (sem incluir u).
+        """
+        pilha = [(u, w)]
+        while pilha:
+            a, b = pilha.pop()
+            meio = self._meios.get((a, b))
+            if meio is None:
+                caminho.append(b)
+            else:
+                pilha.append((meio, b))
+                pilha.append((a, meio))
+
+    def consultar(self, origem: Any, destino: Any) -> Tuple[float, List[Any]]:
+        """
+        Calcula o caminho mínimo entre dois vértices pela busca bidirecional ascendente.
+
+        Args:
+            origem: Vértice de origem.
+            destino: Vértice de destino.
+
+        Returns:
+            Tuple[float, List[Any]]: Custo do caminho e a sequência de vértices,
+            ou (inf, []) se o destino for inalcançável.
+
+        Raises:
+            ValueError: Se algum dos vértices não existir no grafo.
+        """
+        s, t = self.csr.indice(origem), self.csr.indice(destino)
+        if s == t:
+            return 0.0, [origem]
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        # Índice 0: busca a partir da origem; índice 1: a partir do destino
+        distancias: Tuple[Dict[int, float], Dict[int, float]] = ({s: 0.0}, {t: 0.0})
+        predecessores: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+        filas = ([(0.0, s)], [(0.0, t)])
+        melhor, encontro = INFINITO, None
+        lado = 0
+        while filas[0] or filas[1]:
+            # Cada busca termina quando o topo da sua fila atinge o melhor caminho
+            if not filas[lado] or filas[lado][0][0] >= melhor:
+                if not filas[1 - lado] or filas[1 - lado][0][0] >= melhor:
+                    break
+                lado = 1 - lado
+            fila, proprias, opostas = filas[lado], distancias[lado], distancias[1 - lado]
+            dist_atual, v_atual = heappop(fila)
+            if dist_atual > proprias[v_atual]:
+                continue
+
+            oposta = opostas.get(v_atual)
+            if oposta is not None and dist_atual + oposta < melhor:
+                melhor, encontro = dist_atual + oposta, v_atual
+
+            # Stall-on-demand: um vértice mais alto chega a v_atual por caminho menor
+            indptr, indices, pesos = self._listas[1 - lado]
+            parado = False
+            for posicao in range(indptr[v_atual], indptr[v_atual + 1]):
+                anterior = proprias.get(indices[posicao])
+                if anterior is not None and anterior + pesos[posicao] < dist_atual:
+                    parado = True
+                    break
+            if parado:
+                lado = 1 - lado
+                continue
+
+            indptr, indices, pesos = self._listas[lado]
+            anteriores = predecessores[lado]
+            for posicao in range(indptr[v_atual], indptr[v_atual + 1]):
+                vizinho = indices[posicao]
+                nova_dist = dist_atual + pesos[posicao]
+                if nova_dist < proprias.get(vizinho, INFINITO):
+                    proprias[vizinho] = nova_dist
+                    anteriores[vizinho] = v_atual
+                    heappush(fila, (nova_dist, vizinho))
+            lado = 1 - lado
+
+        if encontro is None:
+            return INFINITO, []
+
+        # Vértices do caminho na hierarquia, da origem ao destino
+        ida = [encontro]
+        while ida[-1] in predecessores[0]:
+            ida.append(predecessores[0][ida[-1]])
+        ida.reverse()
+        while ida[-1] in predecessores[1]:
+            ida.append(predecessores[1][ida[-1]])
+
+        caminho = [s]
+        for u, w in zip(ida, ida[1:]):
+            self._desempacotar(u, w, caminho)
+        ids = self.csr.lista_ids()
+        return melhor, [ids[i] for i in caminho]
+
+    def distancia(self, origem: Any, destino: Any) -> float:
+        """
+        Obtém a distância mínima entre dois vértices (infinito se não houver caminho).
+        """
+        return self.consultar(origem, destino)[0]
+
+    def salvar(self, arquivo: str) -> None:
+        """
+        Grava a hierarquia em um arquivo ``.npz``.
+
+        Args:
+            arquivo: Caminho do arquivo.
+        """
+        nomes = ("indptr", "indices", "pesos", "meios")
+        arrays = {"posicoes": self.posicoes}
+        arrays.update((f"subida_{nome}", array) for nome, array in zip(nomes, self.subida))
+        arrays.update((f"descida_{nome}", array) for nome, array in zip(nomes, self.descida))
+
+        # Gravação atômica, para que leitores nunca vejam um arquivo incompleto
+        temporario = f"{arquivo}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporario, "wb") as saida:
+            np.savez(saida, versao=np.array(VERSAO_FORMATO), assinatura=np.array(self.assinatura), **arrays)
+        os.replace(temporario, arquivo)
+
+    @classmethod
+    def carregar(cls, arquivo: str, grafo: Grafo) -> Optional['HierarquiaContracao']:
+        """
+        Carrega uma hierarquia gravada por ``salvar``.
+
+        Args:
+            arquivo: Caminho do arquivo.
+            grafo: Grafo ao qual a hierarquia deve corresponder.
+
+        Returns:
+            Optional[HierarquiaContracao]: Hierarquia carregada, ou None se o
+            arquivo não existir, for inválido ou for de outro grafo.
+        """
+        try:
+            with np.load(arquivo, allow_pickle=False) as dados:
+                if int(dados["versao"]) != VERSAO_FORMATO:
+                    return None
+                if str(dados["assinatura"]) != _assinatura(grafo, grafo.obter_csr()):
+                    return None
+                arrays = {nome: dados[nome] for nome in dados.files if nome not in ("versao", "assinatura")}
+        except (OSError, KeyError, ValueError):
+            return None
+        return cls(grafo, _arrays=arrays)
+
+
+def obter_hierarquia(grafo: Grafo, diretorio: Optional[str] = None) -> HierarquiaContracao:
+    """
+    Obtém a hierarquia de contração do grafo, reconstruída após cada alteração.
+
+    A hierarquia fica no próprio grafo até a próxima alteração. Com um
+    diretório, é também gravada em ``<diretorio>/<hash de conteúdo>.ch.npz``
+    e carregada de lá quando já existir para o mesmo conteúdo.
+
+    Args:
+        grafo: Grafo ponderado.
+        diretorio: Diretório para gravar e reaproveitar as hierarquias (opcional).
+
+    Returns:
+        HierarquiaContracao: Hierarquia da versão atual do grafo.
+
+    Raises:
+        ValueError: Se houver arestas com peso negativo.
+    """
+    def construir() -> HierarquiaContracao:
+        if diretorio is None:
+            return HierarquiaContracao(grafo)
+        arquivo = os.path.join(diretorio, f"{grafo.obter_hash()}.ch.npz")
+        hierarquia = HierarquiaContracao.carregar(arquivo, grafo)
+        if hierarquia is None:
+            hierarquia = HierarquiaContracao(grafo)
+            os.makedirs(diretorio, exist_ok=True)
+            hierarquia.salvar(arquivo)
+        return hierarquia
+
+    return grafo.obter_derivado("hierarquia_contracao", construir)
@@ -0,0 +1,272 @@
+"""
+Implementação do algoritmo de Johnson para caminhos mínimos entre todos os pares de vértices.
+
+O algoritmo calcula potenciais h com uma passada de Bellman-Ford a partir de
+um vértice virtual ligado a todos os vértices com peso zero e repondera as
+arestas como w(u, v) + h(u) - h(v), que não são negativas. Em seguida executa
+um Dijkstra por origem e desfaz a reponderação. Em grafos esparsos o custo é
+O(n·m·log n), contra O(n³) do Floyd-Warshall.
+
+As execuções por origem são distribuídas em lotes por um pool de processos.
+A adjacência reponderada é gravada uma única vez em arquivos ``.npy`` que os
+processos mapeiam em memória, de modo que as páginas são compartilhadas e
+nada além dos índices das origens trafega por tarefa. As linhas de
+distâncias podem ser consumidas como um fluxo (``johnson``) ou gravadas
+diretamente pelos processos em uma matriz mapeada em memória
+(``johnson_matriz``), sem passar pelo processo principal.
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import dijkstra as dijkstra_csgraph
+
+from grafo_backend.core.grafo import Grafo
+from grafo_backend.core.csr import GrafoCSR
+
+
+# Número de origens calculadas por tarefa do pool
+ORIGENS_POR_TAREFA = 64
+
+# Abaixo deste número de vértices o cálculo é feito no próprio processo
+MINIMO_VERTICES_POOL = 2000
+
+# Adjacência reponderada do processo trabalhador
+_adjacencia: Optional["_AdjacenciaReponderada"] = None
+
+
+class _AdjacenciaReponderada:
+    """
+    Adjacência com pesos reponderados e os potenciais usados para desfazer a reponderação.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, pesos: np.ndarray, potenciais: np.ndarray):
+        n = len(indptr) - 1
+        self.matriz = sp.csr_matrix((pesos, indices, indptr), shape=(n, n))
+        self.potenciais = potenciais
+
+    def linhas(self, origens: np.ndarray) -> np.ndarray:
+        """
+        Calcula as distâncias, nos pesos originais, de cada origem a todos os vértices.
+        """
+        distancias = dijkstra_csgraph(self.matriz, directed=True, indices=origens)
+        distancias += self.potenciais[None, :]
+        distancias -= self.potenciais[origens][:, None]
+        return distancias
+
+
+def _iniciar_trabalhador(diretorio: str) -> None:
+    """
+    Carrega, mapeada em memória, a adjacência compartilhada no processo trabalhador.
+    """
+    global _adjacencia
+    arrays = [np.load(os.path.join(diretorio, f"{nome}.npy"), mmap_mode="r")
+              for nome in ("indptr", "indices", "pesos", "potenciais")]
+    _adjacencia = _AdjacenciaReponderada(*arrays)
+
+
+def _calcular_linhas(origens: np.ndarray, adjacencia: Optional[_AdjacenciaReponderada] = None) -> np.ndarray:
+    """
+    Tarefa do pool: distâncias de um lote de origens.
+    """
+    return (adjacencia or _adjacencia).linhas(origens)
+
+
+def _gravar_linhas(origens: np.ndarray, arquivo: str,
+                   adjacencia: Optional[_AdjacenciaReponderada] = None) -> None:
+    """
+    Tarefa do pool: grava as distâncias de um lote de origens na matriz em disco.
+    """
+    matriz = np.load(arquivo, mmap_mode="r+")
+    matriz[origens] = (adjacencia or _adjacencia).linhas(origens)
+    matriz.flush()
+
+
+def calcular_potenciais(csr: GrafoCSR) -> np.ndarray:
+    """
+    Calcula os potenciais de Johnson com um Bellman-Ford vetorizado.
+
+    Os potenciais são as distâncias a partir de um vértice virtual ligado a
+    todos os vértices com peso zero. Cada passada relaxa todas as arestas de
+    uma vez, agrupadas por vértice de destino, e o laço termina assim que uma
+    passada não altera nenhum potencial.
+
+    Args:
+        csr: Representação CSR do grafo.
+
+    Returns:
+        np.ndarray: Potencial de cada vértice (zeros se não houver pesos negativos).
+
+    Raises:
+        ValueError: Se o grafo contiver ciclo de peso negativo.
+    """
+    n = csr.numero_vertices()
+    potenciais = np.zeros(n)
+    if len(csr.pesos) == 0 or float(csr.pesos.min()) >= 0:
+        return potenciais
+
+    # Arestas de entrada de cada vértice, contíguas na transposta
+    transposta = csr.transposta()
+    com_entrada = np.flatnonzero(np.diff(transposta.indptr))
+    inicios = transposta.indptr[com_entrada]
+    for _ in range(n):
+        candidatos = potenciais[transposta.indices] + transposta.pesos
+        melhores = np.minimum(potenciais[com_entrada], np.minimum.reduceat(candidatos, inicios))
+        if not (melhores < potenciais[com_entrada]).any():
+            return potenciais
+        potenciais[com_entrada] = melhores
+
+    raise ValueError("O grafo contém ciclo de peso negativo.")
+
+
+class _ExecucaoJohnson:
+    """
+    Prepara a adjacência reponderada e distribui os lotes de origens.
+    """
+
+    def __init__(self, grafo: Grafo, processos: Optional[int]):
+        self.csr = grafo.obter_csr()
+        self.vertices = self.csr.lista_ids()
+        self.potenciais = calcular_potenciais(self.csr)
+
+        # Pesos reponderados (não negativos, a menos de erro de arredondamento)
+        origens = np.repeat(np.arange(len(self.vertices)), np.diff(self.csr.indptr))
+        self.pesos = np.maximum(
+            self.csr.pesos + self.potenciais[origens] - self.potenciais[self.csr.indices], 0.0)
+
+        if processos is None:
+            processos = os.cpu_count() or 1
+        if processos < 1:
+            raise ValueError("O número de processos deve ser positivo.")
+        self.processos = processos if len(self.vertices) >= MINIMO_VERTICES_POOL else 1
+
+    def lotes(self, origens: Sequence[int]) -> List[np.ndarray]:
+        """
+        Divide os índices das origens em lotes de ORIGENS_POR_TAREFA.
+        """
+        origens = np.asarray(origens, dtype=np.int64)
+        return [origens[i:i + ORIGENS_POR_TAREFA] for i in range(0, len(origens), ORIGENS_POR_TAREFA)]
+
+    def executar(self, tarefa, lotes: List[np.ndarray], *args) -> Iterator[Any]:
+        """
+        Executa uma tarefa por lote, em ordem, com no máximo dois lotes por processo em andamento.
+
+        Args:
+            tarefa: ``_calcular_linhas`` ou ``_gravar_linhas``.
+            lotes: Lotes de índices das origens.
+            *args: Argumentos adicionais da tarefa.
+
+        Yields:
+            Any: Resultado da tarefa de cada lote, na ordem dos lotes.
+        """
+        if self.processos == 1:
+            adjacencia = _AdjacenciaReponderada(self.csr.indptr, self.csr.indices, self.pesos, self.potenciais)
+            for lote in lotes:
+                yield tarefa(lote, *args, adjacencia=adjacencia)
+            return
+
+        # Adjacência compartilhada pelos processos por mapeamento em memória
+        diretorio = tempfile.mkdtemp(prefix="johnson_")
+        try:
+            for nome, array in (("indptr", self.csr.indptr), ("indices", self.csr.indices),
+                                ("pesos", self.pesos), ("potenciais", self.potenciais)):
+                np.save(os.path.join(diretorio, f"{nome}.npy"), np.asarray(array))
+
+            # "spawn" evita copiar, por fork, as threads do processo principal
+            contexto = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=self.processos, mp_context=contexto,
+                                     initializer=_iniciar_trabalhador, initargs=(diretorio,)) as executor:
+                pendentes: "deque[Future]" = deque()
+                proximos = iter(lotes)
+                try:
+                    for lote in proximos:
+                        pendentes.append(executor.submit(tarefa, lote, *args))
+                        if len(pendentes) >= 2 * self.processos:
+                            yield pendentes.popleft().result()
+                    while pendentes:
+                        yield pendentes.popleft().result()
+                finally:
+                    for futuro in pendentes:
+                        futuro.cancel()
+        finally:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+
+def johnson(grafo: Grafo, origens: Optional[Sequence[Any]] = None,
+            processos: Optional[int] = None) -> Iterator[Tuple[Any, np.ndarray]]:
+    """
+    Calcula as distâncias mínimas de cada origem a todos os vértices pelo algoritmo de Johnson.
+
+    Os potenciais são calculados (e os ciclos negativos detectados) na
+    chamada; as linhas são calculadas em lotes pelo pool de processos à
+    medida que o fluxo é consumido, com poucos lotes à frente do consumidor.
+
+    Args:
+        grafo: Grafo ponderado (são aceitos pesos negativos).
+        origens: Vértices de origem (todos, se não informado).
+        processos: Número de processos (padrão: número de CPUs; 1 executa no próprio processo).
+
+    Returns:
+        Iterator[Tuple[Any, np.ndarray]]: Pares (origem, distâncias), com as
+        distâncias na ordem de ``grafo.obter_csr().lista_ids()`` e infinito
+        para os vértices inalcançáveis.
+
+    Raises:
+        ValueError: Se uma origem não existir, se o número de processos for
+            inválido ou se o grafo contiver ciclo de peso negativo.
+    """
+    execucao = _ExecucaoJohnson(grafo, processos)
+    if origens is None:
+        indices = np.arange(len(execucao.vertices))
+    else:
+        indices = np.array([execucao.csr.indice(v) for v in origens], dtype=np.int64)
+
+    def gerar() -> Iterator[Tuple[Any, np.ndarray]]:
+        lotes = execucao.lotes(indices)
+        for lote, linhas in zip(lotes, execucao.executar(_calcular_linhas, lotes)):
+            for indice, linha in zip(lote, linhas):
+                yield execucao.vertices[indice], linha
+
+    return gerar()
+
+
+def johnson_matriz(grafo: Grafo, arquivo: Optional[str] = None,
+                   processos: Optional[int] = None) -> Tuple[List[Any], np.ndarray]:
+    """
+    Calcula a matriz de distâncias entre todos os pares pelo algoritmo de Johnson.
+
+    A matriz é um arquivo ``.npy`` mapeado em memória, preenchido diretamente
+    pelos processos do pool; pode ser reaberta depois com
+    ``np.load(arquivo, mmap_mode="r")``.
+
+    Args:
+        grafo: Grafo ponderado (são aceitos pesos negativos).
+        arquivo: Caminho do arquivo da matriz (padrão: arquivo temporário).
+        processos: Número de processos (padrão: número de CPUs; 1 executa no próprio processo).
+
+    Returns:
+        Tuple[List[Any], np.ndarray]: Vértices, na ordem das linhas e colunas,
+        e a matriz de distâncias (somente leitura).
+
+    Raises:
+        ValueError: Se o número de processos for inválido ou se o grafo
+            contiver ciclo de peso negativo.
+    """
+    execucao = _ExecucaoJohnson(grafo, processos)
+    n = len(execucao.vertices)
+    if arquivo is None:
+        descritor, arquivo = tempfile.mkstemp(prefix="johnson_", suffix=".npy")
+        os.close(descritor)
+
+    matriz = np.lib.format.open_memmap(arquivo, mode="w+", dtype=np.float64, shape=(n, n))
+    del matriz
+    for _ in execucao.executar(_gravar_linhas, execucao.lotes(np.arange(n)), arquivo):
+        pass
+    return execucao.vertices, np.load(arquivo, mmap_mode="r")
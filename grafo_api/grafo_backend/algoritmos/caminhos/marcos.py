@@ -0,0 +1,155 @@
+"""
+Índice de marcos (landmarks) para heurísticas do A* pela técnica ALT.
+
+Um conjunto pequeno de vértices marcos L é escolhido por seleção do mais
+distante: cada novo marco é o vértice mais distante dos marcos já escolhidos.
+As distâncias de cada marco a todos os vértices, d(L, v), e de todos os
+vértices ao marco, d(v, L), são calculadas uma vez. Pela desigualdade
+triangular,
+
+    d(v, t) >= d(L, t) - d(L, v)    e    d(v, t) >= d(v, L) - d(t, L),
+
+e o maior desses limites entre os marcos é uma heurística admissível e
+consistente para o A*, que dispensa coordenadas dos vértices.
+"""
+
+from typing import Any, Callable, List
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import dijkstra as dijkstra_csgraph
+
+from grafo_backend.core.grafo import Grafo
+
+
+# Número padrão de marcos
+QUANTIDADE_MARCOS = 16
+
+# Marcos usados em cada consulta (os de melhor limite entre origem e destino)
+MARCOS_ATIVOS = 4
+
+
+class IndiceMarcos:
+    """
+    Distâncias de e para um conjunto de marcos, usadas como heurística do A*.
+
+    O índice pode ser passado diretamente como ``heuristica`` de ``a_star``:
+    é chamável como h(u, v) com identificadores de vértices e oferece
+    ``potencial`` para a busca sobre índices da representação CSR.
+    """
+
+    def __init__(self, grafo: Grafo, quantidade: int = QUANTIDADE_MARCOS):
+        """
+        Seleciona os marcos e calcula as distâncias.
+
+        Args:
+            grafo: Grafo para o qual o índice é construído.
+            quantidade: Número de marcos (limitado ao número de vértices).
+
+        Raises:
+            ValueError: Se a quantidade não for positiva ou se houver pesos negativos.
+        """
+        if quantidade < 1:
+            raise ValueError("O número de marcos deve ser positivo.")
+        csr = grafo.obter_csr()
+        if len(csr.pesos) and float(csr.pesos.min()) < 0:
+            raise ValueError("O índice de marcos não suporta arestas com peso negativo.")
+
+        self.csr = csr
+        n = csr.numero_vertices()
+        matriz = sp.csr_matrix((np.asarray(csr.pesos, dtype=float), csr.indices, csr.indptr), shape=(n, n))
+        transposta = matriz.T.tocsr() if csr.direcionado else matriz
+
+        # Seleção do mais distante, a partir do vértice mais distante do primeiro
+        marcos: List[int] = []
+        diretas, reversas = [], []
+        if n:
+            inicial = dijkstra_csgraph(matriz, directed=True, indices=0)
+            proximo = int(np.argmax(inicial))
+            minimas = np.full(n, np.inf)
+            for _ in range(min(quantidade, n)):
+                marcos.append(proximo)
+                direta = dijkstra_csgraph(matriz, directed=True, indices=proximo)
+                reversa = dijkstra_csgraph(transposta, directed=True, indices=proximo) if csr.direcionado else direta
+                diretas.append(direta)
+                reversas.append(reversa)
+
+                # Vértices de outros componentes (distância infinita) têm prioridade
+                np.minimum(minimas, direta + reversa, out=minimas)
+                minimas[marcos] = -1
+                proximo = int(np.argmax(minimas))
+
+        self.marcos = marcos
+        self.direta = np.array(diretas).reshape(len(marcos), n)
+        self.reversa = self.direta if not csr.direcionado else np.array(reversas).reshape(len(marcos), n)
+
+    def vertices_marcos(self) -> List[Any]:
+        """
+        Obtém os identificadores dos vértices escolhidos como marcos.
+        """
+        return [self.csr.vertice(i) for i in self.marcos]
+
+    def _limites(self, indice: int, destino: int) -> np.ndarray:
+        """
+        Calcula o limite inferior de d(indice, destino) dado por cada marco.
+        """
+        with np.errstate(invalid="ignore"):
+            limites = np.fmax(self.direta[:, destino] - self.direta[:, indice],
+                              self.reversa[:, indice] - self.reversa[:, destino])
+        return np.nan_to_num(limites, nan=0.0, posinf=np.inf)
+
+    def potencial(self, origem: int, destino: int) -> Callable[[int], float]:
+        """
+        Cria a heurística de uma consulta, sobre índices da representação CSR.
+
+        Usa os MARCOS_ATIVOS marcos com maior limite entre a origem e o destino.
+
+        Args:
+            origem: Índice do vértice de origem.
+            destino: Índice do vértice de destino.
+
+        Returns:
+            Callable[[int], float]: Limite inferior da distância de cada vértice
+            ao destino (infinito se o destino for inalcançável a partir dele).
+        """
+        if not self.marcos:
+            return lambda indice: 0.0
+        ativos = np.argsort(-self._limites(origem, destino), kind="stable")[:MARCOS_ATIVOS]
+        termos = [(self.direta[m], float(self.direta[m, destino]), self.reversa[m], float(self.reversa[m, destino]))
+                  for m in ativos]
+
+        def heuristica(indice: int) -> float:
+            melhor = 0.0
+            for direta, ate_destino, reversa, do_destino in termos:
+                # Diferenças infinito - infinito (nan) não limitam nada
+                limite = ate_destino - float(direta[indice])
+                if limite > melhor:
+                    melhor = limite
+                limite = float(reversa[indice]) - do_destino
+                if limite > melhor:
+                    melhor = limite
+            return melhor
+
+        return heuristica
+
+    def __call__(self, u: Any, v: Any) -> float:
+        """
+        Calcula o limite inferior da distância entre dois vértices, usando todos os marcos.
+        """
+        if not self.marcos:
+            return 0.0
+        return float(self._limites(self.csr.indice(u), self.csr.indice(v)).max(initial=0.0))
+
+
+def obter_indice_marcos(grafo: Grafo, quantidade: int = QUANTIDADE_MARCOS) -> IndiceMarcos:
+    """
+    Obtém o índice de marcos do grafo, mantido até a próxima alteração.
+
+    Args:
+        grafo: Grafo para o qual o índice é construído.
+        quantidade: Número de marcos.
+
+    Returns:
+        IndiceMarcos: Índice de marcos da versão atual do grafo.
+    """
+    return grafo.obter_derivado(f"marcos:{quantidade}", lambda: IndiceMarcos(grafo, quantidade))
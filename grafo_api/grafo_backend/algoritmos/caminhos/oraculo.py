@@ -0,0 +1,256 @@
+"""
+Oráculo de distâncias com linhas calculadas sob demanda e excentricidades por limites.
+
+O oráculo calcula a linha de distâncias de um vértice (uma busca em largura
+ou um Dijkstra) apenas quando ela é pedida e mantém as últimas linhas em um
+cache LRU limitado. Diâmetro, raio, centro e periferia são obtidos pelo
+método de limites de Takes e Kosters: cada linha calculada a partir de um
+vértice v (e a linha reversa, em grafos direcionados) restringe a
+excentricidade e(w) de todos os vértices pela desigualdade triangular,
+
+    max(e(v) - d(v, w), d(w, v)) <= e(w) <= d(w, v) + e(v),
+
+e os vértices cujos limites já decidem a pergunta deixam de ser candidatos.
+Em grafos esparsos reais, poucas buscas bastam mesmo com milhões de vértices.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, List, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import dijkstra as dijkstra_csgraph
+
+from grafo_backend.core.grafo import Grafo
+
+
+# Número padrão de linhas de distâncias mantidas em cache
+CAPACIDADE_LINHAS = 16
+
+
+class OraculoDistancias:
+    """
+    Distâncias e excentricidades de um grafo, calculadas sob demanda.
+
+    Os limites de excentricidade são acumulados entre as consultas, de modo
+    que, por exemplo, o raio calculado depois do diâmetro reaproveita as
+    buscas já feitas.
+    """
+
+    def __init__(self, grafo: Grafo, ponderado: bool = True, capacidade: int = CAPACIDADE_LINHAS):
+        """
+        Inicializa o oráculo.
+
+        Args:
+            grafo: Grafo a ser consultado (não deve ser alterado enquanto o oráculo for usado).
+            ponderado: Se False, as distâncias são em número de arestas.
+            capacidade: Número máximo de linhas de distâncias em cache.
+
+        Raises:
+            ValueError: Se a capacidade não for positiva ou se houver pesos
+                negativos em um oráculo ponderado.
+        """
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser positiva.")
+        csr = grafo.obter_csr()
+        if ponderado and len(csr.pesos) and float(csr.pesos.min()) < 0:
+            raise ValueError("O oráculo de distâncias não suporta arestas com peso negativo.")
+
+        self.csr = csr
+        self.ponderado = ponderado
+        self.capacidade = capacidade
+        self.vertices = csr.lista_ids()
+        n = len(self.vertices)
+        self._matriz = sp.csr_matrix((np.asarray(csr.pesos, dtype=float), csr.indices, csr.indptr), shape=(n, n))
+        self._transposta = self._matriz.T.tocsr() if csr.direcionado else self._matriz
+        self._linhas: "OrderedDict[Tuple[int, bool], np.ndarray]" = OrderedDict()
+        self._trava = threading.RLock()
+        self.buscas = 0
+
+        # Limites das excentricidades e excentricidades já calculadas
+        self._inferior = np.zeros(n)
+        self._superior = np.full(n, np.inf)
+        self._graus = csr.graus()
+        self._pivos: List[int] = []
+
+    def _linha(self, indice: int, reversa: bool = False) -> np.ndarray:
+        """
+        Obtém, do cache ou por uma nova busca, as distâncias a partir de (ou, se reversa, até) um vértice.
+        """
+        chave = (indice, reversa and self.csr.direcionado)
+        with self._trava:
+            if chave in self._linhas:
+                self._linhas.move_to_end(chave)
+                return self._linhas[chave]
+
+            matriz = self._transposta if chave[1] else self._matriz
+            linha = dijkstra_csgraph(matriz, directed=True, indices=indice, unweighted=not self.ponderado)
+            linha.flags.writeable = False
+            self.buscas += 1
+            self._linhas[chave] = linha
+            while len(self._linhas) > self.capacidade:
+                self._linhas.popitem(last=False)
+            return linha
+
+    def distancias(self, vertice: Any) -> np.ndarray:
+        """
+        Obtém as distâncias de um vértice a todos os outros, na ordem de ``vertices``.
+
+        Args:
+            vertice: Vértice de origem.
+
+        Returns:
+            np.ndarray: Distâncias (infinito para os inalcançáveis), somente leitura.
+
+        Raises:
+            ValueError: Se o vértice não existir no grafo.
+        """
+        return self._linha(self.csr.indice(vertice))
+
+    def distancia(self, origem: Any, destino: Any) -> float:
+        """
+        Obtém a distância mínima entre dois vértices (infinito se não houver caminho).
+        """
+        return float(self._linha(self.csr.indice(origem))[self.csr.indice(destino)])
+
+    def excentricidade(self, vertice: Any) -> float:
+        """
+        Obtém a excentricidade de um vértice (a maior distância a partir dele).
+        """
+        indice = self.csr.indice(vertice)
+        if self._inferior[indice] != self._superior[indice]:
+            self._pivotar(indice)
+        return float(self._superior[indice])
+
+    def _pivotar(self, indice: int) -> None:
+        """
+        Calcula a excentricidade de um vértice e atualiza os limites de todos os outros.
+        """
+        direta = self._linha(indice)
+        reversa = self._linha(indice, reversa=True)
+        excentricidade = float(direta.max()) if len(direta) else 0.0
+
+        with np.errstate(invalid="ignore"):
+            # e(w) >= e(v) - d(v, w), quando v alcança w
+            inferior = np.where(np.isfinite(direta), excentricidade - direta, -np.inf)
+            # e(w) >= d(w, v)
+            np.maximum(inferior, reversa, out=inferior)
+            # e(w) <= d(w, v) + e(v)
+            superior = reversa + excentricidade
+
+        with self._trava:
+            np.maximum(self._inferior, inferior, out=self._inferior)
+            np.minimum(self._superior, superior, out=self._superior)
+            self._inferior[indice] = self._superior[indice] = excentricidade
+            self._pivos.append(indice)
+
+    def _refinar(self, diametro: bool = False, raio: bool = False,
+                 periferia: bool = False, centro: bool = False) -> None:
+        """
+        Calcula excentricidades até que os limites decidam as perguntas pedidas.
+
+        Os pivôs alternam entre o candidato de maior limite superior (que
+        pode realizar o diâmetro) e o de menor limite inferior (que pode
+        realizar o raio), com desempate pelo maior grau.
+        """
+        if len(self.vertices) == 0:
+            return
+        procurar_maior = True
+        while True:
+            inferior, superior = self._inferior, self._superior
+            maior_inferior, menor_superior = inferior.max(), superior.min()
+            indefinidos = inferior < superior
+
+            # Vértices cujos limites ainda não decidem as perguntas
+            maiores = np.zeros(len(inferior), dtype=bool)
+            menores = np.zeros(len(inferior), dtype=bool)
+            if diametro:
+                maiores |= superior > maior_inferior
+            if periferia:
+                maiores |= (superior >= maior_inferior) & indefinidos
+            if raio:
+                menores |= inferior < menor_superior
+            if centro:
+                menores |= (inferior <= menor_superior) & indefinidos
+            if not maiores.any() and not menores.any():
+                return
+
+            # Próximo pivô
+            if (procurar_maior and maiores.any()) or not menores.any():
+                candidatos = np.flatnonzero(maiores)
+                ordem = np.lexsort((-self._graus[candidatos], -superior[candidatos]))
+            else:
+                candidatos = np.flatnonzero(menores)
+                ordem = np.lexsort((-self._graus[candidatos], inferior[candidatos]))
+            self._pivotar(int(candidatos[ordem[0]]))
+            procurar_maior = not procurar_maior
+
+    def diametro(self) -> float:
+        """
+        Obtém o diâmetro (a maior excentricidade), infinito se o grafo não for (fortemente) conexo.
+        """
+        self._refinar(diametro=True)
+        return float(self._inferior.max()) if len(self.vertices) else 0.0
+
+    def raio(self) -> float:
+        """
+        Obtém o raio (a menor excentricidade), infinito se nenhum vértice alcançar todos os outros.
+        """
+        self._refinar(raio=True)
+        return float(self._superior.min()) if len(self.vertices) else 0.0
+
+    def centro(self) -> List[Any]:
+        """
+        Obtém os vértices de menor excentricidade.
+        """
+        self._refinar(centro=True)
+        if len(self.vertices) == 0:
+            return []
+        minimo = self._superior.min()
+        return [self.vertices[i] for i in np.flatnonzero(
+            (self._inferior == self._superior) & (self._superior == minimo))]
+
+    def periferia(self) -> List[Any]:
+        """
+        Obtém os vértices de maior excentricidade.
+        """
+        self._refinar(periferia=True)
+        if len(self.vertices) == 0:
+            return []
+        maximo = self._inferior.max()
+        return [self.vertices[i] for i in np.flatnonzero(
+            (self._inferior == self._superior) & (self._inferior == maximo))]
+
+    def par_diametral(self) -> Tuple[Any, Any]:
+        """
+        Obtém um par de vértices (u, v) cuja distância é o diâmetro.
+
+        Raises:
+            ValueError: Se o grafo não tiver vértices ou se o diâmetro for infinito.
+        """
+        diametro = self.diametro()
+        if len(self.vertices) == 0 or not np.isfinite(diametro):
+            raise ValueError("O grafo não possui diâmetro finito.")
+        # Com o diâmetro decidido, todo vértice cujo limite inferior é o diâmetro
+        # tem essa excentricidade. Em grafos direcionados o limite pode vir de
+        # d(w, v) com w fora dos pivôs, então a linha de w é calculada se preciso.
+        candidatos = np.flatnonzero(self._inferior == diametro)
+        pivos = [i for i in self._pivos if self._inferior[i] == diametro]
+        origem = pivos[0] if pivos else int(candidatos[0])
+        destino = int(np.argmax(self._linha(origem)))
+        return self.vertices[origem], self.vertices[destino]
+
+
+def obter_oraculo(grafo: Grafo, ponderado: bool = True) -> OraculoDistancias:
+    """
+    Obtém o oráculo de distâncias do grafo, compartilhado até a próxima alteração.
+
+    Args:
+        grafo: Grafo a ser consultado.
+        ponderado: Se False, as distâncias são em número de arestas.
+
+    Returns:
+        OraculoDistancias: Oráculo do grafo.
+    """
+    return grafo.obter_derivado(f"oraculo_distancias:{ponderado}", lambda: OraculoDistancias(grafo, ponderado))
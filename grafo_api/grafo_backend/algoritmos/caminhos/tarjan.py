@@ -2,12 +2,15 @@
 Implementação do algoritmo de Tarjan para encontrar componentes fortemente conexos em grafos direcionados.
 
 O algoritmo de Tarjan encontra todos os componentes fortemente conexos de um grafo direcionado
-em tempo linear, usando uma única passagem de busca em profundidade.
+em tempo linear, usando uma única passagem de busca em profundidade. As buscas deste
+módulo (componentes, pontes e pontos de articulação) usam a pilha explícita de
+``percorrer_profundidade``, sem limite de profundidade.
 """
 
 from typing import Dict, List, Any, Set, Tuple
 import networkx as nx
 from ...core.grafo import Grafo
+from .busca.profundidade import percorrer_profundidade
 
 
 def tarjan(grafo: Grafo) -> List[List[Any]]:
@@ -32,56 +35,51 @@ def tarjan(grafo: Grafo) -> List[List[Any]]:
     if not isinstance(g_nx, nx.DiGraph):
         raise ValueError("O algoritmo de Tarjan requer um grafo direcionado.")
     
-    # Inicializa as estruturas de dados
-    indice = {}  # Mapeamento de vértices para seus índices de descoberta
-    lowlink = {}  # Mapeamento de vértices para seus valores de lowlink
-    na_pilha = set()  # Conjunto de vértices na pilha
-    pilha = []  # Pilha de vértices
+    csr = grafo.obter_csr()
+    n = csr.numero_vertices()
     
-    # Índice atual para atribuição
-    proximo_indice = [0]  # Lista com um elemento para permitir modificação na função interna
+    # Inicializa as estruturas de dados, por índice da representação CSR
+    indice = [-1] * n  # Índice de descoberta de cada vértice
+    lowlink = [0] * n  # Valor de lowlink de cada vértice
+    na_pilha = [False] * n  # Indica se o vértice está na pilha de componentes
+    pilha = []  # Pilha de vértices
+    proximo_indice = [0]
     
-    # Lista de componentes fortemente conexos
+    # Lista de componentes fortemente conexos (em índices)
     componentes = []
     
-    def strongconnect(v):
+    def ao_descobrir(v, pai):
         # Atribui o mesmo índice e lowlink inicialmente
-        indice[v] = proximo_indice[0]
-        lowlink[v] = proximo_indice[0]
+        indice[v] = lowlink[v] = proximo_indice[0]
         proximo_indice[0] += 1
         pilha.append(v)
-        na_pilha.add(v)
-        
-        # Considera os sucessores de v
-        for w in grafo.obter_adjacentes(v):
-            if w not in indice:
-                # Sucessor w ainda não foi visitado, visita recursivamente
-                strongconnect(w)
-                # Atualiza o lowlink de v com o de w
-                lowlink[v] = min(lowlink[v], lowlink[w])
-            elif w in na_pilha:
-                # Sucessor w está na pilha, portanto está no componente atual
-                # Atualiza o lowlink de v com o índice de w
-                lowlink[v] = min(lowlink[v], indice[w])
-        
+        na_pilha[v] = True
+    
+    def ao_visitado(v, w):
+        # Sucessor w já visitado: se está na pilha, pertence ao componente atual
+        if na_pilha[w] and indice[w] < lowlink[v]:
+            lowlink[v] = indice[w]
+    
+    def ao_finalizar(v, pai):
         # Se v é um nó raiz de um componente fortemente conexo
         if lowlink[v] == indice[v]:
-            # Inicia um novo componente fortemente conexo
             componente = []
             while True:
                 w = pilha.pop()
-                na_pilha.remove(w)
+                na_pilha[w] = False
                 componente.append(w)
                 if w == v:
                     break
             componentes.append(componente)
+        
+        # Atualiza o lowlink do pai com o de v
+        if pai >= 0 and lowlink[v] < lowlink[pai]:
+            lowlink[pai] = lowlink[v]
     
-    # Executa o algoritmo para cada vértice não visitado
-    for v in grafo.obter_vertices():
-        if v not in indice:
-            strongconnect(v)
+    percorrer_profundidade(csr, None, ao_descobrir, ao_finalizar, ao_visitado, ao_visitado)
     
-    return componentes
+    ids = csr.lista_ids()
+    return [[ids[v] for v in componente] for componente in componentes]
 
 
 def encontrar_componentes_fortemente_conexos(grafo: Grafo) -> List[List[Any]]:
@@ -168,48 +166,38 @@ def encontrar_pontes(grafo: Grafo) -> List[Tuple[Any, Any]]:
     if isinstance(g_nx, nx.DiGraph):
         raise ValueError("O algoritmo de encontrar pontes requer um grafo não direcionado.")
     
-    # Inicializa as estruturas de dados
-    descoberta = {}  # Tempo de descoberta de cada vértice
-    low = {}  # Valor low de cada vértice
-    pai = {}  # Pai de cada vértice na árvore DFS
-    pontes = []  # Lista de pontes encontradas
+    csr = grafo.obter_csr()
+    n = csr.numero_vertices()
     
-    # Tempo atual para atribuição
-    tempo = [0]  # Lista com um elemento para permitir modificação na função interna
+    # Inicializa as estruturas de dados, por índice da representação CSR
+    descoberta = [0] * n  # Tempo de descoberta de cada vértice
+    low = [0] * n  # Valor low de cada vértice
+    pontes = []  # Lista de pontes encontradas (em índices)
+    tempo = [0]
     
-    def dfs(u):
-        # Marca o vértice como visitado
-        descoberta[u] = tempo[0]
-        low[u] = tempo[0]
+    def ao_descobrir(u, pai):
+        descoberta[u] = low[u] = tempo[0]
         tempo[0] += 1
-        
-        # Visita todos os vizinhos
-        for v in grafo.obter_adjacentes(u):
-            # Se o vizinho não foi visitado
-            if v not in descoberta:
-                pai[v] = u
-                dfs(v)
-                
-                # Atualiza o valor low de u
-                low[u] = min(low[u], low[v])
-                
-                # Se o valor low de v é maior que o tempo de descoberta de u,
-                # então u-v é uma ponte
-                if low[v] > descoberta[u]:
-                    pontes.append((u, v))
-            
-            # Se o vizinho já foi visitado e não é o pai de u
-            elif v != pai.get(u):
-                # Atualiza o valor low de u
-                low[u] = min(low[u], descoberta[v])
-    
-    # Executa DFS para cada vértice não visitado
-    for u in grafo.obter_vertices():
-        if u not in descoberta:
-            pai[u] = None
-            dfs(u)
     
-    return pontes
+    def ao_retorno(u, v):
+        # Aresta de retorno (exceto a do pai): atualiza o valor low de u
+        if descoberta[v] < low[u]:
+            low[u] = descoberta[v]
+    
+    def ao_finalizar(v, u):
+        if u < 0:
+            return
+        # Atualiza o valor low do pai u
+        if low[v] < low[u]:
+            low[u] = low[v]
+        # Se o valor low de v é maior que o tempo de descoberta de u, u-v é uma ponte
+        if low[v] > descoberta[u]:
+            pontes.append((u, v))
+    
+    percorrer_profundidade(csr, None, ao_descobrir, ao_finalizar, ao_retorno)
+    
+    ids = csr.lista_ids()
+    return [(ids[u], ids[v]) for u, v in pontes]
 
 
 def encontrar_pontos_articulacao(grafo: Grafo) -> Set[Any]:
@@ -232,56 +220,49 @@ def encontrar_pontos_articulacao(grafo: Grafo) -> Set[Any]:
     if isinstance(g_nx, nx.DiGraph):
         raise ValueError("O algoritmo de encontrar pontos de articulação requer um grafo não direcionado.")
     
-    # Inicializa as estruturas de dados
-    descoberta = {}  # Tempo de descoberta de cada vértice
-    low = {}  # Valor low de cada vértice
-    pai = {}  # Pai de cada vértice na árvore DFS
-    articulacoes = set()  # Conjunto de pontos de articulação
+    csr = grafo.obter_csr()
+    n = csr.numero_vertices()
     
-    # Tempo atual para atribuição
-    tempo = [0]  # Lista com um elemento para permitir modificação na função interna
+    # Inicializa as estruturas de dados, por índice da representação CSR
+    descoberta = [0] * n  # Tempo de descoberta de cada vértice
+    low = [0] * n  # Valor low de cada vértice
+    raiz = [False] * n  # Indica as raízes das árvores DFS
+    filhos = [0] * n  # Número de filhos na árvore DFS
+    articulacoes = set()  # Conjunto de pontos de articulação (em índices)
+    tempo = [0]
     
-    def dfs(u):
-        # Marca o vértice como visitado
-        descoberta[u] = tempo[0]
-        low[u] = tempo[0]
+    def ao_descobrir(u, pai):
+        descoberta[u] = low[u] = tempo[0]
         tempo[0] += 1
+        raiz[u] = pai < 0
+    
+    def ao_retorno(u, v):
+        # Aresta de retorno (exceto a do pai): atualiza o valor low de u
+        if descoberta[v] < low[u]:
+            low[u] = descoberta[v]
+    
+    def ao_finalizar(v, u):
+        if u < 0:
+            return
+        # Atualiza o valor low do pai u
+        if low[v] < low[u]:
+            low[u] = low[v]
+        filhos[u] += 1
         
-        # Contador de filhos na árvore DFS
-        filhos = 0
+        # Caso 1: u é raiz da árvore DFS e tem mais de um filho
+        if raiz[u]:
+            if filhos[u] > 1:
+                articulacoes.add(u)
         
-        # Visita todos os vizinhos
-        for v in grafo.obter_adjacentes(u):
-            # Se o vizinho não foi visitado
-            if v not in descoberta:
-                pai[v] = u
-                filhos += 1
-                dfs(v)
-                
-                # Atualiza o valor low de u
-                low[u] = min(low[u], low[v])
-                
-                # Caso 1: u é raiz da árvore DFS e tem mais de um filho
-                if pai[u] is None and filhos > 1:
-                    articulacoes.add(u)
-                
-                # Caso 2: u não é raiz e o valor low de algum filho v é maior ou igual
-                # ao tempo de descoberta de u
-                if pai[u] is not None and low[v] >= descoberta[u]:
-                    articulacoes.add(u)
-            
-            # Se o vizinho já foi visitado e não é o pai de u
-            elif v != pai.get(u):
-                # Atualiza o valor low de u
-                low[u] = min(low[u], descoberta[v])
+        # Caso 2: u não é raiz e o valor low de algum filho v é maior ou igual
+        # ao tempo de descoberta de u
+        elif low[v] >= descoberta[u]:
+            articulacoes.add(u)
     
-    # Executa DFS para cada vértice não visitado
-    for u in grafo.obter_vertices():
-        if u not in descoberta:
-            pai[u] = None
-            dfs(u)
+    percorrer_profundidade(csr, None, ao_descobrir, ao_finalizar, ao_retorno)
     
-    return articulacoes
+    ids = csr.lista_ids()
+    return {ids[u] for u in articulacoes}
 
 
 def verificar_grafo_biconexo(grafo: Grafo) -> bool:
@@ -300,8 +281,7 @@ def verificar_grafo_biconexo(grafo: Grafo) -> bool:
         ValueError: Se o grafo for direcionado.
     """
     # Verifica se o grafo é conexo
-    g_nx = grafo.obter_grafo_networkx()
-    if not nx.is_connected(g_nx):
+    if not grafo.eh_conexo():
         return False
     
     # Verifica se o grafo tem pontos de articulação
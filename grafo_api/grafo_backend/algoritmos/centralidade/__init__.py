@@ -2,7 +2,8 @@
 Módulo de algoritmos de centralidade em grafos.
 
 Este módulo contém implementações de algoritmos para calcular diferentes medidas de centralidade
-em grafos, incluindo centralidade de grau, intermediação, proximidade, autovetor, PageRank e Katz.
+em grafos, incluindo centralidade de grau, intermediação, proximidade, harmônica, autovetor,
+PageRank e Katz.
 """
 
 # Importações absolutas para garantir compatibilidade
@@ -10,6 +11,7 @@ from grafo_backend.algoritmos.centralidade.centralidade import (
     centralidade_grau,
     centralidade_intermediacao,
     centralidade_proximidade,
+    centralidade_harmonica,
     centralidade_autovetor,
     pagerank,
     centralidade_katz
@@ -2,12 +2,15 @@
 Módulo de algoritmos de centralidade em grafos.
 
 Este módulo contém implementações de algoritmos para calcular diferentes medidas de centralidade
-em grafos, incluindo centralidade de grau, intermediação, proximidade, autovetor, PageRank e Katz.
+em grafos, incluindo centralidade de grau, intermediação, proximidade, harmônica, autovetor,
+PageRank e Katz.
 """
 
 from typing import Dict, Any, Optional
 import networkx as nx
+import numpy as np
 from grafo_backend.core.grafo import Grafo
+from grafo_backend.algoritmos.caminhos.busca.multiplas_origens import iterar_lotes_bfs
 
 
 def centralidade_grau(grafo: Grafo) -> Dict[Any, float]:
@@ -53,19 +56,54 @@ def centralidade_proximidade(grafo: Grafo) -> Dict[Any, float]:
     """
     Calcula a centralidade de proximidade para todos os vértices do grafo.
     
+    Usa as distâncias até cada vértice (em número de arestas), obtidas por buscas
+    em largura simultâneas em lotes, com a correção de Wasserman e Faust para
+    grafos desconexos (os mesmos valores de ``nx.closeness_centrality``).
+    
     Args:
         grafo: Grafo a ser analisado.
         
     Returns:
         Dict[Any, float]: Dicionário mapeando vértices para seus valores de centralidade de proximidade.
     """
-    # Obtém o grafo NetworkX subjacente
-    g_nx = grafo.obter_grafo_networkx()
+    csr = grafo.obter_csr()
+    n = csr.numero_vertices()
+    centralidade = np.zeros(n)
+    
+    # Distâncias até cada vértice: busca no sentido contrário das arestas
+    for inicio, lote in iterar_lotes_bfs(csr, np.arange(n), reversa=True):
+        alcancados = (lote > 0).sum(axis=1)
+        totais = np.where(lote > 0, lote, 0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            valores = np.where(totais > 0, alcancados / totais * alcancados / max(n - 1, 1), 0.0)
+        centralidade[inicio:inicio + len(lote)] = valores
+    
+    return dict(zip(csr.lista_ids(), centralidade.tolist()))
+
+
+def centralidade_harmonica(grafo: Grafo) -> Dict[Any, float]:
+    """
+    Calcula a centralidade harmônica para todos os vértices do grafo.
     
-    # Calcula a centralidade de proximidade
-    centralidade = nx.closeness_centrality(g_nx)
+    A centralidade harmônica de v é a soma de 1/d(u, v) sobre os demais vértices u
+    (em número de arestas), e os vértices que não alcançam v contribuem com zero.
     
-    return centralidade
+    Args:
+        grafo: Grafo a ser analisado.
+        
+    Returns:
+        Dict[Any, float]: Dicionário mapeando vértices para seus valores de centralidade harmônica.
+    """
+    csr = grafo.obter_csr()
+    n = csr.numero_vertices()
+    centralidade = np.zeros(n)
+    
+    # Distâncias até cada vértice: busca no sentido contrário das arestas
+    for inicio, lote in iterar_lotes_bfs(csr, np.arange(n), reversa=True):
+        inversos = np.reciprocal(lote.astype(float), where=lote > 0, out=np.zeros(lote.shape))
+        centralidade[inicio:inicio + len(lote)] = inversos.sum(axis=1)
+    
+    return dict(zip(csr.lista_ids(), centralidade.tolist()))
 
 
 def centralidade_autovetor(grafo: Grafo, max_iter: int = 100, tol: float = 1e-6) -> Dict[Any, float]:
@@ -5,4 +5,4 @@ Este módulo contém implementações de algoritmos para encontrar ciclos em gra
 como o algoritmo de Hierholzer para ciclos eulerianos.
 """
 
-from algoritmos.ciclos.hierholzer import hierholzer, verificar_grafo_euleriano, encontrar_caminho_euleriano
+from grafo_backend.algoritmos.ciclos.hierholzer import hierholzer, verificar_grafo_euleriano, encontrar_caminho_euleriano
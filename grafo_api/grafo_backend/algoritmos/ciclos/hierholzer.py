@@ -7,7 +7,27 @@ um ciclo que percorre cada aresta exatamente uma vez.
 
 from typing import Dict, List, Any, Tuple, Set, Optional
 import networkx as nx
+import numpy as np
 from grafo_backend.core.grafo import Grafo
+from grafo_backend.core.csr import GrafoCSR
+
+
+def _arestas_gemeas(csr: GrafoCSR) -> List[int]:
+    """
+    Obtém, para cada posição u -> v da adjacência não direcionada, a posição de v -> u.
+    
+    Os pares (u, v) ordenados e os pares (v, u) ordenados percorrem as mesmas
+    arestas na mesma ordem, o que alinha cada posição à do sentido contrário.
+    Laços são gêmeos de si mesmos.
+    """
+    n = csr.numero_vertices()
+    origens = np.repeat(np.arange(n), np.diff(csr.indptr))
+    destinos = np.asarray(csr.indices)
+    diretas = np.lexsort((destinos, origens))
+    reversas = np.lexsort((origens, destinos))
+    gemeas = np.empty(len(destinos), dtype=np.int64)
+    gemeas[diretas] = reversas
+    return gemeas.tolist()
 
 
 def hierholzer(grafo: Grafo, vertice_inicial: Any = None) -> Optional[List[Any]]:
@@ -41,57 +61,37 @@ def hierholzer(grafo: Grafo, vertice_inicial: Any = None) -> Optional[List[Any]]
     if not verificar_grafo_euleriano(grafo):
         return None
     
-    # Obtém o grafo NetworkX subjacente
-    g_nx = grafo.obter_grafo_networkx()
-    
-    # Cria uma cópia do grafo para manipulação
-    g_copia = g_nx.copy()
-    
-    # Função para encontrar um subciclo a partir de um vértice
-    def encontrar_subciclo(vertice: Any) -> List[Any]:
-        subciclo = [vertice]
-        v_atual = vertice
-        
-        while True:
-            # Obtém os vizinhos do vértice atual
-            vizinhos = list(g_copia.neighbors(v_atual))
-            
-            # Se não há mais vizinhos, termina o subciclo
-            if not vizinhos:
-                break
-            
-            # Escolhe o próximo vértice
-            proximo = vizinhos[0]
-            
-            # Remove a aresta percorrida
-            g_copia.remove_edge(v_atual, proximo)
-            
-            # Atualiza o vértice atual
-            v_atual = proximo
-            
-            # Adiciona o vértice ao subciclo
-            subciclo.append(v_atual)
-        
-        return subciclo
-    
-    # Inicializa o ciclo euleriano com um subciclo a partir do vértice inicial
-    ciclo = encontrar_subciclo(vertice_inicial)
-    
-    # Enquanto houver arestas não percorridas
-    i = 0
-    while i < len(ciclo):
-        # Verifica se o vértice atual tem arestas não percorridas
-        if list(g_copia.neighbors(ciclo[i])):
-            # Encontra um novo subciclo a partir deste vértice
-            subciclo = encontrar_subciclo(ciclo[i])
-            
-            # Insere o subciclo no ciclo principal
-            ciclo = ciclo[:i+1] + subciclo[1:] + ciclo[i+1:]
-        else:
-            # Avança para o próximo vértice
+    csr = grafo.obter_csr()
+    indptr, indices, _ = csr.listas()
+    gemeas = None if csr.direcionado else _arestas_gemeas(csr)
+    
+    # Arestas já percorridas e próxima aresta a examinar de cada vértice
+    usadas = bytearray(len(indices))
+    proxima = indptr[:-1]
+    
+    # Segue arestas não percorridas a partir do topo da pilha; quando o topo
+    # não tem mais arestas livres, o subciclo fecha e o vértice entra no ciclo
+    pilha = [csr.indice(vertice_inicial)]
+    ciclo = []
+    while pilha:
+        u = pilha[-1]
+        i = proxima[u]
+        fim = indptr[u + 1]
+        while i < fim and usadas[i]:
             i += 1
+        if i < fim:
+            proxima[u] = i + 1
+            usadas[i] = 1
+            if gemeas is not None:
+                usadas[gemeas[i]] = 1
+            pilha.append(indices[i])
+        else:
+            proxima[u] = i
+            ciclo.append(pilha.pop())
     
-    return ciclo
+    # Os vértices saem da pilha do fim do ciclo para o início
+    ids = csr.lista_ids()
+    return [ids[v] for v in reversed(ciclo)]
 
 
 def verificar_grafo_euleriano(grafo: Grafo) -> bool:
@@ -120,7 +120,7 @@ def verificar_grafo_euleriano(grafo: Grafo) -> bool:
             if g_nx.in_degree(v) != g_nx.out_degree(v):
                 return False
     else:
-        if not nx.is_connected(g_nx):
+        if not grafo.eh_conexo():
             return False
         
         # Verifica se todos os vértices têm grau par
@@ -152,7 +152,7 @@ def verificar_grafo_semi_euleriano(grafo: Grafo) -> Tuple[bool, Optional[Tuple[A
     
     # Verifica se o grafo é conexo (ou fracamente conexo, se for direcionado)
     if grafo.eh_direcionado():
-        if not nx.is_weakly_connected(g_nx):
+        if not grafo.eh_conexo():
             return False, None
         
         # Encontra vértices com diferença entre grau de entrada e saída
@@ -180,7 +180,7 @@ def verificar_grafo_semi_euleriano(grafo: Grafo) -> Tuple[bool, Optional[Tuple[A
         
         return False, None
     else:
-        if not nx.is_connected(g_nx):
+        if not grafo.eh_conexo():
             return False, None
         
         # Encontra vértices com grau ímpar
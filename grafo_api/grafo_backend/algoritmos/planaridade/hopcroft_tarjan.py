@@ -157,7 +157,7 @@ def calcular_genus(grafo: Grafo) -> int:
     # Para grafos não planares, precisamos de uma aproximação do número de faces
     # Uma estimativa é usar o número de ciclos fundamentais
     # O número de ciclos fundamentais é e - v + c, onde c é o número de componentes conexos
-    c = nx.number_connected_components(g_nx)
+    c = grafo.numero_componentes()
     ciclos_fundamentais = e - v + c
     
     # Estimativa do número de faces
@@ -5,9 +5,12 @@ Este módulo contém funções para verificar se dois grafos são isomorfos,
 ou seja, se possuem a mesma estrutura, independentemente dos rótulos dos vértices.
 """
 
+import math
 import networkx as nx
 from typing import Dict, List, Any, Optional, Set, Tuple
 from grafo_backend.core.grafo import Grafo
+from grafo_backend.algoritmos.caminhos.oraculo import obter_oraculo
+from grafo_backend.algoritmos.caminhos.busca.busca import verificar_bipartido
 
 
 def verificar_isomorfismo(grafo1: Grafo, grafo2: Grafo) -> bool:
@@ -125,18 +128,28 @@ def calcular_invariantes(grafo: Grafo) -> Dict[str, Any]:
     """
     # Obtém o grafo NetworkX subjacente
     g_nx = grafo.obter_grafo_networkx()
+    componentes = grafo.obter_componentes()
+    eh_conexo = componentes.numero_componentes() <= 1
+    
+    # Diâmetro e raio (em número de arestas) pelo oráculo de distâncias, sem
+    # calcular as distâncias entre todos os pares. São infinitos no grafo vazio
+    # e podem sê-lo em um grafo direcionado apenas fracamente conexo
+    diametro = raio = float('inf')
+    if eh_conexo and g_nx.number_of_nodes() > 0:
+        oraculo = obter_oraculo(grafo, ponderado=False)
+        diametro, raio = oraculo.diametro(), oraculo.raio()
     
     # Calcula invariantes básicos
     invariantes = {
         "num_vertices": g_nx.number_of_nodes(),
         "num_arestas": g_nx.number_of_edges(),
         "graus": sorted([d for _, d in g_nx.degree()]),
-        "eh_conexo": nx.is_connected(g_nx),
-        "num_componentes": nx.number_connected_components(g_nx),
-        "tamanho_componentes": sorted([len(c) for c in nx.connected_components(g_nx)], reverse=True),
-        "diametro": nx.diameter(g_nx) if nx.is_connected(g_nx) else float('inf'),
-        "raio": nx.radius(g_nx) if nx.is_connected(g_nx) else float('inf'),
-        "eh_bipartido": nx.is_bipartite(g_nx),
+        "eh_conexo": eh_conexo,
+        "num_componentes": componentes.numero_componentes(),
+        "tamanho_componentes": componentes.tamanhos_componentes(),
+        "diametro": diametro if math.isinf(diametro) else int(diametro),
+        "raio": raio if math.isinf(raio) else int(raio),
+        "eh_bipartido": verificar_bipartido(grafo)[0],
     }
     
     # Tenta calcular invariantes adicionais que podem falhar em alguns grafos
@@ -58,13 +58,13 @@ def similaridade_estrutural(grafo1: Grafo, grafo2: Grafo) -> float:
         sim_graus = 1.0
     
     # Similaridade baseada na conectividade
-    conexo1 = nx.is_connected(g1_nx)
-    conexo2 = nx.is_connected(g2_nx)
+    conexo1 = grafo1.eh_conexo()
+    conexo2 = grafo2.eh_conexo()
     sim_conexo = 1.0 if conexo1 == conexo2 else 0.0
     
     # Similaridade baseada no número de componentes
-    comp1 = nx.number_connected_components(g1_nx)
-    comp2 = nx.number_connected_components(g2_nx)
+    comp1 = grafo1.numero_componentes()
+    comp2 = grafo2.numero_componentes()
     sim_comp = 1.0 - abs(comp1 - comp2) / max(comp1, comp2, 1)
     
     # Combina as métricas com pesos
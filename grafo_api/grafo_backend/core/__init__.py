@@ -6,5 +6,9 @@ Contém as classes fundamentais para representação de grafos.
 from .grafo import Grafo
 from .vertice import Vertice
 from .aresta import Aresta
+from .csr import GrafoCSR, TabelaTexto, ColunaAtributo
+from .assinatura import calcular_hash_conteudo
+from .conectividade import ComponentesConexos
 
-__all__ = ['Grafo', 'Vertice', 'Aresta']
+__all__ = ['Grafo', 'Vertice', 'Aresta', 'GrafoCSR', 'TabelaTexto', 'ColunaAtributo', 'calcular_hash_conteudo',
+           'ComponentesConexos']
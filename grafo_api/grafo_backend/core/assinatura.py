@@ -0,0 +1,101 @@
+"""
+Cálculo do hash de conteúdo de grafos.
+
+O hash é canônico: depende apenas do tipo do grafo, da direção e do conjunto
+de vértices e arestas com seus atributos (inclusive pesos), e não da ordem em
+que foram inseridos nem do nome do grafo. Grafos com o mesmo hash podem
+compartilhar armazenamento e resultados calculados.
+"""
+
+import hashlib
+import json
+from typing import Any, List
+
+import numpy as np
+
+
+# Marcadores dos tipos que o JSON não distingue (tuplas, conjuntos,
+# dicionários com chaves que não são texto e valores de outros tipos)
+CHAVE_TUPLA = "__tupla__"
+CHAVE_CONJUNTO = "__conjunto__"
+CHAVE_DICIONARIO = "__dicionario__"
+CHAVE_TIPO = "__tipo__"
+
+
+def _canonico(valor: Any) -> Any:
+    """
+    Converte um valor em uma estrutura JSON que identifica também o seu tipo.
+
+    Listas e tuplas, conjuntos e textos, ou as chaves 1 e "1" de um
+    dicionário deixam de produzir a mesma codificação. Valores de tipos sem
+    representação em JSON são marcados com o nome do tipo.
+    """
+    if valor is None or isinstance(valor, (bool, int, float, str)):
+        return valor
+    if isinstance(valor, np.generic):
+        return _canonico(valor.item())
+    if isinstance(valor, list):
+        return [_canonico(v) for v in valor]
+    if isinstance(valor, tuple):
+        return {CHAVE_TUPLA: [_canonico(v) for v in valor]}
+    if isinstance(valor, (set, frozenset)):
+        return {CHAVE_CONJUNTO: sorted(_codificar(v) for v in valor)}
+    if isinstance(valor, dict):
+        if all(isinstance(k, str) for k in valor) and not any(k.startswith("__") for k in valor):
+            return {k: _canonico(v) for k, v in valor.items()}
+        return {CHAVE_DICIONARIO: sorted([_codificar(k), _canonico(v)] for k, v in valor.items())}
+    tipo = type(valor)
+    return {CHAVE_TIPO: f"{tipo.__module__}.{tipo.__qualname__}", "valor": str(valor)}
+
+
+def _codificar(valor: Any) -> str:
+    """
+    Codifica um valor em JSON canônico (chaves ordenadas, sem espaços, com os tipos marcados).
+    """
+    return json.dumps(_canonico(valor), sort_keys=True, separators=(",", ":"))
+
+
+def calcular_hash_conteudo(grafo) -> str:
+    """
+    Calcula o hash de conteúdo de um grafo.
+
+    Vértices e arestas são codificados individualmente e ordenados antes de
+    entrar no resumo SHA-256. Em grafos não direcionados, as extremidades de
+    cada aresta são ordenadas, de modo que (u, v) e (v, u) produzem o mesmo
+    hash.
+
+    Args:
+        grafo: Grafo cujo conteúdo será resumido.
+
+    Returns:
+        str: Hash SHA-256 em hexadecimal.
+    """
+    g_nx = grafo.obter_grafo_networkx()
+    direcionado = g_nx.is_directed()
+
+    # Codifica os vértices uma única vez; o código também identifica as arestas
+    codigos = {vertice: _codificar(vertice) for vertice in g_nx.nodes}
+    vertices: List[str] = sorted(
+        f"{codigos[vertice]}\t{_codificar(atributos)}"
+        for vertice, atributos in g_nx.nodes(data=True)
+    )
+
+    arestas: List[str] = []
+    for origem, destino, atributos in g_nx.edges(data=True):
+        codigo_origem, codigo_destino = codigos[origem], codigos[destino]
+        if not direcionado and codigo_destino < codigo_origem:
+            codigo_origem, codigo_destino = codigo_destino, codigo_origem
+        arestas.append(f"{codigo_origem}\t{codigo_destino}\t{_codificar(atributos)}")
+    arestas.sort()
+
+    resumo = hashlib.sha256()
+    resumo.update(f"{type(grafo).__name__}\t{int(direcionado)}\t{len(vertices)}\t{len(arestas)}\n".encode("utf-8"))
+    for linha in vertices:
+        resumo.update(linha.encode("utf-8"))
+        resumo.update(b"\n")
+    resumo.update(b"\n")
+    for linha in arestas:
+        resumo.update(linha.encode("utf-8"))
+        resumo.update(b"\n")
+
+    return resumo.hexdigest()
@@ -0,0 +1,152 @@
+"""
+Componentes conexos mantidos por uma estrutura de conjuntos disjuntos (union-find).
+
+A estrutura acompanha as inserções do grafo: um novo vértice é um novo
+conjunto e uma nova aresta une os conjuntos dos seus extremos, em tempo
+praticamente constante (união por tamanho e compressão de caminhos, custo
+amortizado O(α(n))). Remoções não podem ser desfeitas em um union-find; o
+grafo descarta a estrutura e a reconstrói, a partir da representação CSR,
+na próxima consulta.
+
+Em grafos direcionados, a direção das arestas é ignorada (componentes
+fracamente conexos).
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+
+from grafo_backend.core.csr import GrafoCSR
+
+
+class ComponentesConexos:
+    """
+    Conjuntos disjuntos dos vértices de um grafo, um por componente conexo.
+    """
+
+    def __init__(self):
+        """
+        Inicializa a estrutura sem vértices.
+        """
+        self._indice_por_id: Dict[Any, int] = {}
+        self._pais: List[int] = []
+        self._tamanhos: List[int] = []
+        self._quantidade = 0
+
+    @classmethod
+    def de_csr(cls, csr: GrafoCSR) -> 'ComponentesConexos':
+        """
+        Constrói a estrutura a partir da representação CSR de um grafo.
+
+        Os componentes são rotulados de uma vez e cada vértice aponta
+        diretamente para o primeiro vértice do seu componente.
+
+        Args:
+            csr: Representação CSR do grafo.
+
+        Returns:
+            ComponentesConexos: Estrutura com os componentes do grafo.
+        """
+        estrutura = cls()
+        n = csr.numero_vertices()
+        estrutura._indice_por_id = {v: i for i, v in enumerate(csr.lista_ids())}
+        if n == 0:
+            return estrutura
+
+        matriz = sp.csr_matrix((np.ones(len(csr.indices), dtype=np.int8), csr.indices, csr.indptr), shape=(n, n))
+        quantidade, rotulos = connected_components(matriz, directed=csr.direcionado, connection="weak")
+        _, representantes, tamanhos = np.unique(rotulos, return_index=True, return_counts=True)
+
+        tamanhos_por_indice = np.zeros(n, dtype=np.int64)
+        tamanhos_por_indice[representantes] = tamanhos
+        estrutura._pais = representantes[rotulos].tolist()
+        estrutura._tamanhos = tamanhos_por_indice.tolist()
+        estrutura._quantidade = int(quantidade)
+        return estrutura
+
+    def _indice(self, vertice: Any) -> int:
+        """
+        Obtém o índice interno de um vértice.
+
+        Raises:
+            ValueError: Se o vértice não estiver na estrutura.
+        """
+        try:
+            return self._indice_por_id[vertice]
+        except (KeyError, TypeError):
+            raise ValueError(f"Vértice '{vertice}' não existe no grafo.")
+
+    def _raiz(self, indice: int) -> int:
+        """
+        Encontra o representante do conjunto de um índice, com divisão de caminhos pela metade.
+        """
+        pais = self._pais
+        while pais[indice] != indice:
+            pais[indice] = pais[pais[indice]]
+            indice = pais[indice]
+        return indice
+
+    def adicionar_vertice(self, vertice: Any) -> None:
+        """
+        Adiciona um vértice isolado (um novo componente).
+
+        Args:
+            vertice: Identificador do vértice (ignorado se já existir).
+        """
+        if vertice in self._indice_por_id:
+            return
+        indice = len(self._pais)
+        self._indice_por_id[vertice] = indice
+        self._pais.append(indice)
+        self._tamanhos.append(1)
+        self._quantidade += 1
+
+    def unir(self, u: Any, v: Any) -> bool:
+        """
+        Registra uma aresta entre dois vértices, unindo seus componentes.
+
+        Args:
+            u: Identificador de um extremo.
+            v: Identificador do outro extremo.
+
+        Returns:
+            bool: True se a aresta ligou dois componentes diferentes.
+
+        Raises:
+            ValueError: Se algum dos vértices não estiver na estrutura.
+        """
+        raiz_u = self._raiz(self._indice(u))
+        raiz_v = self._raiz(self._indice(v))
+        if raiz_u == raiz_v:
+            return False
+
+        # União por tamanho: a raiz do conjunto menor passa a apontar para a do maior
+        if self._tamanhos[raiz_u] < self._tamanhos[raiz_v]:
+            raiz_u, raiz_v = raiz_v, raiz_u
+        self._pais[raiz_v] = raiz_u
+        self._tamanhos[raiz_u] += self._tamanhos[raiz_v]
+        self._quantidade -= 1
+        return True
+
+    def conectados(self, u: Any, v: Any) -> bool:
+        """
+        Verifica se dois vértices estão no mesmo componente.
+
+        Raises:
+            ValueError: Se algum dos vértices não estiver na estrutura.
+        """
+        return self._raiz(self._indice(u)) == self._raiz(self._indice(v))
+
+    def numero_componentes(self) -> int:
+        """
+        Obtém o número de componentes.
+        """
+        return self._quantidade
+
+    def tamanhos_componentes(self) -> List[int]:
+        """
+        Obtém o número de vértices de cada componente, em ordem decrescente.
+        """
+        return sorted((t for i, t in enumerate(self._tamanhos) if self._pais[i] == i), reverse=True)
@@ -0,0 +1,550 @@
+"""
+Representação compacta de grafos em formato CSR (Compressed Sparse Row).
+
+Este módulo contém a classe GrafoCSR, que armazena a adjacência de um grafo em
+arrays NumPy contíguos (deslocamentos, vizinhos e pesos), além de tabelas de
+identificadores e colunas de atributos. Os arrays podem ser mapeados em memória
+diretamente de um arquivo, permitindo abrir grafos grandes sem reconstruí-los.
+"""
+
+import json
+import numpy as np
+import networkx as nx
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
+
+from grafo_backend.core.grafo import Grafo
+
+
+# Chave usada para marcar tuplas na serialização JSON
+CHAVE_TUPLA = "__tupla__"
+
+
+def _marcar_tuplas(valor: Any) -> Any:
+    """
+    Substitui recursivamente as tuplas por objetos marcados, que o JSON preservaria como listas.
+    """
+    if isinstance(valor, tuple):
+        return {CHAVE_TUPLA: [_marcar_tuplas(v) for v in valor]}
+    if isinstance(valor, list):
+        return [_marcar_tuplas(v) for v in valor]
+    if isinstance(valor, dict):
+        return {k: _marcar_tuplas(v) for k, v in valor.items()}
+    return valor
+
+
+def _restaurar_tupla(objeto: Dict[str, Any]) -> Any:
+    """
+    Converte de volta em tupla um objeto marcado por ``_marcar_tuplas``.
+    """
+    if len(objeto) == 1 and CHAVE_TUPLA in objeto:
+        return tuple(objeto[CHAVE_TUPLA])
+    return objeto
+
+
+def codificar_json(valor: Any) -> str:
+    """
+    Serializa um valor em JSON preservando tuplas.
+
+    Valores que o JSON não representa (conjuntos, objetos arbitrários,
+    dicionários com chaves não textuais) são gravados como texto com ``str``.
+
+    Args:
+        valor: Valor a ser serializado.
+
+    Returns:
+        str: Texto JSON do valor.
+    """
+    try:
+        return json.dumps(_marcar_tuplas(valor), default=str)
+    except (TypeError, ValueError):
+        return json.dumps(str(valor))
+
+
+def decodificar_json(texto: str) -> Any:
+    """
+    Lê um valor serializado por ``codificar_json``.
+
+    Args:
+        texto: Texto JSON.
+
+    Returns:
+        Any: Valor decodificado, com as tuplas restauradas.
+    """
+    return json.loads(texto, object_hook=_restaurar_tupla)
+
+
+class TabelaTexto:
+    """
+    Tabela de strings armazenada como um buffer UTF-8 e um array de deslocamentos.
+
+    A string ``i`` ocupa os bytes ``dados[deslocamentos[i]:deslocamentos[i + 1]]``.
+    As strings só são decodificadas quando acessadas.
+    """
+
+    def __init__(self, deslocamentos: np.ndarray, dados: np.ndarray):
+        """
+        Inicializa a tabela.
+
+        Args:
+            deslocamentos: Array int64 com ``n + 1`` deslocamentos em bytes.
+            dados: Buffer uint8 com as strings concatenadas em UTF-8.
+        """
+        self.deslocamentos = deslocamentos
+        self.dados = dados
+
+    @classmethod
+    def de_lista(cls, textos: Sequence[str]) -> 'TabelaTexto':
+        """
+        Cria uma tabela a partir de uma sequência de strings.
+
+        Args:
+            textos: Strings a serem armazenadas.
+
+        Returns:
+            TabelaTexto: Tabela com as strings codificadas.
+        """
+        codificados = [t.encode("utf-8") for t in textos]
+        deslocamentos = np.zeros(len(codificados) + 1, dtype=np.int64)
+        if codificados:
+            np.cumsum([len(c) for c in codificados], out=deslocamentos[1:])
+        dados = np.frombuffer(b"".join(codificados), dtype=np.uint8)
+        return cls(deslocamentos, dados)
+
+    def __len__(self) -> int:
+        return len(self.deslocamentos) - 1
+
+    def __getitem__(self, indice: int) -> str:
+        inicio, fim = self.deslocamentos[indice], self.deslocamentos[indice + 1]
+        return self.dados[inicio:fim].tobytes().decode("utf-8")
+
+    def tolist(self) -> List[str]:
+        """
+        Decodifica todas as strings da tabela.
+
+        Returns:
+            List[str]: Strings na ordem da tabela.
+        """
+        buffer = self.dados.tobytes()
+        limites = self.deslocamentos.tolist()
+        return [buffer[a:b].decode("utf-8") for a, b in zip(limites[:-1], limites[1:])]
+
+
+class ColunaAtributo:
+    """
+    Coluna de valores de um atributo de vértices ou arestas.
+
+    Atributos numéricos e booleanos são armazenados em arrays NumPy; os demais
+    valores são serializados em JSON (``codificar_json``) numa TabelaTexto. A máscara ``presente``
+    indica quais elementos possuem o atributo.
+    """
+
+    TIPOS = ("bool", "int", "float", "json")
+
+    def __init__(self, tipo: str, valores: Union[np.ndarray, TabelaTexto], presente: np.ndarray):
+        """
+        Inicializa a coluna.
+
+        Args:
+            tipo: Tipo da coluna ('bool', 'int', 'float' ou 'json').
+            valores: Array de valores ou TabelaTexto com valores em JSON.
+            presente: Máscara booleana de elementos que possuem o atributo.
+        """
+        if tipo not in self.TIPOS:
+            raise ValueError(f"Tipo de coluna '{tipo}' inválido. Tipos válidos: {', '.join(self.TIPOS)}")
+
+        self.tipo = tipo
+        self.valores = valores
+        self.presente = presente
+
+    @classmethod
+    def de_valores(cls, valores: Sequence[Any], presente: Sequence[bool]) -> 'ColunaAtributo':
+        """
+        Cria uma coluna escolhendo o armazenamento mais compacto para os valores.
+
+        Args:
+            valores: Valor de cada elemento (ignorado onde ``presente`` é False).
+            presente: Indica se cada elemento possui o atributo.
+
+        Returns:
+            ColunaAtributo: Coluna com os valores.
+        """
+        mascara = np.asarray(presente, dtype=bool)
+        tipos = {type(v) for v, p in zip(valores, presente) if p}
+
+        if tipos == {bool}:
+            return cls("bool", np.array([bool(v) if p else False for v, p in zip(valores, presente)]), mascara)
+        if tipos and tipos <= {int}:
+            try:
+                return cls("int", np.array([v if p else 0 for v, p in zip(valores, presente)],
+                                           dtype=np.int64), mascara)
+            except OverflowError:
+                # Inteiros maiores que 64 bits são preservados em JSON
+                tipos = {object}
+        if tipos and tipos <= {int, float}:
+            return cls("float", np.array([v if p else 0.0 for v, p in zip(valores, presente)],
+                                         dtype=np.float64), mascara)
+
+        textos = [codificar_json(v) if p else "" for v, p in zip(valores, presente)]
+        return cls("json", TabelaTexto.de_lista(textos), mascara)
+
+    def __len__(self) -> int:
+        return len(self.presente)
+
+    def obter(self, indice: int) -> Any:
+        """
+        Obtém o valor de um elemento.
+
+        Args:
+            indice: Índice do elemento.
+
+        Returns:
+            Any: Valor do atributo.
+
+        Raises:
+            KeyError: Se o elemento não possuir o atributo.
+        """
+        if not self.presente[indice]:
+            raise KeyError(indice)
+        if self.tipo == "json":
+            return decodificar_json(self.valores[indice])
+        return self.valores[indice].item()
+
+    def tolist(self) -> List[Any]:
+        """
+        Converte a coluna em uma lista Python (None onde o atributo está ausente).
+
+        Returns:
+            List[Any]: Valores da coluna.
+        """
+        if self.tipo == "json":
+            valores = [decodificar_json(t) if t else None for t in self.valores.tolist()]
+        else:
+            valores = np.asarray(self.valores).tolist()
+        return [v if p else None for v, p in zip(valores, self.presente.tolist())]
+
+
+class GrafoCSR:
+    """
+    Grafo imutável em formato CSR.
+
+    Os vizinhos do vértice de índice ``i`` são ``indices[indptr[i]:indptr[i + 1]]``
+    e os pesos correspondentes estão em ``pesos`` nas mesmas posições. Em grafos
+    não direcionados cada aresta aparece nas listas de ambos os extremos.
+    """
+
+    def __init__(self, ids: Union[np.ndarray, TabelaTexto, Sequence[Any]], indptr: np.ndarray,
+                 indices: np.ndarray, pesos: np.ndarray, direcionado: bool = False,
+                 num_arestas: Optional[int] = None, nome: str = "Grafo", tipo: str = "Grafo",
+                 atributos_vertices: Optional[Dict[str, ColunaAtributo]] = None,
+                 atributos_arestas: Optional[Dict[str, ColunaAtributo]] = None,
+                 conjuntos: Optional[np.ndarray] = None):
+        """
+        Inicializa o grafo CSR.
+
+        Args:
+            ids: Identificadores dos vértices, na ordem dos índices.
+            indptr: Array de ``n + 1`` deslocamentos.
+            indices: Array com os índices dos vizinhos.
+            pesos: Array com os pesos das arestas, alinhado a ``indices``.
+            direcionado: Se True, ``indices`` contém apenas os sucessores.
+            num_arestas: Número de arestas. Se None, é calculado a partir dos arrays.
+            nome: Nome do grafo.
+            tipo: Nome da classe de grafo de origem (Grafo, GrafoPonderado, ...).
+            atributos_vertices: Colunas de atributos dos vértices.
+            atributos_arestas: Colunas de atributos das arestas, alinhadas a ``indices``.
+            conjuntos: Para grafos bipartidos, 0 (conjunto A) ou 1 (conjunto B) por vértice.
+        """
+        self.nome = nome
+        self.tipo = tipo
+        self.direcionado = direcionado
+        self._ids = ids
+        self.indptr = indptr
+        self.indices = indices
+        self.pesos = pesos
+        self.atributos_vertices = atributos_vertices or {}
+        self.atributos_arestas = atributos_arestas or {}
+        self.conjuntos = conjuntos
+        self._indice_por_id: Optional[Dict[Any, int]] = None
+        self._listas: Optional[Tuple[List[int], List[int], List[float]]] = None
+        self._lista_ids: Optional[List[Any]] = None
+        self._transposta: Optional['GrafoCSR'] = None
+
+        if num_arestas is None:
+            num_arestas = self._contar_arestas()
+        self.num_arestas = int(num_arestas)
+
+    def _contar_arestas(self) -> int:
+        """
+        Conta as arestas a partir dos arrays (laços contam uma vez).
+        """
+        if self.direcionado:
+            return len(self.indices)
+        origens = np.repeat(np.arange(self.numero_vertices()), np.diff(self.indptr))
+        lacos = int(np.count_nonzero(origens == self.indices))
+        return (len(self.indices) - lacos) // 2 + lacos
+
+    @property
+    def ids(self) -> Union[np.ndarray, TabelaTexto, Sequence[Any]]:
+        """
+        Identificadores dos vértices, indexáveis pelo índice interno.
+        """
+        return self._ids
+
+    def numero_vertices(self) -> int:
+        """
+        Retorna o número de vértices do grafo.
+        """
+        return len(self.indptr) - 1
+
+    def numero_arestas(self) -> int:
+        """
+        Retorna o número de arestas do grafo.
+        """
+        return self.num_arestas
+
+    def eh_direcionado(self) -> bool:
+        """
+        Verifica se o grafo é direcionado.
+        """
+        return self.direcionado
+
+    def indice(self, vertice: Any) -> int:
+        """
+        Obtém o índice interno de um vértice.
+
+        O mapeamento de identificadores para índices é construído no primeiro uso.
+
+        Args:
+            vertice: Identificador do vértice.
+
+        Returns:
+            int: Índice do vértice.
+
+        Raises:
+            ValueError: Se o vértice não existir no grafo.
+        """
+        if self._indice_por_id is None:
+            self._indice_por_id = {v: i for i, v in enumerate(self.lista_ids())}
+
+        try:
+            return self._indice_por_id[vertice]
+        except (KeyError, TypeError):
+            raise ValueError(f"Vértice '{vertice}' não existe no grafo.")
+
+    def vertice(self, indice: int) -> Any:
+        """
+        Obtém o identificador do vértice de um índice interno.
+        """
+        valor = self._ids[indice]
+        return valor.item() if isinstance(valor, np.generic) else valor
+
+    def vizinhos(self, indice: int) -> np.ndarray:
+        """
+        Obtém os índices dos vizinhos (sucessores, se direcionado) de um vértice.
+        """
+        return self.indices[self.indptr[indice]:self.indptr[indice + 1]]
+
+    def pesos_vizinhos(self, indice: int) -> np.ndarray:
+        """
+        Obtém os pesos das arestas para os vizinhos de um vértice.
+        """
+        return self.pesos[self.indptr[indice]:self.indptr[indice + 1]]
+
+    def graus(self) -> np.ndarray:
+        """
+        Obtém o grau (de saída, se direcionado) de todos os vértices.
+        """
+        return np.diff(self.indptr)
+
+    def listas(self) -> Tuple[List[int], List[int], List[float]]:
+        """
+        Obtém ``indptr``, ``indices`` e ``pesos`` como listas Python.
+
+        Laços em Python puro acessam listas bem mais rápido que arrays NumPy
+        elemento a elemento; as listas são criadas no primeiro uso.
+        """
+        if self._listas is None:
+            self._listas = (np.asarray(self.indptr).tolist(), np.asarray(self.indices).tolist(),
+                            np.asarray(self.pesos, dtype=float).tolist())
+        return self._listas
+
+    def lista_ids(self) -> List[Any]:
+        """
+        Obtém os identificadores dos vértices como lista Python, na ordem dos índices.
+        """
+        if self._lista_ids is None:
+            self._lista_ids = self._ids.tolist() if hasattr(self._ids, "tolist") else list(self._ids)
+        return self._lista_ids
+
+    def transposta(self) -> 'GrafoCSR':
+        """
+        Obtém o grafo com as arestas invertidas (os predecessores de cada vértice).
+
+        Em grafos não direcionados, é o próprio grafo. Contém apenas a
+        adjacência e os pesos, e é construída no primeiro uso.
+        """
+        if not self.direcionado:
+            return self
+        if self._transposta is None:
+            n = self.numero_vertices()
+            origens = np.repeat(np.arange(n, dtype=np.asarray(self.indices).dtype), np.diff(self.indptr))
+            ordem = np.argsort(self.indices, kind="stable")
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=n), out=indptr[1:])
+            self._transposta = GrafoCSR(self._ids, indptr, origens[ordem], np.asarray(self.pesos)[ordem],
+                                        direcionado=True, num_arestas=self.num_arestas, nome=self.nome,
+                                        tipo=self.tipo)
+            self._transposta._transposta = self
+        return self._transposta
+
+    @classmethod
+    def de_grafo(cls, grafo: Grafo, atributos: bool = True) -> 'GrafoCSR':
+        """
+        Constrói a representação CSR de um grafo.
+
+        Os pesos são lidos do atributo usado por ``obter_peso_aresta``
+        (``ATRIBUTO_PESO`` da classe do grafo), com 'weight' e 1.0 como
+        alternativas.
+
+        Args:
+            grafo: Grafo de origem.
+            atributos: Se False, omite as colunas de atributos de vértices e
+                arestas (mais rápido quando só a adjacência e os pesos importam).
+
+        Returns:
+            GrafoCSR: Representação compacta do grafo.
+        """
+        g_nx = grafo.obter_grafo_networkx()
+        vertices = list(g_nx.nodes())
+        posicoes = {v: i for i, v in enumerate(vertices)}
+
+        # Deslocamentos a partir dos graus de saída
+        graus = np.fromiter((len(adj) for _, adj in g_nx.adjacency()), dtype=np.int64, count=len(vertices))
+        indptr = np.zeros(len(vertices) + 1, dtype=np.int64)
+        np.cumsum(graus, out=indptr[1:])
+        nnz = int(indptr[-1])
+
+        tipo_indice = np.int32 if len(vertices) < 2 ** 31 else np.int64
+        indices = np.fromiter((posicoes[v] for _, adj in g_nx.adjacency() for v in adj),
+                              dtype=tipo_indice, count=nnz)
+        atributo_peso = getattr(grafo, "ATRIBUTO_PESO", "weight")
+        pesos = np.fromiter((d.get(atributo_peso, d.get("weight", 1.0)) for _, adj in g_nx.adjacency()
+                             for d in adj.values()), dtype=np.float64, count=nnz)
+
+        # Identificadores: inteiros em array, demais em tabela de texto
+        if all(type(v) is int for v in vertices):
+            try:
+                ids = np.array(vertices, dtype=np.int64)
+            except OverflowError:
+                ids = vertices
+        elif all(isinstance(v, str) for v in vertices):
+            ids = TabelaTexto.de_lista(vertices)
+        else:
+            ids = vertices
+
+        # Colunas de atributos
+        atributos_vertices, atributos_arestas = None, None
+        if atributos:
+            atributos_vertices = _construir_colunas([d for _, d in g_nx.nodes(data=True)])
+            atributos_arestas = _construir_colunas(
+                [d for _, adj in g_nx.adjacency() for d in adj.values()], ignorar=("weight",))
+
+        conjuntos = None
+        conjunto_b = getattr(grafo, "_conjunto_b", None)
+        if conjunto_b is not None:
+            conjuntos = np.fromiter((v in conjunto_b for v in vertices), dtype=np.uint8, count=len(vertices))
+
+        return cls(ids, indptr, indices, pesos, direcionado=g_nx.is_directed(),
+                   num_arestas=g_nx.number_of_edges(), nome=grafo.nome, tipo=type(grafo).__name__,
+                   atributos_vertices=atributos_vertices, atributos_arestas=atributos_arestas,
+                   conjuntos=conjuntos)
+
+    def para_grafo(self) -> Grafo:
+        """
+        Reconstrói um objeto Grafo (baseado em NetworkX) a partir da representação CSR.
+
+        Returns:
+            Grafo: Grafo equivalente, do mesmo tipo do grafo de origem.
+        """
+        # Importação local para evitar ciclo de importação
+        from grafo_backend.tipos import GrafoDirecionado, GrafoPonderado, GrafoBipartido
+
+        if self.tipo == "GrafoPonderado":
+            grafo = GrafoPonderado(self.nome, direcionado=self.direcionado)
+        elif self.tipo == "GrafoDirecionado":
+            grafo = GrafoDirecionado(self.nome)
+        elif self.tipo == "GrafoBipartido":
+            grafo = GrafoBipartido(self.nome)
+        else:
+            grafo = Grafo(self.nome, direcionado=self.direcionado)
+
+        n = self.numero_vertices()
+        ids = self._ids.tolist() if hasattr(self._ids, "tolist") else list(self._ids)
+
+        g_nx = nx.DiGraph() if self.direcionado else nx.Graph()
+        g_nx.add_nodes_from(zip(ids, _linhas_atributos(self.atributos_vertices, np.arange(n), n)))
+
+        # Em grafos não direcionados, cada aresta é emitida apenas uma vez
+        origens = np.repeat(np.arange(n), np.diff(self.indptr))
+        posicoes = np.arange(len(self.indices))
+        if not self.direcionado:
+            posicoes = posicoes[origens <= self.indices]
+
+        atributos = _linhas_atributos(self.atributos_arestas, posicoes, len(posicoes))
+        pesos = np.asarray(self.pesos)[posicoes].tolist()
+        for dados, peso in zip(atributos, pesos):
+            dados["weight"] = peso
+
+        ids_array = np.empty(n, dtype=object)
+        ids_array[:] = ids
+        g_nx.add_edges_from(zip(ids_array[origens[posicoes]].tolist(),
+                                ids_array[np.asarray(self.indices)[posicoes]].tolist(),
+                                atributos))
+        grafo.definir_grafo_networkx(g_nx)
+
+        if self.conjuntos is not None and hasattr(grafo, "_conjunto_a"):
+            conjuntos = np.asarray(self.conjuntos).tolist()
+            grafo._conjunto_a = {v for v, c in zip(ids, conjuntos) if c == 0}
+            grafo._conjunto_b = {v for v, c in zip(ids, conjuntos) if c == 1}
+
+        return grafo
+
+
+def _construir_colunas(dicionarios: List[Dict[str, Any]], ignorar: Sequence[str] = ()) -> Dict[str, ColunaAtributo]:
+    """
+    Converte uma lista de dicionários de atributos em colunas.
+    """
+    chaves: Dict[str, None] = {}
+    for dados in dicionarios:
+        for chave in dados:
+            if chave not in ignorar:
+                chaves[chave] = None
+
+    colunas = {}
+    for chave in chaves:
+        presente = [chave in dados for dados in dicionarios]
+        valores = [dados.get(chave) for dados in dicionarios]
+        colunas[str(chave)] = ColunaAtributo.de_valores(valores, presente)
+    return colunas
+
+
+def _linhas_atributos(colunas: Dict[str, ColunaAtributo], posicoes: np.ndarray, total: int) -> List[Dict[str, Any]]:
+    """
+    Reconstrói os dicionários de atributos das posições indicadas.
+    """
+    linhas: List[Dict[str, Any]] = [{} for _ in range(total)]
+    for chave, coluna in colunas.items():
+        presente = np.asarray(coluna.presente)[posicoes]
+        selecionadas = np.flatnonzero(presente)
+        if len(selecionadas) == 0:
+            continue
+
+        origem = posicoes[selecionadas]
+        if coluna.tipo == "json":
+            valores = [decodificar_json(coluna.valores[int(i)]) for i in origem]
+        else:
+            valores = np.asarray(coluna.valores)[origem].tolist()
+
+        for linha, valor in zip(selecionadas.tolist(), valores):
+            linhas[linha][chave] = valor
+    return linhas
@@ -5,7 +5,12 @@ Implementa a interface comum para todos os tipos de grafos.
 
 import networkx as nx
 import matplotlib.pyplot as plt
-from typing import Dict, List, Any, Optional, Set, Tuple, Union
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple, Union, TYPE_CHECKING
+from .assinatura import calcular_hash_conteudo
+
+if TYPE_CHECKING:
+    from .conectividade import ComponentesConexos
+    from .csr import GrafoCSR
 
 
 class Grafo:
@@ -16,6 +21,9 @@ class Grafo:
     fidelidade à teoria dos grafos e fornecer uma API consistente.
     """
     
+    # Atributo da aresta lido por ``obter_peso_aresta``
+    ATRIBUTO_PESO = "weight"
+    
     def __init__(self, nome: str = "Grafo", direcionado: bool = False):
         """
         Inicializa um novo grafo.
@@ -30,6 +38,21 @@ class Grafo:
         else:
             self._grafo = nx.Graph()  # Grafo não direcionado
         
+        # Contador de alterações, usado para invalidar caches e detectar mudanças
+        self._versao = 0
+        
+        # Hash de conteúdo e a versão em que foi calculado
+        self._hash = None
+        self._versao_hash = None
+        
+        # Resultados derivados do grafo (representação CSR, distâncias etc.),
+        # descartados a cada alteração
+        self._derivados: Dict[str, Any] = {}
+        
+        # Componentes conexos, atualizados nas inserções, e a versão a que correspondem
+        self._componentes = None
+        self._versao_componentes = None
+        
     def adicionar_vertice(self, id_vertice: Any, atributos: Optional[Dict[str, Any]] = None) -> bool:
         """
         Adiciona um vértice ao grafo.
@@ -45,6 +68,8 @@ class Grafo:
             return False
             
         self._grafo.add_node(id_vertice, **(atributos or {}))
+        self._registrar_alteracao()
+        self._registrar_insercao(id_vertice)
         return True
         
     def adicionar_aresta(self, origem: Any, destino: Any, peso: float = 1.0, 
@@ -75,6 +100,8 @@ class Grafo:
         attr = atributos or {}
         attr["weight"] = peso
         self._grafo.add_edge(origem, destino, **attr)
+        self._registrar_alteracao()
+        self._registrar_insercao(origem, destino)
         return True
         
     def remover_vertice(self, id_vertice: Any) -> bool:
@@ -91,6 +118,7 @@ class Grafo:
             return False
             
         self._grafo.remove_node(id_vertice)
+        self._registrar_alteracao()
         return True
         
     def remover_aresta(self, origem: Any, destino: Any) -> bool:
@@ -108,6 +136,7 @@ class Grafo:
             return False
             
         self._grafo.remove_edge(origem, destino)
+        self._registrar_alteracao()
         return True
         
     def obter_vertices(self) -> List[Any]:
@@ -162,6 +191,7 @@ class Grafo:
 
         # Atualiza os atributos existentes com os novos
         self._grafo.nodes[id_vertice].update(atributos)
+        self._registrar_alteracao()
         
     def obter_atributos_aresta(self, origem: Any, destino: Any) -> Dict[str, Any]:
         """
@@ -199,6 +229,7 @@ class Grafo:
 
         # Atualiza os atributos existentes com os novos
         self._grafo.edges[origem, destino].update(atributos)
+        self._registrar_alteracao()
         
     def obter_peso_aresta(self, origem: Any, destino: Any) -> float:
         """
@@ -235,6 +266,7 @@ class Grafo:
             raise ValueError(f"Aresta ({origem}, {destino}) não existe no grafo.")
 
         self._grafo.edges[origem, destino]["weight"] = peso
+        self._registrar_alteracao()
         
     def obter_adjacentes(self, id_vertice: Any) -> List[Any]:
         """
@@ -366,17 +398,39 @@ class Grafo:
         
     def eh_conexo(self) -> bool:
         """
-        Verifica se o grafo é conexo.
+        Verifica se o grafo é conexo (fracamente conexo, se direcionado).
         
         Returns:
             bool: True se o grafo for conexo, False caso contrário.
         """
-        if self.eh_vazio():
-            return True
-        # Para grafos direcionados, verifica conectividade forte ou fraca
-        if self.eh_direcionado():
-            return nx.is_weakly_connected(self._grafo)
-        return nx.is_connected(self._grafo)
+        return self.obter_componentes().numero_componentes() <= 1
+        
+    def numero_componentes(self) -> int:
+        """
+        Obtém o número de componentes conexos (fracamente conexos, se direcionado).
+        
+        Returns:
+            int: Número de componentes conexos.
+        """
+        return self.obter_componentes().numero_componentes()
+        
+    def estao_conectados(self, u: Any, v: Any) -> bool:
+        """
+        Verifica se dois vértices estão no mesmo componente conexo.
+        
+        Em grafos direcionados, a direção das arestas é ignorada.
+        
+        Args:
+            u: Identificador de um vértice.
+            v: Identificador do outro vértice.
+            
+        Returns:
+            bool: True se existir um caminho entre u e v.
+            
+        Raises:
+            ValueError: Se algum dos vértices não existir no grafo.
+        """
+        return self.obter_componentes().conectados(u, v)
         
     def eh_direcionado(self) -> bool:
         """
@@ -476,6 +530,113 @@ class Grafo:
             grafo: Objeto NetworkX a ser utilizado.
         """
         self._grafo = grafo
+        self._registrar_alteracao()
+        
+    def obter_versao(self) -> int:
+        """
+        Obtém a versão atual do grafo.
+        
+        A versão é incrementada a cada alteração feita pelos métodos do grafo
+        (inclusive ``definir_grafo_networkx``). Alterações feitas diretamente no
+        objeto NetworkX retornado por ``obter_grafo_networkx`` não são contadas.
+        
+        Returns:
+            int: Número de alterações registradas.
+        """
+        return self._versao
+        
+    def obter_hash(self) -> str:
+        """
+        Obtém o hash de conteúdo do grafo.
+        
+        O hash considera o tipo, a direção, os vértices e as arestas com seus
+        atributos, mas não o nome do grafo nem a ordem de inserção. É calculado
+        uma vez por versão do grafo.
+        
+        Returns:
+            str: Hash SHA-256 em hexadecimal.
+        """
+        if self._hash is None or self._versao_hash != self._versao:
+            self._hash = calcular_hash_conteudo(self)
+            self._versao_hash = self._versao
+        return self._hash
+        
+    def obter_derivado(self, chave: str, construir: Callable[[], Any]) -> Any:
+        """
+        Obtém um resultado derivado do grafo, calculado uma vez por versão.
+        
+        Os resultados ficam no próprio grafo e são descartados na próxima
+        alteração, de modo que algoritmos que consultam o grafo várias vezes
+        (ou funções que dependem da mesma execução) compartilham o cálculo.
+        
+        Args:
+            chave: Identificador do resultado, incluindo os parâmetros que o afetam.
+            construir: Função sem argumentos que calcula o resultado.
+            
+        Returns:
+            Any: Resultado em cache ou recém-calculado.
+        """
+        derivados = self.__dict__.setdefault("_derivados", {})
+        if chave not in derivados:
+            derivados[chave] = construir()
+        return derivados[chave]
+        
+    def obter_csr(self) -> "GrafoCSR":
+        """
+        Obtém a representação CSR do grafo, com os pesos de ``obter_peso_aresta``.
+        
+        A representação contém apenas a adjacência e os pesos (sem as colunas
+        de atributos) e é construída uma vez por versão do grafo, para uso dos
+        algoritmos que percorrem o grafo muitas vezes.
+        
+        Returns:
+            GrafoCSR: Representação compacta do grafo.
+        """
+        # Importação local para evitar ciclo de importação
+        from .csr import GrafoCSR
+        return self.obter_derivado("csr", lambda: GrafoCSR.de_grafo(self, atributos=False))
+        
+    def obter_componentes(self) -> "ComponentesConexos":
+        """
+        Obtém a estrutura de componentes conexos do grafo.
+        
+        A estrutura é atualizada a cada vértice ou aresta adicionados pelos
+        métodos do grafo; após remoções (ou outras alterações), é reconstruída
+        na próxima consulta.
+        
+        Returns:
+            ComponentesConexos: Componentes da versão atual do grafo.
+        """
+        # Importação local para evitar ciclo de importação
+        from .conectividade import ComponentesConexos
+        if getattr(self, "_componentes", None) is None or self._versao_componentes != self._versao:
+            self._componentes = ComponentesConexos.de_csr(self.obter_csr())
+            self._versao_componentes = self._versao
+        return self._componentes
+        
+    def _registrar_alteracao(self) -> None:
+        """
+        Registra uma alteração no grafo, incrementando sua versão.
+        """
+        self._versao += 1
+        self._derivados = {}
+        
+    def _registrar_insercao(self, u: Any, v: Any = None) -> None:
+        """
+        Atualiza os componentes conexos com o vértice u ou a aresta (u, v) recém-inseridos.
+        
+        Deve ser chamado logo após ``_registrar_alteracao``. Se a estrutura
+        não corresponder à versão anterior do grafo, é deixada para ser
+        reconstruída na próxima consulta.
+        """
+        componentes = getattr(self, "_componentes", None)
+        if componentes is None or self._versao_componentes != self._versao - 1:
+            return
+        if v is None:
+            componentes.adicionar_vertice(u)
+        else:
+            componentes.unir(u, v)
+        self._versao_componentes = self._versao
         
     def __str__(self) -> str:
         """
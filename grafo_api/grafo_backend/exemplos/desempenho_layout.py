@@ -0,0 +1,90 @@
+"""
+Medição de desempenho dos layouts de força para grafos grandes.
+
+Executa os layouts Barnes-Hut e multinível sobre grades quadradas (cuja
+forma ideal é conhecida) e informa o tempo, o pico de memória e a razão
+entre o comprimento médio das arestas e a distância média entre pares
+aleatórios de vértices (quanto menor, mais "desdobrado" o layout; para uma
+grade de lado s, o valor ideal é cerca de 1 / (0,52 s)).
+
+Uso::
+
+    python -m grafo_backend.exemplos.desempenho_layout 10000 100000 1000000
+"""
+
+import argparse
+import resource
+import time
+import numpy as np
+import scipy.sparse as sp
+from grafo_backend.visualizacao.forca import calcular_layout_forca
+
+
+def gerar_grade(lado: int) -> sp.csr_matrix:
+    """
+    Gera a matriz de adjacência de uma grade lado x lado.
+
+    Args:
+        lado: Número de vértices em cada lado da grade.
+
+    Returns:
+        sp.csr_matrix: Matriz de adjacência simétrica.
+    """
+    caminho = sp.diags([np.ones(lado - 1), np.ones(lado - 1)], [-1, 1], shape=(lado, lado))
+    identidade = sp.identity(lado)
+    return (sp.kron(caminho, identidade) + sp.kron(identidade, caminho)).tocsr()
+
+
+def medir(numero_vertices: int, multinivel: bool = True, semente: int = 1) -> dict:
+    """
+    Mede um layout de força sobre a grade com aproximadamente numero_vertices vértices.
+
+    Args:
+        numero_vertices: Tamanho desejado do grafo.
+        multinivel: Se True, usa o layout multinível; caso contrário, Barnes-Hut em um nível.
+        semente: Semente do gerador de números aleatórios.
+
+    Returns:
+        dict: Tamanho do grafo, tempo em segundos, memória máxima em MB e razão de qualidade.
+    """
+    lado = int(round(np.sqrt(numero_vertices)))
+    adjacencia = gerar_grade(lado)
+
+    inicio = time.perf_counter()
+    posicoes = calcular_layout_forca(adjacencia, multinivel=multinivel, semente=semente)
+    tempo = time.perf_counter() - inicio
+
+    linhas, colunas = adjacencia.nonzero()
+    aresta = np.linalg.norm(posicoes[linhas] - posicoes[colunas], axis=1).mean()
+    gerador = np.random.default_rng(0)
+    i, j = gerador.integers(0, lado * lado, (2, 10000))
+    aleatorio = np.linalg.norm(posicoes[i] - posicoes[j], axis=1).mean()
+
+    return {
+        "vertices": lado * lado,
+        "arestas": adjacencia.nnz // 2,
+        "tempo": tempo,
+        "memoria_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "razao": aresta / aleatorio,
+        "razao_ideal": 1 / (0.52 * lado),
+    }
+
+
+def main():
+    """
+    Executa as medições para os tamanhos informados na linha de comando.
+    """
+    parser = argparse.ArgumentParser(description="Desempenho dos layouts de força")
+    parser.add_argument("tamanhos", nargs="*", type=int, default=[10_000, 100_000])
+    parser.add_argument("--barnes-hut", action="store_true", help="usa apenas Barnes-Hut, sem contração")
+    args = parser.parse_args()
+
+    print(f"{'vértices':>10} {'arestas':>10} {'tempo (s)':>10} {'memória (MB)':>13} {'razão':>8} {'ideal':>8}")
+    for tamanho in args.tamanhos:
+        resultado = medir(tamanho, multinivel=not args.barnes_hut)
+        print(f"{resultado['vertices']:>10} {resultado['arestas']:>10} {resultado['tempo']:>10.1f} "
+              f"{resultado['memoria_mb']:>13.0f} {resultado['razao']:>8.4f} {resultado['razao_ideal']:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,10 @@ from .importador import (
     importar_json,
     importar_csv,
     importar_csv_matriz_adjacencia,
-    importar_csv_lista_arestas
+    importar_csv_lista_arestas,
+    importar_binario,
+    carregar_binario,
+    importar_grafo
 )
 
 from .exportador import (
@@ -19,9 +22,20 @@ from .exportador import (
     exportar_json,
     exportar_csv,
     exportar_csv_matriz_adjacencia,
-    exportar_csv_lista_arestas
+    exportar_csv_lista_arestas,
+    gerar_graphml,
+    gerar_gml,
+    gerar_gexf,
+    gerar_json,
+    gerar_csv_matriz_adjacencia,
+    gerar_csv_lista_arestas,
+    codificar_em_blocos,
+    exportar_binario,
+    exportar_grafo
 )
 
+from .armazem import ArmazemGrafos
+
 __all__ = [
     'importar_graphml',
     'importar_gml',
@@ -30,11 +44,24 @@ __all__ = [
     'importar_csv',
     'importar_csv_matriz_adjacencia',
     'importar_csv_lista_arestas',
+    'importar_binario',
+    'carregar_binario',
+    'importar_grafo',
     'exportar_graphml',
     'exportar_gml',
     'exportar_gexf',
     'exportar_json',
     'exportar_csv',
     'exportar_csv_matriz_adjacencia',
-    'exportar_csv_lista_arestas'
+    'exportar_csv_lista_arestas',
+    'gerar_graphml',
+    'gerar_gml',
+    'gerar_gexf',
+    'gerar_json',
+    'gerar_csv_matriz_adjacencia',
+    'gerar_csv_lista_arestas',
+    'codificar_em_blocos',
+    'exportar_binario',
+    'exportar_grafo',
+    'ArmazemGrafos'
 ]
@@ -0,0 +1,159 @@
+"""
+Armazém de grafos endereçado por conteúdo.
+
+Cada grafo é gravado uma única vez no formato binário nativo, em um arquivo
+cujo nome é o hash de conteúdo do grafo (``Grafo.obter_hash``). Grafos
+idênticos, mesmo em projetos diferentes, compartilham o mesmo arquivo.
+
+Estrutura do diretório::
+
+    objetos/ab/abcdef....grafo
+"""
+
+import os
+from typing import Iterable, Optional, Set
+from grafo_backend.core.grafo import Grafo
+from grafo_backend.persistencia.exportador.binario import exportar_binario
+from grafo_backend.persistencia.importador.binario import importar_binario
+
+
+class ArmazemGrafos:
+    """
+    Armazém de arquivos binários de grafos, deduplicados pelo hash de conteúdo.
+    """
+
+    def __init__(self, diretorio: str):
+        """
+        Inicializa o armazém.
+
+        Args:
+            diretorio: Diretório raiz dos objetos (criado se não existir).
+        """
+        os.makedirs(diretorio, exist_ok=True)
+        self.diretorio = diretorio
+
+    def obter_caminho(self, hash_conteudo: str) -> str:
+        """
+        Obtém o caminho do arquivo de um objeto.
+
+        Args:
+            hash_conteudo: Hash de conteúdo do grafo.
+
+        Returns:
+            str: Caminho do arquivo (que pode não existir).
+
+        Raises:
+            ValueError: Se o hash não for um valor hexadecimal válido.
+        """
+        if len(hash_conteudo) < 3 or any(c not in "0123456789abcdef" for c in hash_conteudo):
+            raise ValueError(f"Hash de conteúdo inválido: {hash_conteudo!r}")
+        return os.path.join(self.diretorio, hash_conteudo[:2], f"{hash_conteudo}.grafo")
+
+    def contem(self, hash_conteudo: str) -> bool:
+        """
+        Verifica se um objeto está no armazém.
+
+        Args:
+            hash_conteudo: Hash de conteúdo do grafo.
+
+        Returns:
+            bool: True se o arquivo do objeto existe.
+        """
+        return os.path.exists(self.obter_caminho(hash_conteudo))
+
+    def gravar(self, grafo: Grafo) -> Optional[str]:
+        """
+        Grava um grafo no armazém, se ainda não houver um objeto idêntico.
+
+        Args:
+            grafo: Grafo a ser gravado.
+
+        Returns:
+            Optional[str]: Hash de conteúdo do grafo ou None se a gravação falhar.
+        """
+        hash_conteudo = grafo.obter_hash()
+        caminho = self.obter_caminho(hash_conteudo)
+        if os.path.exists(caminho):
+            return hash_conteudo
+
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        if not exportar_binario(grafo, caminho):
+            return None
+        return hash_conteudo
+
+    def gravar_arquivo(self, caminho_origem: str) -> Optional[str]:
+        """
+        Move para o armazém um arquivo binário de origem não confiável.
+
+        O grafo é carregado para que o hash seja calculado sobre o conteúdo
+        real, e não aceito de um manifesto externo.
+
+        Args:
+            caminho_origem: Arquivo no formato binário nativo. É removido ao final.
+
+        Returns:
+            Optional[str]: Hash de conteúdo do grafo ou None se o arquivo for inválido.
+        """
+        try:
+            grafo = importar_binario(caminho_origem)
+            if grafo is None:
+                return None
+
+            hash_conteudo = grafo.obter_hash()
+            caminho = self.obter_caminho(hash_conteudo)
+            if not os.path.exists(caminho):
+                os.makedirs(os.path.dirname(caminho), exist_ok=True)
+                os.replace(caminho_origem, caminho)
+            return hash_conteudo
+        finally:
+            if os.path.exists(caminho_origem):
+                os.remove(caminho_origem)
+
+    def carregar(self, hash_conteudo: str, nome: str = None) -> Optional[Grafo]:
+        """
+        Carrega um objeto do armazém como Grafo.
+
+        Args:
+            hash_conteudo: Hash de conteúdo do grafo.
+            nome: Nome a ser atribuído ao grafo (opcional).
+
+        Returns:
+            Optional[Grafo]: Grafo carregado ou None se o objeto não existir.
+        """
+        return importar_binario(self.obter_caminho(hash_conteudo), nome)
+
+    def listar(self) -> Set[str]:
+        """
+        Lista os hashes de todos os objetos do armazém.
+
+        Returns:
+            Set[str]: Hashes dos objetos.
+        """
+        hashes = set()
+        for prefixo in os.listdir(self.diretorio):
+            diretorio = os.path.join(self.diretorio, prefixo)
+            if not os.path.isdir(diretorio):
+                continue
+            for arquivo in os.listdir(diretorio):
+                if arquivo.endswith('.grafo'):
+                    hashes.add(arquivo[:-6])
+        return hashes
+
+    def remover_nao_referenciados(self, candidatos: Iterable[str], referenciados: Set[str]) -> int:
+        """
+        Remove objetos candidatos que não são mais referenciados.
+
+        Args:
+            candidatos: Hashes que podem ter deixado de ser usados.
+            referenciados: Hashes ainda referenciados por algum projeto.
+
+        Returns:
+            int: Número de objetos removidos.
+        """
+        removidos = 0
+        for hash_conteudo in set(candidatos) - referenciados:
+            caminho = self.obter_caminho(hash_conteudo)
+            if os.path.exists(caminho):
+                os.remove(caminho)
+                removidos += 1
+        return removidos
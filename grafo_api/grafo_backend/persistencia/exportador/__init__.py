@@ -2,11 +2,20 @@
 Módulo de inicialização para exportadores de grafos.
 """
 
-from .graphml import exportar_graphml
-from .gml import exportar_gml
-from .gexf import exportar_gexf
-from .json import exportar_json
-from .csv import exportar_csv, exportar_csv_matriz_adjacencia, exportar_csv_lista_arestas
+from .graphml import exportar_graphml, gerar_graphml
+from .gml import exportar_gml, gerar_gml
+from .gexf import exportar_gexf, gerar_gexf
+from .json import exportar_json, gerar_json
+from .csv import (
+    exportar_csv,
+    exportar_csv_matriz_adjacencia,
+    exportar_csv_lista_arestas,
+    gerar_csv_matriz_adjacencia,
+    gerar_csv_lista_arestas
+)
+from .fluxo import codificar_em_blocos
+from .binario import exportar_binario
+from .conteudo import exportar_grafo
 
 __all__ = [
     'exportar_graphml',
@@ -15,5 +24,14 @@ __all__ = [
     'exportar_json',
     'exportar_csv',
     'exportar_csv_matriz_adjacencia',
-    'exportar_csv_lista_arestas'
+    'exportar_csv_lista_arestas',
+    'gerar_graphml',
+    'gerar_gml',
+    'gerar_gexf',
+    'gerar_json',
+    'gerar_csv_matriz_adjacencia',
+    'gerar_csv_lista_arestas',
+    'codificar_em_blocos',
+    'exportar_binario',
+    'exportar_grafo'
 ]
@@ -0,0 +1,211 @@
+"""
+Implementação de exportação de grafos para o formato binário nativo.
+
+Este módulo contém funções para exportar grafos para o formato binário nativo
+(extensão ``.grafo``), que armazena a representação CSR do grafo de forma que
+possa ser mapeada em memória com ``numpy.memmap`` na importação.
+
+Estrutura do arquivo:
+
+- Prefixo de 64 bytes: assinatura ``GRAFOCSR``, versão, deslocamento e
+  tamanho do descritor.
+- Seções de dados, cada uma alinhada a 64 bytes: ``indptr``, ``indices``,
+  ``pesos``, tabela de identificadores, colunas de atributos e conjuntos
+  (grafos bipartidos).
+- Descritor JSON (no final do arquivo) com metadados do grafo e, para cada
+  seção, deslocamento, dtype e número de elementos.
+"""
+
+import json
+import os
+import struct
+import tempfile
+import numpy as np
+from typing import Dict, List, Any, Union
+from grafo_backend.core.grafo import Grafo
+from grafo_backend.core.csr import GrafoCSR, TabelaTexto, ColunaAtributo, codificar_json, decodificar_json
+
+
+# Assinatura e versão do formato
+MAGICO = b"GRAFOCSR"
+VERSAO = 1
+
+# Alinhamento das seções e tamanho do prefixo (em bytes)
+ALINHAMENTO = 64
+TAMANHO_PREFIXO = 64
+
+# Assinatura, versão, reservado, deslocamento e tamanho do descritor
+PREFIXO = struct.Struct("<8sIIQQ")
+
+
+def _codificar_ids(ids: List[Any]) -> List[str]:
+    """
+    Serializa os identificadores em JSON, exigindo que cada um seja lido de volta igual.
+
+    Raises:
+        ValueError: Se algum identificador não puder ser reconstruído a partir do JSON.
+    """
+    textos = []
+    for vertice in ids:
+        texto = codificar_json(vertice)
+        if decodificar_json(texto) != vertice:
+            raise ValueError(f"Identificador de vértice '{vertice!r}' não pode ser gravado no formato binário.")
+        textos.append(texto)
+    return textos
+
+
+class _EscritorSecoes:
+    """
+    Escreve arrays sequencialmente no arquivo, alinhados, registrando suas posições.
+    """
+
+    def __init__(self, arquivo):
+        self.arquivo = arquivo
+        self.secoes: Dict[str, Dict[str, Any]] = {}
+
+    def escrever(self, nome: str, array: np.ndarray) -> None:
+        """
+        Escreve um array como uma nova seção.
+
+        Args:
+            nome: Nome da seção.
+            array: Array a ser escrito.
+        """
+        # Preenche até a próxima posição alinhada
+        posicao = self.arquivo.tell()
+        resto = posicao % ALINHAMENTO
+        if resto:
+            self.arquivo.write(b"\0" * (ALINHAMENTO - resto))
+            posicao += ALINHAMENTO - resto
+
+        array = np.ascontiguousarray(array)
+        self.secoes[nome] = {
+            "offset": posicao,
+            "dtype": array.dtype.str,
+            "tamanho": int(array.size)
+        }
+        if array.size:
+            self.arquivo.write(memoryview(array).cast("B"))
+
+    def escrever_texto(self, prefixo: str, tabela: TabelaTexto) -> None:
+        """
+        Escreve uma TabelaTexto como duas seções (deslocamentos e dados).
+        """
+        self.escrever(f"{prefixo}.deslocamentos", tabela.deslocamentos.astype(np.int64))
+        self.escrever(f"{prefixo}.dados", tabela.dados.astype(np.uint8))
+
+    def escrever_colunas(self, prefixo: str, colunas: Dict[str, ColunaAtributo]) -> List[Dict[str, Any]]:
+        """
+        Escreve colunas de atributos e retorna seus descritores.
+        """
+        descritores = []
+        for i, (nome, coluna) in enumerate(colunas.items()):
+            secao = f"{prefixo}.{i}"
+            self.escrever(f"{secao}.presente", np.asarray(coluna.presente, dtype=np.bool_))
+            if coluna.tipo == "json":
+                self.escrever_texto(f"{secao}.valores", coluna.valores)
+            else:
+                self.escrever(f"{secao}.valores", np.asarray(coluna.valores))
+            descritores.append({"nome": nome, "tipo": coluna.tipo, "secao": secao})
+        return descritores
+
+
+def escrever_binario(csr: GrafoCSR, caminho: str) -> None:
+    """
+    Escreve a representação CSR de um grafo no formato binário nativo.
+
+    O arquivo é escrito em um caminho temporário e movido para o destino ao
+    final, de modo que leitores que já mapearam a versão anterior continuam
+    vendo um arquivo consistente.
+
+    Args:
+        csr: Grafo em formato CSR.
+        caminho: Caminho do arquivo de saída.
+
+    Raises:
+        OSError: Se não for possível escrever o arquivo.
+        ValueError: Se algum identificador de vértice não puder ser gravado.
+    """
+    # Identificadores que não são todos inteiros nem todos textos vão em JSON,
+    # validados antes de criar o arquivo
+    ids = csr.ids
+    ids_json = None
+    if not isinstance(ids, TabelaTexto) and not (isinstance(ids, np.ndarray) and ids.dtype.kind in "iu"):
+        ids_json = TabelaTexto.de_lista(_codificar_ids(ids))
+
+    # Arquivo temporário exclusivo no diretório de destino: gravações
+    # simultâneas no mesmo caminho não escrevem no mesmo temporário
+    descritor_arquivo, caminho_temporario = tempfile.mkstemp(
+        suffix=".tmp", dir=os.path.dirname(os.path.abspath(caminho)))
+    try:
+        with os.fdopen(descritor_arquivo, 'wb') as arquivo:
+            # Reserva o prefixo; ele é preenchido após o descritor
+            arquivo.write(b"\0" * TAMANHO_PREFIXO)
+            escritor = _EscritorSecoes(arquivo)
+
+            escritor.escrever("indptr", csr.indptr.astype(np.int64, copy=False))
+            escritor.escrever("indices", csr.indices)
+            escritor.escrever("pesos", csr.pesos.astype(np.float64, copy=False))
+
+            # Tabela de identificadores
+            if isinstance(ids, TabelaTexto):
+                tipo_ids = "texto"
+                escritor.escrever_texto("ids", ids)
+            elif ids_json is not None:
+                tipo_ids = "json"
+                escritor.escrever_texto("ids", ids_json)
+            else:
+                tipo_ids = "inteiro"
+                escritor.escrever("ids", ids.astype(np.int64, copy=False))
+
+            atributos_vertices = escritor.escrever_colunas("vertice", csr.atributos_vertices)
+            atributos_arestas = escritor.escrever_colunas("aresta", csr.atributos_arestas)
+
+            if csr.conjuntos is not None:
+                escritor.escrever("conjuntos", np.asarray(csr.conjuntos, dtype=np.uint8))
+
+            # Descritor no final do arquivo
+            descritor = json.dumps({
+                "nome": csr.nome,
+                "tipo": csr.tipo,
+                "direcionado": csr.direcionado,
+                "num_vertices": csr.numero_vertices(),
+                "num_arestas": csr.numero_arestas(),
+                "ids": tipo_ids,
+                "atributos_vertices": atributos_vertices,
+                "atributos_arestas": atributos_arestas,
+                "secoes": escritor.secoes
+            }).encode("utf-8")
+            posicao_descritor = arquivo.tell()
+            arquivo.write(descritor)
+
+            arquivo.seek(0)
+            arquivo.write(PREFIXO.pack(MAGICO, VERSAO, 0, posicao_descritor, len(descritor)))
+
+        os.replace(caminho_temporario, caminho)
+    except BaseException:
+        os.unlink(caminho_temporario)
+        raise
+
+
+def exportar_binario(grafo: Union[Grafo, GrafoCSR], caminho: str) -> bool:
+    """
+    Exporta um grafo para o formato binário nativo.
+
+    Args:
+        grafo: Grafo a ser exportado (Grafo ou GrafoCSR).
+        caminho: Caminho do arquivo de saída.
+
+    Returns:
+        bool: True se a exportação foi bem-sucedida, False caso contrário.
+    """
+    try:
+        # Converte para CSR, se necessário
+        csr = grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.de_grafo(grafo)
+
+        escrever_binario(csr, caminho)
+
+        return True
+    except Exception as e:
+        print(f"Erro ao exportar grafo para o formato binário: {e}")
+        return False
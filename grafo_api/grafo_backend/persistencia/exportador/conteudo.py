@@ -0,0 +1,46 @@
+"""
+Exportação de grafos para conteúdo em memória.
+
+Este módulo contém a função ``exportar_grafo``, que produz a representação
+textual de um grafo em qualquer formato suportado sem passar por arquivos.
+"""
+
+from typing import Optional
+from grafo_backend.core.grafo import Grafo
+from grafo_backend.persistencia.exportador.graphml import gerar_graphml
+from grafo_backend.persistencia.exportador.gml import gerar_gml
+from grafo_backend.persistencia.exportador.gexf import gerar_gexf
+from grafo_backend.persistencia.exportador.json import gerar_json
+from grafo_backend.persistencia.exportador.csv import gerar_csv_lista_arestas, gerar_csv_matriz_adjacencia
+
+
+# Geradores de texto por formato
+GERADORES = {
+    "graphml": gerar_graphml,
+    "gml": gerar_gml,
+    "gexf": gerar_gexf,
+    "json": gerar_json,
+    "csv": gerar_csv_lista_arestas,
+    "csv_matriz": gerar_csv_matriz_adjacencia
+}
+
+
+def exportar_grafo(grafo: Grafo, formato: str = "graphml") -> Optional[str]:
+    """
+    Exporta um grafo para uma string no formato especificado.
+
+    Args:
+        grafo: Grafo a ser exportado.
+        formato: Formato de exportação (graphml, gml, gexf, json, csv, csv_matriz).
+
+    Returns:
+        Optional[str]: Conteúdo exportado ou None se a exportação falhar.
+    """
+    try:
+        if formato not in GERADORES:
+            raise ValueError(f"Formato '{formato}' inválido. Formatos válidos: {', '.join(GERADORES)}")
+
+        return "".join(GERADORES[formato](grafo))
+    except Exception as e:
+        print(f"Erro ao exportar grafo para {formato}: {e}")
+        return None
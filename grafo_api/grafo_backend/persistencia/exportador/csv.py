@@ -7,11 +7,89 @@ representando a matriz de adjacência ou a lista de arestas do grafo.
 
 import networkx as nx
 import csv
+import io
 import os
-from typing import Dict, List, Any, Optional, Literal
+from typing import Dict, List, Any, Optional, Literal, Iterator, Iterable
 from grafo_backend.core.grafo import Grafo
 
 
+def _formatar_linhas_csv(linhas: Iterable[List[str]]) -> Iterator[str]:
+    """
+    Converte linhas (listas de campos) em texto CSV, uma linha por vez.
+    """
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+    for linha in linhas:
+        escritor.writerow(linha)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+
+def gerar_csv_matriz_adjacencia(grafo: Grafo) -> Iterator[str]:
+    """
+    Gera a matriz de adjacência de um grafo em CSV, uma linha por vez.
+
+    Args:
+        grafo: Grafo a ser exportado.
+
+    Returns:
+        Iterator[str]: Linhas do documento CSV.
+    """
+    # Obtém o grafo NetworkX subjacente
+    g_nx = grafo.obter_grafo_networkx()
+
+    # Obtém a lista de vértices
+    vertices = list(g_nx.nodes())
+    posicoes = {v: i for i, v in enumerate(vertices)}
+
+    def linhas():
+        # Linha de cabeçalho com os vértices
+        yield [''] + [str(v) for v in vertices]
+
+        # Para cada vértice, uma linha com os pesos das arestas
+        for v1 in vertices:
+            linha = ['0'] * len(vertices)
+            for v2, atributos in g_nx.adj[v1].items():
+                linha[posicoes[v2]] = str(atributos.get('weight', 1.0))
+            yield [str(v1)] + linha
+
+    yield from _formatar_linhas_csv(linhas())
+
+
+def gerar_csv_lista_arestas(grafo: Grafo) -> Iterator[str]:
+    """
+    Gera a lista de arestas de um grafo em CSV, uma linha por vez.
+
+    Args:
+        grafo: Grafo a ser exportado.
+
+    Returns:
+        Iterator[str]: Linhas do documento CSV.
+    """
+    # Obtém o grafo NetworkX subjacente
+    g_nx = grafo.obter_grafo_networkx()
+
+    def linhas():
+        # Linha de cabeçalho
+        yield ['origem', 'destino', 'peso']
+
+        # Para cada aresta, uma linha com origem, destino e peso
+        for origem, destino, atributos in g_nx.edges(data=True):
+            yield [str(origem), str(destino), str(atributos.get('weight', 1.0))]
+
+    yield from _formatar_linhas_csv(linhas())
+
+
+def _escrever_arquivo(caminho: str, partes: Iterable[str]) -> None:
+    """
+    Escreve os fragmentos gerados em um arquivo CSV.
+    """
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        for parte in partes:
+            arquivo.write(parte)
+
+
 def exportar_csv_matriz_adjacencia(grafo: Grafo, caminho: str) -> bool:
     """
     Exporta um grafo para o formato CSV como matriz de adjacência.
@@ -24,35 +102,7 @@ def exportar_csv_matriz_adjacencia(grafo: Grafo, caminho: str) -> bool:
         bool: True se a exportação foi bem-sucedida, False caso contrário.
     """
     try:
-        # Obtém o grafo NetworkX subjacente
-        g_nx = grafo.obter_grafo_networkx()
-        
-        # Obtém a lista de vértices
-        vertices = list(g_nx.nodes())
-        
-        # Cria a matriz de adjacência
-        matriz = []
-        
-        # Adiciona a linha de cabeçalho com os vértices
-        cabecalho = [''] + [str(v) for v in vertices]
-        matriz.append(cabecalho)
-        
-        # Para cada vértice, adiciona uma linha com os pesos das arestas
-        for v1 in vertices:
-            linha = [str(v1)]
-            for v2 in vertices:
-                if g_nx.has_edge(v1, v2):
-                    peso = g_nx[v1][v2].get('weight', 1.0)
-                    linha.append(str(peso))
-                else:
-                    linha.append('0')
-            matriz.append(linha)
-        
-        # Exporta para CSV
-        with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
-            escritor = csv.writer(arquivo)
-            for linha in matriz:
-                escritor.writerow(linha)
+        _escrever_arquivo(caminho, gerar_csv_matriz_adjacencia(grafo))
         
         return True
     except Exception as e:
@@ -72,26 +122,7 @@ def exportar_csv_lista_arestas(grafo: Grafo, caminho: str) -> bool:
         bool: True se a exportação foi bem-sucedida, False caso contrário.
     """
     try:
-        # Obtém o grafo NetworkX subjacente
-        g_nx = grafo.obter_grafo_networkx()
-        
-        # Cria a lista de arestas
-        arestas = []
-        
-        # Adiciona a linha de cabeçalho
-        cabecalho = ['origem', 'destino', 'peso']
-        arestas.append(cabecalho)
-        
-        # Para cada aresta, adiciona uma linha com origem, destino e peso
-        for origem, destino, atributos in g_nx.edges(data=True):
-            peso = atributos.get('weight', 1.0)
-            arestas.append([str(origem), str(destino), str(peso)])
-        
-        # Exporta para CSV
-        with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
-            escritor = csv.writer(arquivo)
-            for linha in arestas:
-                escritor.writerow(linha)
+        _escrever_arquivo(caminho, gerar_csv_lista_arestas(grafo))
         
         return True
     except Exception as e:
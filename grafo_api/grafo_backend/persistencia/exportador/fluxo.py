@@ -0,0 +1,103 @@
+"""
+Utilitários para exportação de grafos em fluxo.
+
+Este módulo contém funções para converter os fragmentos de texto produzidos
+pelos geradores de exportação em blocos de bytes de tamanho limitado, com
+compactação gzip opcional feita durante a transmissão.
+"""
+
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+
+# Tamanho aproximado (em bytes) de cada bloco enviado
+TAMANHO_BLOCO_PADRAO = 64 * 1024
+
+
+def codificar_em_blocos(partes: Iterable[str], tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                        compactar: bool = False) -> Iterator[bytes]:
+    """
+    Agrupa fragmentos de texto em blocos de bytes UTF-8.
+
+    Os fragmentos são acumulados até atingir ``tamanho_bloco`` bytes, de modo
+    que a memória usada é limitada pelo tamanho do bloco, e não pelo tamanho
+    total da exportação.
+
+    Args:
+        partes: Fragmentos de texto a serem codificados.
+        tamanho_bloco: Tamanho aproximado de cada bloco em bytes.
+        compactar: Se True, compacta o fluxo no formato gzip.
+
+    Returns:
+        Iterator[bytes]: Blocos de bytes prontos para envio ou escrita.
+    """
+    # wbits=31 produz cabeçalho e rodapé gzip
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compactar else None
+
+    buffer = []
+    tamanho = 0
+    for parte in partes:
+        dados = parte.encode("utf-8")
+        buffer.append(dados)
+        tamanho += len(dados)
+
+        if tamanho >= tamanho_bloco:
+            bloco = b"".join(buffer)
+            buffer = []
+            tamanho = 0
+
+            if compressor is not None:
+                bloco = compressor.compress(bloco)
+            if bloco:
+                yield bloco
+
+    # Envia o restante do buffer
+    bloco = b"".join(buffer)
+    if compressor is not None:
+        bloco = compressor.compress(bloco) + compressor.flush()
+    if bloco:
+        yield bloco
+
+
+def coletar_tipos_atributos(dicionarios: Iterable[Dict[str, Any]],
+                            ignorar: Tuple[str, ...] = ()) -> Dict[str, type]:
+    """
+    Percorre dicionários de atributos e determina o tipo de cada chave.
+
+    Usado pelos formatos XML, que precisam declarar os atributos antes dos
+    vértices e arestas. Apenas as chaves e seus tipos são mantidos em memória.
+    Tipos conflitantes são promovidos (``int`` + ``float`` vira ``float``;
+    qualquer outra combinação vira ``str``).
+
+    Args:
+        dicionarios: Dicionários de atributos de vértices ou arestas.
+        ignorar: Chaves que não devem ser declaradas.
+
+    Returns:
+        Dict[str, type]: Mapeamento de nome do atributo para bool, int, float ou str.
+    """
+    tipos: Dict[str, type] = {}
+    for atributos in dicionarios:
+        for chave, valor in atributos.items():
+            if chave in ignorar:
+                continue
+
+            tipo = type(valor) if type(valor) in (bool, int, float) else str
+            anterior = tipos.get(chave)
+            if anterior is None or anterior is tipo:
+                tipos[chave] = tipo
+            elif {anterior, tipo} == {int, float}:
+                tipos[chave] = float
+            else:
+                tipos[chave] = str
+
+    return tipos
+
+
+def formatar_valor_xml(valor: Any) -> str:
+    """
+    Converte um valor de atributo em texto para os formatos XML.
+    """
+    if isinstance(valor, bool):
+        return "true" if valor else "false"
+    return str(valor)
@@ -5,9 +5,89 @@ Este módulo contém funções para exportar grafos para o formato GEXF (Graph E
 um formato XML para representação de grafos, especialmente utilizado pelo software Gephi.
 """
 
-import networkx as nx
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Iterator
+from xml.sax.saxutils import quoteattr
 from grafo_backend.core.grafo import Grafo
+from grafo_backend.persistencia.exportador.fluxo import coletar_tipos_atributos, formatar_valor_xml
+
+
+# Tipos GEXF correspondentes aos tipos Python
+_TIPOS_GEXF = {bool: "boolean", int: "long", float: "double", str: "string"}
+
+
+def gerar_gexf(grafo: Grafo) -> Iterator[str]:
+    """
+    Gera o documento GEXF de um grafo em fragmentos de texto.
+
+    O peso das arestas é escrito no atributo ``weight`` do elemento ``<edge>``;
+    os demais atributos são declarados em ``<attributes>`` e emitidos como
+    ``<attvalues>``, um vértice ou aresta por vez.
+
+    Args:
+        grafo: Grafo a ser exportado.
+
+    Returns:
+        Iterator[str]: Fragmentos do documento GEXF.
+    """
+    # Obtém o grafo NetworkX subjacente
+    g_nx = grafo.obter_grafo_networkx()
+
+    # Coleta os atributos declarados
+    tipos_vertices = coletar_tipos_atributos(
+        (atributos for _, atributos in g_nx.nodes(data=True)), ignorar=("label",))
+    tipos_arestas = coletar_tipos_atributos(
+        (atributos for _, _, atributos in g_nx.edges(data=True)), ignorar=("weight", "id", "label"))
+    ids_vertices = {nome: str(i) for i, nome in enumerate(tipos_vertices)}
+    ids_arestas = {nome: str(i) for i, nome in enumerate(tipos_arestas)}
+
+    direcao = "directed" if g_nx.is_directed() else "undirected"
+    yield "<?xml version='1.0' encoding='utf-8'?>\n"
+    yield '<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">\n'
+    yield f'  <graph defaultedgetype="{direcao}" mode="static" name={quoteattr(str(grafo.nome))}>\n'
+
+    for classe, tipos, ids in (("node", tipos_vertices, ids_vertices),
+                               ("edge", tipos_arestas, ids_arestas)):
+        if not tipos:
+            continue
+        yield f'    <attributes class="{classe}" mode="static">\n'
+        for nome, tipo in tipos.items():
+            yield (f'      <attribute id="{ids[nome]}" title={quoteattr(str(nome))} '
+                   f'type="{_TIPOS_GEXF[tipo]}" />\n')
+        yield '    </attributes>\n'
+
+    # Emite os vértices
+    yield '    <nodes>\n'
+    for vertice, atributos in g_nx.nodes(data=True):
+        rotulo = atributos.get("label", vertice)
+        abertura = f'      <node id={quoteattr(str(vertice))} label={quoteattr(str(rotulo))}'
+        valores = _gerar_attvalues(atributos, ids_vertices)
+        yield f'{abertura}>{valores}</node>\n' if valores else f'{abertura} />\n'
+    yield '    </nodes>\n'
+
+    # Emite as arestas
+    yield '    <edges>\n'
+    for indice, (origem, destino, atributos) in enumerate(g_nx.edges(data=True)):
+        abertura = (f'      <edge id="{indice}" source={quoteattr(str(origem))} '
+                    f'target={quoteattr(str(destino))}')
+        if "weight" in atributos:
+            abertura += f' weight="{atributos["weight"]}"'
+        valores = _gerar_attvalues(atributos, ids_arestas)
+        yield f'{abertura}>{valores}</edge>\n' if valores else f'{abertura} />\n'
+    yield '    </edges>\n'
+
+    yield '  </graph>\n'
+    yield '</gexf>\n'
+
+
+def _gerar_attvalues(atributos: Dict[str, Any], ids: Dict[str, str]) -> str:
+    """
+    Gera o elemento ``<attvalues>`` de um vértice ou aresta.
+    """
+    partes = [f'<attvalue for="{ids[nome]}" value={quoteattr(formatar_valor_xml(valor))} />'
+              for nome, valor in atributos.items() if nome in ids]
+    if not partes:
+        return ""
+    return "<attvalues>" + "".join(partes) + "</attvalues>"
 
 
 def exportar_gexf(grafo: Grafo, caminho: str) -> bool:
@@ -22,11 +102,10 @@ def exportar_gexf(grafo: Grafo, caminho: str) -> bool:
         bool: True se a exportação foi bem-sucedida, False caso contrário.
     """
     try:
-        # Obtém o grafo NetworkX subjacente
-        g_nx = grafo.obter_grafo_networkx()
-        
-        # Exporta o grafo para o formato GEXF
-        nx.write_gexf(g_nx, caminho)
+        # Escreve o documento GEXF gerado em partes
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            for parte in gerar_gexf(grafo):
+                arquivo.write(parte)
         
         return True
     except Exception as e:
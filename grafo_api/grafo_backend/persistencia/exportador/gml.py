@@ -6,10 +6,25 @@ um formato de texto para representação de grafos.
 """
 
 import networkx as nx
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 from grafo_backend.core.grafo import Grafo
 
 
+def gerar_gml(grafo: Grafo) -> Iterator[str]:
+    """
+    Gera o documento GML de um grafo linha a linha.
+
+    Args:
+        grafo: Grafo a ser exportado.
+
+    Returns:
+        Iterator[str]: Linhas do documento GML, terminadas por quebra de linha.
+    """
+    # O gerador do NetworkX já produz o documento incrementalmente
+    for linha in nx.generate_gml(grafo.obter_grafo_networkx()):
+        yield linha + "\n"
+
+
 def exportar_gml(grafo: Grafo, caminho: str) -> bool:
     """
     Exporta um grafo para o formato GML.
@@ -22,11 +37,10 @@ def exportar_gml(grafo: Grafo, caminho: str) -> bool:
         bool: True se a exportação foi bem-sucedida, False caso contrário.
     """
     try:
-        # Obtém o grafo NetworkX subjacente
-        g_nx = grafo.obter_grafo_networkx()
-        
-        # Exporta o grafo para o formato GML
-        nx.write_gml(g_nx, caminho)
+        # Escreve o documento GML gerado em partes
+        with open(caminho, 'w', encoding='ascii') as arquivo:
+            for parte in gerar_gml(grafo):
+                arquivo.write(parte)
         
         return True
     except Exception as e:
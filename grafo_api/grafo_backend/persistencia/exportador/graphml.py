@@ -5,30 +5,105 @@ Este módulo contém funções para exportar grafos para o formato GraphML,
 um formato baseado em XML para representação de grafos.
 """
 
-import networkx as nx
-import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Iterator
+from xml.sax.saxutils import escape, quoteattr
 from grafo_backend.core.grafo import Grafo
+from grafo_backend.persistencia.exportador.fluxo import coletar_tipos_atributos, formatar_valor_xml
+
+
+# Tipos GraphML correspondentes aos tipos Python (mesma convenção do NetworkX)
+_TIPOS_GRAPHML = {bool: "boolean", int: "long", float: "double", str: "string"}
+
+
+def gerar_graphml(grafo: Grafo) -> Iterator[str]:
+    """
+    Gera o documento GraphML de um grafo em fragmentos de texto.
+
+    Os atributos são declarados após uma primeira passada que coleta apenas
+    as chaves; em seguida cada vértice e aresta é emitido individualmente, sem
+    montar a árvore XML inteira em memória.
+
+    Args:
+        grafo: Grafo a ser exportado.
+
+    Returns:
+        Iterator[str]: Fragmentos do documento GraphML.
+    """
+    # Obtém o grafo NetworkX subjacente
+    g_nx = grafo.obter_grafo_networkx()
+
+    # Declara as chaves de atributos de vértices e arestas
+    tipos_vertices = coletar_tipos_atributos(atributos for _, atributos in g_nx.nodes(data=True))
+    tipos_arestas = coletar_tipos_atributos(atributos for _, _, atributos in g_nx.edges(data=True))
+
+    yield "<?xml version='1.0' encoding='utf-8'?>\n"
+    yield ('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+           'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+           'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+           'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
+
+    chaves_vertices = {}
+    chaves_arestas = {}
+    for dominio, tipos, chaves in (("node", tipos_vertices, chaves_vertices),
+                                   ("edge", tipos_arestas, chaves_arestas)):
+        for nome, tipo in tipos.items():
+            chave = f"d{len(chaves_vertices) + len(chaves_arestas)}"
+            chaves[nome] = chave
+            yield (f'  <key id="{chave}" for="{dominio}" attr.name={quoteattr(str(nome))} '
+                   f'attr.type="{_TIPOS_GRAPHML[tipo]}" />\n')
+
+    direcao = "directed" if g_nx.is_directed() else "undirected"
+    yield f'  <graph edgedefault="{direcao}">\n'
+
+    # Emite os vértices
+    for vertice, atributos in g_nx.nodes(data=True):
+        dados = _gerar_dados(atributos, chaves_vertices)
+        if dados:
+            yield f'    <node id={quoteattr(str(vertice))}>{dados}</node>\n'
+        else:
+            yield f'    <node id={quoteattr(str(vertice))} />\n'
+
+    # Emite as arestas
+    for origem, destino, atributos in g_nx.edges(data=True):
+        dados = _gerar_dados(atributos, chaves_arestas)
+        abertura = f'    <edge source={quoteattr(str(origem))} target={quoteattr(str(destino))}'
+        if dados:
+            yield f'{abertura}>{dados}</edge>\n'
+        else:
+            yield f'{abertura} />\n'
+
+    yield '  </graph>\n'
+    yield '</graphml>\n'
+
+
+def _gerar_dados(atributos: Dict[str, Any], chaves: Dict[str, str]) -> str:
+    """
+    Gera os elementos ``<data>`` de um vértice ou aresta.
+    """
+    partes = []
+    for nome, valor in atributos.items():
+        texto = formatar_valor_xml(valor)
+        partes.append(f'<data key="{chaves[nome]}">{escape(texto)}</data>')
+    return "".join(partes)
 
 
 def exportar_graphml(grafo: Grafo, caminho: str) -> bool:
     """
     Exporta um grafo para o formato GraphML.
-    
+
     Args:
         grafo: Grafo a ser exportado.
         caminho: Caminho do arquivo de saída.
-        
+
     Returns:
         bool: True se a exportação foi bem-sucedida, False caso contrário.
     """
     try:
-        # Obtém o grafo NetworkX subjacente
-        g_nx = grafo.obter_grafo_networkx()
-        
-        # Exporta o grafo para o formato GraphML
-        nx.write_graphml(g_nx, caminho)
-        
+        # Escreve o documento GraphML gerado em partes
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            for parte in gerar_graphml(grafo):
+                arquivo.write(parte)
+
         return True
     except Exception as e:
         print(f"Erro ao exportar grafo para GraphML: {e}")
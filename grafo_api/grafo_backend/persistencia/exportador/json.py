@@ -7,10 +7,58 @@ um formato de texto estruturado para representação de dados.
 
 import networkx as nx
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 from grafo_backend.core.grafo import Grafo
 
 
+def gerar_json(grafo: Grafo, cabecalho: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """
+    Gera o documento JSON de um grafo em fragmentos de texto.
+
+    O documento tem a forma ``{"nome", "vertices": [...], "arestas": [...]}``
+    e é emitido um vértice ou aresta por linha, sem montar o dicionário
+    completo em memória.
+
+    Args:
+        grafo: Grafo a ser exportado.
+        cabecalho: Campos adicionais emitidos antes dos vértices. Se None,
+            apenas o nome do grafo é incluído.
+
+    Returns:
+        Iterator[str]: Fragmentos do documento JSON.
+    """
+    # Obtém o grafo NetworkX subjacente
+    g_nx = grafo.obter_grafo_networkx()
+
+    if cabecalho is None:
+        cabecalho = {"nome": grafo.nome}
+
+    yield "{\n"
+    for chave, valor in cabecalho.items():
+        yield f"  {json.dumps(chave)}: {json.dumps(valor)},\n"
+
+    # Adiciona os vértices
+    yield '  "vertices": ['
+    separador = "\n    "
+    for vertice, atributos in g_nx.nodes(data=True):
+        yield separador + json.dumps({"id": vertice, "atributos": atributos})
+        separador = ",\n    "
+    yield "\n  ],\n"
+
+    # Adiciona as arestas
+    yield '  "arestas": ['
+    separador = "\n    "
+    for origem, destino, atributos in g_nx.edges(data=True):
+        yield separador + json.dumps({
+            "origem": origem,
+            "destino": destino,
+            "peso": atributos.get("weight", 1.0),
+            "atributos": atributos
+        })
+        separador = ",\n    "
+    yield "\n  ]\n}\n"
+
+
 def exportar_json(grafo: Grafo, caminho: str) -> bool:
     """
     Exporta um grafo para o formato JSON.
@@ -23,36 +71,10 @@ def exportar_json(grafo: Grafo, caminho: str) -> bool:
         bool: True se a exportação foi bem-sucedida, False caso contrário.
     """
     try:
-        # Obtém o grafo NetworkX subjacente
-        g_nx = grafo.obter_grafo_networkx()
-        
-        # Converte o grafo para um dicionário
-        dados = {
-            "nome": grafo.nome,
-            "vertices": [],
-            "arestas": []
-        }
-        
-        # Adiciona os vértices
-        for vertice in g_nx.nodes():
-            atributos = dict(g_nx.nodes[vertice])
-            dados["vertices"].append({
-                "id": vertice,
-                "atributos": atributos
-            })
-        
-        # Adiciona as arestas
-        for origem, destino, atributos in g_nx.edges(data=True):
-            dados["arestas"].append({
-                "origem": origem,
-                "destino": destino,
-                "peso": atributos.get("weight", 1.0),
-                "atributos": atributos
-            })
-        
-        # Exporta para JSON
+        # Escreve o documento JSON gerado em partes
         with open(caminho, 'w', encoding='utf-8') as arquivo:
-            json.dump(dados, arquivo, indent=2)
+            for parte in gerar_json(grafo):
+                arquivo.write(parte)
         
         return True
     except Exception as e:
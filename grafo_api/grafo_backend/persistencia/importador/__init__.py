@@ -7,6 +7,8 @@ from .gml import importar_gml
 from .gexf import importar_gexf
 from .json import importar_json
 from .csv import importar_csv, importar_csv_matriz_adjacencia, importar_csv_lista_arestas
+from .binario import importar_binario, carregar_binario
+from .conteudo import importar_grafo
 
 __all__ = [
     'importar_graphml',
@@ -15,5 +17,8 @@ __all__ = [
     'importar_json',
     'importar_csv',
     'importar_csv_matriz_adjacencia',
-    'importar_csv_lista_arestas'
+    'importar_csv_lista_arestas',
+    'importar_binario',
+    'carregar_binario',
+    'importar_grafo'
 ]
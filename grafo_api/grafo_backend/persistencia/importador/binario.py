@@ -0,0 +1,139 @@
+"""
+Implementação de importação de grafos a partir do formato binário nativo.
+
+Este módulo contém funções para abrir arquivos ``.grafo`` escritos por
+``exportar_binario``. Os arrays CSR e as colunas de atributos são mapeados em
+memória com ``numpy.memmap``: abrir o arquivo lê apenas o descritor, e as
+páginas do arquivo são compartilhadas entre processos que abrem o mesmo grafo.
+"""
+
+import json
+import numpy as np
+from typing import Dict, List, Any, Optional
+from grafo_backend.core.grafo import Grafo
+from grafo_backend.core.csr import GrafoCSR, TabelaTexto, ColunaAtributo, decodificar_json
+from grafo_backend.persistencia.exportador.binario import MAGICO, VERSAO, PREFIXO
+
+
+def _ler_secao(buffer: np.ndarray, secoes: Dict[str, Dict[str, Any]], nome: str) -> np.ndarray:
+    """
+    Obtém uma seção do arquivo como array (visão sobre o buffer, sem cópia).
+    """
+    secao = secoes[nome]
+    dtype = np.dtype(secao["dtype"])
+    inicio = secao["offset"]
+    fim = inicio + secao["tamanho"] * dtype.itemsize
+    return buffer[inicio:fim].view(dtype)
+
+
+def _ler_texto(buffer: np.ndarray, secoes: Dict[str, Dict[str, Any]], prefixo: str) -> TabelaTexto:
+    """
+    Obtém uma TabelaTexto armazenada em duas seções.
+    """
+    return TabelaTexto(_ler_secao(buffer, secoes, f"{prefixo}.deslocamentos"),
+                       _ler_secao(buffer, secoes, f"{prefixo}.dados"))
+
+
+def _ler_colunas(buffer: np.ndarray, secoes: Dict[str, Dict[str, Any]],
+                 descritores: List[Dict[str, Any]]) -> Dict[str, ColunaAtributo]:
+    """
+    Obtém as colunas de atributos descritas no cabeçalho.
+    """
+    colunas = {}
+    for descritor in descritores:
+        secao = descritor["secao"]
+        presente = _ler_secao(buffer, secoes, f"{secao}.presente")
+        if descritor["tipo"] == "json":
+            valores = _ler_texto(buffer, secoes, f"{secao}.valores")
+        else:
+            valores = _ler_secao(buffer, secoes, f"{secao}.valores")
+        colunas[descritor["nome"]] = ColunaAtributo(descritor["tipo"], valores, presente)
+    return colunas
+
+
+def carregar_binario(caminho: str, mmap: bool = True) -> GrafoCSR:
+    """
+    Abre um arquivo no formato binário nativo como GrafoCSR.
+
+    Args:
+        caminho: Caminho do arquivo de entrada.
+        mmap: Se True, mapeia o arquivo em memória (somente leitura). Se False,
+            lê o arquivo inteiro para a memória.
+
+    Returns:
+        GrafoCSR: Grafo cujos arrays são visões sobre o arquivo.
+
+    Raises:
+        ValueError: Se o arquivo não estiver no formato binário nativo.
+    """
+    with open(caminho, 'rb') as arquivo:
+        prefixo = arquivo.read(PREFIXO.size)
+        if len(prefixo) < PREFIXO.size:
+            raise ValueError(f"Arquivo '{caminho}' não está no formato binário de grafos.")
+
+        magico, versao, _, posicao_descritor, tamanho_descritor = PREFIXO.unpack(prefixo)
+        if magico != MAGICO:
+            raise ValueError(f"Arquivo '{caminho}' não está no formato binário de grafos.")
+        if versao > VERSAO:
+            raise ValueError(f"Versão {versao} do formato binário não suportada.")
+
+        arquivo.seek(posicao_descritor)
+        descritor = json.loads(arquivo.read(tamanho_descritor).decode("utf-8"))
+
+    if mmap:
+        buffer = np.memmap(caminho, dtype=np.uint8, mode='r')
+    else:
+        buffer = np.fromfile(caminho, dtype=np.uint8)
+
+    secoes = descritor["secoes"]
+
+    # Tabela de identificadores
+    if descritor["ids"] == "inteiro":
+        ids = _ler_secao(buffer, secoes, "ids")
+    elif descritor["ids"] == "texto":
+        ids = _ler_texto(buffer, secoes, "ids")
+    else:
+        ids = [decodificar_json(v) for v in _ler_texto(buffer, secoes, "ids").tolist()]
+
+    conjuntos = _ler_secao(buffer, secoes, "conjuntos") if "conjuntos" in secoes else None
+
+    return GrafoCSR(
+        ids,
+        _ler_secao(buffer, secoes, "indptr"),
+        _ler_secao(buffer, secoes, "indices"),
+        _ler_secao(buffer, secoes, "pesos"),
+        direcionado=descritor["direcionado"],
+        num_arestas=descritor["num_arestas"],
+        nome=descritor["nome"],
+        tipo=descritor.get("tipo", "Grafo"),
+        atributos_vertices=_ler_colunas(buffer, secoes, descritor["atributos_vertices"]),
+        atributos_arestas=_ler_colunas(buffer, secoes, descritor["atributos_arestas"]),
+        conjuntos=conjuntos
+    )
+
+
+def importar_binario(caminho: str, nome: str = None) -> Optional[Grafo]:
+    """
+    Importa um grafo a partir de um arquivo no formato binário nativo.
+
+    Diferente de ``carregar_binario``, reconstrói um objeto Grafo completo,
+    adequado para edição.
+
+    Args:
+        caminho: Caminho do arquivo de entrada.
+        nome: Nome a ser atribuído ao grafo. Se None, usa o nome armazenado no arquivo.
+
+    Returns:
+        Optional[Grafo]: Grafo importado ou None se a importação falhar.
+    """
+    try:
+        grafo = carregar_binario(caminho).para_grafo()
+
+        # Define o nome do grafo
+        if nome is not None:
+            grafo.nome = nome
+
+        return grafo
+    except Exception as e:
+        print(f"Erro ao importar grafo do formato binário: {e}")
+        return None
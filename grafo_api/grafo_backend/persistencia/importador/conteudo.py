@@ -0,0 +1,56 @@
+"""
+Importação de grafos a partir de conteúdo em memória.
+
+Este módulo contém a função ``importar_grafo``, que interpreta a representação
+textual de um grafo em qualquer formato suportado, reutilizando os
+importadores baseados em arquivo.
+"""
+
+import os
+import tempfile
+from typing import Optional
+from grafo_backend.core.grafo import Grafo
+from grafo_backend.persistencia.importador.graphml import importar_graphml
+from grafo_backend.persistencia.importador.gml import importar_gml
+from grafo_backend.persistencia.importador.gexf import importar_gexf
+from grafo_backend.persistencia.importador.json import importar_json
+from grafo_backend.persistencia.importador.csv import importar_csv_lista_arestas, importar_csv_matriz_adjacencia
+
+
+# Importadores por formato
+IMPORTADORES = {
+    "graphml": importar_graphml,
+    "gml": importar_gml,
+    "gexf": importar_gexf,
+    "json": importar_json,
+    "csv": importar_csv_lista_arestas,
+    "csv_matriz": importar_csv_matriz_adjacencia
+}
+
+
+def importar_grafo(conteudo: str, formato: str = "graphml", nome: str = "Grafo") -> Optional[Grafo]:
+    """
+    Importa um grafo a partir de uma string no formato especificado.
+
+    Args:
+        conteudo: Conteúdo a ser interpretado.
+        formato: Formato do conteúdo (graphml, gml, gexf, json, csv, csv_matriz).
+        nome: Nome a ser atribuído ao grafo.
+
+    Returns:
+        Optional[Grafo]: Grafo importado ou None se a importação falhar.
+    """
+    if formato not in IMPORTADORES:
+        print(f"Erro ao importar grafo: formato '{formato}' inválido. "
+              f"Formatos válidos: {', '.join(IMPORTADORES)}")
+        return None
+
+    # Os importadores trabalham com arquivos; usa um arquivo temporário
+    descritor, caminho = tempfile.mkstemp(suffix=f".{formato}")
+    try:
+        with os.fdopen(descritor, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(conteudo)
+
+        return IMPORTADORES[formato](caminho, nome)
+    finally:
+        os.remove(caminho)
@@ -3,23 +3,169 @@ Implementação de importação de grafos a partir do formato CSV.
 
 Este módulo contém funções para importar grafos a partir do formato CSV,
 representando a matriz de adjacência ou a lista de arestas do grafo.
+
+A leitura é feita em blocos de linhas: cada bloco é convertido em arrays NumPy
+(origem, destino, peso) pelo leitor em C do NumPy, os identificadores dos
+vértices são internados por fatoração vetorizada e o grafo é construído em lote
+ao final, sem conversões célula a célula em Python.
 """
 
 import networkx as nx
+import numpy as np
 import csv
 import os
-from typing import Dict, List, Any, Optional, Literal
+from itertools import chain, islice
+from typing import List, Any, Optional, Literal, Iterator, Tuple
 from grafo_backend.core.grafo import Grafo
 
 
-def importar_csv_matriz_adjacencia(caminho: str, nome: str = None) -> Optional[Grafo]:
+# Número de linhas lidas e convertidas por vez
+TAMANHO_BLOCO_PADRAO = 100_000
+
+
+def _fatorar_identificadores(valores: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    """
+    Interna identificadores de vértices por fatoração vetorizada.
+
+    Cada identificador distinto recebe um índice inteiro na ordem da sua
+    primeira ocorrência em ``valores`` (percorrido em ordem de linha).
+
+    Args:
+        valores: Array de identificadores na ordem em que aparecem no arquivo.
+
+    Returns:
+        Tuple[List[str], np.ndarray]: Identificadores distintos e array de
+        índices com o mesmo formato de ``valores``.
+    """
+    if valores.size == 0:
+        return [], np.empty(valores.shape, dtype=np.int64)
+
+    unicos, primeiras, inverso = np.unique(valores, return_index=True, return_inverse=True)
+
+    # Reordena os identificadores pela primeira ocorrência
+    ordem = np.argsort(primeiras, kind="stable")
+    posicoes = np.empty(len(unicos), dtype=np.int64)
+    posicoes[ordem] = np.arange(len(unicos))
+
+    return unicos[ordem].tolist(), posicoes[inverso.reshape(valores.shape)]
+
+
+def _ler_blocos(arquivo, tamanho_bloco: int) -> Iterator[List[str]]:
+    """
+    Lê o arquivo em blocos de até ``tamanho_bloco`` linhas.
+    """
+    while True:
+        bloco = list(islice(arquivo, tamanho_bloco))
+        if not bloco:
+            return
+        yield bloco
+
+
+def _converter_pesos(coluna: np.ndarray) -> np.ndarray:
+    """
+    Converte uma coluna de pesos para float, usando 1.0 para valores inválidos.
+    """
+    try:
+        return coluna.astype(np.float64)
+    except ValueError:
+        # Caminho lento apenas para blocos com valores não numéricos
+        pesos = np.ones(len(coluna), dtype=np.float64)
+        for i, valor in enumerate(coluna):
+            try:
+                pesos[i] = float(valor)
+            except ValueError:
+                pass
+        return pesos
+
+
+def _converter_bloco_lista_arestas(bloco: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converte um bloco de linhas de lista de arestas em arrays (origens, destinos, pesos).
+    """
+    try:
+        dados = np.loadtxt(bloco, delimiter=',', dtype=str, ndmin=2, quotechar='"', comments=None)
+    except ValueError:
+        dados = None
+
+    if dados is not None and dados.shape[0] > 0 and dados.shape[1] >= 2:
+        origens = dados[:, 0]
+        destinos = dados[:, 1]
+        if dados.shape[1] > 2:
+            pesos = _converter_pesos(dados[:, 2])
+        else:
+            pesos = np.ones(len(origens), dtype=np.float64)
+        return origens, destinos, pesos
+
+    # Bloco irregular (número variável de colunas): usa o leitor csv linha a linha
+    origens, destinos, pesos = [], [], []
+    for linha in csv.reader(bloco):
+        if len(linha) < 2:
+            continue
+        peso = 1.0
+        if len(linha) > 2:
+            try:
+                peso = float(linha[2])
+            except ValueError:
+                # Usa o peso padrão se não for possível converter
+                pass
+        origens.append(linha[0])
+        destinos.append(linha[1])
+        pesos.append(peso)
+
+    return (np.array(origens, dtype=str), np.array(destinos, dtype=str),
+            np.array(pesos, dtype=np.float64))
+
+
+def _converter_bloco_matriz(bloco: List[str], num_colunas: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converte um bloco de linhas da matriz de adjacência em (rótulos, valores).
+
+    Células vazias ou não numéricas são tratadas como zero (ausência de aresta).
+    """
+    colunas = range(1, num_colunas + 1)
+    try:
+        rotulos = np.loadtxt(bloco, delimiter=',', dtype=str, usecols=(0,), ndmin=1,
+                             quotechar='"', comments=None)
+        valores = np.loadtxt(bloco, delimiter=',', dtype=np.float64, usecols=colunas,
+                             ndmin=2, quotechar='"', comments=None)
+        return rotulos, valores
+    except ValueError:
+        pass
+
+    # Bloco com células vazias, não numéricas ou linhas incompletas
+    rotulos, linhas_valores = [], []
+    for linha in csv.reader(bloco):
+        if not linha:
+            continue
+        valores_linha = np.zeros(num_colunas, dtype=np.float64)
+        for j, valor in enumerate(linha[1:num_colunas + 1]):
+            try:
+                valores_linha[j] = float(valor)
+            except ValueError:
+                # Ignora valores não numéricos
+                pass
+        rotulos.append(linha[0])
+        linhas_valores.append(valores_linha)
+
+    if not rotulos:
+        return np.empty(0, dtype=str), np.empty((0, num_colunas), dtype=np.float64)
+    return np.array(rotulos, dtype=str), np.vstack(linhas_valores)
+
+
+def importar_csv_matriz_adjacencia(caminho: str, nome: str = None,
+                                   tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Optional[Grafo]:
     """
     Importa um grafo a partir de um arquivo CSV contendo uma matriz de adjacência.
-    
+
+    As linhas são lidas em blocos e apenas as células com peso positivo são
+    extraídas (via ``np.nonzero``), de modo que células zero nunca passam por
+    código Python.
+
     Args:
         caminho: Caminho do arquivo de entrada.
         nome: Nome a ser atribuído ao grafo. Se None, usa o nome do arquivo sem extensão.
-        
+        tamanho_bloco: Número de linhas da matriz processadas por vez.
+
     Returns:
         Optional[Grafo]: Grafo importado ou None se a importação falhar.
     """
@@ -27,62 +173,58 @@ def importar_csv_matriz_adjacencia(caminho: str, nome: str = None) -> Optional[G
         # Define o nome do grafo
         if nome is None:
             nome = os.path.splitext(os.path.basename(caminho))[0]
-        
+
         # Cria um novo grafo
         grafo = Grafo(nome)
         g_nx = nx.Graph()
-        
-        # Lê o arquivo CSV
+
         with open(caminho, 'r', newline='', encoding='utf-8') as arquivo:
-            leitor = csv.reader(arquivo)
-            linhas = list(leitor)
-        
-        if not linhas:
-            raise ValueError("Arquivo CSV vazio")
-        
-        # Obtém os vértices da primeira linha (cabeçalho)
-        vertices = [v for v in linhas[0][1:] if v]
-        
-        # Adiciona os vértices ao grafo
-        for vertice in vertices:
-            g_nx.add_node(vertice)
-        
-        # Para cada linha após o cabeçalho
-        for i, linha in enumerate(linhas[1:], 1):
-            if not linha:
-                continue
-                
-            origem = linha[0]
-            
-            # Para cada coluna após a primeira
-            for j, valor in enumerate(linha[1:], 1):
-                if j <= len(vertices):
-                    destino = vertices[j-1]
-                    try:
-                        peso = float(valor)
-                        if peso > 0:  # Adiciona aresta apenas se o peso for positivo
-                            g_nx.add_edge(origem, destino, weight=peso)
-                    except ValueError:
-                        # Ignora valores não numéricos
-                        pass
-        
+            # Obtém os vértices da primeira linha (cabeçalho)
+            cabecalho = next(csv.reader([arquivo.readline()]), None)
+            if not cabecalho:
+                raise ValueError("Arquivo CSV vazio")
+
+            vertices = np.array([v for v in cabecalho[1:] if v], dtype=object)
+            g_nx.add_nodes_from(vertices.tolist())
+
+            # Processa a matriz em blocos de linhas
+            for bloco in _ler_blocos(arquivo, tamanho_bloco):
+                rotulos, valores = _converter_bloco_matriz(bloco, len(vertices))
+                if len(rotulos) == 0:
+                    continue
+
+                # Adiciona aresta apenas se o peso for positivo
+                linhas_idx, colunas_idx = np.nonzero(valores > 0)
+                origens = rotulos.astype(object)[linhas_idx]
+                destinos = vertices[colunas_idx]
+                pesos = valores[linhas_idx, colunas_idx]
+
+                g_nx.add_weighted_edges_from(zip(origens.tolist(), destinos.tolist(), pesos.tolist()))
+
         # Define o grafo NetworkX importado
         grafo.definir_grafo_networkx(g_nx)
-        
+
         return grafo
     except Exception as e:
         print(f"Erro ao importar grafo de CSV (matriz de adjacência): {e}")
         return None
 
 
-def importar_csv_lista_arestas(caminho: str, nome: str = None) -> Optional[Grafo]:
+def importar_csv_lista_arestas(caminho: str, nome: str = None,
+                               tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Optional[Grafo]:
     """
     Importa um grafo a partir de um arquivo CSV contendo uma lista de arestas.
-    
+
+    O arquivo é lido em blocos de ``tamanho_bloco`` linhas; cada bloco vira
+    arrays NumPy de origens, destinos e pesos; ao final da leitura os
+    identificadores são internados por fatoração vetorizada e o grafo é
+    construído em lote.
+
     Args:
         caminho: Caminho do arquivo de entrada.
         nome: Nome a ser atribuído ao grafo. Se None, usa o nome do arquivo sem extensão.
-        
+        tamanho_bloco: Número de linhas processadas por vez.
+
     Returns:
         Optional[Grafo]: Grafo importado ou None se a importação falhar.
     """
@@ -90,55 +232,51 @@ def importar_csv_lista_arestas(caminho: str, nome: str = None) -> Optional[Grafo
         # Define o nome do grafo
         if nome is None:
             nome = os.path.splitext(os.path.basename(caminho))[0]
-        
+
         # Cria um novo grafo
         grafo = Grafo(nome)
         g_nx = nx.Graph()
-        
-        # Lê o arquivo CSV
+
+        blocos_pares, blocos_pesos = [], []
+
         with open(caminho, 'r', newline='', encoding='utf-8') as arquivo:
-            leitor = csv.reader(arquivo)
-            linhas = list(leitor)
-        
-        if not linhas:
-            raise ValueError("Arquivo CSV vazio")
-        
-        # Verifica se a primeira linha é um cabeçalho
-        cabecalho = linhas[0]
-        tem_cabecalho = cabecalho[0].lower() == 'origem' and cabecalho[1].lower() == 'destino'
-        
-        # Define o índice inicial para processar as linhas
-        indice_inicial = 1 if tem_cabecalho else 0
-        
-        # Para cada linha após o cabeçalho (se houver)
-        for linha in linhas[indice_inicial:]:
-            if len(linha) < 2:
-                continue
-                
-            origem = linha[0]
-            destino = linha[1]
-            
-            # Adiciona os vértices se não existirem
-            if origem not in g_nx:
-                g_nx.add_node(origem)
-            if destino not in g_nx:
-                g_nx.add_node(destino)
-            
-            # Obtém o peso, se disponível
-            peso = 1.0
-            if len(linha) > 2:
-                try:
-                    peso = float(linha[2])
-                except ValueError:
-                    # Usa o peso padrão se não for possível converter
-                    pass
-            
-            # Adiciona a aresta
-            g_nx.add_edge(origem, destino, weight=peso)
-        
+            primeira_linha = arquivo.readline()
+            if not primeira_linha:
+                raise ValueError("Arquivo CSV vazio")
+
+            # Verifica se a primeira linha é um cabeçalho
+            cabecalho = next(csv.reader([primeira_linha]), [])
+            tem_cabecalho = (len(cabecalho) >= 2 and cabecalho[0].lower() == 'origem'
+                             and cabecalho[1].lower() == 'destino')
+
+            blocos = _ler_blocos(arquivo, tamanho_bloco)
+            if not tem_cabecalho:
+                # A primeira linha já é uma aresta
+                blocos = chain([[primeira_linha]], blocos)
+
+            for bloco in blocos:
+                origens, destinos, pesos = _converter_bloco_lista_arestas(bloco)
+                if len(origens) == 0:
+                    continue
+
+                # Intercala origem/destino por linha para preservar a ordem dos vértices
+                blocos_pares.append(np.column_stack((origens, destinos)))
+                blocos_pesos.append(pesos)
+
+        if blocos_pares:
+            # Interna os identificadores e constrói o grafo em lote
+            vertices, pares = _fatorar_identificadores(np.concatenate(blocos_pares))
+            pesos = np.concatenate(blocos_pesos)
+            identificadores = np.array(vertices, dtype=object)
+
+            g_nx.add_nodes_from(vertices)
+            g_nx.add_weighted_edges_from(zip(identificadores[pares[:, 0]].tolist(),
+                                             identificadores[pares[:, 1]].tolist(),
+                                             pesos.tolist()))
+
         # Define o grafo NetworkX importado
         grafo.definir_grafo_networkx(g_nx)
-        
+
         return grafo
     except Exception as e:
         print(f"Erro ao importar grafo de CSV (lista de arestas): {e}")
@@ -148,12 +286,12 @@ def importar_csv_lista_arestas(caminho: str, nome: str = None) -> Optional[Grafo
 def importar_csv(caminho: str, nome: str = None, formato: Literal['matriz', 'lista'] = 'lista') -> Optional[Grafo]:
     """
     Importa um grafo a partir de um arquivo CSV.
-    
+
     Args:
         caminho: Caminho do arquivo de entrada.
         nome: Nome a ser atribuído ao grafo. Se None, usa o nome do arquivo sem extensão.
         formato: Formato de importação ('matriz' para matriz de adjacência, 'lista' para lista de arestas).
-        
+
     Returns:
         Optional[Grafo]: Grafo importado ou None se a importação falhar.
     """
@@ -11,7 +11,7 @@ setup(
     install_requires=[
         'networkx>=2.6.3',
         'matplotlib>=3.5.1',
-        'numpy>=1.21.5',
+        'numpy>=1.23',
         'scipy>=1.7.3',
     ],
 )
@@ -64,6 +64,8 @@ class GrafoBipartido(Grafo):
         else:
             self._conjunto_b.add(id_vertice)
             
+        self._registrar_alteracao()
+        self._registrar_insercao(id_vertice)
         return True
         
     def adicionar_aresta(self, origem: Any, destino: Any, peso: float = 1.0, 
@@ -102,6 +104,8 @@ class GrafoBipartido(Grafo):
         attr = atributos or {}
         attr['weight'] = peso
         self._grafo.add_edge(origem, destino, **attr)
+        self._registrar_alteracao()
+        self._registrar_insercao(origem, destino)
         return True
         
     def obter_conjunto_a(self) -> Set[Any]:
@@ -134,9 +134,7 @@ class GrafoDirecionado(Grafo):
         Returns:
             bool: True se o grafo for fracamente conexo, False caso contrário.
         """
-        if self.eh_vazio():
-            return True
-        return nx.is_weakly_connected(self._grafo)
+        return self.eh_conexo()
         
     def obter_componentes_fortemente_conexos(self) -> List[Set[Any]]:
         """
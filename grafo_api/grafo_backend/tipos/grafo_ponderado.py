@@ -18,6 +18,9 @@ class GrafoPonderado(Grafo):
     Classe para representação de grafos ponderados.
     """
     
+    # O peso fica no atributo "peso" (e é replicado em "weight")
+    ATRIBUTO_PESO = "peso"
+    
     def __init__(self, nome: str, direcionado: bool = False):
         """
         Inicializa um grafo ponderado.
@@ -50,7 +53,7 @@ class GrafoPonderado(Grafo):
         atributos["peso"] = peso
         
         # Chama o método da classe base para adicionar a aresta
-        return super().adicionar_aresta(origem, destino, atributos)
+        return super().adicionar_aresta(origem, destino, peso, atributos)
     
     def obter_peso_aresta(self, origem: Any, destino: Any) -> float:
         """
@@ -93,8 +96,9 @@ class GrafoPonderado(Grafo):
         # Obtém os atributos da aresta
         atributos = self.obter_atributos_aresta(origem, destino)
         
-        # Atualiza o peso
+        # Atualiza o peso (mantendo "weight" coerente para os algoritmos e exportadores)
         atributos["peso"] = peso
+        atributos["weight"] = peso
         
         # Define os atributos atualizados
         self.definir_atributos_aresta(origem, destino, atributos)
@@ -1,3 +1,13 @@
-from .layout import gerar_layout, visualizar_grafo
+from .agregacao import agregar, agrupar_comunidades, agrupar_espacial, propagar_rotulos
+from .forca import (calcular_layout_forca, iterar_layout_forca, layout_barnes_hut, layout_multinivel,
+                    matriz_adjacencia, montar_matriz_simetrica)
+from .indice_espacial import IndiceEspacial
+from .quadros import CodificadorQuadros
+from .layout import gerar_layout, gerar_layout_incremental, posicionar_vertices_novos, visualizar_grafo
+from .renderizacao import agendar_renderizacao, renderizar_em_segundo_plano, renderizar_grafo
 
-__all__ = ['gerar_layout', 'visualizar_grafo']
+__all__ = ['CodificadorQuadros', 'IndiceEspacial', 'agendar_renderizacao', 'agregar', 'agrupar_comunidades',
+           'agrupar_espacial', 'calcular_layout_forca', 'gerar_layout', 'gerar_layout_incremental',
+           'iterar_layout_forca', 'layout_barnes_hut', 'layout_multinivel', 'matriz_adjacencia',
+           'montar_matriz_simetrica', 'posicionar_vertices_novos', 'propagar_rotulos', 'renderizar_em_segundo_plano',
+           'renderizar_grafo', 'visualizar_grafo']
@@ -0,0 +1,239 @@
+"""
+Agregação de grafos grandes em super-vértices, para visualização em níveis de detalhe.
+
+Os vértices são divididos em grupos, seja por comunidades (propagação de
+rótulos sobre a matriz de adjacência, seguida de emparelhamentos no grafo de
+comunidades até caber no limite), seja espacialmente (células de uma quadtree
+sobre as posições do layout). Cada grupo pode ser dividido novamente,
+aplicando o mesmo agrupamento apenas aos seus vértices.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from typing import Optional, Tuple
+
+
+# Iterações máximas da propagação de rótulos
+ITERACOES_PROPAGACAO = 20
+
+# A propagação termina quando menos desta fração dos vértices muda de rótulo
+FRACAO_CONVERGENCIA = 1e-3
+
+# Rodadas de propostas em cada emparelhamento e redução mínima de um nível
+# de emparelhamento para que as comunidades continuem sendo unidas
+RODADAS_EMPARELHAMENTO = 4
+RAZAO_MINIMA_EMPARELHAMENTO = 0.9
+
+# Níveis máximos da quadtree do agrupamento espacial
+MAXIMO_NIVEIS_ESPACIAIS = 30
+
+AGRUPAMENTOS = ("comunidades", "espacial")
+
+
+def agregar(adjacencia: sp.csr_matrix, rotulos: np.ndarray) -> Tuple[np.ndarray, sp.csr_matrix]:
+    """
+    Soma as entradas da matriz de adjacência entre cada par de grupos.
+
+    Args:
+        adjacencia: Matriz de adjacência simétrica (n x n).
+        rotulos: Grupo de cada vértice (inteiros de 0 a g - 1).
+
+    Returns:
+        Tuple[np.ndarray, sp.csr_matrix]: Número de vértices de cada grupo e
+        matriz simétrica g x g, sem diagonal, com as somas entre grupos.
+    """
+    n = len(rotulos)
+    numero_grupos = int(rotulos.max()) + 1 if n else 0
+    contracao = sp.csr_matrix((np.ones(n), (np.arange(n), rotulos)), shape=(n, numero_grupos))
+    quociente = (contracao.T @ adjacencia @ contracao).tocsr()
+    quociente.setdiag(0)
+    quociente.eliminate_zeros()
+    return np.bincount(rotulos, minlength=numero_grupos), quociente
+
+
+def propagar_rotulos(adjacencia: sp.csr_matrix, semente: Optional[int] = None,
+                     iteracoes: int = ITERACOES_PROPAGACAO) -> np.ndarray:
+    """
+    Detecta comunidades por propagação de rótulos.
+
+    A cada iteração, cada vértice adota o rótulo de maior peso entre seus
+    vizinhos (empates desfeitos ao acaso). Apenas metade dos vértices,
+    sorteada, é atualizada por vez, o que evita as oscilações da versão
+    síncrona; cada iteração é vetorizada sobre a matriz esparsa, em O(m).
+
+    Args:
+        adjacencia: Matriz de adjacência simétrica (n x n).
+        semente: Semente do gerador de números aleatórios.
+        iteracoes: Número máximo de iterações.
+
+    Returns:
+        np.ndarray: Comunidade de cada vértice (inteiros de 0 a c - 1).
+    """
+    gerador = np.random.default_rng(semente)
+    n = adjacencia.shape[0]
+    coo = adjacencia.tocoo()
+    rotulos = np.arange(n)
+
+    for _ in range(iteracoes):
+        # Peso de cada rótulo na vizinhança de cada vértice
+        votos = sp.coo_matrix((coo.data, (coo.row, rotulos[coo.col])), shape=(n, n)).tocsr()
+        votos.sum_duplicates()
+        if votos.nnz == 0:
+            break
+        votos = votos.tocoo()
+        valores = votos.data * (1.0 + 1e-6 * gerador.random(votos.nnz))
+        escolha = _escolher_por_linha(votos.row, votos.col, valores, n)
+        novos = np.where(escolha >= 0, escolha, rotulos)
+
+        atualizar = gerador.random(n) < 0.5
+        mudancas = int(np.count_nonzero(atualizar & (novos != rotulos)))
+        rotulos = np.where(atualizar, novos, rotulos)
+        if mudancas <= FRACAO_CONVERGENCIA * n:
+            break
+
+    return np.unique(rotulos, return_inverse=True)[1]
+
+
+def agrupar_espacial(posicoes: np.ndarray, limite_grupos: int) -> np.ndarray:
+    """
+    Agrupa os vértices pelas células da quadtree das posições.
+
+    Usa o nível mais fino da quadtree cujo número de células ocupadas não
+    passa de ``limite_grupos``.
+
+    Args:
+        posicoes: Posições dos vértices (n x 2).
+        limite_grupos: Número máximo de grupos.
+
+    Returns:
+        np.ndarray: Grupo de cada vértice (inteiros de 0 a g - 1).
+    """
+    n = len(posicoes)
+    rotulos = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return rotulos
+
+    minimo = posicoes.min(axis=0)
+    lado = max(float(np.ptp(posicoes, axis=0).max()), 1e-12) * (1 + 1e-9)
+    unitario = (posicoes - minimo) / lado
+    for nivel in range(1, MAXIMO_NIVEIS_ESPACIAIS + 1):
+        tamanho = 1 << nivel
+        celula = np.minimum((unitario * tamanho).astype(np.int64), tamanho - 1)
+        _, novos = np.unique(celula[:, 0] * tamanho + celula[:, 1], return_inverse=True)
+        if novos.max() + 1 > limite_grupos:
+            break
+        rotulos = novos
+        if novos.max() + 1 == n:
+            break
+
+    return _garantir_divisao(rotulos, limite_grupos)
+
+
+def agrupar_comunidades(adjacencia: sp.csr_matrix, posicoes: np.ndarray, limite_grupos: int,
+                        semente: Optional[int] = None) -> np.ndarray:
+    """
+    Agrupa os vértices em comunidades, com no máximo ``limite_grupos`` grupos.
+
+    As comunidades da propagação de rótulos são unidas por emparelhamentos
+    no grafo de comunidades enquanto passarem do limite; se ainda assim houver
+    grupos demais (por exemplo, muitos componentes isolados), os restantes
+    são unidos pela posição de seus centroides.
+
+    Args:
+        adjacencia: Matriz de adjacência simétrica (n x n).
+        posicoes: Posições dos vértices no layout (n x 2).
+        limite_grupos: Número máximo de grupos.
+        semente: Semente do gerador de números aleatórios.
+
+    Returns:
+        np.ndarray: Grupo de cada vértice (inteiros de 0 a g - 1).
+    """
+    gerador = np.random.default_rng(semente)
+    rotulos = propagar_rotulos(adjacencia, semente)
+
+    # Une comunidades vizinhas, duas a duas, enquanto houver grupos demais
+    while rotulos.max() + 1 > limite_grupos:
+        tamanhos, quociente = agregar(adjacencia, rotulos)
+        pares = _emparelhar(quociente, tamanhos, gerador)
+        if pares.max() + 1 > RAZAO_MINIMA_EMPARELHAMENTO * len(tamanhos):
+            break
+        rotulos = pares[rotulos]
+
+    if rotulos.max() + 1 > limite_grupos:
+        tamanhos = np.bincount(rotulos)
+        centroides = np.stack([np.bincount(rotulos, weights=posicoes[:, eixo]) for eixo in (0, 1)], axis=1)
+        centroides /= tamanhos[:, None]
+        rotulos = agrupar_espacial(centroides, limite_grupos)[rotulos]
+
+    return _garantir_divisao(rotulos, limite_grupos)
+
+
+def _garantir_divisao(rotulos: np.ndarray, limite_grupos: int) -> np.ndarray:
+    """
+    Divide os vértices em blocos consecutivos se o agrupamento gerou um único grupo.
+
+    Isso acontece com vértices sobrepostos ou comunidades que não se separam;
+    sem a divisão, detalhar o grupo devolveria sempre a mesma visão.
+    """
+    n = len(rotulos)
+    if n > 1 and rotulos.max() == 0:
+        return np.arange(n) * min(limite_grupos, n) // n
+    return rotulos
+
+
+def _escolher_por_linha(linhas: np.ndarray, colunas: np.ndarray, valores: np.ndarray, n: int) -> np.ndarray:
+    """
+    Obtém, para cada linha, a coluna da entrada de maior valor (-1 se a linha não tiver entradas).
+
+    As entradas devem estar ordenadas por linha, como na conversão de CSR para COO.
+    """
+    escolha = np.full(n, -1, dtype=np.int64)
+    if len(linhas) == 0:
+        return escolha
+
+    # Segmentos de entradas consecutivas da mesma linha
+    inicio_segmento = np.ones(len(linhas), dtype=bool)
+    inicio_segmento[1:] = linhas[1:] != linhas[:-1]
+    inicios = np.flatnonzero(inicio_segmento)
+    segmento = np.cumsum(inicio_segmento) - 1
+    maximo = np.maximum.reduceat(valores, inicios)
+
+    # Primeira entrada de valor máximo em cada segmento
+    maximas = np.flatnonzero(valores == maximo[segmento])
+    primeira = np.ones(len(maximas), dtype=bool)
+    primeira[1:] = segmento[maximas[1:]] != segmento[maximas[:-1]]
+    maximas = maximas[primeira]
+    escolha[linhas[maximas]] = colunas[maximas]
+    return escolha
+
+
+def _emparelhar(quociente: sp.csr_matrix, tamanhos: np.ndarray, gerador: np.random.Generator) -> np.ndarray:
+    """
+    Une grupos vizinhos dois a dois por emparelhamento de arestas pesadas.
+
+    Cada grupo livre propõe o vizinho livre de maior peso relativo
+    (w / (tamanho_i * tamanho_j), o que favorece unir grupos pequenos) e as
+    propostas mútuas são aceitas. Como cada grupo se une a no máximo outro,
+    nenhum grupo cresce mais que o dobro por nível.
+
+    Returns:
+        np.ndarray: Novo grupo de cada grupo (inteiros de 0 a g' - 1).
+    """
+    n = quociente.shape[0]
+    coo = quociente.tocoo()
+    linhas, colunas = coo.row.astype(np.int64), coo.col.astype(np.int64)
+    pontuacao = coo.data / (tamanhos[linhas] * tamanhos[colunas]) * (1.0 + 1e-6 * gerador.random(len(coo.data)))
+    parceiro = np.full(n, -1, dtype=np.int64)
+
+    for _ in range(RODADAS_EMPARELHAMENTO):
+        livres = parceiro < 0
+        disponiveis = livres[linhas] & livres[colunas]
+        if not disponiveis.any():
+            break
+        proposta = _escolher_por_linha(linhas[disponiveis], colunas[disponiveis], pontuacao[disponiveis], n)
+        propoem = np.flatnonzero(proposta >= 0)
+        mutuas = propoem[proposta[proposta[propoem]] == propoem]
+        parceiro[mutuas] = proposta[mutuas]
+
+    representante = np.where(parceiro >= 0, np.minimum(np.arange(n), parceiro), np.arange(n))
+    return np.unique(representante, return_inverse=True)[1]
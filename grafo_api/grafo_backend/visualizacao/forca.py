@@ -0,0 +1,748 @@
+"""
+Layouts dirigidos por forças para grafos grandes.
+
+Este módulo implementa o modelo de Fruchterman-Reingold com duas técnicas
+que o tornam viável para centenas de milhares de vértices:
+
+- Aproximação de Barnes-Hut: os vértices são ordenados pela curva de
+  Morton e agrupados em uma quadtree adaptativa, em que só se dividem os nós
+  com mais de CAPACIDADE_FOLHA vértices. A árvore é percorrida aos pares de
+  nós (como no FMM): um par suficientemente separado pelo critério de
+  abertura θ interage pela expansão multipolar da fonte, convertida em uma
+  expansão local no alvo; os pares de folhas próximas são somados vértice a
+  vértice, de forma exata. As expansões locais descem até as folhas e são
+  avaliadas uma vez por vértice. Cada etapa é vetorizada com NumPy sobre
+  blocos de pares.
+- Multinível (como no FM³ e no sfdp): o grafo é contraído sucessivamente,
+  agrupando cada vértice com um centro local escolhido por prioridade
+  aleatória, até restarem poucos vértices. O layout do grafo mais grosso é
+  propagado nível a nível e refinado com poucas iterações, já que parte de
+  uma configuração quase estável.
+
+O passo de cada iteração segue o controle adaptativo de Hu (2005): aumenta
+enquanto a energia cai de forma consistente e diminui caso contrário.
+"""
+
+import math
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .indice_espacial import _expandir_intervalos
+
+
+# Abaixo deste número de vértices, a repulsão é calculada de forma exata
+LIMITE_REPULSAO_EXATA = 256
+
+# Número máximo de vértices em uma folha da quadtree
+CAPACIDADE_FOLHA = 8
+
+# Profundidade máxima da quadtree (folhas mais profundas podem exceder a capacidade)
+MAXIMO_NIVEIS = 20
+
+# Critério de abertura: dois nós de raios r_a e r_b (em torno dos centros de
+# massa) interagem pelas expansões quando r_a + r_b < θ d, sendo d a distância
+# entre os centros de massa
+THETA = 0.7
+
+# O grafo deixa de ser contraído abaixo deste número de vértices, ou quando
+# um nível reduz o número de vértices em menos de 20%
+LIMITE_GROSSO = 100
+RAZAO_MINIMA_CONTRACAO = 0.8
+
+# Orçamento de iterações por nível (vértices x iterações) e seus limites
+ORCAMENTO_ITERACOES = 2_000_000
+MINIMO_ITERACOES = 10
+MAXIMO_ITERACOES = 50
+
+# Iterações no grafo mais grosso do layout multinível
+ITERACOES_GROSSO = 300
+
+# Controle adaptativo do passo (Hu, 2005)
+FATOR_RESFRIAMENTO = 0.9
+PASSOS_PARA_AQUECER = 5
+TOLERANCIA = 1e-3
+
+# Pares de nós processados por bloco no percurso da quadtree (limita a memória)
+TAMANHO_BLOCO = 1 << 14
+
+# Pares de nós acumulados antes de calcular as suas interações de uma só vez
+LOTE_INTERACOES = 1 << 18
+
+# Termos das expansões multipolares e locais de cada nó da quadtree
+TERMOS_EXPANSAO = 6
+
+# Coeficientes binomiais usados nas translações das expansões
+_BINOMIAIS = np.array([[math.comb(i, j) for j in range(2 * TERMOS_EXPANSAO)]
+                       for i in range(2 * TERMOS_EXPANSAO)], dtype=float)
+
+
+def matriz_adjacencia(g_nx: nx.Graph, pesos: bool = False) -> Tuple[List[Any], sp.csr_matrix]:
+    """
+    Obtém a matriz de adjacência simétrica usada pelos layouts.
+
+    A direção das arestas e os laços são ignorados.
+
+    Args:
+        g_nx: Grafo NetworkX.
+        pesos: Se True, as entradas somam os pesos numéricos ('weight', 1.0 por
+            padrão) das arestas entre os dois vértices; caso contrário, valem 1.
+
+    Returns:
+        Tuple[List[Any], sp.csr_matrix]: Vértices (na ordem das linhas) e matriz n x n.
+    """
+    vertices = list(g_nx)
+    n = len(vertices)
+    indice = {v: i for i, v in enumerate(vertices)}
+    m = g_nx.number_of_edges()
+    origens = np.fromiter((indice[u] for u, _ in g_nx.edges()), dtype=np.int64, count=m)
+    destinos = np.fromiter((indice[v] for _, v in g_nx.edges()), dtype=np.int64, count=m)
+    valores = None
+    if pesos:
+        valores = np.fromiter((w for _, _, w in g_nx.edges(data="weight", default=1.0)), dtype=float, count=m)
+
+    return vertices, montar_matriz_simetrica(n, origens, destinos, valores)
+
+
+def montar_matriz_simetrica(n: int, origens: np.ndarray, destinos: np.ndarray,
+                            valores: Optional[np.ndarray] = None) -> sp.csr_matrix:
+    """
+    Monta a matriz de adjacência simétrica a partir de listas de arestas.
+
+    Args:
+        n: Número de vértices.
+        origens: Índice da origem de cada aresta.
+        destinos: Índice do destino de cada aresta.
+        valores: Valor de cada aresta, somado nos dois sentidos (None para
+            uma matriz binária). Laços são descartados.
+
+    Returns:
+        sp.csr_matrix: Matriz n x n.
+    """
+    fora_diagonal = origens != destinos
+    origens, destinos = origens[fora_diagonal], destinos[fora_diagonal]
+    dados = np.ones(len(origens)) if valores is None else np.asarray(valores, dtype=float)[fora_diagonal]
+    matriz = sp.csr_matrix((np.concatenate([dados, dados]),
+                            (np.concatenate([origens, destinos]), np.concatenate([destinos, origens]))),
+                           shape=(n, n))
+    if valores is None:
+        matriz.data[:] = 1.0  # Remove multiplicidades (arestas nos dois sentidos)
+    return matriz
+
+
+def _repulsao_exata(pos: np.ndarray, massa: np.ndarray, k2: float) -> np.ndarray:
+    """
+    Calcula a repulsão k² m_i m_j / d entre todos os pares (O(n²)).
+    """
+    delta = pos[:, None, :] - pos[None, :, :]
+    d2 = np.maximum((delta ** 2).sum(axis=2), 1e-4 * k2)
+    fator = k2 * massa[None, :] / d2
+    np.fill_diagonal(fator, 0.0)
+    return (delta * fator[:, :, None]).sum(axis=1) * massa[:, None]
+
+
+def _intercalar_bits(valores: np.ndarray) -> np.ndarray:
+    """
+    Espalha os bits de inteiros de até 32 bits nas posições pares de um uint64.
+    """
+    x = valores.astype(np.uint64) & np.uint64(0x00000000FFFFFFFF)
+    for deslocamento, mascara in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF),
+                                  (4, 0x0F0F0F0F0F0F0F0F), (2, 0x3333333333333333),
+                                  (1, 0x5555555555555555)):
+        x = (x | (x << np.uint64(deslocamento))) & np.uint64(mascara)
+    return x
+
+
+def _construir_quadtree(codigos: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Constrói a quadtree adaptativa sobre pontos ordenados pela curva de Morton.
+
+    Cada nó ocupa um intervalo contíguo dos pontos ordenados, e os filhos de
+    um nó têm índices consecutivos. Os nós são numerados nível a nível, a
+    partir da raiz (nó 0).
+
+    Args:
+        codigos: Códigos de Morton (2 * MAXIMO_NIVEIS bits), em ordem crescente.
+
+    Returns:
+        Tuple[np.ndarray, ...]: Início e fim do intervalo de pontos, nível,
+        primeiro filho e número de filhos (0 nas folhas) de cada nó.
+    """
+    n = len(codigos)
+    inicios, fins, niveis, primeiros, quantidades = [], [], [], [], []
+    inicio_nivel, fim_nivel = np.array([0]), np.array([n])
+    total = 1
+
+    for nivel in range(MAXIMO_NIVEIS + 1):
+        inicios.append(inicio_nivel)
+        fins.append(fim_nivel)
+        niveis.append(np.full(len(inicio_nivel), nivel))
+        primeiro = np.zeros(len(inicio_nivel), dtype=np.int64)
+        quantidade = np.zeros(len(inicio_nivel), dtype=np.int64)
+        primeiros.append(primeiro)
+        quantidades.append(quantidade)
+
+        pais = np.flatnonzero(fim_nivel - inicio_nivel > CAPACIDADE_FOLHA)
+        if nivel == MAXIMO_NIVEIS or len(pais) == 0:
+            break
+
+        # Limites dos quatro quadrantes de cada nó dividido, pelo prefixo do código no nível seguinte
+        deslocamento = np.uint64(2 * (MAXIMO_NIVEIS - nivel - 1))
+        prefixos = codigos >> deslocamento
+        base = (codigos[inicio_nivel[pais]] >> deslocamento) & ~np.uint64(3)
+        limites = np.searchsorted(prefixos, base[:, None] + np.arange(5, dtype=np.uint64))
+        inicio_filhos, fim_filhos = limites[:, :4].ravel(), limites[:, 1:].ravel()
+        ocupados = fim_filhos > inicio_filhos
+
+        quantidade[pais] = ocupados.reshape(-1, 4).sum(axis=1)
+        primeiro[pais] = total + np.cumsum(quantidade[pais]) - quantidade[pais]
+        total += int(ocupados.sum())
+        inicio_nivel, fim_nivel = inicio_filhos[ocupados], fim_filhos[ocupados]
+
+    return (np.concatenate(inicios), np.concatenate(fins), np.concatenate(niveis),
+            np.concatenate(primeiros), np.concatenate(quantidades))
+
+
+def _momentos_quadtree(inicio: np.ndarray, fim: np.ndarray, niveis: np.ndarray,
+                       z: np.ndarray, massa: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calcula o centro de massa, o raio e os momentos multipolares de cada nó.
+
+    O momento de ordem p de um nó é Σ m_j (z_j - c)^p em torno do seu centro
+    de massa c (o de ordem 0 é a massa e o de ordem 1 é nulo); o raio é a
+    maior distância de um vértice do nó a c.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Centros de massa
+        (complexos), raios e momentos (TERMOS_EXPANSAO x nós).
+    """
+    centro = np.zeros(len(inicio), dtype=complex)
+    raio = np.zeros(len(inicio))
+    momentos = np.zeros((TERMOS_EXPANSAO, len(inicio)), dtype=complex)
+
+    # Os nós de um mesmo nível cobrem intervalos disjuntos dos pontos
+    for nivel in range(int(niveis.max()) + 1):
+        nos = np.flatnonzero(niveis == nivel)
+        pontos = _expandir_intervalos(inicio[nos], fim[nos])
+        dono = np.repeat(np.arange(len(nos)), fim[nos] - inicio[nos])
+        m = massa[pontos]
+        soma_massa = np.bincount(dono, weights=m, minlength=len(nos))
+        centro[nos] = _somar_por_alvo(dono, m * z[pontos], len(nos)) / soma_massa
+        momentos[0, nos] = soma_massa
+
+        relativo = z[pontos] - centro[nos][dono]
+        raio_nivel = np.zeros(len(nos))
+        np.maximum.at(raio_nivel, dono, np.abs(relativo))
+        raio[nos] = raio_nivel
+
+        termo = m * relativo
+        for p in range(2, TERMOS_EXPANSAO):
+            termo = termo * relativo
+            momentos[p, nos] = _somar_por_alvo(dono, termo, len(nos))
+
+    return centro, raio, momentos
+
+
+def _multipolo_para_local(local: np.ndarray, alvos: np.ndarray, fontes: np.ndarray,
+                          momentos: np.ndarray, delta: np.ndarray) -> None:
+    """
+    Acumula em ``local`` as expansões locais trocadas entre pares de nós.
+
+    Com D = c_alvo - c_fonte e t = z - c_alvo, o termo a_p / (D + t)^(p + 1)
+    da fonte contribui com (-1)^q C(p + q, q) a_p / D^(p + q + 1) para o
+    coeficiente de t^q do alvo; o sentido oposto usa -D, com as mesmas potências.
+
+    Args:
+        local: Coeficientes locais (TERMOS_EXPANSAO x nós), modificados no lugar.
+        alvos: Primeiro nó de cada par.
+        fontes: Segundo nó de cada par.
+        momentos: Momentos de todos os nós (TERMOS_EXPANSAO x nós).
+        delta: Diferença D entre os centros de massa de cada par.
+    """
+    inverso = 1.0 / delta
+    potencias = np.empty((2 * TERMOS_EXPANSAO, len(delta)), dtype=complex)
+    potencias[0] = 1.0
+    for k in range(1, 2 * TERMOS_EXPANSAO):
+        potencias[k] = potencias[k - 1] * inverso
+    momentos_alvo, momentos_fonte = momentos[:, alvos], momentos[:, fontes]
+    indices = np.concatenate([alvos, fontes])
+
+    # No sentido oposto, (-1)^q / (-D)^(p + q + 1) = (-1)^(p + 1) / D^(p + q + 1)
+    sinais = np.where(np.arange(TERMOS_EXPANSAO) % 2 == 1, 1.0, -1.0)
+    for q in range(TERMOS_EXPANSAO):
+        fatores = _BINOMIAIS[q:q + TERMOS_EXPANSAO, q]
+        trecho = potencias[q + 1:q + 1 + TERMOS_EXPANSAO]
+        para_alvo = np.einsum("p,pk,pk->k", fatores if q % 2 == 0 else -fatores, momentos_fonte, trecho)
+        para_fonte = np.einsum("p,pk,pk->k", fatores * sinais, momentos_alvo, trecho)
+        np.add.at(local[q], indices, np.concatenate([para_alvo, para_fonte]))
+
+
+def _transladar_local(coeficientes: np.ndarray, deslocamento: np.ndarray) -> np.ndarray:
+    """
+    Reescreve expansões locais em torno de centros deslocados de ``deslocamento``.
+    """
+    transladados = np.zeros_like(coeficientes)
+    for r in range(TERMOS_EXPANSAO):
+        potencia = np.ones_like(deslocamento)
+        for q in range(r, TERMOS_EXPANSAO):
+            transladados[r] += _BINOMIAIS[q, r] * coeficientes[q] * potencia
+            potencia = potencia * deslocamento
+    return transladados
+
+
+def _somar_proximos(campo: np.ndarray, alvos: np.ndarray, fontes: np.ndarray, inicio: np.ndarray,
+                    fim: np.ndarray, z: np.ndarray, massa: np.ndarray, distancia_minima2: float) -> None:
+    """
+    Acumula em ``campo`` a soma exata entre os vértices de pares de folhas.
+
+    Cada par de vértices é calculado uma vez e aplicado aos dois (em uma
+    folha pareada consigo mesma, apenas os pares de vértices distintos).
+    """
+    receptores = _expandir_intervalos(inicio[alvos], fim[alvos])
+    par = np.repeat(np.arange(len(alvos)), fim[alvos] - inicio[alvos])
+    tamanhos_fonte = (fim[fontes] - inicio[fontes])[par]
+    origens = _expandir_intervalos(inicio[fontes][par], fim[fontes][par])
+    receptores = np.repeat(receptores, tamanhos_fonte)
+
+    validos = (alvos != fontes)[np.repeat(par, tamanhos_fonte)] | (origens > receptores)
+    origens, receptores = origens[validos], receptores[validos]
+    dx = z.real[receptores] - z.real[origens]
+    dy = z.imag[receptores] - z.imag[origens]
+    inverso2 = 1.0 / np.maximum(dx * dx + dy * dy, distancia_minima2)
+    # m conj(Δ) / |Δ|² sobre o receptor e o oposto, com a massa do receptor, sobre a origem
+    indices = np.concatenate([receptores, origens])
+    pesos = np.concatenate([massa[origens], -massa[receptores]]) * np.concatenate([inverso2, inverso2])
+    n = len(campo)
+    campo += (np.bincount(indices, weights=pesos * np.concatenate([dx, dx]), minlength=n)
+              - 1j * np.bincount(indices, weights=pesos * np.concatenate([dy, dy]), minlength=n))
+
+
+def _repulsao_barnes_hut(pos: np.ndarray, massa: np.ndarray, k2: float) -> np.ndarray:
+    """
+    Calcula a repulsão aproximada pela quadtree adaptativa (Barnes-Hut).
+
+    No plano complexo, a repulsão sobre z é k² vezes o conjugado de
+    Σ m_j / (z - z_j). O percurso visita cada par não ordenado de nós uma
+    única vez, a partir do par (raiz, raiz):
+
+    - se os nós estão separados pelo critério de abertura, a expansão
+      multipolar de cada um é convertida em expansão local do outro;
+    - se ambos são folhas, a soma sobre os seus vértices é feita de forma
+      exata, nos dois sentidos;
+    - caso contrário, o nó de maior raio é dividido (um nó pareado consigo
+      mesmo gera os pares não ordenados dos seus filhos).
+
+    Por fim, as expansões locais descem da raiz às folhas e são avaliadas em
+    cada vértice. Para que a aproximação não altere a distância mínima
+    usada na soma exata, só são aceitos pares cujos vértices estão todos
+    além dela.
+
+    Args:
+        pos: Posições (n x 2).
+        massa: Massa de cada vértice (vértices contraídos pesam mais).
+        k2: Quadrado da distância ideal entre vértices.
+
+    Returns:
+        np.ndarray: Força de repulsão sobre cada vértice (n x 2).
+    """
+    n = len(pos)
+    if n <= LIMITE_REPULSAO_EXATA:
+        return _repulsao_exata(pos, massa, k2)
+
+    # Ordena os vértices pela curva de Morton no quadrado que contém o layout
+    minimo = pos.min(axis=0)
+    lado = max(float((pos.max(axis=0) - minimo).max()), 1e-9) * (1 + 1e-9)
+    grade = (1 << MAXIMO_NIVEIS) - 1
+    celulas = np.minimum(((pos - minimo) / lado * (grade + 1)).astype(np.int64), grade)
+    codigos = (_intercalar_bits(celulas[:, 0]) << np.uint64(1)) | _intercalar_bits(celulas[:, 1])
+    ordem = np.argsort(codigos, kind="stable")
+    z = pos[ordem, 0] + 1j * pos[ordem, 1]
+    m = massa[ordem]
+
+    inicio, fim, niveis, primeiro, quantidade = _construir_quadtree(codigos[ordem])
+    centro, raio, momentos = _momentos_quadtree(inicio, fim, niveis, z, m)
+    folha = quantidade == 0
+    distancia_minima2 = 1e-4 * k2
+    distancia_minima = np.sqrt(distancia_minima2)
+
+    campo = np.zeros(n, dtype=complex)
+    local = np.zeros((TERMOS_EXPANSAO, len(inicio)), dtype=complex)
+    distantes, proximos = [], []
+    acumulados = 0
+
+    def interagir():
+        # Calcula as interações acumuladas: expansões dos pares distantes e soma exata dos próximos
+        if distantes:
+            alvos, fontes = np.concatenate(distantes, axis=1)
+            _multipolo_para_local(local, alvos, fontes, momentos, centro[alvos] - centro[fontes])
+        if proximos:
+            alvos, fontes = np.concatenate(proximos, axis=1)
+            for bloco in range(0, len(alvos), TAMANHO_BLOCO):
+                _somar_proximos(campo, alvos[bloco:bloco + TAMANHO_BLOCO], fontes[bloco:bloco + TAMANHO_BLOCO],
+                                inicio, fim, z, m, distancia_minima2)
+        distantes.clear()
+        proximos.clear()
+
+    pendentes = [(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))]
+    while pendentes:
+        alvos, fontes = pendentes.pop()
+        if len(alvos) > TAMANHO_BLOCO:
+            pendentes.append((alvos[TAMANHO_BLOCO:], fontes[TAMANHO_BLOCO:]))
+            alvos, fontes = alvos[:TAMANHO_BLOCO], fontes[:TAMANHO_BLOCO]
+
+        distancia = np.abs(centro[alvos] - centro[fontes])
+        alcance = raio[alvos] + raio[fontes]
+        aceitos = (alvos != fontes) & (alcance < THETA * distancia) & (distancia - alcance >= distancia_minima)
+        ambas_folhas = folha[alvos] & folha[fontes]
+        vizinhos = ~aceitos & ambas_folhas
+        distantes.append(np.stack([alvos[aceitos], fontes[aceitos]]))
+        proximos.append(np.stack([alvos[vizinhos], fontes[vizinhos]]))
+        acumulados += len(alvos)
+        if acumulados >= LOTE_INTERACOES:
+            interagir()
+            acumulados = 0
+
+        # Demais pares: divide um dos nós (o de maior raio; em empates, o de maior
+        # índice, de modo que a escolha não depende da ordem do par)
+        abertos = ~aceitos & ~ambas_folhas
+        alvos, fontes = alvos[abertos], fontes[abertos]
+        mesmo = alvos == fontes
+        maior = (raio[alvos] > raio[fontes]) | ((raio[alvos] == raio[fontes]) & (alvos > fontes))
+        divide_alvo = ~mesmo & ~folha[alvos] & (folha[fontes] | maior)
+        divide_fonte = ~mesmo & ~divide_alvo
+        novos_alvos, novas_fontes = [], []
+
+        # Pares não ordenados (i <= j) dos filhos de um nó pareado consigo mesmo
+        nos = alvos[mesmo]
+        filhos = _expandir_intervalos(primeiro[nos], primeiro[nos] + quantidade[nos])
+        ultimo = np.repeat(primeiro[nos] + quantidade[nos], quantidade[nos])
+        novos_alvos.append(np.repeat(filhos, ultimo - filhos))
+        novas_fontes.append(_expandir_intervalos(filhos, ultimo))
+
+        nos = alvos[divide_alvo]
+        novos_alvos.append(_expandir_intervalos(primeiro[nos], primeiro[nos] + quantidade[nos]))
+        novas_fontes.append(np.repeat(fontes[divide_alvo], quantidade[nos]))
+
+        nos = fontes[divide_fonte]
+        novos_alvos.append(np.repeat(alvos[divide_fonte], quantidade[nos]))
+        novas_fontes.append(_expandir_intervalos(primeiro[nos], primeiro[nos] + quantidade[nos]))
+
+        novos_alvos = np.concatenate(novos_alvos)
+        if len(novos_alvos):
+            pendentes.append((novos_alvos, np.concatenate(novas_fontes)))
+
+    interagir()
+
+    # Desce as expansões locais da raiz às folhas (os filhos de cada nível são consecutivos)
+    pais = np.repeat(np.arange(len(inicio)), quantidade)
+    for nivel in range(1, int(niveis.max()) + 1):
+        nos = np.flatnonzero(niveis == nivel)
+        pai = pais[nos - 1]
+        local[:, nos] += _transladar_local(local[:, pai], centro[nos] - centro[pai])
+
+    # Avalia a expansão local da folha de cada vértice (Horner)
+    folhas = np.flatnonzero(folha)
+    pontos = _expandir_intervalos(inicio[folhas], fim[folhas])
+    dono = np.repeat(folhas, fim[folhas] - inicio[folhas])
+    t = z[pontos] - centro[dono]
+    valor = local[-1, dono]
+    for q in range(TERMOS_EXPANSAO - 2, -1, -1):
+        valor = valor * t + local[q, dono]
+    campo[pontos] += valor
+
+    forca = np.empty((n, 2))
+    forca[ordem, 0] = k2 * m * campo.real
+    forca[ordem, 1] = -k2 * m * campo.imag
+    return forca
+
+
+def _somar_por_alvo(alvos: np.ndarray, valores: np.ndarray, n: int) -> np.ndarray:
+    """
+    Soma valores complexos por índice de destino.
+    """
+    return (np.bincount(alvos, weights=valores.real, minlength=n)
+            + 1j * np.bincount(alvos, weights=valores.imag, minlength=n))
+
+
+def _atracao(pos: np.ndarray, linhas: np.ndarray, colunas: np.ndarray,
+             pesos: np.ndarray, k: float) -> np.ndarray:
+    """
+    Calcula a atração w d² / k ao longo das arestas (cada aresta aparece nos dois sentidos).
+    """
+    delta = pos[linhas] - pos[colunas]
+    fator = pesos * np.sqrt((delta ** 2).sum(axis=1)) / k
+    n = len(pos)
+    return -np.stack([np.bincount(linhas, weights=delta[:, 0] * fator, minlength=n),
+                      np.bincount(linhas, weights=delta[:, 1] * fator, minlength=n)], axis=1)
+
+
+def _relaxar(adjacencia: sp.csr_matrix, pos: np.ndarray, massa: np.ndarray, k: float,
+             iteracoes: int, passo: float) -> np.ndarray:
+    """
+    Executa iterações de Fruchterman-Reingold com controle adaptativo do passo.
+
+    Args:
+        adjacencia: Matriz de adjacência simétrica (pesos nas entradas).
+        pos: Posições iniciais (n x 2), modificadas no lugar.
+        massa: Massa de cada vértice.
+        k: Distância ideal entre vértices.
+        iteracoes: Número máximo de iterações.
+        passo: Deslocamento máximo inicial de cada vértice.
+
+    Returns:
+        np.ndarray: Posições finais.
+    """
+    for _ in _iterar_relaxacao(adjacencia, pos, massa, k, iteracoes, passo):
+        pass
+    return pos
+
+
+def _iterar_relaxacao(adjacencia: sp.csr_matrix, pos: np.ndarray, massa: np.ndarray, k: float,
+                      iteracoes: int, passo: float) -> Iterator[None]:
+    """
+    Versão de ``_relaxar`` que devolve o controle após cada iteração.
+
+    As posições são atualizadas no lugar em ``pos``.
+    """
+    coo = adjacencia.tocoo()
+    linhas, colunas, pesos = coo.row.astype(np.int64), coo.col.astype(np.int64), coo.data
+    k2 = k * k
+    energia_anterior = np.inf
+    progresso = 0
+
+    for _ in range(iteracoes):
+        forca = _repulsao_barnes_hut(pos, massa, k2) + _atracao(pos, linhas, colunas, pesos, k)
+        norma = np.sqrt((forca ** 2).sum(axis=1))
+        pos += forca * (passo / np.maximum(norma, 1e-12))[:, None]
+        yield
+
+        # Controle adaptativo do passo
+        energia = float((norma ** 2).sum())
+        if energia < energia_anterior:
+            progresso += 1
+            if progresso >= PASSOS_PARA_AQUECER:
+                progresso = 0
+                passo /= FATOR_RESFRIAMENTO
+        else:
+            progresso = 0
+            passo *= FATOR_RESFRIAMENTO
+        energia_anterior = energia
+
+        if passo < TOLERANCIA * k:
+            break
+
+
+def _iteracoes_por_nivel(n: int) -> int:
+    """
+    Obtém o número de iterações de um nível a partir do orçamento total.
+    """
+    return int(np.clip(ORCAMENTO_ITERACOES // max(n, 1), MINIMO_ITERACOES, MAXIMO_ITERACOES))
+
+
+def _contrair(adjacencia: sp.csr_matrix, massa: np.ndarray,
+              gerador: np.random.Generator) -> Tuple[np.ndarray, sp.csr_matrix, np.ndarray]:
+    """
+    Contrai o grafo agrupando vértices em torno de centros locais.
+
+    Cada vértice recebe uma prioridade aleatória; os vértices de prioridade
+    máxima em sua vizinhança fechada são centros. Os demais se juntam ao
+    centro vizinho de maior prioridade ou, se não houver, formam um grupo
+    sozinhos.
+
+    Args:
+        adjacencia: Matriz de adjacência simétrica.
+        massa: Massa de cada vértice.
+        gerador: Gerador de números aleatórios.
+
+    Returns:
+        Tuple[np.ndarray, sp.csr_matrix, np.ndarray]: Grupo de cada vértice,
+        matriz de adjacência do grafo contraído e massa de cada grupo.
+    """
+    n = adjacencia.shape[0]
+    prioridade = gerador.random(n)
+
+    # Vizinhança fechada (inclui o próprio vértice, de modo que nenhuma linha é vazia)
+    fechada = (adjacencia + sp.identity(n, format="csr")).tocsr()
+    fechada.sort_indices()
+    inicio = fechada.indptr[:-1]
+
+    centros = np.maximum.reduceat(prioridade[fechada.indices], inicio) == prioridade
+
+    # Cada vértice escolhe o centro de maior prioridade em sua vizinhança fechada
+    candidata = np.where(centros[fechada.indices], prioridade[fechada.indices], -1.0)
+    escolhida = np.maximum.reduceat(candidata, inicio)
+    ordem = np.argsort(prioridade)
+    lider = np.where(escolhida >= 0,
+                     ordem[np.searchsorted(prioridade[ordem], np.maximum(escolhida, 0.0))],
+                     np.arange(n))
+
+    # Renumera os grupos e monta a matriz de contração
+    _, grupo = np.unique(lider, return_inverse=True)
+    numero_grupos = int(grupo.max()) + 1
+    contracao = sp.csr_matrix((np.ones(n), (np.arange(n), grupo)), shape=(n, numero_grupos))
+
+    grossa = (contracao.T @ adjacencia @ contracao).tocsr()
+    grossa.setdiag(0)
+    grossa.eliminate_zeros()
+    massa_grossa = np.bincount(grupo, weights=massa, minlength=numero_grupos)
+    return grupo, grossa, massa_grossa
+
+
+def _normalizar(pos: np.ndarray) -> np.ndarray:
+    """
+    Centraliza as posições e as escala para o intervalo [-1, 1] (como o NetworkX).
+    """
+    if len(pos) == 0:
+        return pos
+    pos = pos - pos.mean(axis=0)
+    extensao = np.abs(pos).max()
+    if extensao > 0:
+        pos = pos / extensao
+    return pos
+
+
+def calcular_layout_forca(adjacencia: sp.csr_matrix, multinivel: bool = True,
+                          posicoes_iniciais: Optional[np.ndarray] = None,
+                          semente: Optional[int] = None) -> np.ndarray:
+    """
+    Calcula um layout de força sobre a matriz de adjacência.
+
+    Args:
+        adjacencia: Matriz de adjacência simétrica (n x n).
+        multinivel: Se True, usa contração multinível; caso contrário, apenas
+            Barnes-Hut a partir das posições iniciais.
+        posicoes_iniciais: Posições de partida (n x 2). Se informadas, o
+            layout é apenas refinado, sem contração.
+        semente: Semente do gerador de números aleatórios.
+
+    Returns:
+        np.ndarray: Posições (n x 2) normalizadas para [-1, 1].
+    """
+    for _, pos in iterar_layout_forca(adjacencia, multinivel, posicoes_iniciais, semente, intervalo=0):
+        pass
+    return pos
+
+
+def iterar_layout_forca(adjacencia: sp.csr_matrix, multinivel: bool = True,
+                        posicoes_iniciais: Optional[np.ndarray] = None,
+                        semente: Optional[int] = None,
+                        intervalo: int = 10) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Calcula um layout de força devolvendo quadros intermediários.
+
+    Enquanto um nível grosso da hierarquia é refinado, cada vértice aparece
+    na posição do seu grupo nesse nível. Interromper a iteração interrompe o
+    cálculo; o último quadro é sempre o layout final, idêntico ao de
+    ``calcular_layout_forca`` com os mesmos argumentos.
+
+    Args:
+        adjacencia: Matriz de adjacência simétrica (n x n).
+        multinivel: Se True, usa contração multinível.
+        posicoes_iniciais: Posições de partida (n x 2), opcionais.
+        semente: Semente do gerador de números aleatórios.
+        intervalo: Iterações entre quadros intermediários (0 devolve apenas o final).
+
+    Yields:
+        Tuple[int, np.ndarray]: Iterações executadas até o quadro e posições
+        (n x 2) normalizadas para [-1, 1].
+    """
+    gerador = np.random.default_rng(semente)
+    n = adjacencia.shape[0]
+    if n <= 1:
+        yield 0, np.zeros((n, 2))
+        return
+
+    k = 1.0
+    massa = np.ones(n)
+    contador = {"iteracoes": 0}
+
+    def relaxar(matriz, pos, massa_nivel, iteracoes, passo, projecao=None):
+        # Executa as iterações de um nível, devolvendo quadros a cada ``intervalo``
+        for _ in _iterar_relaxacao(matriz, pos, massa_nivel, k, iteracoes, passo):
+            contador["iteracoes"] += 1
+            if intervalo and contador["iteracoes"] % intervalo == 0:
+                yield contador["iteracoes"], _normalizar(pos if projecao is None else pos[projecao])
+
+    # Refinamento a partir de posições conhecidas (reescaladas para a área ideal)
+    if posicoes_iniciais is not None:
+        pos = np.array(posicoes_iniciais, dtype=float)
+        extensao = max(float(np.ptp(pos, axis=0).max()), 1e-9)
+        pos *= np.sqrt(n) * k / extensao
+        yield from relaxar(adjacencia, pos, massa, _iteracoes_por_nivel(n), 0.1 * k)
+        yield contador["iteracoes"], _normalizar(pos)
+        return
+
+    if not multinivel:
+        pos = gerador.random((n, 2)) * np.sqrt(n) * k
+        yield from relaxar(adjacencia, pos, massa, _iteracoes_por_nivel(n), np.sqrt(n) * k * 0.1)
+        yield contador["iteracoes"], _normalizar(pos)
+        return
+
+    # Contrai o grafo até que fique pequeno ou pare de encolher, guardando o
+    # grupo de cada vértice original em cada nível
+    hierarquia = []
+    atual, massa_atual = adjacencia, massa
+    projecao = np.arange(n)
+    while atual.shape[0] > LIMITE_GROSSO:
+        grupo, grossa, massa_grossa = _contrair(atual, massa_atual, gerador)
+        if grossa.shape[0] > RAZAO_MINIMA_CONTRACAO * atual.shape[0]:
+            break
+        hierarquia.append((atual, massa_atual, grupo, projecao))
+        atual, massa_atual = grossa, massa_grossa
+        projecao = grupo[projecao]
+
+    # Layout do grafo mais grosso, a partir de posições aleatórias
+    lado = np.sqrt(massa_atual.sum()) * k
+    pos = gerador.random((atual.shape[0], 2)) * lado
+    yield from relaxar(atual, pos, massa_atual, ITERACOES_GROSSO, 0.1 * lado, projecao)
+
+    # Propaga e refina nível a nível (a massa total é preservada, logo a escala também)
+    for fina, massa_fina, grupo, projecao in reversed(hierarquia):
+        pos = pos[grupo] + gerador.normal(0.0, 0.1 * k, (fina.shape[0], 2))
+        yield from relaxar(fina, pos, massa_fina, _iteracoes_por_nivel(fina.shape[0]), k, projecao)
+
+    yield contador["iteracoes"], _normalizar(pos)
+
+
+def layout_barnes_hut(g_nx: nx.Graph, pos: Optional[Dict[Any, Any]] = None,
+                      seed: Optional[int] = None) -> Dict[Any, np.ndarray]:
+    """
+    Layout de força com aproximação de Barnes-Hut, em um único nível.
+
+    Args:
+        g_nx: Grafo NetworkX.
+        pos: Posições iniciais (opcional). Vértices sem posição começam em
+            pontos aleatórios.
+        seed: Semente do gerador de números aleatórios.
+
+    Returns:
+        Dict[Any, np.ndarray]: Posição de cada vértice.
+    """
+    vertices, adjacencia = matriz_adjacencia(g_nx)
+    iniciais = None
+    if pos is not None and vertices:
+        gerador = np.random.default_rng(seed)
+        conhecidas = np.array([pos[v] for v in vertices if v in pos], dtype=float).reshape(-1, 2)
+        minimo = conhecidas.min(axis=0) if len(conhecidas) else np.zeros(2)
+        extensao = np.ptp(conhecidas, axis=0) if len(conhecidas) else np.ones(2)
+        iniciais = np.array([pos[v] if v in pos else minimo + gerador.random(2) * extensao
+                             for v in vertices], dtype=float)
+    coordenadas = calcular_layout_forca(adjacencia, multinivel=False, posicoes_iniciais=iniciais, semente=seed)
+    return dict(zip(vertices, coordenadas))
+
+
+def layout_multinivel(g_nx: nx.Graph, seed: Optional[int] = None) -> Dict[Any, np.ndarray]:
+    """
+    Layout de força multinível com aproximação de Barnes-Hut (estilo FM³/sfdp).
+
+    Args:
+        g_nx: Grafo NetworkX.
+        seed: Semente do gerador de números aleatórios.
+
+    Returns:
+        Dict[Any, np.ndarray]: Posição de cada vértice.
+    """
+    vertices, adjacencia = matriz_adjacencia(g_nx)
+    coordenadas = calcular_layout_forca(adjacencia, multinivel=True, semente=seed)
+    return dict(zip(vertices, coordenadas))
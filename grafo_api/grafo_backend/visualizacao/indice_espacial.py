@@ -0,0 +1,229 @@
+"""
+Índice espacial de vértices e arestas de um layout, para consultas por janela.
+
+O índice é uma quadtree linear: o quadrado que contém o layout é dividido
+em grades de 2^L x 2^L células e cada elemento é identificado pela chave
+(coluna * 2^L + linha) da sua célula, com os elementos ordenados pela chave.
+Uma janela corresponde, em cada coluna de células, a um intervalo contíguo
+de chaves, localizado por busca binária.
+
+- Vértices ficam no nível mais fino, com poucos vértices por célula.
+- Cada aresta fica no nível mais fino cujas células são maiores que a sua
+  caixa envolvente, na célula do canto inferior esquerdo da caixa; assim a
+  caixa ocupa no máximo 2 x 2 células desse nível, e basta estender a janela
+  em uma célula para baixo e para a esquerda.
+
+Os candidatos são então filtrados de forma exata: vértices pela posição e
+arestas pelo teste de eixo separador entre segmento e retângulo.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+# Ocupação média desejada das células dos vértices
+OCUPACAO_CELULA = 4
+
+# Nível máximo das grades (2^16 x 2^16 células)
+MAXIMO_NIVEIS = 16
+
+# Células por eixo da grade de rarefação no zoom 0 (dobram a cada nível de zoom)
+CELULAS_ZOOM_ZERO = 64
+
+# Vértices mantidos por célula da grade de rarefação
+VERTICES_POR_CELULA = 1
+
+# Acima deste zoom a grade de rarefação não fica mais fina
+MAXIMO_ZOOM = 18
+
+
+class IndiceEspacial:
+    """
+    Índice estático de vértices (pontos) e arestas (segmentos) de um layout.
+    """
+
+    def __init__(self, posicoes: np.ndarray, origens: np.ndarray, destinos: np.ndarray):
+        """
+        Constrói o índice.
+
+        Args:
+            posicoes: Posições dos vértices (n x 2).
+            origens: Índice do vértice de origem de cada aresta.
+            destinos: Índice do vértice de destino de cada aresta.
+        """
+        self.posicoes = np.asarray(posicoes, dtype=float).reshape(-1, 2)
+        self.origens = np.asarray(origens, dtype=np.int64)
+        self.destinos = np.asarray(destinos, dtype=np.int64)
+        n = len(self.posicoes)
+
+        # Quadrado que contém o layout
+        self.minimo = self.posicoes.min(axis=0) if n else np.zeros(2)
+        extensao = float(np.ptp(self.posicoes, axis=0).max()) if n else 0.0
+        self.lado = max(extensao, 1e-12) * (1 + 1e-9)
+
+        # Grau dos vértices, usado como prioridade na rarefação
+        self.graus = (np.bincount(self.origens, minlength=n) + np.bincount(self.destinos, minlength=n))
+
+        # Vértices no nível mais fino, ordenados pela chave da célula
+        self.nivel_vertices = int(np.clip(np.ceil(np.log(max(n, 1) / OCUPACAO_CELULA) / np.log(4)), 0, MAXIMO_NIVEIS))
+        celulas = self._celulas(self.posicoes, self.nivel_vertices)
+        chaves = celulas[:, 0] * (1 << self.nivel_vertices) + celulas[:, 1]
+        self._ordem_vertices = np.argsort(chaves, kind="stable")
+        self._chaves_vertices = chaves[self._ordem_vertices]
+
+        # Arestas no nível em que a caixa envolvente cabe em uma célula
+        inicio = np.minimum(self.posicoes[self.origens], self.posicoes[self.destinos])
+        fim = np.maximum(self.posicoes[self.origens], self.posicoes[self.destinos])
+        tamanho = (fim - inicio).max(axis=1) / self.lado if len(self.origens) else np.zeros(0)
+        with np.errstate(divide="ignore"):
+            niveis = np.floor(-np.log2(np.maximum(tamanho, 2.0 ** -MAXIMO_NIVEIS)))
+        niveis = np.clip(niveis, 0, MAXIMO_NIVEIS).astype(np.int64)
+        chaves = np.zeros(len(niveis), dtype=np.int64)
+        for nivel in np.unique(niveis):
+            selecao = niveis == nivel
+            celulas = self._celulas(inicio[selecao], int(nivel))
+            chaves[selecao] = celulas[:, 0] * (1 << int(nivel)) + celulas[:, 1]
+        self._ordem_arestas = np.lexsort((chaves, niveis))
+        self._niveis_arestas = niveis[self._ordem_arestas]
+        self._chaves_arestas = chaves[self._ordem_arestas]
+
+    def _celulas(self, pontos: np.ndarray, nivel: int) -> np.ndarray:
+        """
+        Obtém a célula (coluna, linha) de cada ponto na grade do nível.
+        """
+        tamanho = 1 << nivel
+        return np.clip(((pontos - self.minimo) / self.lado * tamanho).astype(np.int64), 0, tamanho - 1)
+
+    def _buscar(self, chaves: np.ndarray, nivel: int, canto_inferior: np.ndarray, canto_superior: np.ndarray,
+                margem: int = 0) -> np.ndarray:
+        """
+        Obtém as posições, em ``chaves``, dos elementos nas células que cobrem a janela.
+
+        Args:
+            chaves: Chaves ordenadas dos elementos do nível.
+            nivel: Nível da grade.
+            canto_inferior: Canto (xmin, ymin) da janela.
+            canto_superior: Canto (xmax, ymax) da janela.
+            margem: Células a mais à esquerda e abaixo da janela.
+
+        Returns:
+            np.ndarray: Posições dos candidatos em ``chaves``.
+        """
+        tamanho = 1 << nivel
+        inicio = self._celulas(canto_inferior[None, :], nivel)[0] - margem
+        fim = self._celulas(canto_superior[None, :], nivel)[0]
+        inicio = np.maximum(inicio, 0)
+
+        # Um intervalo contíguo de chaves por coluna de células
+        colunas = np.arange(inicio[0], fim[0] + 1)
+        primeiros = np.searchsorted(chaves, colunas * tamanho + inicio[1], side="left")
+        ultimos = np.searchsorted(chaves, colunas * tamanho + fim[1], side="right")
+        return _expandir_intervalos(primeiros, ultimos)
+
+    def consultar(self, xmin: float, ymin: float, xmax: float, ymax: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtém os vértices e as arestas que intersectam uma janela.
+
+        Args:
+            xmin: Limite esquerdo da janela.
+            ymin: Limite inferior da janela.
+            xmax: Limite direito da janela.
+            ymax: Limite superior da janela.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Índices dos vértices dentro da
+            janela e das arestas que a atravessam ou tocam.
+        """
+        vazio = np.zeros(0, dtype=np.int64)
+        if len(self.posicoes) == 0:
+            return vazio, vazio
+
+        # Janela recortada ao quadrado do layout
+        inferior = np.maximum(np.array([xmin, ymin], dtype=float), self.minimo)
+        superior = np.minimum(np.array([xmax, ymax], dtype=float), self.minimo + self.lado)
+        if (inferior > superior).any():
+            return vazio, vazio
+
+        # Vértices: candidatos das células e filtro exato
+        candidatos = self._ordem_vertices[self._buscar(self._chaves_vertices, self.nivel_vertices, inferior, superior)]
+        pontos = self.posicoes[candidatos]
+        dentro = ((pontos[:, 0] >= xmin) & (pontos[:, 0] <= xmax)
+                  & (pontos[:, 1] >= ymin) & (pontos[:, 1] <= ymax))
+        vertices = np.sort(candidatos[dentro])
+
+        # Arestas: candidatos de cada nível e teste exato do segmento
+        limites_niveis = np.searchsorted(self._niveis_arestas, np.arange(MAXIMO_NIVEIS + 2))
+        candidatas = []
+        for nivel in range(MAXIMO_NIVEIS + 1):
+            inicio, fim = limites_niveis[nivel], limites_niveis[nivel + 1]
+            if inicio == fim:
+                continue
+            posicoes = self._buscar(self._chaves_arestas[inicio:fim], nivel, inferior, superior, margem=1)
+            candidatas.append(self._ordem_arestas[inicio + posicoes])
+        if not candidatas:
+            return vertices, vazio
+        candidatas = np.concatenate(candidatas)
+        arestas = np.sort(candidatas[self._segmentos_na_janela(candidatas, xmin, ymin, xmax, ymax)])
+        return vertices, arestas
+
+    def _segmentos_na_janela(self, arestas: np.ndarray, xmin: float, ymin: float,
+                             xmax: float, ymax: float) -> np.ndarray:
+        """
+        Testa quais segmentos intersectam a janela (teorema do eixo separador).
+        """
+        p = self.posicoes[self.origens[arestas]]
+        q = self.posicoes[self.destinos[arestas]]
+
+        # Caixas envolventes
+        sobrepoe = ((np.minimum(p[:, 0], q[:, 0]) <= xmax) & (np.maximum(p[:, 0], q[:, 0]) >= xmin)
+                    & (np.minimum(p[:, 1], q[:, 1]) <= ymax) & (np.maximum(p[:, 1], q[:, 1]) >= ymin))
+
+        # A reta do segmento não pode deixar os quatro cantos do mesmo lado
+        direcao = q - p
+        lados = np.stack([direcao[:, 0] * (y - p[:, 1]) - direcao[:, 1] * (x - p[:, 0])
+                          for x, y in ((xmin, ymin), (xmin, ymax), (xmax, ymin), (xmax, ymax))], axis=1)
+        return sobrepoe & (lados.min(axis=1) <= 0) & (lados.max(axis=1) >= 0)
+
+    def rarefazer(self, vertices: np.ndarray, zoom: int) -> np.ndarray:
+        """
+        Seleciona os vértices visíveis em um nível de zoom.
+
+        O quadrado do layout é dividido em CELULAS_ZOOM_ZERO * 2^zoom células
+        por eixo e, em cada célula, apenas os VERTICES_POR_CELULA vértices de
+        maior grau são mantidos. Como a grade é fixa no layout, e não na
+        janela, os vértices escolhidos não mudam ao deslocar a janela.
+
+        Args:
+            vertices: Índices dos vértices candidatos.
+            zoom: Nível de zoom (0 mostra a menor densidade).
+
+        Returns:
+            np.ndarray: Índices dos vértices mantidos, em ordem crescente.
+        """
+        if len(vertices) == 0:
+            return vertices
+        tamanho = CELULAS_ZOOM_ZERO << min(zoom, MAXIMO_ZOOM)
+        celulas = np.clip(((self.posicoes[vertices] - self.minimo) / self.lado * tamanho).astype(np.int64),
+                          0, tamanho - 1)
+        chaves = celulas[:, 0] * tamanho + celulas[:, 1]
+
+        # Ordena por célula e, dentro da célula, por grau decrescente
+        ordem = np.lexsort((vertices, -self.graus[vertices], chaves))
+        chaves_ordenadas = chaves[ordem]
+        inicio_celula = np.ones(len(ordem), dtype=bool)
+        inicio_celula[1:] = chaves_ordenadas[1:] != chaves_ordenadas[:-1]
+        posicao_inicio = np.maximum.accumulate(np.where(inicio_celula, np.arange(len(ordem)), 0))
+        mantidos = (np.arange(len(ordem)) - posicao_inicio) < VERTICES_POR_CELULA
+        return np.sort(vertices[ordem[mantidos]])
+
+
+def _expandir_intervalos(inicios: np.ndarray, fins: np.ndarray) -> np.ndarray:
+    """
+    Concatena os intervalos [inicios[i], fins[i]) em um único vetor de índices.
+    """
+    tamanhos = fins - inicios
+    total = int(tamanhos.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    deslocamentos = np.repeat(inicios - (np.cumsum(tamanhos) - tamanhos), tamanhos)
+    return np.arange(total) + deslocamentos
@@ -3,15 +3,35 @@ Módulo para funções de layout de grafos.
 """
 
 import networkx as nx
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
 from grafo_backend.core.grafo import Grafo
+from grafo_backend.visualizacao.forca import layout_barnes_hut, layout_multinivel
 
-def gerar_layout(grafo: Grafo, tipo_layout: str = 'spring') -> dict:
+
+# Layouts de força que podem partir de posições calculadas anteriormente
+LAYOUTS_INCREMENTAIS = {"spring", "kamada_kawai", "barnes_hut", "multinivel"}
+
+# Iterações usadas para acomodar vértices novos em um layout existente
+ITERACOES_INCREMENTAIS = 30
+
+# Fração máxima de vértices novos para que apenas eles sejam reposicionados
+# (até MINIMO_INCREMENTAL vértices novos a atualização é sempre incremental)
+FRACAO_MAXIMA_INCREMENTAL = 0.2
+MINIMO_INCREMENTAL = 10
+
+
+def gerar_layout(grafo: Grafo, tipo_layout: str = 'spring', semente: Optional[int] = None) -> dict:
     """
     Gera as posições dos vértices para visualização usando um layout específico.
 
     Args:
         grafo: O objeto Grafo.
         tipo_layout: O tipo de layout a ser usado (ex: 'spring', 'circular', 'kamada_kawai').
+            Para grafos grandes, 'barnes_hut' e 'multinivel' calculam layouts de
+            força em O(n log n) por iteração.
+        semente: Semente dos layouts aleatórios ('spring', 'random', 'barnes_hut'
+            e 'multinivel'), para resultados reproduzíveis.
 
     Returns:
         dict: Um dicionário mapeando cada vértice para suas coordenadas (x, y).
@@ -20,31 +40,185 @@ def gerar_layout(grafo: Grafo, tipo_layout: str = 'spring') -> dict:
     pos = {}
     try:
         if tipo_layout == 'spring':
-            pos = nx.spring_layout(g_nx)
+            pos = nx.spring_layout(g_nx, seed=semente)
         elif tipo_layout == 'circular':
             pos = nx.circular_layout(g_nx)
         elif tipo_layout == 'kamada_kawai':
             pos = nx.kamada_kawai_layout(g_nx)
         elif tipo_layout == 'random':
-            pos = nx.random_layout(g_nx)
+            pos = nx.random_layout(g_nx, seed=semente)
         elif tipo_layout == 'shell':
             pos = nx.shell_layout(g_nx)
         elif tipo_layout == 'spectral':
             pos = nx.spectral_layout(g_nx)
+        elif tipo_layout == 'barnes_hut':
+            pos = layout_barnes_hut(g_nx, seed=semente)
+        elif tipo_layout == 'multinivel':
+            pos = layout_multinivel(g_nx, seed=semente)
         else:
             # Layout padrão caso o tipo seja inválido
-            pos = nx.spring_layout(g_nx)
+            pos = nx.spring_layout(g_nx, seed=semente)
     except Exception as e:
         # Fallback em caso de erro no layout específico
         print(f"Erro ao gerar layout {tipo_layout}: {e}. Usando layout spring.")
-        pos = nx.spring_layout(g_nx)
-        
+        pos = nx.spring_layout(g_nx, seed=semente)
+
     # Converte as posições para um formato serializável (listas)
     pos_serializavel = {vertice: list(coord) for vertice, coord in pos.items()}
-    
+
     return pos_serializavel
 
+
+def posicionar_vertices_novos(g_nx: nx.Graph, posicoes: Dict[Any, Sequence[float]],
+                              semente: Optional[int] = None) -> Dict[Any, np.ndarray]:
+    """
+    Completa um layout anterior com posições para os vértices que não o tinham.
+
+    Cada vértice novo é colocado no centro de seus vizinhos já posicionados,
+    com um pequeno deslocamento aleatório. Cadeias de vértices novos são
+    resolvidas em passadas sucessivas; vértices sem nenhum vizinho posicionado
+    são espalhados em torno do centro do layout. Vértices que não existem mais
+    no grafo são descartados.
+
+    Args:
+        g_nx: Grafo NetworkX com o estado atual.
+        posicoes: Posições anteriores dos vértices.
+        semente: Semente do gerador de deslocamentos.
+
+    Returns:
+        Dict[Any, np.ndarray]: Posição de cada vértice do grafo atual.
+    """
+    gerador = np.random.default_rng(semente)
+    pos = {v: np.asarray(p, dtype=float) for v, p in posicoes.items() if v in g_nx}
+
+    # Escala do layout atual, usada para os deslocamentos
+    if pos:
+        coordenadas = np.array(list(pos.values()))
+        centro = coordenadas.mean(axis=0)
+        escala = max(float(coordenadas.std()), 1e-3)
+    else:
+        centro = np.zeros(2)
+        escala = 1.0
+    deslocamento = 0.05 * escala
+
+    pendentes = [v for v in g_nx if v not in pos]
+    while pendentes:
+        restantes = []
+        for v in pendentes:
+            vizinhos = [pos[u] for u in nx.all_neighbors(g_nx, v) if u in pos]
+            if vizinhos:
+                pos[v] = np.mean(vizinhos, axis=0) + gerador.normal(0.0, deslocamento, 2)
+            else:
+                restantes.append(v)
+
+        if len(restantes) == len(pendentes):
+            # Nenhum vizinho posicionado: distribui em torno do centro
+            for v in restantes:
+                pos[v] = centro + gerador.normal(0.0, escala, 2)
+            break
+        pendentes = restantes
+
+    return pos
+
+
+def gerar_layout_incremental(g_nx: nx.Graph, tipo_layout: str, posicoes: Dict[Any, Sequence[float]],
+                             semente: Optional[int] = None) -> Dict[Any, np.ndarray]:
+    """
+    Atualiza um layout de força a partir das posições calculadas anteriormente.
+
+    Vértices que já tinham posição ficam parados quando as mudanças são
+    pequenas: apenas os vértices novos são acomodados, com poucas iterações,
+    de modo que a atualização é barata e a figura não "salta". Se houver mais
+    de ``MINIMO_INCREMENTAL`` vértices novos e eles passarem da fração
+    ``FRACAO_MAXIMA_INCREMENTAL``, o layout é recalculado por inteiro, ainda
+    partindo das posições anteriores.
+
+    Args:
+        g_nx: Grafo NetworkX com o estado atual (pesos numéricos em 'weight').
+        tipo_layout: Layout de força ('spring', 'kamada_kawai', 'barnes_hut' ou 'multinivel').
+        posicoes: Posições anteriores dos vértices.
+        semente: Semente para os componentes aleatórios.
+
+    Returns:
+        Dict[Any, np.ndarray]: Posição de cada vértice do grafo atual.
+
+    Raises:
+        ValueError: Se o layout não admitir atualização incremental.
+    """
+    if tipo_layout not in LAYOUTS_INCREMENTAIS:
+        raise ValueError(f"Layout '{tipo_layout}' não admite atualização incremental.")
+
+    pos = posicionar_vertices_novos(g_nx, posicoes, semente)
+    fixos = [v for v in g_nx if v in posicoes]
+    novos = len(pos) - len(fixos)
+    if novos == 0:
+        return pos
+
+    # Poucas mudanças: move apenas os vértices novos
+    if fixos and novos <= max(MINIMO_INCREMENTAL, FRACAO_MAXIMA_INCREMENTAL * len(pos)):
+        return _acomodar_vertices_novos(g_nx, pos, [v for v in g_nx if v not in posicoes])
+
+    # Muitas mudanças: recalcula tudo, partindo das posições atuais
+    if tipo_layout == "kamada_kawai":
+        return nx.kamada_kawai_layout(g_nx, pos=pos)
+    if tipo_layout in ("barnes_hut", "multinivel"):
+        return layout_barnes_hut(g_nx, pos=pos, seed=semente)
+    return nx.spring_layout(g_nx, pos=pos, seed=semente)
+
+
+def _acomodar_vertices_novos(g_nx: nx.Graph, pos: Dict[Any, np.ndarray], novos: List[Any],
+                             iteracoes: int = ITERACOES_INCREMENTAIS) -> Dict[Any, np.ndarray]:
+    """
+    Relaxa apenas os vértices novos pelo modelo de Fruchterman-Reingold.
+
+    Os demais vértices ficam fixos; cada iteração calcula a repulsão entre os
+    vértices novos e todos os outros (em blocos, O(novos * n)) e a atração
+    pelas arestas dos vértices novos, com deslocamento limitado por uma
+    temperatura decrescente.
+    """
+    vertices = list(pos)
+    indice = {v: i for i, v in enumerate(vertices)}
+    coordenadas = np.array([pos[v] for v in vertices], dtype=float)
+    moveis = np.array([indice[v] for v in novos], dtype=np.int64)
+    n = len(vertices)
+
+    # Distância ideal entre vértices, proporcional à área ocupada pelo layout
+    extensao = np.ptp(coordenadas, axis=0).max() or 1.0
+    k = extensao / np.sqrt(n)
+
+    # Arestas incidentes aos vértices novos (índice do vértice móvel, vizinho)
+    pares = [(j, indice[u]) for j, v in enumerate(novos) for u in nx.all_neighbors(g_nx, v)]
+    origem_pares = np.array([p[0] for p in pares], dtype=np.int64)
+    vizinho_pares = np.array([p[1] for p in pares], dtype=np.int64)
+
+    tamanho_bloco = max(1, 1_000_000 // n)
+    temperatura = 0.1 * extensao
+    resfriamento = temperatura / (iteracoes + 1)
+    for _ in range(iteracoes):
+        deslocamento = np.zeros((len(moveis), 2))
+
+        # Repulsão: k² / d em relação a todos os vértices
+        for inicio in range(0, len(moveis), tamanho_bloco):
+            bloco = moveis[inicio:inicio + tamanho_bloco]
+            delta = coordenadas[bloco, None, :] - coordenadas[None, :, :]
+            distancia = np.maximum(np.linalg.norm(delta, axis=2), 1e-6)
+            deslocamento[inicio:inicio + len(bloco)] += (delta * (k * k / distancia ** 2)[:, :, None]).sum(axis=1)
+
+        # Atração: d² / k ao longo das arestas
+        if len(pares):
+            delta = coordenadas[moveis[origem_pares]] - coordenadas[vizinho_pares]
+            distancia = np.linalg.norm(delta, axis=1)
+            np.add.at(deslocamento, origem_pares, -delta * (distancia / k)[:, None])
+
+        # Limita o passo pela temperatura
+        comprimento = np.maximum(np.linalg.norm(deslocamento, axis=1), 1e-9)
+        passo = np.minimum(comprimento, temperatura) / comprimento
+        coordenadas[moveis] += deslocamento * passo[:, None]
+        temperatura -= resfriamento
+
+    return {v: coordenadas[indice[v]] for v in vertices}
+
+
 # Adicionar outras funções de visualização se necessário, como visualizar_grafo
 def visualizar_grafo(grafo: Grafo, layout: dict = None, arquivo: str = None):
     pass
-
@@ -0,0 +1,86 @@
+"""
+Codificação compacta de quadros de posições para transmissão progressiva de layouts.
+
+As posições, normalizadas para [-1, 1], são quantizadas em inteiros de
+``bits`` bits por eixo. O primeiro quadro é completo; os seguintes levam
+apenas os vértices cuja posição quantizada mudou, com os índices em
+diferenças sucessivas e os deslocamentos em relação ao quadro anterior.
+Como o codificador guarda exatamente o estado quantizado já enviado, o
+cliente que soma os deslocamentos reproduz as posições sem acumular erro.
+
+Para reconstruir um quadro no cliente::
+
+    indice = -1
+    for salto, dx, dy in zip(quadro["indices"], quadro["dx"], quadro["dy"]):
+        indice += salto
+        x[indice] += dx
+        y[indice] += dy
+
+e a posição real de um valor quantizado q é ``q / (2^bits - 1) * 2 - 1``.
+"""
+
+import numpy as np
+from typing import Any, Dict, Optional
+
+
+# Limites da resolução da quantização, em bits por eixo
+MINIMO_BITS = 4
+MAXIMO_BITS = 16
+
+
+class CodificadorQuadros:
+    """
+    Converte posições sucessivas de um layout em quadros completos ou de diferenças.
+    """
+
+    def __init__(self, bits: int = 12):
+        """
+        Inicializa o codificador.
+
+        Args:
+            bits: Bits por eixo da quantização.
+
+        Raises:
+            ValueError: Se a resolução estiver fora dos limites.
+        """
+        if not MINIMO_BITS <= bits <= MAXIMO_BITS:
+            raise ValueError(f"A resolução deve estar entre {MINIMO_BITS} e {MAXIMO_BITS} bits.")
+        self.bits = bits
+        self.maximo = (1 << bits) - 1
+        self._anterior: Optional[np.ndarray] = None
+
+    def quantizar(self, posicoes: np.ndarray) -> np.ndarray:
+        """
+        Converte posições em [-1, 1] para inteiros de 0 a 2^bits - 1.
+        """
+        unitario = (np.asarray(posicoes, dtype=float).reshape(-1, 2) + 1.0) / 2.0
+        return np.clip(np.rint(unitario * self.maximo), 0, self.maximo).astype(np.int64)
+
+    def codificar(self, posicoes: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Codifica o próximo quadro.
+
+        Args:
+            posicoes: Posições dos vértices (n x 2), normalizadas para [-1, 1].
+
+        Returns:
+            Optional[Dict[str, Any]]: Quadro completo (``x`` e ``y``) na
+            primeira chamada e quadro de diferenças (``indices``, ``dx`` e
+            ``dy``) nas seguintes, ou None se nenhuma posição quantizada mudou.
+        """
+        atual = self.quantizar(posicoes)
+        anterior, self._anterior = self._anterior, atual
+        if anterior is None or len(anterior) != len(atual):
+            return {"tipo": "completo", "x": atual[:, 0].tolist(), "y": atual[:, 1].tolist()}
+
+        diferenca = atual - anterior
+        alterados = np.flatnonzero(diferenca.any(axis=1))
+        if len(alterados) == 0:
+            return None
+        saltos = np.diff(alterados, prepend=-1)
+        return {
+            "tipo": "diferenca",
+            "indices": saltos.tolist(),
+            "dx": diferenca[alterados, 0].tolist(),
+            "dy": diferenca[alterados, 1].tolist(),
+        }
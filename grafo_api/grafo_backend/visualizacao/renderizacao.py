@@ -0,0 +1,135 @@
+"""
+Renderização de grafos em imagens, segura para uso concorrente.
+
+A renderização usa a API orientada a objetos do Matplotlib (uma ``Figure``
+própria com o canvas Agg a cada imagem), sem o estado global de
+``matplotlib.pyplot``, e é executada em um pool dedicado de threads, de
+modo que as threads das requisições apenas aguardam o resultado.
+"""
+
+import io
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import networkx as nx
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+# Tipo de mídia de cada formato de imagem suportado
+FORMATOS_IMAGEM = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "pdf": "application/pdf",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+}
+
+# Resolução usada para converter o tamanho em pixels para polegadas
+DPI = 100
+
+# Limites do tamanho das imagens, em pixels
+MINIMO_PIXELS = 100
+MAXIMO_PIXELS = 4000
+
+# Número de threads do pool de renderização
+TRABALHADORES_RENDERIZACAO = min(4, os.cpu_count() or 1)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_trava_executor = threading.Lock()
+
+
+def renderizar_grafo(g_nx: nx.Graph, pos: Dict[Any, Tuple[float, float]], formato: str = "png",
+                     largura: int = 1000, altura: int = 800,
+                     rotulos_arestas: Optional[Dict[Tuple[Any, Any], Any]] = None,
+                     estilo: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Desenha um grafo em uma figura própria e retorna a imagem codificada.
+
+    Args:
+        g_nx: Grafo NetworkX a ser desenhado.
+        pos: Posição de cada vértice.
+        formato: Formato da imagem (png, svg, pdf, jpg ou jpeg).
+        largura: Largura da imagem em pixels.
+        altura: Altura da imagem em pixels.
+        rotulos_arestas: Rótulos das arestas, por par de vértices (opcional).
+        estilo: Parâmetros de desenho que substituem os padrões (opcional).
+
+    Returns:
+        bytes: Conteúdo da imagem.
+
+    Raises:
+        ValueError: Se o formato ou o tamanho não forem suportados.
+    """
+    if formato not in FORMATOS_IMAGEM:
+        raise ValueError(f"Formato '{formato}' não suportado. Formatos suportados: {', '.join(FORMATOS_IMAGEM)}")
+    for dimensao in (largura, altura):
+        if not MINIMO_PIXELS <= dimensao <= MAXIMO_PIXELS:
+            raise ValueError(f"O tamanho da imagem deve estar entre {MINIMO_PIXELS} e {MAXIMO_PIXELS} pixels.")
+
+    parametros = {"node_color": "skyblue", "node_size": 1500, "edge_color": "black",
+                  "linewidths": 1, "font_size": 15, "font_weight": "normal", "width": 1.0}
+    parametros.update(estilo or {})
+
+    # Figura e canvas exclusivos desta renderização
+    figura = Figure(figsize=(largura / DPI, altura / DPI), dpi=DPI, facecolor="white")
+    FigureCanvasAgg(figura)
+    eixos = figura.add_axes((0, 0, 1, 1))
+    eixos.set_axis_off()
+
+    nx.draw_networkx_nodes(g_nx, pos, ax=eixos, node_color=parametros["node_color"],
+                           node_size=parametros["node_size"], linewidths=parametros["linewidths"])
+    nx.draw_networkx_edges(g_nx, pos, ax=eixos, edge_color=parametros["edge_color"],
+                           width=parametros["width"], node_size=parametros["node_size"])
+    nx.draw_networkx_labels(g_nx, pos, ax=eixos, font_size=parametros["font_size"],
+                            font_weight=parametros["font_weight"])
+    if rotulos_arestas:
+        nx.draw_networkx_edge_labels(g_nx, pos, edge_labels=rotulos_arestas, ax=eixos)
+
+    # Margem para que os vértices das bordas não sejam cortados
+    eixos.margins(0.1)
+
+    buffer = io.BytesIO()
+    figura.savefig(buffer, format=formato, dpi=DPI)
+    return buffer.getvalue()
+
+
+def agendar_renderizacao(funcao: Callable[..., Any], *args, **kwargs) -> Future:
+    """
+    Executa uma função no pool de renderização.
+
+    Permite incluir no pool etapas que acompanham o desenho, como o cálculo
+    do layout. A função não deve aguardar outras tarefas do mesmo pool.
+
+    Args:
+        funcao: Função a ser executada.
+        *args: Argumentos posicionais da função.
+        **kwargs: Argumentos nomeados da função.
+
+    Returns:
+        Future: Futuro com o resultado da função.
+    """
+    global _executor
+    with _trava_executor:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=TRABALHADORES_RENDERIZACAO,
+                                           thread_name_prefix="renderizacao")
+    return _executor.submit(funcao, *args, **kwargs)
+
+
+def renderizar_em_segundo_plano(g_nx: nx.Graph, pos: Dict[Any, Tuple[float, float]], formato: str = "png",
+                                largura: int = 1000, altura: int = 800,
+                                rotulos_arestas: Optional[Dict[Tuple[Any, Any], Any]] = None,
+                                estilo: Optional[Dict[str, Any]] = None) -> Future:
+    """
+    Agenda a renderização de um grafo no pool de renderização.
+
+    Os argumentos são os de ``renderizar_grafo``; o grafo e as posições não
+    devem ser alterados até que a renderização termine.
+
+    Returns:
+        Future: Futuro com o conteúdo da imagem.
+    """
+    return agendar_renderizacao(renderizar_grafo, g_nx, pos, formato, largura, altura, rotulos_arestas, estilo)
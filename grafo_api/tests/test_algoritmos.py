@@ -409,3 +409,652 @@ def test_executar_algoritmo_grafo_inexistente():
     
     # Verifica se a resposta indica erro
     assert response.status_code == 404
+
+
+def test_variantes_dijkstra_csr():
+    """Testa as variantes do Dijkstra em CSR contra o NetworkX, com pesos de Grafo e GrafoPonderado."""
+    import random
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.tipos.grafo_ponderado import GrafoPonderado
+    from grafo_backend.algoritmos.caminhos import (
+        dijkstra, dijkstra_bidirecional, dijkstra_multiplas_origens, k_mais_proximos, reconstruir_caminho)
+    
+    aleatorio = random.Random(7)
+    pares = {tuple(sorted(aleatorio.sample(range(60), 2))) for _ in range(200)}
+    arestas = [(u, v, aleatorio.randint(1, 9)) for u, v in sorted(pares)]
+    for classe in (Grafo, GrafoPonderado):
+        for direcionado in (False, True):
+            grafo = classe(nome="Teste", direcionado=direcionado)
+            referencia = nx.DiGraph() if direcionado else nx.Graph()
+            for v in range(60):
+                grafo.adicionar_vertice(v)
+                referencia.add_node(v)
+            for u, v, peso in arestas:
+                grafo.adicionar_aresta(u, v, peso=peso)
+                referencia.add_edge(u, v, custo=peso)
+            esperado = nx.single_source_dijkstra_path_length(referencia, 0, weight="custo")
+            
+            # Todas as distâncias, com infinito para os inalcançáveis
+            distancias, predecessores = dijkstra(grafo, 0)
+            assert distancias == {v: esperado.get(v, float('inf')) for v in range(60)}
+            
+            for destino in range(60):
+                custo, caminho = dijkstra_bidirecional(grafo, 0, destino)
+                assert custo == esperado.get(destino, float('inf'))
+                if destino in esperado:
+                    assert caminho[0] == 0 and caminho[-1] == destino
+                    assert sum(grafo.obter_peso_aresta(a, b) for a, b in zip(caminho, caminho[1:])) == custo
+                    
+                    # Término antecipado no destino
+                    parciais, anteriores = dijkstra(grafo, 0, destino)
+                    assert parciais[destino] == custo
+                    assert reconstruir_caminho(anteriores, 0, destino)[-1] == destino
+                else:
+                    assert caminho == []
+            
+            proximos = k_mais_proximos(grafo, 0, 5)
+            assert [d for _, d in proximos] == sorted(esperado.values())[:5]
+            
+            multiplas, fontes = dijkstra_multiplas_origens(grafo, [0, 30])
+            assert multiplas == nx.multi_source_dijkstra_path_length(referencia, {0, 30}, weight="custo")
+            assert fontes[0] == 0 and fontes[30] == 30
+    
+    # Pesos negativos não são aceitos
+    grafo = GrafoPonderado(nome="Negativo")
+    grafo.adicionar_vertice("A")
+    grafo.adicionar_vertice("B")
+    grafo.adicionar_aresta("A", "B", peso=-1)
+    with pytest.raises(ValueError):
+        dijkstra(grafo, "A")
+
+
+def test_executar_dijkstra_com_destino_e_k():
+    """Testa os parâmetros opcionais 'destino' e 'k' do Dijkstra pela API."""
+    grafo_service = get_grafo_service()
+    grafo_id = grafo_service.criar_grafo("Caminho Ponderado", ponderado=True)
+    grafo = grafo_service.obter_grafo(grafo_id)
+    for v in "ABCD":
+        grafo.adicionar_vertice(v)
+    for u, v, peso in [("A", "B", 1), ("B", "C", 2), ("A", "C", 5), ("C", "D", 1)]:
+        grafo.adicionar_aresta(u, v, peso=peso)
+    
+    response = client.post(f"/api/v1/algoritmos/executar/dijkstra/{grafo_id}",
+                           json={"parametros": {"origem": "A", "destino": "D"}})
+    assert response.status_code == 200
+    assert response.json()["resultado"] == {"custo": 4.0, "caminho": ["A", "B", "C", "D"]}
+    
+    response = client.post(f"/api/v1/algoritmos/executar/dijkstra/{grafo_id}",
+                           json={"parametros": {"origem": "A", "k": 2}})
+    assert response.status_code == 200
+    assert response.json()["resultado"] == {"A": 0.0, "B": 1.0}
+
+
+def test_floyd_warshall_em_blocos_com_resultado_compartilhado():
+    """Testa o Floyd-Warshall vetorizado contra o NetworkX e o reaproveitamento da execução."""
+    import random
+    import networkx as nx
+    from grafo_backend.tipos.grafo_ponderado import GrafoPonderado
+    from grafo_backend.algoritmos.caminhos import (
+        floyd_warshall, calcular_diametro, calcular_centro, calcular_matriz_distancias)
+    
+    # Mais vértices que um bloco, para exercitar a divisão em blocos
+    aleatorio = random.Random(11)
+    grafo = GrafoPonderado(nome="Floyd", direcionado=True)
+    referencia = nx.DiGraph()
+    for v in range(150):
+        grafo.adicionar_vertice(v)
+        referencia.add_node(v)
+    for v in range(150):
+        grafo.adicionar_aresta(v, (v + 1) % 150, peso=5)
+        referencia.add_edge(v, (v + 1) % 150, custo=5)
+    for _ in range(300):
+        u, v = aleatorio.sample(range(150), 2)
+        if not grafo.existe_aresta(u, v):
+            peso = aleatorio.randint(1, 9)
+            grafo.adicionar_aresta(u, v, peso=peso)
+            referencia.add_edge(u, v, custo=peso)
+    
+    resultado = floyd_warshall(grafo)
+    esperado = dict(nx.all_pairs_dijkstra_path_length(referencia, weight="custo"))
+    for u in range(0, 150, 7):
+        for v in range(150):
+            assert resultado.distancia(u, v) == esperado[u][v]
+            caminho = resultado.caminho(u, v)
+            assert caminho[0] == u and caminho[-1] == v
+            assert sum(grafo.obter_peso_aresta(a, b) for a, b in zip(caminho, caminho[1:])) == esperado[u][v]
+    
+    # Uma única execução, compartilhada até a próxima alteração
+    assert calcular_matriz_distancias(grafo) is resultado
+    assert calcular_matriz_distancias(grafo)[(3, 4)] == esperado[3][4]
+    diametro, (u, v) = calcular_diametro(grafo)
+    assert diametro == max(max(d.values()) for d in esperado.values()) == esperado[u][v]
+    excentricidades = {u: max(d.values()) for u, d in esperado.items()}
+    assert sorted(calcular_centro(grafo)) == sorted(
+        u for u, e in excentricidades.items() if e == min(excentricidades.values()))
+    assert floyd_warshall(grafo) is resultado
+    
+    grafo.adicionar_aresta(0, 75, peso=1)
+    assert floyd_warshall(grafo) is not resultado
+    assert floyd_warshall(grafo).distancia(0, 75) == 1
+    
+    # Ciclo de peso negativo
+    negativo = GrafoPonderado(nome="Negativo", direcionado=True)
+    for v in "ABC":
+        negativo.adicionar_vertice(v)
+    negativo.adicionar_aresta("A", "B", peso=1)
+    negativo.adicionar_aresta("B", "C", peso=-3)
+    negativo.adicionar_aresta("C", "A", peso=1)
+    with pytest.raises(ValueError):
+        floyd_warshall(negativo)
+
+
+def test_johnson_com_pesos_negativos(tmp_path):
+    """Testa o algoritmo de Johnson em fluxo e em matriz mapeada, contra o Floyd-Warshall."""
+    import random
+    import numpy as np
+    from grafo_backend.tipos.grafo_ponderado import GrafoPonderado
+    from grafo_backend.algoritmos.caminhos import floyd_warshall, johnson, johnson_matriz
+    
+    # Arestas negativas apenas "para frente", sem ciclos negativos
+    aleatorio = random.Random(5)
+    grafo = GrafoPonderado(nome="Johnson", direcionado=True)
+    for v in range(80):
+        grafo.adicionar_vertice(v)
+    for _ in range(320):
+        u, v = aleatorio.sample(range(80), 2)
+        if not grafo.existe_aresta(u, v):
+            grafo.adicionar_aresta(u, v, peso=aleatorio.randint(-5, 10) if u < v else aleatorio.randint(5, 15))
+    esperado = floyd_warshall(grafo)
+    
+    linhas = dict(johnson(grafo, origens=[0, 40, 79], processos=1))
+    assert list(linhas) == [0, 40, 79]
+    for origem, linha in linhas.items():
+        np.testing.assert_allclose(linha, esperado.distancias[esperado.indice(origem)])
+    
+    vertices, matriz = johnson_matriz(grafo, arquivo=str(tmp_path / "distancias.npy"), processos=1)
+    assert vertices == esperado.vertices
+    np.testing.assert_allclose(matriz, esperado.distancias)
+    np.testing.assert_allclose(np.load(tmp_path / "distancias.npy", mmap_mode="r"), esperado.distancias)
+    
+    # Ciclo negativo detectado na chamada, antes de consumir o fluxo
+    grafo.adicionar_vertice("x")
+    grafo.adicionar_vertice("y")
+    grafo.adicionar_aresta("x", "y", peso=1)
+    grafo.adicionar_aresta("y", "x", peso=-2)
+    with pytest.raises(ValueError):
+        johnson(grafo)
+
+
+def test_johnson_no_pool_de_processos(tmp_path, monkeypatch):
+    """Testa o algoritmo de Johnson distribuído em dois processos contra a execução no próprio processo."""
+    import importlib
+    import random
+    import numpy as np
+    from grafo_backend.tipos.grafo_ponderado import GrafoPonderado
+    from grafo_backend.algoritmos.caminhos import johnson, johnson_matriz
+    # O pacote reexporta a função com o mesmo nome do módulo
+    modulo_johnson = importlib.import_module("grafo_backend.algoritmos.caminhos.johnson")
+    
+    # O mesmo grafo de test_johnson_com_pesos_negativos, sem ciclos negativos
+    aleatorio = random.Random(5)
+    grafo = GrafoPonderado(nome="Johnson", direcionado=True)
+    for v in range(80):
+        grafo.adicionar_vertice(v)
+    for _ in range(320):
+        u, v = aleatorio.sample(range(80), 2)
+        if not grafo.existe_aresta(u, v):
+            grafo.adicionar_aresta(u, v, peso=aleatorio.randint(-5, 10) if u < v else aleatorio.randint(5, 15))
+    
+    sequencial = list(johnson(grafo, processos=1))
+    _, matriz_sequencial = johnson_matriz(grafo, processos=1)
+    
+    # Grafo pequeno no pool, com vários lotes por processo
+    monkeypatch.setattr(modulo_johnson, "MINIMO_VERTICES_POOL", 10)
+    monkeypatch.setattr(modulo_johnson, "ORIGENS_POR_TAREFA", 8)
+    assert modulo_johnson._ExecucaoJohnson(grafo, 2).processos == 2
+    
+    paralelo = list(johnson(grafo, processos=2))
+    assert [origem for origem, _ in paralelo] == [origem for origem, _ in sequencial]
+    for (_, linha), (_, esperada) in zip(paralelo, sequencial):
+        np.testing.assert_allclose(linha, esperada)
+    
+    vertices, matriz = johnson_matriz(grafo, arquivo=str(tmp_path / "distancias.npy"), processos=2)
+    assert vertices == grafo.obter_csr().lista_ids()
+    np.testing.assert_allclose(matriz, matriz_sequencial)
+    np.testing.assert_allclose(np.load(tmp_path / "distancias.npy", mmap_mode="r"), matriz_sequencial)
+
+
+def test_oraculo_distancias_por_limites_de_excentricidade():
+    """Testa diâmetro, raio, centro e periferia pelo oráculo, com poucas buscas e cache limitado."""
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.algoritmos.caminhos import OraculoDistancias, calcular_diametro, calcular_centro
+    from grafo_backend.comparacao import calcular_invariantes
+    
+    # Grade 30 x 30: 900 vértices
+    referencia = nx.convert_node_labels_to_integers(nx.grid_2d_graph(30, 30))
+    grafo = Grafo("Grade")
+    for v in referencia.nodes():
+        grafo.adicionar_vertice(v)
+    for u, v in referencia.edges():
+        grafo.adicionar_aresta(u, v)
+    
+    oraculo = OraculoDistancias(grafo, ponderado=False, capacidade=4)
+    assert oraculo.diametro() == nx.diameter(referencia) == 58
+    assert oraculo.raio() == nx.radius(referencia)
+    assert sorted(oraculo.centro()) == sorted(nx.center(referencia))
+    assert sorted(oraculo.periferia()) == sorted(nx.periphery(referencia))
+    assert oraculo.buscas < 40
+    assert len(oraculo._linhas) <= 4
+    assert oraculo.distancia(0, 899) == 58
+    
+    # Funções do módulo usam o oráculo compartilhado do grafo
+    diametro, (u, v) = calcular_diametro(grafo)
+    assert diametro == 58 and oraculo.distancia(u, v) == 58
+    assert sorted(calcular_centro(grafo)) == sorted(nx.center(referencia))
+    invariantes = calcular_invariantes(grafo)
+    assert invariantes["diametro"] == 58 and invariantes["raio"] == nx.radius(referencia)
+    
+    # Grafo direcionado: excentricidades de saída
+    direcionado = Grafo("Ciclo", direcionado=True)
+    for v in range(5):
+        direcionado.adicionar_vertice(v)
+    for v in range(5):
+        direcionado.adicionar_aresta(v, (v + 1) % 5)
+    direcionado.adicionar_aresta(0, 2)
+    oraculo = OraculoDistancias(direcionado)
+    esperado = nx.eccentricity(direcionado.obter_grafo_networkx())
+    assert oraculo.diametro() == max(esperado.values())
+    assert oraculo.raio() == min(esperado.values())
+    assert sorted(oraculo.centro()) == sorted(v for v, e in esperado.items() if e == min(esperado.values()))
+    invariantes = calcular_invariantes(direcionado)
+    assert invariantes["diametro"] == max(esperado.values()) and invariantes["raio"] == min(esperado.values())
+    
+    # Fracamente, mas não fortemente, conexo: diâmetro infinito
+    caminho = Grafo("Caminho", direcionado=True)
+    caminho.adicionar_vertice(1)
+    caminho.adicionar_vertice(2)
+    caminho.adicionar_aresta(1, 2)
+    invariantes = calcular_invariantes(caminho)
+    assert invariantes["eh_conexo"]
+    assert invariantes["diametro"] == float('inf') and invariantes["raio"] == 1
+    
+    # Grafo vazio: diâmetro e raio indefinidos
+    invariantes = calcular_invariantes(Grafo("Vazio"))
+    assert invariantes["num_vertices"] == 0
+    assert invariantes["diametro"] == float('inf') and invariantes["raio"] == float('inf')
+
+
+def test_par_diametral_em_grafos_direcionados():
+    """Testa o par diametral em grafos fortemente conexos ponderados, em que o diâmetro pode não vir de um pivô."""
+    import random
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.algoritmos.caminhos import OraculoDistancias, calcular_diametro
+    
+    testados = 0
+    for semente in (46, 82) + tuple(range(20)):
+        aleatorio = random.Random(semente)
+        referencia = nx.gnm_random_graph(25, 90, seed=semente, directed=True)
+        if not nx.is_strongly_connected(referencia):
+            continue
+        grafo = Grafo("Aleatório", direcionado=True)
+        for v in referencia.nodes():
+            grafo.adicionar_vertice(v)
+        for u, v in referencia.edges():
+            peso = aleatorio.randint(1, 9)
+            grafo.adicionar_aresta(u, v, peso)
+            referencia[u][v]["weight"] = peso
+        esperado = max(max(linha.values()) for _, linha in nx.all_pairs_dijkstra_path_length(referencia))
+    
+        u, v = OraculoDistancias(grafo).par_diametral()
+        assert nx.dijkstra_path_length(referencia, u, v) == esperado
+        diametro, (u, v) = calcular_diametro(grafo)
+        assert diametro == esperado == nx.dijkstra_path_length(referencia, u, v)
+        testados += 1
+    assert testados > 5
+
+
+def test_a_star_com_marcos(monkeypatch):
+    """Testa o A* com heurística por marcos contra o NetworkX, os nós explorados e a API."""
+    import random
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.algoritmos.caminhos import (
+        a_star, comparar_a_star_dijkstra, IndiceMarcos, obter_indice_marcos)
+    
+    # Grade 40 x 40 com pesos aleatórios, nos dois sentidos
+    aleatorio = random.Random(3)
+    referencia = nx.DiGraph()
+    for u, v in nx.grid_2d_graph(40, 40).edges():
+        referencia.add_edge(u, v, custo=aleatorio.randint(1, 9))
+        referencia.add_edge(v, u, custo=aleatorio.randint(1, 9))
+    grafo = Grafo("Grade", direcionado=True)
+    for v in referencia.nodes():
+        grafo.adicionar_vertice(v)
+    for u, v, dados in referencia.edges(data=True):
+        grafo.adicionar_aresta(u, v, peso=dados["custo"])
+    
+    indice = obter_indice_marcos(grafo, 8)
+    assert obter_indice_marcos(grafo, 8) is indice
+    assert len(indice.vertices_marcos()) == 8
+    explorados_a_star = explorados_dijkstra = 0
+    for _ in range(20):
+        origem, destino = aleatorio.sample(list(referencia.nodes()), 2)
+        esperado = nx.dijkstra_path_length(referencia, origem, destino, weight="custo")
+        assert indice(origem, destino) <= esperado
+        caminho, custo = a_star(grafo, origem, destino, indice)
+        assert custo == esperado and caminho[0] == origem and caminho[-1] == destino
+        
+        comparacao = comparar_a_star_dijkstra(grafo, origem, destino, indice)
+        assert comparacao["iguais"] and comparacao["dijkstra_custo"] == esperado
+        explorados_a_star += comparacao["nos_explorados_a_star"]
+        explorados_dijkstra += comparacao["nos_explorados_dijkstra"]
+    assert explorados_a_star * 3 < explorados_dijkstra
+    
+    # O índice deixa de valer após uma alteração do grafo
+    grafo.adicionar_vertice("isolado")
+    assert obter_indice_marcos(grafo, 8) is not indice
+    with pytest.raises(ValueError):
+        a_star(grafo, origem, destino, indice)
+    with pytest.raises(ValueError):
+        a_star(grafo, origem, "isolado", IndiceMarcos(grafo, 4))
+    
+    # Execução pela API
+    grafo_service = get_grafo_service()
+    grafo_id = grafo_service.criar_grafo("Caminho A*", ponderado=True)
+    grafo = grafo_service.obter_grafo(grafo_id)
+    for v in "ABCD":
+        grafo.adicionar_vertice(v)
+    for u, v, peso in [("A", "B", 1), ("B", "C", 2), ("A", "C", 5), ("C", "D", 1)]:
+        grafo.adicionar_aresta(u, v, peso=peso)
+    
+    response = client.post(f"/api/v1/algoritmos/executar/a_star/{grafo_id}",
+                           json={"parametros": {"origem": "A", "destino": "D", "marcos": 2, "comparar": True}})
+    assert response.status_code == 200
+    resultado = response.json()["resultado"]
+    assert resultado["custo"] == 4.0 and resultado["caminho"] == ["A", "B", "C", "D"]
+    assert resultado["comparacao"]["iguais"]
+    assert resultado["comparacao"]["nos_explorados_a_star"] <= resultado["comparacao"]["nos_explorados_dijkstra"]
+    
+    # A comparação é uma medição: cada chamada executa os dois algoritmos de novo,
+    # enquanto o caminho sem comparação vem do cache
+    import app.services.algoritmo_service as servico_algoritmos
+    chamadas = []
+    comparar_original = servico_algoritmos.comparar_a_star_dijkstra
+    a_star_original = servico_algoritmos.a_star
+    monkeypatch.setattr(servico_algoritmos, "comparar_a_star_dijkstra",
+                        lambda *args: chamadas.append("comparar") or comparar_original(*args))
+    monkeypatch.setattr(servico_algoritmos, "a_star",
+                        lambda *args: chamadas.append("a_star") or a_star_original(*args))
+    for parametros in [{"comparar": True}] * 2 + [{}] * 2:
+        parametros = dict(parametros, origem="A", destino="D", marcos=2)
+        response = client.post(f"/api/v1/algoritmos/executar/a_star/{grafo_id}", json={"parametros": parametros})
+        assert response.status_code == 200
+        assert ("comparacao" in response.json()["resultado"]) == bool(parametros.get("comparar"))
+    assert chamadas == ["comparar", "comparar", "a_star"]
+
+
+def test_hierarquia_contracao(tmp_path):
+    """Testa as consultas pela hierarquia de contração, a gravação em disco e a API de rotas."""
+    import random
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.algoritmos.caminhos import HierarquiaContracao, obter_hierarquia
+    
+    aleatorio = random.Random(11)
+    for direcionado in (False, True):
+        grafo = Grafo("Rede", direcionado=direcionado)
+        referencia = nx.DiGraph() if direcionado else nx.Graph()
+        for v in range(300):
+            grafo.adicionar_vertice(v)
+            referencia.add_node(v)
+        pares = {tuple(aleatorio.sample(range(300), 2)) for _ in range(900)}
+        for u, v in sorted(pares):
+            if not referencia.has_edge(u, v):
+                peso = aleatorio.choice([0, 1, 2, 5, 10])
+                grafo.adicionar_aresta(u, v, peso=peso)
+                referencia.add_edge(u, v, custo=peso)
+        
+        hierarquia = obter_hierarquia(grafo, str(tmp_path))
+        assert obter_hierarquia(grafo, str(tmp_path)) is hierarquia
+        for _ in range(100):
+            origem, destino = aleatorio.sample(range(300), 2)
+            custo, caminho = hierarquia.consultar(origem, destino)
+            try:
+                esperado = nx.dijkstra_path_length(referencia, origem, destino, weight="custo")
+            except nx.NetworkXNoPath:
+                assert custo == float('inf') and caminho == []
+                continue
+            assert custo == esperado and caminho[0] == origem and caminho[-1] == destino
+            assert sum(grafo.obter_peso_aresta(a, b) for a, b in zip(caminho, caminho[1:])) == custo
+        
+        # Gravada pelo hash de conteúdo e reaproveitada
+        arquivo = tmp_path / f"{grafo.obter_hash()}.ch.npz"
+        carregada = HierarquiaContracao.carregar(str(arquivo), grafo)
+        assert carregada is not None and carregada.consultar(0, 1) == hierarquia.consultar(0, 1)
+        
+        # Reconstruída após uma alteração
+        grafo.adicionar_vertice("novo")
+        grafo.adicionar_aresta(0, "novo", peso=1)
+        assert HierarquiaContracao.carregar(str(arquivo), grafo) is None
+        nova = obter_hierarquia(grafo, str(tmp_path))
+        assert nova is not hierarquia and nova.consultar(0, "novo") == (1.0, [0, "novo"])
+    
+    # Consultas pela API
+    grafo_service = get_grafo_service()
+    grafo_id = grafo_service.criar_grafo("Rotas", ponderado=True)
+    grafo = grafo_service.obter_grafo(grafo_id)
+    for v in "ABCDE":
+        grafo.adicionar_vertice(v)
+    for u, v, peso in [("A", "B", 1), ("B", "C", 2), ("A", "C", 5), ("C", "D", 1)]:
+        grafo.adicionar_aresta(u, v, peso=peso)
+    
+    response = client.post(f"/api/v1/algoritmos/rotas/{grafo_id}",
+                           json={"pares": [["A", "D"], ["D", "B"], ["A", "E"]]})
+    assert response.status_code == 200
+    assert response.json() == [
+        {"custo": 4.0, "caminho": ["A", "B", "C", "D"]},
+        {"custo": 3.0, "caminho": ["D", "C", "B"]},
+        {"custo": None, "caminho": []}
+    ]
+    response = client.post(f"/api/v1/algoritmos/rotas/{grafo_id}", json={"pares": [["A", "Z"]]})
+    assert response.status_code == 400
+    response = client.post(f"/api/v1/algoritmos/executar/contracao_hierarquica/{grafo_id}",
+                           json={"parametros": {"origem": "A", "destino": "D"}})
+    assert response.status_code == 200
+    assert response.json()["resultado"] == {"custo": 4.0, "caminho": ["A", "B", "C", "D"]}
+
+
+def test_bellman_ford_fila_e_vetorizado_com_ciclo_negativo():
+    """Testa as variantes do Bellman-Ford contra o NetworkX e a extração de ciclos negativos."""
+    import random
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.algoritmos.caminhos import bellman_ford, detectar_ciclo_negativo
+    from grafo_backend.algoritmos.caminhos.bellman_ford import caminho_minimo
+    
+    aleatorio = random.Random(5)
+    for _ in range(100):
+        grafo = Grafo("Negativo", direcionado=True)
+        referencia = nx.DiGraph()
+        for v in range(20):
+            grafo.adicionar_vertice(v)
+            referencia.add_node(v)
+        for _ in range(45):
+            u, v = aleatorio.randrange(20), aleatorio.randrange(20)
+            if not referencia.has_edge(u, v):
+                peso = aleatorio.randint(-3, 10)
+                grafo.adicionar_aresta(u, v, peso=peso)
+                referencia.add_edge(u, v, weight=peso)
+        
+        tem_ciclo = nx.negative_edge_cycle(referencia)
+        for metodo in ("fila", "vetorizado"):
+            ciclo = detectar_ciclo_negativo(grafo, metodo=metodo)
+            assert (ciclo is not None) == tem_ciclo
+            if ciclo:
+                arestas = zip(ciclo, ciclo[1:] + ciclo[:1])
+                assert sum(referencia[u][v]["weight"] for u, v in arestas) < 0
+            
+            distancias, predecessores, ciclo_alcancavel = bellman_ford(grafo, 0, metodo)
+            try:
+                esperado = nx.single_source_bellman_ford_path_length(referencia, 0)
+            except nx.NetworkXUnbounded:
+                assert ciclo_alcancavel
+                continue
+            assert not ciclo_alcancavel
+            assert {v: d for v, d in distancias.items() if d != float('inf')} == esperado
+            destino = max(esperado, key=esperado.get)
+            caminho, custo = caminho_minimo(grafo, 0, destino, metodo)
+            assert custo == esperado[destino] and caminho[-1] == destino
+    
+    # Em grafos não direcionados, uma aresta negativa é um ciclo negativo
+    grafo = Grafo("Não direcionado")
+    for v in "ABC":
+        grafo.adicionar_vertice(v)
+    grafo.adicionar_aresta("A", "B", peso=2)
+    grafo.adicionar_aresta("B", "C", peso=-1)
+    assert sorted(detectar_ciclo_negativo(grafo)) == ["B", "C"]
+    with pytest.raises(ValueError):
+        caminho_minimo(grafo, "A", "C")
+    with pytest.raises(ValueError):
+        bellman_ford(grafo, "A", metodo="outro")
+
+
+def test_bfs_por_fronteira_nas_duas_direcoes():
+    """Testa a BFS por níveis (cima-para-baixo, baixo-para-cima e com troca), componentes e bipartição."""
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.algoritmos.caminhos import bfs_fronteira
+    from grafo_backend.algoritmos.caminhos.busca.busca import (
+        bfs, encontrar_componentes_conexos, verificar_bipartido)
+    
+    for semente, direcionado in enumerate((False, True, False, True)):
+        referencia = nx.gnm_random_graph(300, 700, seed=semente, directed=direcionado)
+        grafo = Grafo("Aleatório", direcionado=direcionado)
+        for v in referencia.nodes():
+            grafo.adicionar_vertice(v)
+        for u, v in referencia.edges():
+            grafo.adicionar_aresta(u, v)
+        ids = grafo.obter_csr().lista_ids()
+        esperado = nx.single_source_shortest_path_length(referencia, 0)
+        
+        # Direção padrão, sempre baixo-para-cima e sempre cima-para-baixo
+        for alfa, beta in ((14, 24), (1e-9, 1e18), (1e18, 1)):
+            distancias, pais = bfs_fronteira(grafo, 0, alfa, beta)
+            assert {ids[i]: int(d) for i, d in enumerate(distancias) if d >= 0} == esperado
+            for i, d in enumerate(distancias.tolist()):
+                if d > 0:
+                    assert referencia.has_edge(ids[pais[i]], ids[i]) and distancias[pais[i]] == d - 1
+        
+        predecessores, distancias = bfs(grafo, 0)
+        assert {v: d for v, d in distancias.items() if d != float('infinity')} == esperado
+        
+        componentes = encontrar_componentes_conexos(grafo)
+        referencia_componentes = (nx.weakly_connected_components(referencia) if direcionado
+                                  else nx.connected_components(referencia))
+        assert sorted(map(sorted, componentes)) == sorted(map(sorted, referencia_componentes))
+    
+    # Bipartição: grade (bipartida) com e sem uma aresta que fecha um ciclo ímpar
+    grade = nx.convert_node_labels_to_integers(nx.grid_2d_graph(20, 20))
+    grafo = Grafo("Grade")
+    for v in grade.nodes():
+        grafo.adicionar_vertice(v)
+    for u, v in grade.edges():
+        grafo.adicionar_aresta(u, v)
+    grafo.adicionar_vertice("isolado")
+    bipartido, cores = verificar_bipartido(grafo)
+    assert bipartido and all(cores[u] != cores[v] for u, v in grade.edges())
+    grafo.adicionar_aresta(0, 21)
+    assert verificar_bipartido(grafo) == (False, {})
+
+
+def test_bfs_multiplas_origens_e_centralidades():
+    """Testa a busca em largura em lotes de 64 origens e as centralidades calculadas com ela."""
+    import math
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.algoritmos import (
+        bfs_multiplas_origens, centralidade_proximidade, centralidade_harmonica)
+    
+    for semente, direcionado in enumerate((False, True)):
+        # Mais de um lote e vértices inalcançáveis
+        referencia = nx.gnm_random_graph(150, 220, seed=semente, directed=direcionado)
+        grafo = Grafo("Aleatório", direcionado=direcionado)
+        for v in referencia.nodes():
+            grafo.adicionar_vertice(v)
+        for u, v in referencia.edges():
+            grafo.adicionar_aresta(u, v)
+        ids = grafo.obter_csr().lista_ids()
+        
+        distancias = bfs_multiplas_origens(grafo)
+        assert distancias.shape == (150, 150)
+        for i, origem in enumerate(ids):
+            linha = {ids[j]: int(d) for j, d in enumerate(distancias[i]) if d >= 0}
+            assert linha == nx.single_source_shortest_path_length(referencia, origem)
+        
+        # Origens escolhidas, inclusive repetidas
+        parciais = bfs_multiplas_origens(grafo, [5, 0, 5])
+        assert (parciais == distancias[[ids.index(5), ids.index(0), ids.index(5)]]).all()
+        
+        proximidade = centralidade_proximidade(grafo)
+        for v, valor in nx.closeness_centrality(referencia).items():
+            assert math.isclose(proximidade[v], valor, abs_tol=1e-12)
+        harmonica = centralidade_harmonica(grafo)
+        for v, valor in nx.harmonic_centrality(referencia).items():
+            assert math.isclose(harmonica[v], valor, abs_tol=1e-12)
+    
+    with pytest.raises(ValueError):
+        bfs_multiplas_origens(grafo, ["inexistente"])
+
+
+def test_busca_em_profundidade_iterativa():
+    """Testa os algoritmos baseados em DFS com pilha explícita, inclusive em cadeias profundas."""
+    import sys
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.algoritmos.caminhos.busca.busca import dfs, encontrar_ciclo, ordenacao_topologica
+    from grafo_backend.algoritmos.caminhos.tarjan import tarjan, encontrar_pontes, encontrar_pontos_articulacao
+    from grafo_backend.algoritmos.ciclos.hierholzer import hierholzer
+    
+    def criar(referencia):
+        grafo = Grafo("Teste", direcionado=referencia.is_directed())
+        grafo.definir_grafo_networkx(referencia)
+        return grafo
+    
+    # Cadeias bem mais longas que o limite de recursão do Python
+    n = sys.getrecursionlimit() * 5
+    cadeia = criar(nx.path_graph(n))
+    cadeia_dirigida = criar(nx.path_graph(n, create_using=nx.DiGraph))
+    assert len(encontrar_pontes(cadeia)) == n - 1
+    assert encontrar_pontos_articulacao(cadeia) == set(range(1, n - 1))
+    assert encontrar_ciclo(cadeia) is None
+    assert dfs(cadeia, 0)[1][n - 1] == (n, n + 1)
+    assert len(tarjan(cadeia_dirigida)) == n
+    assert ordenacao_topologica(cadeia_dirigida) == list(range(n))
+    anel = nx.cycle_graph(n, create_using=nx.DiGraph)
+    assert len(tarjan(criar(anel))) == 1
+    assert hierholzer(criar(anel), 0) == list(range(n)) + [0]
+    
+    # Comparação com o NetworkX em grafos aleatórios
+    for semente in range(3):
+        referencia = nx.gnm_random_graph(200, 260, seed=semente)
+        grafo = criar(referencia)
+        assert {frozenset(p) for p in encontrar_pontes(grafo)} == {frozenset(p) for p in nx.bridges(referencia)}
+        assert encontrar_pontos_articulacao(grafo) == set(nx.articulation_points(referencia))
+        ciclo = encontrar_ciclo(grafo)
+        assert ciclo[0] == ciclo[-1] and len(ciclo) >= 4
+        assert all(referencia.has_edge(u, v) for u, v in zip(ciclo, ciclo[1:]))
+        
+        dirigido = nx.gnm_random_graph(200, 400, seed=semente, directed=True)
+        componentes = tarjan(criar(dirigido))
+        assert sorted(map(sorted, componentes)) == sorted(map(sorted, nx.strongly_connected_components(dirigido)))
+        assert ordenacao_topologica(criar(dirigido)) is None
+        
+        # Grafo 4-regular conexo: todos os graus são pares
+        euleriano = nx.random_regular_graph(4, 60, seed=semente)
+        assert nx.is_eulerian(euleriano)
+        ciclo = hierholzer(criar(euleriano))
+        assert ciclo[0] == ciclo[-1] and len(ciclo) == euleriano.number_of_edges() + 1
+        assert {frozenset(p) for p in zip(ciclo, ciclo[1:])} == {frozenset(p) for p in euleriano.edges()}
@@ -218,3 +218,46 @@ def test_excluir_grafo(client):
     # Verifica se o grafo foi excluído
     response = client.get(f"/api/v1/grafos/{grafo_id}")
     assert response.status_code == 404
+
+
+def test_componentes_conexos_incrementais():
+    """Testa os componentes conexos mantidos nas inserções e reconstruídos após remoções."""
+    import random
+    import networkx as nx
+    from grafo_backend.core.grafo import Grafo
+    
+    gerador = random.Random(7)
+    for direcionado in (False, True):
+        grafo = Grafo("Conectividade", direcionado=direcionado)
+        referencia = nx.DiGraph() if direcionado else nx.Graph()
+        assert grafo.eh_conexo() and grafo.numero_componentes() == 0
+        
+        for passo in range(1500):
+            operacao = gerador.random()
+            if operacao < 0.3 or referencia.number_of_nodes() < 2:
+                v = gerador.randrange(200)
+                grafo.adicionar_vertice(v)
+                referencia.add_node(v)
+            elif operacao < 0.85:
+                u, v = gerador.sample(sorted(referencia.nodes()), 2)
+                grafo.adicionar_aresta(u, v)
+                referencia.add_edge(u, v)
+            elif operacao < 0.95 and referencia.number_of_edges():
+                u, v = gerador.choice(sorted(referencia.edges()))
+                grafo.remover_aresta(u, v)
+                referencia.remove_edge(u, v)
+            else:
+                v = gerador.choice(sorted(referencia.nodes()))
+                grafo.remover_vertice(v)
+                referencia.remove_node(v)
+            
+            if passo % 5 == 0:
+                componentes = list(nx.weakly_connected_components(referencia) if direcionado
+                                   else nx.connected_components(referencia))
+                assert grafo.numero_componentes() == len(componentes)
+                assert grafo.eh_conexo() == (len(componentes) <= 1)
+                u, v = gerador.choice(sorted(referencia.nodes())), gerador.choice(sorted(referencia.nodes()))
+                assert grafo.estao_conectados(u, v) == any(u in c and v in c for c in componentes)
+    
+    with pytest.raises(ValueError):
+        grafo.estao_conectados("inexistente", u)
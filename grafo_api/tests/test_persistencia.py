@@ -139,3 +139,188 @@ def test_importar_grafo_formato_invalido(client):
     
     # Verifica se a resposta indica erro
     assert response.status_code == 400
+
+
+def test_importar_csv_lista_arestas_em_blocos(tmp_path):
+    """Testa a importação de lista de arestas CSV processada em vários blocos."""
+    from grafo_backend.persistencia import importar_csv_lista_arestas
+
+    caminho = tmp_path / "arestas.csv"
+    caminho.write_text("origem,destino,peso\nA,B,1.5\nB,C,abc\nC\nC,D,2\nD,A\n", encoding="utf-8")
+
+    # Usa blocos pequenos para exercitar a leitura em partes e o caminho irregular
+    grafo = importar_csv_lista_arestas(str(caminho), tamanho_bloco=2)
+
+    assert grafo is not None
+    assert grafo.nome == "arestas"
+    assert grafo.obter_vertices() == ["A", "B", "C", "D"]
+    assert grafo.obter_peso_aresta("A", "B") == 1.5
+    assert grafo.obter_peso_aresta("B", "C") == 1.0
+    assert grafo.obter_peso_aresta("C", "D") == 2.0
+    assert grafo.existe_aresta("D", "A")
+
+
+def test_importar_csv_matriz_adjacencia_em_blocos(tmp_path):
+    """Testa a importação de matriz de adjacência CSV processada em vários blocos."""
+    from grafo_backend.persistencia import importar_csv_matriz_adjacencia
+
+    caminho = tmp_path / "matriz.csv"
+    caminho.write_text(",A,B,C\nA,0,2.5,0\nB,2.5,0,x\nC,0,,0\n", encoding="utf-8")
+
+    grafo = importar_csv_matriz_adjacencia(str(caminho), nome="m", tamanho_bloco=2)
+
+    assert grafo is not None
+    assert grafo.obter_vertices() == ["A", "B", "C"]
+    assert grafo.obter_peso_aresta("A", "B") == 2.5
+    assert grafo.numero_arestas() == 1
+
+
+def test_importar_csv_preserva_cerquilha(tmp_path):
+    """Testa que '#' dentro de um campo não é tratado como início de comentário."""
+    from grafo_backend.persistencia import importar_csv_lista_arestas, importar_csv_matriz_adjacencia
+
+    caminho = tmp_path / "arestas.csv"
+    caminho.write_text("origem,destino,peso\nA,B#x,2\n", encoding="utf-8")
+
+    grafo = importar_csv_lista_arestas(str(caminho))
+
+    assert grafo is not None
+    assert grafo.obter_vertices() == ["A", "B#x"]
+    assert grafo.obter_peso_aresta("A", "B#x") == 2.0
+
+    caminho = tmp_path / "matriz.csv"
+    caminho.write_text(",#1,#2\n#1,0,3\n#2,3,0\n", encoding="utf-8")
+
+    grafo = importar_csv_matriz_adjacencia(str(caminho))
+
+    assert grafo is not None
+    assert grafo.obter_vertices() == ["#1", "#2"]
+    assert grafo.obter_peso_aresta("#1", "#2") == 3.0
+
+
+def test_exportar_grafo_arquivo_compactado(client, grafo_teste):
+    """Testa a exportação em fluxo de um grafo compactado com gzip."""
+    import gzip
+    import json
+
+    grafo_id = grafo_teste
+
+    # Faz a requisição para exportar o grafo compactado
+    response = client.get(f"/api/v1/persistencia/{grafo_id}/exportar/arquivo?formato=json&compactar=true")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/gzip"
+    assert ".json.gz" in response.headers["Content-Disposition"]
+
+    # Verifica o conteúdo descompactado
+    dados = json.loads(gzip.decompress(response.content))
+    assert dados["id"] == grafo_id
+    assert len(dados["vertices"]) == 3
+    pesos = {(a["origem"], a["destino"]): a["peso"] for a in dados["arestas"]}
+    assert pesos[("A", "B")] == 1.5
+
+
+def test_exportar_formatos_xml_reimportaveis(tmp_path, grafo_teste):
+    """Testa se os exportadores GraphML e GEXF geram arquivos legíveis pelo importador."""
+    from grafo_backend.persistencia import (
+        exportar_graphml, exportar_gexf, importar_graphml, importar_gexf
+    )
+
+    grafo = get_grafo_service().obter_grafo(grafo_teste)
+    grafo.definir_atributos_vertice("A", {"cor": "vermelho & azul"})
+
+    for exportar, importar, extensao in ((exportar_graphml, importar_graphml, "graphml"),
+                                         (exportar_gexf, importar_gexf, "gexf")):
+        caminho = str(tmp_path / f"grafo.{extensao}")
+        assert exportar(grafo, caminho)
+
+        importado = importar(caminho)
+        assert importado is not None
+        assert sorted(importado.obter_vertices()) == ["A", "B", "C"]
+        assert importado.obter_atributos_vertice("A")["cor"] == "vermelho & azul"
+        assert importado.obter_peso_aresta("B", "C") == 2.0
+
+
+def test_exportar_importar_binario(tmp_path, grafo_teste):
+    """Testa a ida e volta de um grafo pelo formato binário nativo."""
+    from grafo_backend.persistencia import exportar_binario, carregar_binario, importar_binario
+
+    grafo = get_grafo_service().obter_grafo(grafo_teste)
+    grafo.definir_atributos_vertice("A", {"cor": "vermelho", "rank": 3})
+    caminho = str(tmp_path / "grafo.grafo")
+
+    assert exportar_binario(grafo, caminho)
+
+    # O carregamento mapeia os arrays CSR diretamente do arquivo
+    csr = carregar_binario(caminho)
+    assert csr.numero_vertices() == 3
+    assert csr.numero_arestas() == 2
+    indice_b = csr.indice("B")
+    vizinhos = sorted(csr.vertice(i) for i in csr.vizinhos(indice_b))
+    assert vizinhos == ["A", "C"]
+
+    importado = importar_binario(caminho)
+    assert type(importado).__name__ == "GrafoPonderado"
+    assert importado.obter_peso_aresta("A", "B") == 1.5
+    assert importado.obter_atributos_vertice("A") == {"cor": "vermelho", "rank": 3}
+    assert importado.obter_atributos_vertice("C") == {}
+
+
+def test_binario_preserva_ids_tupla(tmp_path):
+    """Testa a ida e volta pelo formato binário de vértices com identificadores em tupla."""
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.persistencia import exportar_binario, importar_binario
+
+    grafo = Grafo("Tuplas")
+    grafo.adicionar_vertice((0, 1), {"vizinhos": {"x"}, "rotulo": ("a", 1)})
+    grafo.adicionar_vertice((0, 2))
+    grafo.adicionar_aresta((0, 1), (0, 2))
+    caminho = str(tmp_path / "tuplas.grafo")
+
+    assert exportar_binario(grafo, caminho)
+
+    importado = importar_binario(caminho)
+    assert importado is not None
+    assert sorted(importado.obter_vertices()) == [(0, 1), (0, 2)]
+    assert importado.existe_aresta((0, 1), (0, 2))
+    # Tuplas são preservadas; valores sem representação em JSON viram texto
+    atributos = importado.obter_atributos_vertice((0, 1))
+    assert atributos["rotulo"] == ("a", 1)
+    assert atributos["vizinhos"] == "{'x'}"
+
+
+def test_binario_gravacoes_simultaneas_no_mesmo_caminho(tmp_path):
+    """Testa se exportações simultâneas para o mesmo arquivo não compartilham o arquivo temporário."""
+    import threading
+    from grafo_backend.core.grafo import Grafo
+    from grafo_backend.persistencia import exportar_binario, importar_binario
+
+    grafos = []
+    for tamanho in (200, 300, 400, 500):
+        grafo = Grafo(f"Caminho {tamanho}")
+        for v in range(tamanho):
+            grafo.adicionar_vertice(v)
+        for v in range(tamanho - 1):
+            grafo.adicionar_aresta(v, v + 1)
+        grafos.append(grafo)
+    caminho = str(tmp_path / "compartilhado.grafo")
+
+    resultados = []
+    barreira = threading.Barrier(len(grafos))
+
+    def exportar(grafo):
+        barreira.wait()
+        for _ in range(5):
+            resultados.append(exportar_binario(grafo, caminho))
+
+    threads = [threading.Thread(target=exportar, args=(grafo,)) for grafo in grafos]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(resultados) and len(resultados) == 20
+    importado = importar_binario(caminho)
+    assert importado.nome in {grafo.nome for grafo in grafos}
+    assert importado.obter_grafo_networkx().number_of_edges() == len(importado.obter_vertices()) - 1
+    assert [p.name for p in tmp_path.iterdir()] == ["compartilhado.grafo"]
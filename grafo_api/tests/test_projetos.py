@@ -0,0 +1,483 @@
+"""
+Arquivo de testes para o gerenciamento de projetos de estudo.
+"""
+
+import threading
+import time
+import zipfile
+import pytest
+from grafo_backend.tipos import GrafoPonderado
+from app.services.projeto_service import GerenciadorProjetos
+
+
+@pytest.fixture
+def gerenciador(tmp_path):
+    """Cria um gerenciador de projetos com armazenamento temporário."""
+    return GerenciadorProjetos(diretorio_armazenamento=str(tmp_path))
+
+
+@pytest.fixture
+def projeto_com_grafo(gerenciador):
+    """Cria um projeto com um grafo ponderado."""
+    projeto_id = gerenciador.criar_projeto("Projeto de Teste", autor="Tester")
+    projeto = gerenciador.obter_projeto(projeto_id)
+
+    grafo = GrafoPonderado("Rede")
+    for v in ["A", "B", "C"]:
+        grafo.adicionar_vertice(v)
+    grafo.adicionar_aresta("A", "B", 1.5)
+    grafo.adicionar_aresta("B", "C", 2.0)
+    grafo_id = projeto.adicionar_grafo(grafo)
+
+    return projeto_id, grafo_id
+
+
+def test_salvar_e_carregar_projeto(tmp_path, gerenciador, projeto_com_grafo):
+    """Testa se os grafos de um projeto salvo são recarregados do formato binário."""
+    projeto_id, grafo_id = projeto_com_grafo
+
+    assert gerenciador.salvar_projeto(projeto_id)
+
+    # Um novo gerenciador precisa ler o projeto do disco
+    outro = GerenciadorProjetos(diretorio_armazenamento=str(tmp_path))
+    projeto = outro.carregar_projeto(projeto_id)
+
+    assert projeto is not None
+    grafo = projeto.obter_grafo(grafo_id)
+    assert grafo.nome == "Rede"
+    assert grafo.numero_arestas() == 2
+    assert grafo.obter_peso_aresta("B", "C") == 2.0
+
+
+def test_listar_projetos_pelo_indice(tmp_path, gerenciador, projeto_com_grafo):
+    """Testa se a listagem usa o índice de metadados, com filtro e ordenação."""
+    projeto_id, _ = projeto_com_grafo
+    projeto = gerenciador.obter_projeto(projeto_id)
+    projeto.adicionar_tag("algoritmos")
+    assert gerenciador.salvar_projeto(projeto_id)
+
+    outro_id = gerenciador.criar_projeto("Outro Projeto")
+    assert gerenciador.salvar_projeto(outro_id)
+
+    # Invalida os arquivos dos projetos: a listagem não deve abri-los
+    for projeto in (projeto_id, outro_id):
+        (tmp_path / projeto / "manifesto.json").write_text("corrompido")
+
+    outro = GerenciadorProjetos(diretorio_armazenamento=str(tmp_path))
+
+    projetos = outro.listar_projetos(ordenar_por="data_atualizacao")
+    assert [p["id"] for p in projetos] == [outro_id, projeto_id]
+    assert projetos[1]["num_grafos"] == 1
+
+    filtrados = outro.listar_projetos(tag="algoritmos")
+    assert [p["titulo"] for p in filtrados] == ["Projeto de Teste"]
+
+    # A exclusão remove o projeto do índice
+    assert outro.excluir_projeto(outro_id)
+    assert [p["id"] for p in outro.listar_projetos()] == [projeto_id]
+
+
+def _salvar_projetos_em_outro_processo(diretorio, prefixo, quantidade):
+    """Cria e salva projetos com um gerenciador próprio, como faria outro worker."""
+    gerenciador = GerenciadorProjetos(diretorio_armazenamento=diretorio)
+    ids = []
+    for i in range(quantidade):
+        projeto_id = gerenciador.criar_projeto(f"{prefixo} {i}")
+        grafo = GrafoPonderado(f"{prefixo} {i}")
+        grafo.adicionar_vertice(prefixo)
+        grafo.adicionar_vertice(i)
+        grafo.adicionar_aresta(prefixo, i, 1.0)
+        gerenciador.obter_projeto(projeto_id).adicionar_grafo(grafo)
+        assert gerenciador.salvar_projeto(projeto_id)
+        ids.append(projeto_id)
+    return ids
+
+
+def test_indice_atualizado_por_varios_processos(tmp_path):
+    """Testa se gravações simultâneas de processos diferentes não perdem entradas do índice."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    contexto = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=4, mp_context=contexto) as executor:
+        futuros = [executor.submit(_salvar_projetos_em_outro_processo, str(tmp_path), f"P{p}", 15)
+                   for p in range(4)]
+        esperados = {projeto_id for futuro in futuros for projeto_id in futuro.result()}
+
+    gerenciador = GerenciadorProjetos(diretorio_armazenamento=str(tmp_path))
+    assert {p["id"] for p in gerenciador.listar_projetos()} == esperados
+    assert len(gerenciador.armazem.listar()) == len(esperados)
+    assert not list(tmp_path.glob("**/*.tmp"))
+
+
+def test_grafos_carregados_sob_demanda(tmp_path, gerenciador, projeto_com_grafo):
+    """Testa se os grafos são lidos no primeiro acesso e só os alterados são regravados."""
+    projeto_id, grafo_id = projeto_com_grafo
+    projeto = gerenciador.obter_projeto(projeto_id)
+    segundo = GrafoPonderado("Segundo")
+    segundo.adicionar_vertice("X")
+    segundo.adicionar_vertice("Y")
+    segundo.adicionar_aresta("X", "Y", 3.0)
+    segundo_id = projeto.adicionar_grafo(segundo)
+    assert gerenciador.salvar_projeto(projeto_id)
+
+    armazem = gerenciador.armazem
+    hash_segundo = segundo.obter_hash()
+    assert armazem.listar() == {projeto.obter_grafo(grafo_id).obter_hash(), hash_segundo}
+
+    outro = GerenciadorProjetos(diretorio_armazenamento=str(tmp_path))
+    projeto = outro.carregar_projeto(projeto_id)
+
+    # A listagem usa os metadados do manifesto, sem carregar os grafos
+    metadados = {g["id"]: g for g in projeto.listar_grafos()}
+    assert metadados[segundo_id]["num_arestas"] == 1
+    assert not projeto.grafos.esta_carregado(grafo_id)
+    assert not projeto.grafos.esta_carregado(segundo_id)
+
+    # Altera apenas o primeiro grafo
+    projeto.obter_grafo(grafo_id).adicionar_aresta("C", "A", 4.0)
+    assert projeto.grafos.obter_alterados() == [grafo_id]
+
+    arquivo_segundo = tmp_path / "objetos" / hash_segundo[:2] / f"{hash_segundo}.grafo"
+    modificacao = arquivo_segundo.stat().st_mtime_ns
+    assert outro.salvar_projeto(projeto_id)
+    assert arquivo_segundo.stat().st_mtime_ns == modificacao
+    assert projeto.grafos.obter_alterados() == []
+
+    # Grafos que deixam de ser usados são removidos do armazém no salvamento
+    projeto.remover_grafo(segundo_id)
+    assert outro.salvar_projeto(projeto_id)
+    assert not arquivo_segundo.exists()
+
+    recarregado = GerenciadorProjetos(diretorio_armazenamento=str(tmp_path)).carregar_projeto(projeto_id)
+    assert list(recarregado.grafos) == [grafo_id]
+    assert recarregado.obter_grafo(grafo_id).numero_arestas() == 3
+
+
+def test_exportar_e_importar_projeto_zip(tmp_path, gerenciador, projeto_com_grafo):
+    """Testa o pacote ZIP emitido em partes e sua importação em outro armazenamento."""
+    projeto_id, grafo_id = projeto_com_grafo
+    projeto = gerenciador.obter_projeto(projeto_id)
+    projeto.adicionar_nota("Observação sobre a rede", grafo_id)
+
+    partes = list(gerenciador.exportar_projeto_zip(projeto_id))
+    assert len(partes) > 1
+    pacote = tmp_path / "projeto.zip"
+    pacote.write_bytes(b"".join(partes))
+
+    with zipfile.ZipFile(pacote) as arquivo_zip:
+        assert {"manifesto.json", "notas.json", "historico.json",
+                f"grafos/{grafo_id}.grafo"} <= set(arquivo_zip.namelist())
+
+    destino = GerenciadorProjetos(diretorio_armazenamento=str(tmp_path / "destino"))
+    with open(pacote, 'rb') as arquivo:
+        importado_id = destino.importar_projeto_zip(arquivo)
+
+    assert importado_id == projeto_id
+    importado = destino.obter_projeto(importado_id)
+    assert not importado.grafos.esta_carregado(grafo_id)
+    assert importado.notas[0]["texto"] == "Observação sobre a rede"
+    assert importado.obter_grafo(grafo_id).obter_peso_aresta("A", "B") == 1.5
+
+    # O projeto importado já está salvo no armazenamento de destino
+    recarregado = GerenciadorProjetos(diretorio_armazenamento=str(tmp_path / "destino"))
+    assert [p["id"] for p in recarregado.listar_projetos()] == [projeto_id]
+
+
+def test_grafos_identicos_compartilham_armazenamento(tmp_path, gerenciador, projeto_com_grafo):
+    """Testa a deduplicação pelo hash de conteúdo e a cópia de grafos entre projetos."""
+    projeto_id, grafo_id = projeto_com_grafo
+    projeto = gerenciador.obter_projeto(projeto_id)
+    original = projeto.obter_grafo(grafo_id)
+
+    # Mesmo conteúdo inserido em outra ordem e com outro nome
+    igual = GrafoPonderado("Cópia")
+    for v in ["C", "B", "A"]:
+        igual.adicionar_vertice(v)
+    igual.adicionar_aresta("C", "B", 2.0)
+    igual.adicionar_aresta("B", "A", 1.5)
+    assert igual.obter_hash() == original.obter_hash()
+
+    igual.definir_peso_aresta("A", "B", 9.0)
+    assert igual.obter_hash() != original.obter_hash()
+    igual.definir_peso_aresta("A", "B", 1.5)
+
+    outro_id = gerenciador.criar_projeto("Outro")
+    outro = gerenciador.obter_projeto(outro_id)
+    outro.adicionar_grafo(igual)
+    copia_id = gerenciador.copiar_grafo(projeto_id, grafo_id, outro_id)
+    assert not outro.grafos.esta_carregado(copia_id)
+
+    assert gerenciador.salvar_projeto(projeto_id)
+    assert gerenciador.salvar_projeto(outro_id)
+    assert len(gerenciador.armazem.listar()) == 1
+
+    # O objeto compartilhado sobrevive à exclusão de um dos projetos
+    assert gerenciador.excluir_projeto(projeto_id)
+    recarregado = GerenciadorProjetos(diretorio_armazenamento=str(tmp_path)).carregar_projeto(outro_id)
+    assert recarregado.obter_grafo(copia_id).obter_peso_aresta("B", "C") == 2.0
+    assert recarregado.obter_grafo(copia_id).nome == "Rede"
+
+    assert gerenciador.excluir_projeto(outro_id)
+    assert gerenciador.armazem.listar() == set()
+
+
+def test_hash_distingue_tipos_dos_atributos(gerenciador):
+    """Testa se atributos que o JSON confundiria (tupla e lista, conjunto e texto) geram hashes e objetos distintos."""
+    def criar(atributos):
+        grafo = GrafoPonderado("Tipos")
+        grafo.adicionar_vertice("A", atributos)
+        grafo.adicionar_vertice("B")
+        grafo.adicionar_aresta("A", "B", 1.0)
+        return grafo
+
+    pares = [
+        ({"pos": (1, 2)}, {"pos": [1, 2]}),
+        ({"cor": {3}}, {"cor": "{3}"}),
+        ({"mapa": {1: "x"}}, {"mapa": {"1": "x"}}),
+        ({"__tupla__": [1]}, {"valor": (1,)}),
+    ]
+    for atributos, outros in pares:
+        assert criar(atributos).obter_hash() != criar(outros).obter_hash()
+    assert criar({"pos": (1, 2)}).obter_hash() == criar({"pos": (1, 2)}).obter_hash()
+    assert criar({"cor": {1, 2, 3}}).obter_hash() == criar({"cor": {3, 2, 1}}).obter_hash()
+
+    # Cada grafo é gravado em seu próprio objeto e recarregado com o tipo original
+    com_tupla, com_lista = criar({"pos": (1, 2)}), criar({"pos": [1, 2]})
+    armazem = gerenciador.armazem
+    hashes = {armazem.gravar(com_tupla), armazem.gravar(com_lista)}
+    assert hashes == {com_tupla.obter_hash(), com_lista.obter_hash()}
+    assert armazem.carregar(com_lista.obter_hash()).obter_atributos_vertice("A")["pos"] == [1, 2]
+    assert armazem.carregar(com_tupla.obter_hash()).obter_atributos_vertice("A")["pos"] == (1, 2)
+
+
+def test_assinatura_acompanha_versao_do_projeto(tmp_path, gerenciador, projeto_com_grafo):
+    """Testa se a assinatura usada no cache de relatórios muda apenas com o conteúdo."""
+    projeto_id, grafo_id = projeto_com_grafo
+    projeto = gerenciador.obter_projeto(projeto_id)
+    assinatura = projeto.obter_assinatura()
+    assert projeto.obter_assinatura() == assinatura
+
+    # Alteração feita diretamente no grafo
+    projeto.obter_grafo(grafo_id).definir_peso_aresta("A", "B", 3.0)
+    alterada = projeto.obter_assinatura()
+    assert alterada != assinatura
+
+    # Ações registradas no projeto e edição direta dos metadados
+    projeto.adicionar_nota("Revisar pesos")
+    assert projeto.obter_assinatura() != alterada
+    alterada = projeto.obter_assinatura()
+    projeto.titulo = "Novo título"
+    assert projeto.obter_assinatura() != alterada
+
+    # Projeto recarregado do disco, sem carregar os grafos
+    assert gerenciador.salvar_projeto(projeto_id)
+    recarregado = GerenciadorProjetos(diretorio_armazenamento=str(tmp_path)).carregar_projeto(projeto_id)
+    recarregado.obter_assinatura()
+    assert not recarregado.grafos.esta_carregado(grafo_id)
+
+
+@pytest.fixture
+def relatorios(tmp_path, monkeypatch):
+    """
+    Cria o serviço de relatórios com a geração do PDF substituída por uma
+    função controlada pelo teste (o WeasyPrint não é necessário).
+    """
+    from app.services.relatorio_service import RelatorioGrafoPDF
+
+    servico = RelatorioGrafoPDF(template_dir=str(tmp_path / "templates"))
+    controle = {"chamadas": [], "liberar": threading.Event(), "erro": None}
+
+    def gerar_relatorio_projeto(dados, config=None):
+        controle["chamadas"].append((dados["titulo"], dict(config or {})))
+        assert controle["liberar"].wait(10)
+        if controle["erro"] is not None:
+            raise controle["erro"]
+        return f"%PDF {dados['titulo']} {len(controle['chamadas'])}".encode()
+
+    monkeypatch.setattr(servico, "gerar_relatorio_projeto", gerar_relatorio_projeto)
+    return servico, controle
+
+
+def _aguardar_tarefa(servico, tarefa_id):
+    """Aguarda o fim de uma tarefa de relatório e devolve seu estado."""
+    limite = time.monotonic() + 10
+    while time.monotonic() < limite:
+        tarefa = servico.obter_tarefa(tarefa_id)
+        if tarefa["estado"] in ("concluido", "erro"):
+            return tarefa
+        time.sleep(0.01)
+    raise AssertionError(f"Tarefa {tarefa_id} não terminou")
+
+
+def test_relatorio_de_projeto_em_segundo_plano(gerenciador, projeto_com_grafo, relatorios):
+    """Testa o fluxo iniciar -> obter_tarefa -> obter_pdf_tarefa e a reutilização do PDF em cache."""
+    servico, controle = relatorios
+    projeto_id, grafo_id = projeto_com_grafo
+    projeto = gerenciador.obter_projeto(projeto_id)
+    config = {"estilo": "padrao", "incluir_teoria": True}
+
+    # Enquanto a geração não termina, o PDF não está disponível
+    tarefa = servico.iniciar_relatorio_projeto(projeto, config)
+    assert tarefa["projeto_id"] == projeto_id
+    assert tarefa["estado"] in ("pendente", "executando")
+    assert servico.obter_pdf_tarefa(tarefa["tarefa_id"]) is None
+
+    # Um novo pedido igual reaproveita a geração em andamento
+    assert servico.iniciar_relatorio_projeto(projeto, config)["tarefa_id"] == tarefa["tarefa_id"]
+
+    controle["liberar"].set()
+    concluida = _aguardar_tarefa(servico, tarefa["tarefa_id"])
+    assert concluida["estado"] == "concluido"
+    assert concluida["erro"] is None
+    pdf = servico.obter_pdf_tarefa(tarefa["tarefa_id"])
+    assert pdf == b"%PDF Projeto de Teste 1"
+    assert controle["chamadas"] == [("Projeto de Teste", config)]
+
+    # Mesma versão do projeto e mesma configuração: nova tarefa já concluída, sem gerar de novo
+    repetida = servico.iniciar_relatorio_projeto(projeto, dict(config))
+    assert repetida["tarefa_id"] != tarefa["tarefa_id"]
+    assert repetida["estado"] == "concluido"
+    assert servico.obter_pdf_tarefa(repetida["tarefa_id"]) == pdf
+    assert len(controle["chamadas"]) == 1
+
+    # Outra configuração ou outra versão do projeto geram um novo PDF
+    outra = servico.iniciar_relatorio_projeto(projeto, dict(config, incluir_teoria=False))
+    assert _aguardar_tarefa(servico, outra["tarefa_id"])["estado"] == "concluido"
+    projeto.obter_grafo(grafo_id).definir_peso_aresta("A", "B", 3.0)
+    alterada = servico.iniciar_relatorio_projeto(projeto, config)
+    assert _aguardar_tarefa(servico, alterada["tarefa_id"])["estado"] == "concluido"
+    assert servico.obter_pdf_tarefa(alterada["tarefa_id"]) != pdf
+    assert len(controle["chamadas"]) == 3
+
+    # Tarefas desconhecidas
+    assert servico.obter_tarefa("inexistente") is None
+    assert servico.obter_pdf_tarefa("inexistente") is None
+
+
+def test_relatorio_de_projeto_com_erro(gerenciador, projeto_com_grafo, relatorios):
+    """Testa se uma falha na geração fica registrada na tarefa e não entra no cache."""
+    servico, controle = relatorios
+    projeto = gerenciador.obter_projeto(projeto_com_grafo[0])
+    controle["erro"] = RuntimeError("falha no PDF")
+    controle["liberar"].set()
+
+    tarefa = _aguardar_tarefa(servico, servico.iniciar_relatorio_projeto(projeto)["tarefa_id"])
+    assert tarefa["estado"] == "erro"
+    assert tarefa["erro"] == "falha no PDF"
+    assert servico.obter_pdf_tarefa(tarefa["tarefa_id"]) is None
+
+    # A próxima tentativa gera o relatório novamente
+    controle["erro"] = None
+    tarefa = _aguardar_tarefa(servico, servico.iniciar_relatorio_projeto(projeto)["tarefa_id"])
+    assert tarefa["estado"] == "concluido"
+    assert len(controle["chamadas"]) == 2
+
+
+def test_imagens_de_grafos_reaproveitadas_pelo_cache(gerenciador, projeto_com_grafo, relatorios, monkeypatch):
+    """Testa se grafos com o mesmo conteúdo são desenhados uma única vez."""
+    servico, _ = relatorios
+    projeto_id, grafo_id = projeto_com_grafo
+    grafo = gerenciador.obter_projeto(projeto_id).obter_grafo(grafo_id)
+    desenhos = []
+
+    def desenhar(grafo, layout, largura, altura):
+        desenhos.append((grafo.nome, layout, largura, altura))
+        return f"imagem-{len(desenhos)}"
+
+    monkeypatch.setattr(servico, "_desenhar_imagem_grafo", desenhar)
+
+    imagem = servico._gerar_imagem_grafo_base64(grafo)
+    assert imagem == "imagem-1"
+
+    # Uma cópia com o mesmo conteúdo usa a imagem em cache, já pronta
+    copia = GrafoPonderado("Cópia")
+    for v in ["A", "B", "C"]:
+        copia.adicionar_vertice(v)
+    copia.adicionar_aresta("A", "B", 1.5)
+    copia.adicionar_aresta("B", "C", 2.0)
+    futuro = servico._agendar_imagem_grafo(copia)
+    assert futuro.done()
+    assert futuro.result() == imagem
+    assert len(desenhos) == 1
+
+    # Outro tamanho ou um grafo alterado são desenhados novamente
+    assert servico._gerar_imagem_grafo_base64(grafo, largura=400, altura=300) == "imagem-2"
+    grafo.definir_peso_aresta("A", "B", 3.0)
+    assert servico._gerar_imagem_grafo_base64(grafo) == "imagem-3"
+    assert len(desenhos) == 3
+
+
+class _ArmazenamentoSessao:
+    """Armazenamento de sessão em memória usado pelos endpoints de projetos."""
+
+    def __init__(self):
+        self.dados = {}
+
+    def store_data(self, session_id, data_type, data_id, data=None, **kwargs):
+        self.dados[(session_id, data_type, data_id)] = data if data is not None else True
+
+    def get_data(self, session_id, data_type, data_id):
+        return self.dados.get((session_id, data_type, data_id))
+
+
+@pytest.fixture
+def cliente_relatorios(gerenciador, projeto_com_grafo, relatorios):
+    """Cria um cliente para os endpoints de relatório, com o projeto associado à sessão."""
+    from fastapi import FastAPI, Request
+    from fastapi.testclient import TestClient
+    from app.api.v1.endpoints import projetos
+
+    app = FastAPI()
+    app.include_router(projetos.router, prefix="/projetos")
+    app.state.projeto_service = gerenciador
+    app.state.relatorio_service = relatorios[0]
+    app.state.session_storage = _ArmazenamentoSessao()
+    app.state.session_storage.store_data("sessao", "projetos", projeto_com_grafo[0])
+
+    @app.middleware("http")
+    async def definir_sessao(request: Request, call_next):
+        request.state.session_id = "sessao"
+        return await call_next(request)
+
+    with TestClient(app) as cliente:
+        yield cliente
+
+
+def test_endpoints_de_relatorio_do_projeto(cliente_relatorios, projeto_com_grafo, relatorios):
+    """Testa os endpoints de estado e de download do relatório, incluindo tarefa inexistente e não concluída."""
+    _, controle = relatorios
+    projeto_id = projeto_com_grafo[0]
+    base = f"/projetos/{projeto_id}/relatorio"
+
+    response = cliente_relatorios.post(base, params={"incluir_teoria": False})
+    assert response.status_code == 202
+    tarefa = response.json()
+    tarefa_id = tarefa["tarefa_id"]
+    assert tarefa["estado"] in ("pendente", "executando")
+    assert tarefa["url_pdf"] == f"{base}/{tarefa_id}/pdf"
+
+    # Ainda não concluído
+    response = cliente_relatorios.get(f"{base}/{tarefa_id}")
+    assert response.status_code == 200
+    assert response.json()["estado"] in ("pendente", "executando")
+    response = cliente_relatorios.get(f"{base}/{tarefa_id}/pdf")
+    assert response.status_code == 409
+
+    # Tarefa e projeto desconhecidos
+    assert cliente_relatorios.get(f"{base}/inexistente").status_code == 404
+    assert cliente_relatorios.get(f"{base}/inexistente/pdf").status_code == 404
+    assert cliente_relatorios.get(f"/projetos/outro/relatorio/{tarefa_id}").status_code == 404
+
+    controle["liberar"].set()
+    limite = time.monotonic() + 10
+    while cliente_relatorios.get(f"{base}/{tarefa_id}").json()["estado"] != "concluido":
+        assert time.monotonic() < limite
+        time.sleep(0.01)
+
+    response = cliente_relatorios.get(tarefa["url_pdf"])
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-disposition"].startswith("attachment; filename=Projeto_de_Teste_relatorio_")
+    assert response.content == b"%PDF Projeto de Teste 1"
+    assert controle["chamadas"][0][1]["incluir_teoria"] is False
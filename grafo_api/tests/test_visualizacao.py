@@ -2,8 +2,11 @@
 Arquivo de testes para os endpoints de visualização de grafos.
 """
 
+import networkx as nx
+import numpy as np
 import pytest
 from app.core.session import get_grafo_service
+from grafo_backend.visualizacao import IndiceEspacial, calcular_layout_forca, matriz_adjacencia
 
 
 def test_visualizar_grafo(client, grafo_teste):
@@ -77,12 +80,38 @@ def test_gerar_imagem_grafo(client, grafo_teste):
     # Verifica se a resposta foi bem-sucedida
     assert response.status_code == 200
     
-    # Verifica se a resposta contém os dados da imagem
-    data = response.json()
-    assert data["grafo_id"] == grafo_id
-    assert data["formato"] == "png"
-    assert data["layout"] == "spring"
-    assert "conteudo" in data
+    # Verifica se a resposta contém a imagem PNG diretamente no corpo
+    assert response.headers["content-type"] == "image/png"
+    assert response.content.startswith(b"\x89PNG")
+    
+    # SVG com tamanho personalizado
+    response = client.get(f"/api/v1/visualizacao/{grafo_id}/imagem?formato=svg&largura=400&altura=300")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("image/svg+xml")
+    assert b"<svg" in response.content
+    
+    # Tamanho fora dos limites
+    response = client.get(f"/api/v1/visualizacao/{grafo_id}/imagem?largura=10")
+    assert response.status_code == 400
+
+
+def test_imagens_renderizadas_em_paralelo_e_em_cache(grafo_teste):
+    """Testa renderizações simultâneas e o cache de imagens por versão do grafo."""
+    from concurrent.futures import ThreadPoolExecutor
+    from app.core.session import get_grafo_service, get_visualizacao_service
+    
+    servico = get_visualizacao_service()
+    tamanhos = [(300 + 10 * i, 200) for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        imagens = list(executor.map(lambda t: servico.gerar_imagem(grafo_teste, "png", "circular", None, *t), tamanhos))
+    assert all(tipo == "image/png" and conteudo.startswith(b"\x89PNG") for conteudo, tipo in imagens)
+    
+    # A mesma imagem vem do cache até que o grafo seja alterado
+    primeira, _ = servico.gerar_imagem(grafo_teste, "png", "circular", None, 300, 200)
+    assert primeira is imagens[0][0]
+    get_grafo_service().obter_grafo(grafo_teste).adicionar_vertice("Z")
+    nova, _ = servico.gerar_imagem(grafo_teste, "png", "circular", None, 300, 200)
+    assert nova is not primeira
 
 
 def test_visualizar_grafo_layout_invalido(client, grafo_teste):
@@ -95,3 +124,204 @@ def test_visualizar_grafo_layout_invalido(client, grafo_teste):
     
     # Verifica se a resposta indica erro
     assert response.status_code == 400
+
+
+def test_layout_em_cache_e_incremental(client, grafo_teste):
+    """Testa se as posições são reaproveitadas e preservadas após uma pequena alteração."""
+    grafo_id = grafo_teste
+
+    def posicoes():
+        response = client.get(f"/api/v1/visualizacao/{grafo_id}?layout=spring&semente=7")
+        assert response.status_code == 200
+        return {v["id"]: (v["x"], v["y"]) for v in response.json()["vertices"]}
+
+    iniciais = posicoes()
+    assert posicoes() == iniciais
+
+    # Adiciona um vértice ligado a C: os vértices existentes não se movem
+    client.post(f"/api/v1/grafos/{grafo_id}/vertices/", json={"id": "D"})
+    client.post(f"/api/v1/grafos/{grafo_id}/arestas/", json={"origem": "C", "destino": "D", "peso": 1.0})
+
+    atualizadas = posicoes()
+    assert set(atualizadas) == {"A", "B", "C", "D"}
+    for vertice, coordenadas in iniciais.items():
+        assert atualizadas[vertice] == pytest.approx(coordenadas)
+
+
+def test_layouts_de_forca_para_grafos_grandes(client, grafo_teste):
+    """Testa os layouts Barnes-Hut e multinível pela API e em uma grade com a quadtree ativa."""
+    layouts = client.get("/api/v1/visualizacao/layouts").json()
+    assert {"barnes_hut", "multinivel"} <= set(layouts)
+
+    for layout in ("barnes_hut", "multinivel"):
+        response = client.get(f"/api/v1/visualizacao/{grafo_teste}?layout={layout}&semente=3")
+        assert response.status_code == 200
+        assert {v["id"] for v in response.json()["vertices"]} == {"A", "B", "C"}
+
+    # Em uma grade 30 x 30, vizinhos devem ficar muito mais próximos que pares aleatórios
+    vertices, adjacencia = matriz_adjacencia(nx.grid_2d_graph(30, 30))
+    posicoes = calcular_layout_forca(adjacencia, semente=1)
+    assert posicoes.shape == (len(vertices), 2)
+    assert np.abs(posicoes).max() == pytest.approx(1.0)
+
+    linhas, colunas = adjacencia.nonzero()
+    aresta = np.linalg.norm(posicoes[linhas] - posicoes[colunas], axis=1).mean()
+    gerador = np.random.default_rng(0)
+    i, j = gerador.integers(0, len(vertices), (2, 2000))
+    aleatorio = np.linalg.norm(posicoes[i] - posicoes[j], axis=1).mean()
+    assert aresta < 0.15 * aleatorio
+
+
+def test_repulsao_barnes_hut_aproxima_a_exata():
+    """Testa a precisão da repulsão pela quadtree contra a soma exata, com pontos uniformes e aglomerados."""
+    from grafo_backend.visualizacao.forca import _repulsao_barnes_hut, _repulsao_exata
+
+    gerador = np.random.default_rng(5)
+    n = 2400
+    uniformes = gerador.random((n, 2)) * np.sqrt(n)
+    # Aglomerados de escalas muito diferentes, incluindo um mais denso que a distância mínima
+    aglomerados = np.concatenate([gerador.normal(centro, escala, (n // 4, 2))
+                                  for centro, escala in (((0, 0), 0.005), ((3, 3), 0.5),
+                                                         ((40, 0), 2.0), ((20, 30), 8.0))])
+
+    for pos in (uniformes, aglomerados):
+        massa = gerador.integers(1, 5, len(pos)).astype(float)
+        aproximada = _repulsao_barnes_hut(pos, massa, 1.0)
+        exata = _repulsao_exata(pos, massa, 1.0)
+        erro = np.linalg.norm(aproximada - exata, axis=1) / np.linalg.norm(exata, axis=1)
+        assert np.percentile(erro, 90) < 1e-2
+        assert np.median(erro) < 1e-3
+
+
+@pytest.mark.parametrize("agrupamento", ["comunidades", "espacial"])
+def test_visao_agregada_com_detalhamento(client, agrupamento):
+    """Testa os super-vértices dentro do limite de elementos e o detalhamento de um grupo."""
+    grafo_service = get_grafo_service()
+    grafo_id = grafo_service.criar_grafo("Grade")
+    grafo = grafo_service.obter_grafo(grafo_id)
+    grade = nx.grid_2d_graph(20, 20)
+    for u in grade:
+        grafo.adicionar_vertice(f"{u[0]}-{u[1]}")
+    for u, v in grade.edges():
+        grafo.adicionar_aresta(f"{u[0]}-{u[1]}", f"{v[0]}-{v[1]}")
+
+    url = f"/api/v1/visualizacao/{grafo_id}/agregado"
+    parametros = {"agrupamento": agrupamento, "limite_elementos": 100, "semente": 1}
+    dados = client.get(url, params=parametros).json()
+    assert not dados["detalhado"]
+    assert dados["total_vertices"] == 400
+    assert len(dados["vertices"]) + len(dados["arestas"]) <= 100
+    assert sum(v["tamanho"] for v in dados["vertices"]) == 400
+
+    # Detalha os grupos até chegar aos vértices originais
+    grupo = max(dados["vertices"], key=lambda v: v["tamanho"])
+    while True:
+        detalhe = client.get(url, params={**parametros, "grupo": grupo["id"]}).json()
+        assert detalhe["total_vertices"] == grupo["tamanho"]
+        assert len(detalhe["vertices"]) + len(detalhe["arestas"]) <= 100
+        if detalhe["detalhado"]:
+            break
+        grupo = max(detalhe["vertices"], key=lambda v: v["tamanho"])
+
+    ids = {v["id"] for v in detalhe["vertices"]}
+    assert len(ids) == grupo["tamanho"]
+    assert all(a["origem"] in ids and a["destino"] in ids for a in detalhe["arestas"])
+
+    response = client.get(url, params={**parametros, "grupo": "999"})
+    assert response.status_code == 400
+
+
+def test_janela_com_indice_espacial(client, grafo_teste):
+    """Testa a consulta por janela, as arestas que a atravessam e a rarefação por zoom."""
+    posicoes = client.get(f"/api/v1/visualizacao/{grafo_teste}?layout=circular").json()["vertices"]
+    posicoes = {v["id"]: (v["x"], v["y"]) for v in posicoes}
+
+    # Janela em torno de A apenas
+    x, y = posicoes["A"]
+    url = f"/api/v1/visualizacao/{grafo_teste}/janela"
+    dados = client.get(url, params={"xmin": x - 0.01, "ymin": y - 0.01, "xmax": x + 0.01, "ymax": y + 0.01,
+                                    "layout": "circular"}).json()
+    assert [v["id"] for v in dados["vertices"]] == ["A"]
+    assert [(a["origem"], a["destino"]) for a in dados["arestas"]] == [("A", "B")]
+
+    # Janela sem vértices no meio da aresta B-C: a aresta a atravessa
+    x = (posicoes["B"][0] + posicoes["C"][0]) / 2
+    y = (posicoes["B"][1] + posicoes["C"][1]) / 2
+    dados = client.get(url, params={"xmin": x - 0.01, "ymin": y - 0.01, "xmax": x + 0.01, "ymax": y + 0.01,
+                                    "layout": "circular"}).json()
+    assert dados["vertices"] == []
+    assert [(a["origem"], a["destino"]) for a in dados["arestas"]] == [("B", "C")]
+    assert (dados["arestas"][0]["x_origem"], dados["arestas"][0]["y_origem"]) == pytest.approx(posicoes["B"])
+
+    # Janela vazia fora do layout e janela invertida
+    dados = client.get(url, params={"xmin": 5, "ymin": 5, "xmax": 6, "ymax": 6, "layout": "circular"}).json()
+    assert dados["vertices"] == [] and dados["arestas"] == []
+    response = client.get(url, params={"xmin": 1, "ymin": 0, "xmax": 0, "ymax": 1})
+    assert response.status_code == 400
+
+    # Em uma grade densa, o zoom baixo rarefaz os vértices
+    vertices = np.array([(i % 300, i // 300) for i in range(90000)], dtype=float)
+    indice = IndiceEspacial(vertices, np.arange(89999), np.arange(1, 90000))
+    dentro, arestas = indice.consultar(10, 10, 20, 20)
+    assert len(dentro) == 121
+    # 12 arestas horizontais em cada uma das 11 linhas e 10 arestas de mudança
+    # de linha, que cortam a janela na diagonal
+    assert len(arestas) == 11 * 12 + 10
+    esperado = np.flatnonzero((vertices >= 10).all(axis=1) & (vertices <= 20).all(axis=1))
+    assert np.array_equal(dentro, esperado)
+    assert len(indice.rarefazer(dentro, 0)) < len(dentro) == len(indice.rarefazer(dentro, 4))
+
+
+def test_layout_progressivo_por_sse(client):
+    """Testa a transmissão de quadros do layout e a reconstrução das posições finais."""
+    import json
+
+    grafo_service = get_grafo_service()
+    grafo_id = grafo_service.criar_grafo("Grade")
+    grafo = grafo_service.obter_grafo(grafo_id)
+    grade = nx.grid_2d_graph(15, 15)
+    for u in grade:
+        grafo.adicionar_vertice(f"{u[0]}-{u[1]}")
+    for u, v in grade.edges():
+        grafo.adicionar_aresta(f"{u[0]}-{u[1]}", f"{v[0]}-{v[1]}")
+
+    def receber():
+        response = client.get(f"/api/v1/visualizacao/{grafo_id}/layout/progressivo",
+                              params={"semente": 2, "intervalo": 20, "bits": 12})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        eventos = []
+        for bloco in response.text.strip().split("\n\n"):
+            campos = dict(linha.split(": ", 1) for linha in bloco.split("\n"))
+            eventos.append((campos["event"], json.loads(campos["data"])))
+        return eventos
+
+    eventos = receber()
+    nomes = [nome for nome, _ in eventos]
+    assert nomes[0] == "inicio" and nomes[-1] == "fim" and nomes.count("quadro") > 2
+    vertices = eventos[0][1]["vertices"]
+
+    # Aplica o quadro completo e as diferenças
+    quadros = [dados for nome, dados in eventos if nome == "quadro"]
+    assert quadros[0]["tipo"] == "completo"
+    x, y = np.array(quadros[0]["x"]), np.array(quadros[0]["y"])
+    for quadro in quadros[1:]:
+        assert quadro["tipo"] == "diferenca"
+        indices = np.cumsum(quadro["indices"]) - 1
+        x[indices] += quadro["dx"]
+        y[indices] += quadro["dy"]
+    finais = np.stack([x, y], axis=1) / 4095 * 2 - 1
+
+    # O layout final fica em cache e coincide com o reconstruído
+    dados = client.get(f"/api/v1/visualizacao/{grafo_id}?layout=multinivel&semente=2").json()
+    posicoes = {v["id"]: (v["x"], v["y"]) for v in dados["vertices"]}
+    esperadas = np.array([posicoes[v] for v in vertices])
+    assert np.abs(finais - esperadas).max() <= 1 / 4095 + 1e-9
+
+    # Uma nova transmissão usa o cache: um único quadro completo
+    eventos = receber()
+    assert [nome for nome, _ in eventos] == ["inicio", "quadro", "fim"]
+    assert eventos[-1][1]["em_cache"]
+
+    response = client.get(f"/api/v1/visualizacao/{grafo_id}/layout/progressivo", params={"layout": "circular"})
+    assert response.status_code == 400